@@ -0,0 +1,16 @@
+"""
+Analyse-Paket für das Studien-Dashboard.
+
+Dieses Paket enthält Auswertungen über ganze Kohorten (Kennzahlen und
+Notenprojektion). Es benötigt das optionale Paket numpy (pip install numpy).
+"""
+
+from .kohorten_tabelle import KohortenTabelle
+from .projektion import NotenProjektion, NotenVerteilung, SimulationsErgebnis
+
+__all__ = [
+    'KohortenTabelle',
+    'NotenProjektion',
+    'NotenVerteilung',
+    'SimulationsErgebnis'
+]
@@ -0,0 +1,319 @@
+"""
+KohortenTabelle-Klasse für vektorisierte Kennzahlen über viele Studiengänge.
+
+Die Moduldaten einer ganzen Kohorte werden spaltenweise in numpy-Arrays
+abgelegt. Notendurchschnitt, Fortschritt und verbleibende ECTS werden dann
+für alle Studierenden in einem Durchgang berechnet statt je Studiengang.
+"""
+
+from typing import Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _pruefe_numpy() -> None:
+    """
+    Prüft, ob numpy installiert ist.
+    
+    Raises:
+        ImportError: Wenn numpy fehlt
+    """
+    if np is None:
+        raise ImportError("Für die Kohortenanalyse wird numpy benötigt (pip install numpy)")
+
+
+def _nahe_rundungsgrenze(werte) -> 'np.ndarray':
+    """
+    Ermittelt Werte, die nahe einer Rundungsgrenze auf zwei Nachkommastellen liegen.
+    
+    Nur dort können np.round und Pythons round() oder kleinste Rechenfehler
+    zu einem anderen Ergebnis führen.
+    
+    Args:
+        werte: Die ungerundeten Werte
+        
+    Returns:
+        Boolesche Maske der Werte nahe einer Grenze
+    """
+    skaliert = werte * 100
+    return np.abs(skaliert - np.floor(skaliert) - 0.5) < 1e-6
+
+
+def _runde(werte) -> 'np.ndarray':
+    """
+    Rundet auf zwei Nachkommastellen mit demselben Ergebnis wie Pythons round().
+    
+    Args:
+        werte: Die ungerundeten Werte
+        
+    Returns:
+        Die gerundeten Werte
+    """
+    gerundet = np.round(werte, 2)
+    for i in np.flatnonzero(_nahe_rundungsgrenze(werte)).tolist():
+        gerundet[i] = round(float(werte[i]), 2)
+    return gerundet
+
+
+class KohortenTabelle:
+    """
+    Spaltenweise Moduldaten vieler Studiengänge.
+    
+    Jede Zeile ist ein Modul; die Module eines Studierenden liegen in
+    Semester- und Einfügereihenfolge hintereinander.
+    
+    Attributes:
+        _kennungen: Die Kennungen der Studierenden (Index = Studierenden-Nummer)
+        _ects_ziel: Die Gesamt-ECTS des Abschlusses je Studierendem
+        _ziel_note: Der Ziel-Notendurchschnitt je Studierendem (NaN wenn unbekannt)
+        _studierender: Spalte mit der Studierenden-Nummer je Modul
+        _semester: Spalte mit der Semesternummer
+        _ects: Spalte mit den ECTS
+        _status: Spalte mit dem Statuscode (Index in ModulStatus)
+        _note: Spalte mit der Note (NaN ohne Prüfungsleistung)
+        _datum: Spalte mit dem Prüfungsdatum als Ordinalzahl (0 ohne Prüfungsleistung)
+        _art: Spalte mit dem Prüfungsart-Code (Index in Pruefungsart, -1 ohne Prüfungsleistung)
+        _bestandene_ects: Zwischengespeicherte bestandene ECTS je Studierendem
+    """
+    
+    def __init__(self, kennungen: List[str], ects_ziel, studierender, semester, ects, status, note,
+                 datum, art, ziel_note=None):
+        """
+        Initialisiert die KohortenTabelle aus fertigen Spalten.
+        
+        Args:
+            kennungen: Die Kennungen der Studierenden
+            ects_ziel: Die Gesamt-ECTS des Abschlusses je Studierendem
+            studierender: Studierenden-Nummer je Modul
+            semester: Semesternummer je Modul
+            ects: ECTS je Modul
+            status: Statuscode je Modul
+            note: Note je Modul (NaN ohne Prüfungsleistung)
+            datum: Prüfungsdatum als Ordinalzahl je Modul (0 ohne Prüfungsleistung)
+            art: Prüfungsart-Code je Modul (-1 ohne Prüfungsleistung)
+            ziel_note: Der Ziel-Notendurchschnitt je Studierendem (Standard: unbekannt)
+            
+        Raises:
+            ImportError: Wenn numpy nicht installiert ist
+            ValueError: Wenn die Spalten unterschiedlich lang sind
+        """
+        _pruefe_numpy()
+        self._kennungen = list(kennungen)
+        self._ects_ziel = np.asarray(ects_ziel, dtype=np.int32)
+        self._studierender = np.asarray(studierender, dtype=np.int32)
+        self._semester = np.asarray(semester, dtype=np.int16)
+        self._ects = np.asarray(ects, dtype=np.int32)
+        self._status = np.asarray(status, dtype=np.int8)
+        self._note = np.asarray(note, dtype=np.float64)
+        self._datum = np.asarray(datum, dtype=np.int32)
+        self._art = np.asarray(art, dtype=np.int8)
+        if ziel_note is None:
+            ziel_note = np.full(len(self._kennungen), np.nan)
+        self._ziel_note = np.asarray(ziel_note, dtype=np.float64)
+        self._bestandene_ects = None
+        
+        spalten = (self._semester, self._ects, self._status, self._note, self._datum, self._art)
+        if any(len(spalte) != len(self._studierender) for spalte in spalten):
+            raise ValueError("Alle Modulspalten müssen gleich lang sein")
+        if len(self._ects_ziel) != len(self._kennungen) or len(self._ziel_note) != len(self._kennungen):
+            raise ValueError("Je Studierendem werden die Ziel-ECTS und der Ziel-Durchschnitt benötigt")
+    
+    @classmethod
+    def aus_studiengaengen(cls, studiengaenge: Iterable) -> 'KohortenTabelle':
+        """
+        Erstellt die Tabelle aus Studiengängen.
+        
+        Args:
+            studiengaenge: Studiengänge oder (Kennung, Studiengang)-Paare;
+                ohne Kennung wird fortlaufend ab 1 nummeriert
+            
+        Returns:
+            Die KohortenTabelle
+            
+        Raises:
+            ImportError: Wenn numpy nicht installiert ist
+        """
+        _pruefe_numpy()
+        from domain.enums import ModulStatus, Pruefungsart
+        
+        status_codes = {status: i for i, status in enumerate(ModulStatus)}
+        art_codes = {art: i for i, art in enumerate(Pruefungsart)}
+        nan = float('nan')
+        
+        kennungen, ects_ziel, ziel_note = [], [], []
+        studierender, semester_spalte, ects, status, note, datum, art = [], [], [], [], [], [], []
+        for nummer, eintrag in enumerate(studiengaenge):
+            if isinstance(eintrag, tuple):
+                kennung, studiengang = str(eintrag[0]), eintrag[1]
+            else:
+                kennung, studiengang = str(nummer + 1), eintrag
+            kennungen.append(kennung)
+            ects_ziel.append(studiengang.gesamt_ects_ziel)
+            ziel_note.append(studiengang.ziel_notendurchschnitt)
+            for semester in studiengang.semester:
+                for modul in semester.hole_modulen():
+                    studierender.append(nummer)
+                    semester_spalte.append(semester.nummer)
+                    ects.append(modul.ects)
+                    status.append(status_codes[modul.status])
+                    pruefung = modul.hole_massgebliche_pruefungsleistung()
+                    if pruefung:
+                        note.append(pruefung.note)
+                        datum.append(pruefung.datum.toordinal())
+                        art.append(art_codes[pruefung.art])
+                    else:
+                        note.append(nan)
+                        datum.append(0)
+                        art.append(-1)
+        
+        return cls(kennungen, ects_ziel, studierender, semester_spalte, ects, status, note, datum, art,
+                   ziel_note)
+    
+    @property
+    def kennungen(self) -> List[str]:
+        """Getter für die Kennungen (gibt eine Kopie zurück)."""
+        return self._kennungen.copy()
+    
+    @property
+    def anzahl_studierende(self) -> int:
+        """Getter für die Anzahl der Studierenden."""
+        return len(self._kennungen)
+    
+    @property
+    def anzahl_module(self) -> int:
+        """Getter für die Anzahl der Module (Zeilen)."""
+        return len(self._studierender)
+    
+    @property
+    def ziel_notendurchschnitte(self) -> 'np.ndarray':
+        """Getter für den Ziel-Notendurchschnitt je Studierendem (gibt eine Kopie zurück)."""
+        return self._ziel_note.copy()
+    
+    def spalte(self, name: str) -> 'np.ndarray':
+        """
+        Gibt eine Modulspalte schreibgeschützt zurück.
+        
+        Args:
+            name: 'studierender', 'semester', 'ects', 'status', 'note', 'datum' oder 'art'
+            
+        Returns:
+            Eine schreibgeschützte Ansicht auf die Spalte
+            
+        Raises:
+            ValueError: Wenn die Spalte unbekannt ist
+        """
+        if name not in ('studierender', 'semester', 'ects', 'status', 'note', 'datum', 'art'):
+            raise ValueError(f"Unbekannte Spalte '{name}'")
+        ansicht = getattr(self, '_' + name).view()
+        ansicht.flags.writeable = False
+        return ansicht
+    
+    def _bestanden(self) -> 'np.ndarray':
+        """
+        Ermittelt die bestandenen Module.
+        
+        Returns:
+            Boolesche Maske über alle Module
+        """
+        from domain.enums import ModulStatus
+        
+        return self._status == list(ModulStatus).index(ModulStatus.BESTANDEN)
+    
+    def berechne_bestandene_ects(self) -> 'np.ndarray':
+        """
+        Berechnet die ECTS der bestandenen Module je Studierendem.
+        
+        Returns:
+            Die bestandenen ECTS je Studierendem
+        """
+        if self._bestandene_ects is None:
+            gewichte = np.where(self._bestanden(), self._ects, 0)
+            self._bestandene_ects = np.bincount(self._studierender, weights=gewichte,
+                                                minlength=self.anzahl_studierende).astype(np.int64)
+        return self._bestandene_ects.copy()
+    
+    def berechne_durchschnitte(self) -> 'np.ndarray':
+        """
+        Berechnet den gewichteten Notendurchschnitt aller Studierenden.
+        
+        Wie im Domänenmodell werden die Beiträge Note · ECTS · NOTEN_SKALA als
+        ganze Zahlen summiert; jeder Beitrag wird dazu in einen oberen und einen
+        unteren Teil zerlegt, deren Summen als float64 exakt bleiben. Liegt ein
+        Durchschnitt nahe einer Rundungsgrenze, wird er exakt mit Python-int
+        berechnet, sodass die Werte genau Studiengang.berechne_durchschnitt
+        entsprechen.
+        
+        Returns:
+            Der Durchschnitt je Studierendem (0.0 ohne bestandene Module)
+        """
+        from domain.modul import NOTEN_SKALA
+        
+        mit_note = self._bestanden() & ~np.isnan(self._note)
+        produkte = np.where(mit_note, np.nan_to_num(self._note) * self._ects, 0.0)
+        bestandene_ects = self.berechne_bestandene_ects()
+        hat_ects = bestandene_ects > 0
+        
+        if produkte.max(initial=0.0) >= 2 ** 10:
+            # Die Beiträge passen nicht mehr in int64: exakt mit Python-int summieren
+            summen = [0] * self.anzahl_studierende
+            for studierender, produkt in zip(self._studierender.tolist(), produkte.tolist()):
+                summen[studierender] += int(produkt * NOTEN_SKALA)
+            return np.array([round(summe / (int(ects) * NOTEN_SKALA), 2) if ects else 0.0
+                             for summe, ects in zip(summen, bestandene_ects.tolist())])
+        
+        beitraege = (produkte * NOTEN_SKALA).astype(np.int64)
+        obere = np.bincount(self._studierender, weights=beitraege >> 26, minlength=self.anzahl_studierende)
+        untere = np.bincount(self._studierender, weights=beitraege & (2 ** 26 - 1),
+                             minlength=self.anzahl_studierende)
+        naeherung = np.divide(obere * 2.0 ** 26 + untere, bestandene_ects * float(NOTEN_SKALA),
+                              out=np.zeros(self.anzahl_studierende), where=hat_ects)
+        durchschnitte = np.round(naeherung, 2)
+        for i in np.flatnonzero(hat_ects & _nahe_rundungsgrenze(naeherung)).tolist():
+            summe = (int(obere[i]) << 26) + int(untere[i])
+            durchschnitte[i] = round(summe / (int(bestandene_ects[i]) * NOTEN_SKALA), 2)
+        return durchschnitte
+    
+    def berechne_fortschritte(self) -> 'np.ndarray':
+        """
+        Berechnet den Studienfortschritt in Prozent aller Studierenden.
+        
+        Returns:
+            Der Fortschritt je Studierendem (0.0 - 100.0)
+        """
+        fortschritte = (self.berechne_bestandene_ects() / self._ects_ziel) * 100
+        return _runde(np.minimum(fortschritte, 100.0))
+    
+    def berechne_verbleibende_ects(self) -> 'np.ndarray':
+        """
+        Berechnet die verbleibenden ECTS aller Studierenden.
+        
+        Returns:
+            Die verbleibenden ECTS je Studierendem
+        """
+        return np.maximum(0, self._ects_ziel - self.berechne_bestandene_ects())
+    
+    def finde_studierenden(self, kennung: str) -> Optional[int]:
+        """
+        Sucht die Nummer eines Studierenden.
+        
+        Args:
+            kennung: Die Kennung
+            
+        Returns:
+            Die Studierenden-Nummer (Index in den Ergebnis-Arrays) oder None
+        """
+        try:
+            return self._kennungen.index(kennung)
+        except ValueError:
+            return None
+    
+    def __len__(self) -> int:
+        """Anzahl der Module (Zeilen)."""
+        return self.anzahl_module
+    
+    def __str__(self) -> str:
+        """String-Repräsentation der Tabelle."""
+        return f"KohortenTabelle ({self.anzahl_studierende} Studierende, {self.anzahl_module} Module)"
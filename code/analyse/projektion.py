@@ -0,0 +1,371 @@
+"""
+Notenprojektion für ganze Kohorten.
+
+Je Studierendem wird berechnet, welchen Durchschnitt die verbleibenden ECTS
+höchstens haben dürfen, damit der Ziel-Notendurchschnitt erreicht wird. Die
+Verteilung der Abschlussnote wird aus historischen Noten per Monte-Carlo-
+Simulation geschätzt; die Simulation ist vektorisiert und kann auf mehrere
+Prozesse verteilt werden.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence
+
+from .kohorten_tabelle import KohortenTabelle, _pruefe_numpy, np
+
+# Obergrenze der gleichzeitig gezogenen Noten je Block (begrenzt den Speicherbedarf)
+ZIEHUNGEN_PRO_BLOCK = 2 ** 22
+
+# Höchstgröße der Ziehungstabelle einer NotenVerteilung
+TABELLEN_GROESSE = 2 ** 16
+
+
+class NotenVerteilung:
+    """
+    Empirische Verteilung historischer Noten bestandener Module.
+    
+    Gezogen wird über eine Tabelle, in der jede Note entsprechend ihrem Anteil
+    vorkommt; eine Ziehung ist damit ein gleichverteilter Index statt einer
+    Suche in der Verteilungsfunktion. Bei mehr als TABELLEN_GROESSE gekürzten
+    Beobachtungen werden die Anteile auf die Tabellengröße gerundet.
+    
+    Attributes:
+        _noten: Die vorkommenden Noten (aufsteigend)
+        _anteile: Der Anteil jeder Note
+        _tabelle: Die Ziehungstabelle
+    """
+    
+    def __init__(self, noten: Iterable[float]):
+        """
+        Initialisiert die NotenVerteilung aus beobachteten Noten.
+        
+        Args:
+            noten: Die historischen Noten (NaN und Noten über 4.0 werden ignoriert)
+        
+        Raises:
+            ImportError: Wenn numpy nicht installiert ist
+            ValueError: Wenn keine bestandene Note vorhanden ist
+        """
+        _pruefe_numpy()
+        werte = np.fromiter(noten, dtype=np.float64)
+        werte = werte[(werte >= 1.0) & (werte <= 4.0)]
+        if not len(werte):
+            raise ValueError("Für die Notenverteilung wird mindestens eine bestandene Note benötigt")
+        self._noten, anzahl = np.unique(werte, return_counts=True)
+        self._anteile = anzahl / anzahl.sum()
+        
+        anzahl = anzahl // np.gcd.reduce(anzahl)
+        if anzahl.sum() > TABELLEN_GROESSE:
+            # Größte-Reste-Verfahren: die Summe bleibt genau TABELLEN_GROESSE
+            exakt = self._anteile * TABELLEN_GROESSE
+            anzahl = np.floor(exakt).astype(np.int64)
+            reste = np.argsort(anzahl - exakt)[:TABELLEN_GROESSE - anzahl.sum()]
+            anzahl[reste] += 1
+        self._tabelle = np.repeat(self._noten, anzahl)
+    
+    @classmethod
+    def aus_tabelle(cls, tabelle: KohortenTabelle) -> 'NotenVerteilung':
+        """
+        Erstellt die Verteilung aus den bestandenen Modulen einer Kohorte.
+        
+        Args:
+            tabelle: Die KohortenTabelle
+        
+        Returns:
+            Die NotenVerteilung
+        """
+        from domain.enums import ModulStatus
+        
+        bestanden = tabelle.spalte('status') == list(ModulStatus).index(ModulStatus.BESTANDEN)
+        return cls(tabelle.spalte('note')[bestanden])
+    
+    @property
+    def noten(self) -> 'np.ndarray':
+        """Getter für die vorkommenden Noten (gibt eine Kopie zurück)."""
+        return self._noten.copy()
+    
+    @property
+    def anteile(self) -> 'np.ndarray':
+        """Getter für die Anteile der Noten (gibt eine Kopie zurück)."""
+        return self._anteile.copy()
+    
+    @property
+    def mittelwert(self) -> float:
+        """Getter für die mittlere Note."""
+        return float(self._noten @ self._anteile)
+    
+    def ziehe(self, generator: 'np.random.Generator', form) -> 'np.ndarray':
+        """
+        Zieht Noten gemäß der Verteilung.
+        
+        Args:
+            generator: Der Zufallsgenerator
+            form: Die Form des Ergebnis-Arrays
+        
+        Returns:
+            Die gezogenen Noten
+        """
+        return self._tabelle[generator.integers(0, len(self._tabelle), size=form, dtype=np.int32)]
+    
+    def __len__(self) -> int:
+        """Anzahl der verschiedenen Noten."""
+        return len(self._noten)
+    
+    def __str__(self) -> str:
+        """String-Repräsentation der Verteilung."""
+        return f"NotenVerteilung ({len(self)} Notenstufen, Mittelwert {self.mittelwert:.2f})"
+
+
+class SimulationsErgebnis:
+    """
+    Ergebnis einer Monte-Carlo-Simulation der Abschlussnoten.
+    
+    Attributes:
+        _kennungen: Die Kennungen der Studierenden
+        _simulationen: Die Anzahl der Simulationsläufe
+        _mittelwerte: Die mittlere Abschlussnote je Studierendem
+        _quantile: Die Abschlussnote je Quantil (Zeile) und Studierendem (Spalte)
+        _stufen: Die Quantilstufen in der Reihenfolge der Zeilen
+        _wahrscheinlichkeiten: Der Anteil der Läufe, in denen das Ziel erreicht wird
+    """
+    
+    def __init__(self, kennungen: List[str], simulationen: int, mittelwerte, quantile,
+                 stufen: Sequence[float], wahrscheinlichkeiten):
+        """
+        Initialisiert das SimulationsErgebnis.
+        
+        Args:
+            kennungen: Die Kennungen der Studierenden
+            simulationen: Die Anzahl der Simulationsläufe
+            mittelwerte: Die mittlere Abschlussnote je Studierendem
+            quantile: Die Abschlussnoten je Quantilstufe und Studierendem
+            stufen: Die Quantilstufen
+            wahrscheinlichkeiten: Der Anteil der Läufe mit erreichtem Ziel je Studierendem
+        """
+        self._kennungen = kennungen
+        self._simulationen = simulationen
+        self._mittelwerte = mittelwerte
+        self._quantile = quantile
+        self._stufen = tuple(stufen)
+        self._wahrscheinlichkeiten = wahrscheinlichkeiten
+    
+    @property
+    def kennungen(self) -> List[str]:
+        """Getter für die Kennungen (gibt eine Kopie zurück)."""
+        return self._kennungen.copy()
+    
+    @property
+    def simulationen(self) -> int:
+        """Getter für die Anzahl der Simulationsläufe."""
+        return self._simulationen
+    
+    @property
+    def mittelwerte(self) -> 'np.ndarray':
+        """Getter für die mittlere Abschlussnote je Studierendem (gibt eine Kopie zurück)."""
+        return self._mittelwerte.copy()
+    
+    @property
+    def wahrscheinlichkeiten(self) -> 'np.ndarray':
+        """Getter für die Wahrscheinlichkeit, das Ziel zu erreichen (NaN ohne Ziel)."""
+        return self._wahrscheinlichkeiten.copy()
+    
+    def quantil(self, stufe: float) -> 'np.ndarray':
+        """
+        Gibt die Abschlussnote einer Quantilstufe je Studierendem zurück.
+        
+        Args:
+            stufe: Eine der simulierten Quantilstufen, z.B. 0.9
+        
+        Returns:
+            Die Abschlussnote, die in diesem Anteil der Läufe nicht überschritten wird
+        
+        Raises:
+            ValueError: Wenn die Stufe nicht simuliert wurde
+        """
+        if stufe not in self._stufen:
+            raise ValueError(f"Quantil {stufe} wurde nicht simuliert (verfügbar: {self._stufen})")
+        return self._quantile[self._stufen.index(stufe)].copy()
+    
+    def __len__(self) -> int:
+        """Anzahl der Studierenden."""
+        return len(self._kennungen)
+    
+    def __str__(self) -> str:
+        """String-Repräsentation des Ergebnisses."""
+        return f"SimulationsErgebnis ({len(self)} Studierende, {self._simulationen} Läufe)"
+
+
+def _simuliere_block(verteilung: NotenVerteilung, summen, bestanden, verbleibend, ziele,
+                     simulationen: int, modul_ects: int, stufen: Sequence[float], saat) -> tuple:
+    """
+    Simuliert die Abschlussnoten eines Blocks von Studierenden.
+    
+    Die verbleibenden ECTS jedes Studierenden werden in Module zu modul_ects
+    aufgeteilt (das letzte ggf. kleiner); für alle Module aller Läufe werden die
+    Noten in einem Aufruf gezogen und je Studierendem gewichtet summiert.
+    Die Funktion liegt auf Modulebene, damit sie in einem Prozess-Pool läuft.
+    
+    Args:
+        verteilung: Die NotenVerteilung
+        summen: Summe Note · ECTS der bestandenen Module je Studierendem
+        bestanden: Die bestandenen ECTS je Studierendem
+        verbleibend: Die verbleibenden ECTS je Studierendem
+        ziele: Der Ziel-Notendurchschnitt je Studierendem
+        simulationen: Die Anzahl der Simulationsläufe
+        modul_ects: Die ECTS eines simulierten Moduls
+        stufen: Die zu berechnenden Quantilstufen
+        saat: Startwert des Zufallsgenerators (SeedSequence)
+    
+    Returns:
+        (Mittelwerte, Quantile, Wahrscheinlichkeiten) des Blocks
+    """
+    generator = np.random.default_rng(saat)
+    anzahl_module = -(-verbleibend // modul_ects)
+    besitzer = np.repeat(np.arange(len(verbleibend)), anzahl_module)
+    gewichte = np.full(len(besitzer), modul_ects, dtype=np.float64)
+    enden = np.cumsum(anzahl_module)
+    offen = anzahl_module > 0
+    gewichte[enden[offen] - 1] = verbleibend[offen] - (anzahl_module[offen] - 1) * modul_ects
+    
+    summen_gesamt = np.broadcast_to(summen.astype(np.float64), (simulationen, len(summen))).copy()
+    if len(besitzer):
+        gezogen = verteilung.ziehe(generator, (simulationen, len(besitzer))) * gewichte
+        summen_gesamt[:, offen] += np.add.reduceat(gezogen, (enden - anzahl_module)[offen], axis=1)
+    abschluss = summen_gesamt / (bestanden + verbleibend)
+        
+    erreicht = abschluss <= ziele + 1e-9
+    wahrscheinlichkeiten = np.where(np.isnan(ziele), np.nan, erreicht.mean(axis=0))
+    return abschluss.mean(axis=0), np.quantile(abschluss, stufen, axis=0), wahrscheinlichkeiten
+
+
+class NotenProjektion:
+    """
+    Projektion der Abschlussnoten einer Kohorte.
+    
+    Attributes:
+        _tabelle: Die zugrunde liegende KohortenTabelle
+        _summen: Summe Note · ECTS der bestandenen Module je Studierendem
+        _bestanden: Die bestandenen ECTS je Studierendem
+        _verbleibend: Die verbleibenden ECTS je Studierendem
+        _ziele: Der Ziel-Notendurchschnitt je Studierendem
+    """
+    
+    def __init__(self, tabelle: KohortenTabelle):
+        """
+        Initialisiert die NotenProjektion.
+        
+        Args:
+            tabelle: Die KohortenTabelle (mit Ziel-Notendurchschnitten)
+        """
+        from domain.enums import ModulStatus
+        
+        self._tabelle = tabelle
+        note = tabelle.spalte('note')
+        mit_note = ((tabelle.spalte('status') == list(ModulStatus).index(ModulStatus.BESTANDEN))
+                    & ~np.isnan(note))
+        self._summen = np.bincount(tabelle.spalte('studierender'),
+                                   weights=np.where(mit_note, np.nan_to_num(note) * tabelle.spalte('ects'), 0.0),
+                                   minlength=tabelle.anzahl_studierende)
+        self._bestanden = tabelle.berechne_bestandene_ects()
+        self._verbleibend = tabelle.berechne_verbleibende_ects()
+        self._ziele = tabelle.ziel_notendurchschnitte
+    
+    @classmethod
+    def aus_studiengaengen(cls, studiengaenge: Iterable) -> 'NotenProjektion':
+        """
+        Erstellt die Projektion direkt aus Studiengängen.
+        
+        Args:
+            studiengaenge: Studiengänge oder (Kennung, Studiengang)-Paare
+        
+        Returns:
+            Die NotenProjektion
+        """
+        return cls(KohortenTabelle.aus_studiengaengen(studiengaenge))
+    
+    @property
+    def tabelle(self) -> KohortenTabelle:
+        """Getter für die KohortenTabelle."""
+        return self._tabelle
+    
+    def berechne_benoetigte_durchschnitte(self) -> 'np.ndarray':
+        """
+        Berechnet je Studierendem den schlechtesten noch erlaubten Durchschnitt der verbleibenden ECTS.
+        
+        Entspricht Studiengang.berechne_benoetigten_durchschnitt für alle
+        Studierenden in einem Durchgang.
+        
+        Returns:
+            Der erlaubte Durchschnitt, auf zwei Nachkommastellen abgerundet
+            (NaN ohne verbleibende ECTS oder ohne Ziel; unter 1.0 ist das Ziel
+            nicht mehr erreichbar, ab 4.0 genügt jede bestandene Note)
+        """
+        gesamt = self._bestanden + self._verbleibend
+        erlaubt = np.divide(self._ziele * gesamt - self._summen, self._verbleibend,
+                            out=np.full(len(gesamt), np.nan), where=self._verbleibend > 0)
+        return np.floor(np.round(erlaubt * 100, 6)) / 100
+    
+    def simuliere(self, verteilung: Optional[NotenVerteilung] = None, simulationen: int = 1000,
+                  modul_ects: int = 5, stufen: Sequence[float] = (0.1, 0.5, 0.9),
+                  saat: Optional[int] = None, prozesse: Optional[int] = None) -> SimulationsErgebnis:
+        """
+        Simuliert die Verteilung der Abschlussnoten aller Studierenden.
+        
+        Die Studierenden werden in Blöcke aufgeteilt, die nacheinander oder mit
+        prozesse > 1 in einem Prozess-Pool simuliert werden. Jeder Block erhält
+        einen eigenen Zufallsstrom aus der Saat, daher ist das Ergebnis bei
+        gleicher Saat unabhängig von der Anzahl der Prozesse.
+        
+        Args:
+            verteilung: Die Notenverteilung (Standard: die Noten der Kohorte selbst)
+            simulationen: Die Anzahl der Simulationsläufe
+            modul_ects: Die ECTS eines noch offenen Moduls
+            stufen: Die zu berechnenden Quantilstufen
+            saat: Startwert für reproduzierbare Ergebnisse
+            prozesse: Die Anzahl der Prozesse (None oder 1 = im aktuellen Prozess)
+        
+        Returns:
+            Das SimulationsErgebnis
+        
+        Raises:
+            ValueError: Wenn simulationen oder modul_ects kleiner als 1 sind
+        """
+        if simulationen < 1:
+            raise ValueError("Es wird mindestens ein Simulationslauf benötigt")
+        if modul_ects < 1:
+            raise ValueError("Ein Modul muss mindestens 1 ECTS haben")
+        if verteilung is None:
+            verteilung = NotenVerteilung.aus_tabelle(self._tabelle)
+        
+        anzahl = self._tabelle.anzahl_studierende
+        module_je_studierendem = max(1, -(-int(self._verbleibend.max(initial=0)) // modul_ects))
+        blockgroesse = max(1, ZIEHUNGEN_PRO_BLOCK // (simulationen * module_je_studierendem))
+        grenzen = list(range(0, anzahl, blockgroesse))
+        saaten = np.random.SeedSequence(saat).spawn(len(grenzen))
+        bloecke = [
+            (verteilung, self._summen[start:start + blockgroesse],
+             self._bestanden[start:start + blockgroesse], self._verbleibend[start:start + blockgroesse],
+             self._ziele[start:start + blockgroesse], simulationen, modul_ects, stufen, block_saat)
+            for start, block_saat in zip(grenzen, saaten)
+        ]
+        
+        if prozesse is not None and prozesse > 1 and len(bloecke) > 1:
+            with ProcessPoolExecutor(max_workers=prozesse) as executor:
+                ergebnisse = list(executor.map(_simuliere_block, *zip(*bloecke)))
+        else:
+            ergebnisse = [_simuliere_block(*block) for block in bloecke]
+        
+        if ergebnisse:
+            mittelwerte, quantile, wahrscheinlichkeiten = zip(*ergebnisse)
+            mittelwerte = np.concatenate(mittelwerte)
+            quantile = np.concatenate(quantile, axis=1)
+            wahrscheinlichkeiten = np.concatenate(wahrscheinlichkeiten)
+        else:
+            mittelwerte = wahrscheinlichkeiten = np.zeros(0)
+            quantile = np.zeros((len(stufen), 0))
+        return SimulationsErgebnis(self._tabelle.kennungen, simulationen, mittelwerte, quantile,
+                                   stufen, wahrscheinlichkeiten)
+    
+    def __str__(self) -> str:
+        """String-Repräsentation der Projektion."""
+        return f"NotenProjektion ({self._tabelle.anzahl_studierende} Studierende)"
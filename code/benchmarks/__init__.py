@@ -0,0 +1,63 @@
+"""
+Benchmark-Paket für das Studien-Dashboard.
+
+Die Benchmarks werden aus dem Verzeichnis code/ gestartet, z.B.:
+    python -m benchmarks.speichern
+"""
+
+from datetime import date
+
+from domain import Studiengang, Modul, Pruefungsleistung
+from domain.enums import Abschluss, ModulStatus, Pruefungsart
+
+
+def erstelle_grossen_studiengang(anzahl_module: int = 1000, gesamtdauer: int = 6) -> Studiengang:
+    """
+    Erstellt einen Studiengang mit vielen Modulen für Messungen.
+    
+    Jedes zweite Modul hat eine Prüfungsleistung, die übrigen sind offen
+    oder angemeldet.
+    
+    Args:
+        anzahl_module: Die Anzahl der Module
+        gesamtdauer: Die Anzahl der Semester
+        
+    Returns:
+        Der erstellte Studiengang
+    """
+    studiengang = Studiengang("Benchmark", Abschluss.BACHELOR, gesamtdauer, 2.0, gesamtdauer)
+    semester_liste = studiengang.semester
+    arten = list(Pruefungsart)
+    for i in range(anzahl_module):
+        semester_nr = i % gesamtdauer + 1
+        modul = Modul(f"BM{i:06d}", f"Benchmark-Modul {i}", 5, semester_nr)
+        if i % 2 == 0:
+            note = 1.0 + (i % 31) / 10
+            modul.setze_pruefungsleistung(
+                Pruefungsleistung(note, date(2024, 1 + i % 12, 1 + i % 28), 1, arten[i % len(arten)])
+            )
+        elif i % 4 == 1:
+            modul.status = ModulStatus.ANGEMELDET
+        semester_liste[semester_nr - 1].fuege_modul_hinzu(modul)
+    return studiengang
+
+
+def miss(funktion, wiederholungen: int = 5) -> float:
+    """
+    Misst die beste Laufzeit einer Funktion in Sekunden.
+    
+    Args:
+        funktion: Die zu messende Funktion ohne Argumente
+        wiederholungen: Die Anzahl der Messungen
+        
+    Returns:
+        Die kürzeste gemessene Laufzeit in Sekunden
+    """
+    import time
+    
+    beste = float('inf')
+    for _ in range(wiederholungen):
+        start = time.perf_counter()
+        funktion()
+        beste = min(beste, time.perf_counter() - start)
+    return beste
@@ -0,0 +1,67 @@
+"""
+Benchmark: Kosten der Änderungsverfolgung auf dem Schreibpfad.
+
+Gemessen werden Statuswechsel und Notenänderungen an 10.000 Modulen, jeweils
+ohne Änderungsverfolgung (Vergleichswert), mit Änderungsverfolgung und mit
+einem zusätzlich registrierten Beobachter.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.aenderungen
+"""
+
+from datetime import date
+
+from domain import Modul, Pruefungsleistung, Semester, Studiengang
+from domain.enums import ModulStatus, Pruefungsart
+
+from . import erstelle_grossen_studiengang, miss
+
+
+def aendere_alle(module) -> None:
+    """Wechselt den Status jedes Moduls hin und zurück und ändert dessen Note."""
+    for modul in module:
+        alter_status = modul.status
+        modul.status = ModulStatus.ANGEMELDET
+        modul.status = alter_status
+        pruefung = modul.hole_pruefungsleistung()
+        if pruefung:
+            pruefung.note = pruefung.note
+
+
+def ohne_verfolgung(funktion) -> float:
+    """Misst die Funktion mit deaktivierter Änderungsverfolgung."""
+    originale = [(klasse, klasse._markiere_geaendert)
+                 for klasse in (Pruefungsleistung, Modul, Semester, Studiengang)]
+    for klasse, _ in originale:
+        klasse._markiere_geaendert = lambda self, objekt=None: None
+    try:
+        return miss(funktion, 10)
+    finally:
+        for klasse, methode in originale:
+            klasse._markiere_geaendert = methode
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    studiengang = erstelle_grossen_studiengang(10000)
+    module = studiengang.hole_alle_modulen()
+    for modul in module[::2]:
+        if modul.hole_pruefungsleistung() is None:
+            modul.setze_pruefungsleistung(Pruefungsleistung(2.3, date(2024, 2, 1), 1, Pruefungsart.KLAUSUR))
+    
+    ohne = ohne_verfolgung(lambda: aendere_alle(module))
+    mit = miss(lambda: aendere_alle(module), 10)
+    zaehler = []
+    studiengang.registriere_beobachter(zaehler.append)
+    beobachtet = miss(lambda: aendere_alle(module), 10)
+    studiengang.entferne_beobachter(zaehler.append)
+    
+    print("Statuswechsel und Notenänderungen an 10.000 Modulen:")
+    print(f"  {'Ohne Verfolgung':<22} {ohne * 1000:9.2f} ms")
+    print(f"  {'Mit Verfolgung':<22} {mit * 1000:9.2f} ms  ({(mit / ohne - 1) * 100:+.0f}%)")
+    print(f"  {'Mit Beobachter':<22} {beobachtet * 1000:9.2f} ms  ({(beobachtet / ohne - 1) * 100:+.0f}%)")
+    print(f"\nGeänderte Objekte seit dem Anlegen: {len(studiengang.hole_geaenderte_objekte())}")
+
+
+if __name__ == "__main__":
+    main()
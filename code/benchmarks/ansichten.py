@@ -0,0 +1,71 @@
+"""
+Benchmark: Speicherbelegung beim Durchlaufen mit Listenkopien vs. Ansichten.
+
+Die Variante "Kopie" bildet das bisherige Verhalten der Getter nach
+(semester, hole_modulen und hole_alle_modulen lieferten Kopien).
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.ansichten
+"""
+
+import tracemalloc
+
+from . import erstelle_grossen_studiengang, miss
+
+
+def durchlauf_kopie(studiengang) -> int:
+    """Durchläuft Semester und Module wie bisher über kopierte Listen."""
+    anzahl = 0
+    for semester in list(studiengang.semester):
+        for modul in list(semester.hole_modulen()):
+            anzahl += modul.ects
+    alle_module = []
+    for semester in list(studiengang.semester):
+        alle_module.extend(list(semester.hole_modulen()))
+    for modul in alle_module:
+        anzahl += 1
+    return anzahl
+
+
+def durchlauf_ansicht(studiengang) -> int:
+    """Durchläuft Semester und Module über Ansichten und iter_alle_module."""
+    anzahl = 0
+    for semester in studiengang.semester:
+        for modul in semester.hole_modulen():
+            anzahl += modul.ects
+    for modul in studiengang.iter_alle_module():
+        anzahl += 1
+    return anzahl
+
+
+def spitzen_speicher(funktion) -> int:
+    """
+    Misst den zusätzlichen Spitzenspeicher eines Aufrufs.
+    
+    Args:
+        funktion: Die zu messende Funktion ohne Argumente
+        
+    Returns:
+        Die Spitzenbelegung in Bytes
+    """
+    tracemalloc.start()
+    funktion()
+    _, spitze = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return spitze
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    studiengang = erstelle_grossen_studiengang(10000)
+    
+    print("Ein Dashboard-Durchlauf (10.000 Module):")
+    print(f"  {'Variante':<10} {'Spitzenspeicher':>16} {'Laufzeit':>12}")
+    for name, funktion in (("Kopie", durchlauf_kopie), ("Ansicht", durchlauf_ansicht)):
+        spitze = spitzen_speicher(lambda: funktion(studiengang))
+        dauer = miss(lambda: funktion(studiengang), 20)
+        print(f"  {name:<10} {spitze / 1024:13.1f} KB {dauer * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
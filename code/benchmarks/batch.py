@@ -0,0 +1,85 @@
+"""
+Benchmark: Befehle einzeln mit Speichern vs. im Batch-Modus.
+
+Auf einem großen Studiengang werden Noten für alle nicht bestandenen Module
+eingetragen und neue Module mit Note angelegt. Einzeln wird jede Änderung wie
+im Menü angewendet, protokolliert und sofort im Journal gespeichert; im
+Batch-Modus werden dieselben Befehle als Textzeilen über BatchVerarbeitung
+geprüft, gesammelt angewendet und einmal gespeichert.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.batch
+"""
+
+import os
+import tempfile
+import time
+from datetime import date
+
+from domain import Modul, Pruefungsleistung
+from domain.enums import ModulStatus, Pruefungsart
+from gui import BatchVerarbeitung
+from persistence import JournalDatenManager
+
+from . import erstelle_grossen_studiengang
+
+
+def erstelle_befehle(studiengang, neue_module: int) -> list:
+    """Erstellt Notenbefehle für alle nicht bestandenen Module und neue Module mit Note."""
+    befehle = [f"note {modul.modulcode} {1.0 + (i % 31) / 10:.1f} 2025-02-15"
+               for i, modul in enumerate(studiengang.iter_alle_module())
+               if modul.status != ModulStatus.BESTANDEN]
+    for i in range(neue_module):
+        befehle.append(f'modul {i % len(studiengang.semester) + 1} NEU{i:06d} 5 "Neues Modul {i}"')
+        befehle.append(f"note NEU{i:06d} 2.0 2025-02-15")
+    return befehle
+
+
+def einzeln(studiengang, daten_manager, befehle) -> None:
+    """Wendet die Befehle einzeln an und speichert nach jedem Befehl."""
+    semester_liste = studiengang.semester
+    for zeile in befehle:
+        teile = zeile.split(maxsplit=4)
+        if teile[0] == "modul":
+            semester_nummer = int(teile[1])
+            modul = Modul(teile[2], teile[4].strip('"'), int(teile[3]), semester_nummer)
+            semester_liste[semester_nummer - 1].fuege_modul_hinzu(modul)
+            daten_manager.protokolliere_modul_hinzugefuegt(semester_nummer, modul)
+        else:
+            modul = studiengang.finde_modul(teile[1])
+            modul.setze_pruefungsleistung(Pruefungsleistung(
+                float(teile[2]), date.fromisoformat(teile[3]), 1, Pruefungsart.KLAUSUR))
+            daten_manager.protokolliere_pruefungsleistung(modul)
+        daten_manager.speichere_studiengang(studiengang)
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        ergebnisse = {}
+        for name in ("einzeln", "batch"):
+            studiengang = erstelle_grossen_studiengang(10000)
+            befehle = erstelle_befehle(studiengang, 1000)
+            daten_manager = JournalDatenManager(os.path.join(verzeichnis, f"{name}.pkl"))
+            daten_manager.meldungen = False
+            daten_manager.speichere_studiengang(studiengang)
+            
+            start = time.perf_counter()
+            if name == "einzeln":
+                einzeln(studiengang, daten_manager, befehle)
+            else:
+                BatchVerarbeitung(studiengang, daten_manager).fuehre_aus(befehle)
+            dauer = time.perf_counter() - start
+            
+            geladen = JournalDatenManager(daten_manager.datei_pfad)
+            geladen.meldungen = False
+            ergebnisse[name] = (dauer, geladen.lade_studiengang().berechne_durchschnitt())
+    
+    print(f"{len(befehle)} Befehle (Noten für 5.000 Module, 1.000 neue Module mit Note), Journal:")
+    for name, (dauer, durchschnitt) in ergebnisse.items():
+        print(f"  {name:<8} {dauer * 1000:9.1f} ms  {len(befehle) / dauer:9,.0f} Befehle/s  "
+              f"Ø nach Laden {durchschnitt}")
+
+
+if __name__ == "__main__":
+    main()
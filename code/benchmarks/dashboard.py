@@ -0,0 +1,82 @@
+"""
+Benchmark: Dashboard zeilenweise vs. gepuffert ausgeben.
+
+Für einen Studiengang mit 1.000 Modulen wird das Dashboard in ein
+zeilengepuffertes Ziel geschrieben (wie ein Terminal), einmal mit einem
+print()-Aufruf je Zeile wie bisher und einmal über DashboardView mit einem
+einzigen Schreibaufruf. Gezählt werden zusätzlich die write()-Aufrufe auf dem
+darunterliegenden Datei-Objekt, die bei einem Terminal oder über SSH jeweils
+einzeln übertragen werden.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.dashboard
+"""
+
+import io
+import os
+import time
+
+from gui.dashboard_view import DashboardView
+
+from . import erstelle_grossen_studiengang
+
+
+class _ZaehlendeDatei(io.FileIO):
+    """Datei-Objekt, das die write()-Aufrufe zählt."""
+    
+    def __init__(self, *args, **kwargs):
+        """Öffnet die Datei und setzt den Zähler zurück."""
+        super().__init__(*args, **kwargs)
+        self.schreibaufrufe = 0
+    
+    def write(self, daten):
+        """Zählt den Aufruf und schreibt die Daten."""
+        self.schreibaufrufe += 1
+        return super().write(daten)
+
+
+def _oeffne_terminal():
+    """Öffnet ein zeilengepuffertes Textziel wie sys.stdout an einem Terminal."""
+    roh = _ZaehlendeDatei(os.devnull, 'w')
+    return roh, io.TextIOWrapper(io.BufferedWriter(roh), encoding='utf-8', line_buffering=True)
+
+
+def zeilenweise(view: DashboardView, ziel) -> None:
+    """Gibt das Dashboard wie bisher mit einem print() je Zeile aus."""
+    for zeile in view.rendere_dashboard().splitlines():
+        print(zeile, file=ziel)
+
+
+def gepuffert(view: DashboardView, ziel) -> None:
+    """Gibt das Dashboard mit einem einzigen Schreibaufruf aus."""
+    view.ausgabe = ziel
+    view.zeige_dashboard()
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    view = DashboardView(erstelle_grossen_studiengang(1000))
+    zeilen = len(view.rendere_dashboard().splitlines())
+    
+    print(f"Dashboard für 1.000 Module ({zeilen} Zeilen):")
+    for name, ausgeben in (("zeilenweise", zeilenweise), ("gepuffert", gepuffert)):
+        beste = float('inf')
+        for _ in range(20):
+            roh, ziel = _oeffne_terminal()
+            start = time.perf_counter()
+            ausgeben(view, ziel)
+            beste = min(beste, time.perf_counter() - start)
+            schreibaufrufe = roh.schreibaufrufe
+            ziel.close()
+        print(f"  {name:<12} {beste * 1000:7.2f} ms  {schreibaufrufe:5} write()-Aufrufe")
+    
+    beste = float('inf')
+    for _ in range(20):
+        start = time.perf_counter()
+        view.rendere_dashboard()
+        beste = min(beste, time.perf_counter() - start)
+    print(f"  {'nur aufbauen':<12} {beste * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: Dashboard ohne vs. mit Zwischenspeicher aufbauen.
+
+Für einen Studiengang mit 10.000 Modulen wird das Dashboard wiederholt
+aufgebaut: einmal jedes Mal mit einer neuen DashboardView (kein
+Zwischenspeicher), einmal mit derselben DashboardView ohne Änderung dazwischen
+und einmal mit derselben DashboardView nach je einer neuen Note.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.dashboard_cache
+"""
+
+import time
+from datetime import date
+
+from domain import Pruefungsleistung
+from domain.enums import ModulStatus, Pruefungsart
+from gui.dashboard_view import DashboardView
+
+from . import erstelle_grossen_studiengang
+
+WIEDERHOLUNGEN = 50
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    studiengang = erstelle_grossen_studiengang(10000)
+    offene = [modul for modul in studiengang.iter_alle_module() if modul.status != ModulStatus.BESTANDEN]
+    view = DashboardView(studiengang)
+    
+    def ohne_zwischenspeicher(_):
+        DashboardView(studiengang).rendere_dashboard()
+    
+    def unveraendert(_):
+        view.rendere_dashboard()
+    
+    def nach_neuer_note(i):
+        offene[i].setze_pruefungsleistung(
+            Pruefungsleistung(1.0 + (i % 31) / 10, date(2025, 2, 15), 1, Pruefungsart.KLAUSUR))
+        view.rendere_dashboard()
+    
+    print(f"Dashboard für 10.000 Module, je Aufruf (bester von {WIEDERHOLUNGEN}):")
+    view.rendere_dashboard()
+    for name, aufruf in (("ohne Zwischenspeicher", ohne_zwischenspeicher),
+                         ("unverändert", unveraendert),
+                         ("nach neuer Note", nach_neuer_note)):
+        beste = float('inf')
+        for i in range(WIEDERHOLUNGEN):
+            start = time.perf_counter()
+            aufruf(i)
+            beste = min(beste, time.perf_counter() - start)
+        print(f"  {name:<22} {beste * 1000:8.3f} ms")
+    
+    assert view.rendere_dashboard() == DashboardView(studiengang).rendere_dashboard()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark: Kennzahlen einer Kohorte je Studiengang vs. vektorisiert (numpy).
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.kohorte
+"""
+
+import time
+
+from . import erstelle_grossen_studiengang, miss
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    try:
+        from analyse import KohortenTabelle
+        KohortenTabelle.aus_studiengaengen([])
+    except ImportError as e:
+        print(f"ℹ {e}")
+        return
+    
+    studierende = 10000
+    kohorte = [erstelle_grossen_studiengang(36) for _ in range(studierende)]
+    
+    def skalar():
+        return [(s.berechne_durchschnitt(), s.berechne_fortschritt(), s.berechne_verbleibende_ects())
+                for s in kohorte]
+    
+    start = time.perf_counter()
+    tabelle = KohortenTabelle.aus_studiengaengen(kohorte)
+    aufbau = time.perf_counter() - start
+    
+    def vektorisiert():
+        return (tabelle.berechne_durchschnitte(), tabelle.berechne_fortschritte(),
+                tabelle.berechne_verbleibende_ects())
+    
+    print(f"Kohorte mit {studierende} Studierenden ({tabelle.anzahl_module} Module):")
+    print(f"  Tabelle aufbauen (einmalig):  {aufbau * 1000:8.1f} ms")
+    print(f"  je Studiengang (Domäne):      {miss(skalar) * 1000:8.1f} ms")
+    print(f"  vektorisiert (KohortenTabelle): {miss(vektorisiert) * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Benchmark: Dateigröße, Speicher- und Ladezeit je Kompressionsverfahren.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.kompression
+"""
+
+import os
+import tempfile
+
+from persistence import DatenManager
+from persistence.kompression import KOMPRESSIONEN
+from . import erstelle_grossen_studiengang, miss
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    studiengang = erstelle_grossen_studiengang(10000)
+    
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        print("Kompression (10.000 Module):")
+        print(f"  {'Verfahren':<10} {'Größe':>12} {'Speichern':>12} {'Laden':>12}")
+        for verfahren in [None] + list(KOMPRESSIONEN):
+            pfad = os.path.join(verzeichnis, f"studiengang_{verfahren}.pkl")
+            daten_manager = DatenManager(pfad, kompression=verfahren)
+            daten_manager.meldungen = False
+            speichern = miss(lambda: daten_manager.speichere_studiengang(studiengang), 3)
+            laden = miss(daten_manager.lade_studiengang, 3)
+            groesse = os.path.getsize(pfad)
+            print(f"  {verfahren or 'keine':<10} {groesse / 1024:9.1f} KB {speichern * 1000:9.1f} ms "
+                  f"{laden * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
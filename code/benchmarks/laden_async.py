@@ -0,0 +1,49 @@
+"""
+Benchmark: Kohorte nacheinander vs. nebenläufig mit asyncio laden.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.laden_async
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from persistence import DatenManager, lade_studiengaenge_async
+from persistence.asynchron import _lade_datei
+from . import erstelle_grossen_studiengang
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    anzahl = 200
+    gleichzeitig = 16
+    studiengang = erstelle_grossen_studiengang(500)
+    
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        pfade = [os.path.join(verzeichnis, f"student_{i:04d}.pkl") for i in range(anzahl)]
+        for pfad in pfade:
+            daten_manager = DatenManager(pfad)
+            daten_manager.meldungen = False
+            daten_manager.speichere_studiengang(studiengang)
+        
+        print(f"{anzahl} Studiengänge à 500 Module laden ({os.cpu_count()} CPU-Kerne):")
+        start = time.perf_counter()
+        for pfad in pfade:
+            _lade_datei(pfad)
+        print(f"  nacheinander:           {(time.perf_counter() - start) * 1000:8.1f} ms")
+        
+        start = time.perf_counter()
+        asyncio.run(lade_studiengaenge_async(pfade, max_gleichzeitig=gleichzeitig))
+        print(f"  asyncio, Threads ({gleichzeitig}):  {(time.perf_counter() - start) * 1000:8.1f} ms")
+        
+        with ProcessPoolExecutor() as executor:
+            start = time.perf_counter()
+            asyncio.run(lade_studiengaenge_async(pfade, max_gleichzeitig=gleichzeitig, executor=executor))
+            print(f"  asyncio, Prozesse ({gleichzeitig}): {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
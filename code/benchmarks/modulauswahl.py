@@ -0,0 +1,61 @@
+"""
+Benchmark: Modulauswahl als vollständige Liste vs. seitenweise.
+
+Für einen Studiengang mit 10.000 Modulen wird die Auswahl angezeigt, einmal
+wie bisher mit allen Modulen (hole_alle_modulen und str je Modul) und einmal
+mit ModulAuswahl (nur die erste bzw. die letzte Seite). Die Ausgabe geht in
+einen StringIO-Puffer, damit das Terminal nicht mitgemessen wird.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.modulauswahl
+"""
+
+import contextlib
+import io
+import time
+
+from gui.modul_auswahl import ModulAuswahl
+
+from . import erstelle_grossen_studiengang
+
+
+def alle_anzeigen(studiengang) -> None:
+    """Gibt alle Module wie bisher nummeriert aus."""
+    alle_module = studiengang.hole_alle_modulen()
+    print("\nVerfügbare Module:")
+    for i, modul in enumerate(alle_module, 1):
+        print(f"  {i}. {modul}")
+
+
+def erste_seite(studiengang) -> None:
+    """Gibt die erste Seite der Modulauswahl aus."""
+    ModulAuswahl(studiengang).zeige_seite()
+
+
+def letzte_seite(studiengang) -> None:
+    """Gibt die letzte Seite der Modulauswahl aus."""
+    auswahl = ModulAuswahl(studiengang)
+    auswahl.seite = auswahl.anzahl_seiten()
+    auswahl.zeige_seite()
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    studiengang = erstelle_grossen_studiengang(10000)
+    print("Modulauswahl für 10.000 Module:")
+    for name, anzeigen in (("alle Module", alle_anzeigen),
+                           ("erste Seite", erste_seite),
+                           ("letzte Seite", letzte_seite)):
+        beste = float('inf')
+        for _ in range(10):
+            puffer = io.StringIO()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(puffer):
+                anzeigen(studiengang)
+            beste = min(beste, time.perf_counter() - start)
+        zeilen = puffer.getvalue().count("\n")
+        print(f"  {name:<13} {beste * 1000:8.3f} ms  {zeilen:6} Zeilen")
+
+
+if __name__ == "__main__":
+    main()
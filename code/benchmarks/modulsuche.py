@@ -0,0 +1,89 @@
+"""
+Benchmark: Modulsuche durch Filtern aller Module vs. über den Suchindex.
+
+Für einen Studiengang mit 50.000 Modulen werden typische Suchanfragen
+ausgeführt (Code-Präfix, Wortanfang im Namen, Teilstring, mehrere Wörter),
+einmal durch Filtern aller Module und einmal über Studiengang.suche_module.
+Zusätzlich werden der Aufbau des Index (einmalig bei der ersten Suche), sein
+Speicherbedarf (tracemalloc), die Suche im Picker samt Modul-Nummern und das
+Nachführen beim Umbenennen und Hinzufügen gemessen.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.modulsuche
+"""
+
+import time
+import tracemalloc
+
+from domain import Modul, ModulSuchindex
+from gui import ModulAuswahl
+
+from . import erstelle_grossen_studiengang
+
+ANFRAGEN = ("BM0412", "bench", "modul 4711", "dul 4711", "4711 benchmark", "nicht vorhanden")
+
+
+def filtere(studiengang, anfrage: str, anzahl: int = 10) -> list:
+    """Sucht durch Filtern aller Module nach Code oder Name, die jedes Wort der Anfrage enthalten."""
+    woerter = anfrage.casefold().split()
+    treffer = []
+    for modul in studiengang.iter_alle_module():
+        text = f"{modul.modulcode.casefold()} {modul.name.casefold()}"
+        if all(wort in text for wort in woerter):
+            treffer.append(modul)
+            if len(treffer) >= anzahl:
+                break
+    return treffer
+
+
+def beste_zeit(funktion, wiederholungen: int = 20) -> float:
+    """Gibt die beste Laufzeit in Millisekunden zurück."""
+    beste = float('inf')
+    for _ in range(wiederholungen):
+        start = time.perf_counter()
+        funktion()
+        beste = min(beste, time.perf_counter() - start)
+    return beste * 1000
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    studiengang = erstelle_grossen_studiengang(50000)
+    
+    start = time.perf_counter()
+    ModulSuchindex(studiengang.iter_alle_module())
+    aufbau = time.perf_counter() - start
+    tracemalloc.start()
+    studiengang.suche_module("")
+    speicher = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"Suchindex für 50.000 Module: Aufbau {aufbau * 1000:.0f} ms, {speicher / 2**20:.1f} MiB")
+    
+    print(f"  {'Anfrage':<17} {'Filtern':>10} {'Index':>10}  Treffer")
+    for anfrage in ANFRAGEN:
+        gefiltert = beste_zeit(lambda: filtere(studiengang, anfrage), 5)
+        indexiert = beste_zeit(lambda: studiengang.suche_module(anfrage))
+        treffer = studiengang.suche_module(anfrage)
+        erster = treffer[0].modulcode if treffer else "-"
+        print(f"  {anfrage!r:<17} {gefiltert:8.3f} ms {indexiert:7.3f} ms  {len(treffer):2} ({erster})")
+    
+    auswahl = ModulAuswahl(studiengang)
+    picker = beste_zeit(lambda: auswahl.suche("bm0499"))
+    print(f"  Picker-Suche mit Modul-Nummern ('bm0499', Ende des Studiengangs): {picker:.3f} ms")
+    
+    module = list(studiengang.iter_alle_module())[:100]
+    start = time.perf_counter()
+    for i, modul in enumerate(module):
+        modul.name = f"Umbenanntes Modul {i}"
+    umbenennen = (time.perf_counter() - start) / len(module)
+    semester = studiengang.semester[0]
+    start = time.perf_counter()
+    for i in range(100):
+        semester.fuege_modul_hinzu(Modul(f"NEU{i:04d}", f"Neues Modul {i}", 5, 1))
+    hinzufuegen = (time.perf_counter() - start) / 100
+    print(f"  Nachführen je Modul: umbenennen {umbenennen * 1000:.3f} ms, hinzufügen {hinzufuegen * 1000:.3f} ms")
+    assert studiengang.suche_module("umbenanntes modul 42")[0] is module[42]
+
+
+if __name__ == "__main__":
+    main()
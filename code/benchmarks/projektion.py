@@ -0,0 +1,73 @@
+"""
+Benchmark: Monte-Carlo-Projektion der Abschlussnoten je Studiengang vs. vektorisiert.
+
+Die Variante "je Studiengang" zieht die Noten mit dem random-Modul in einer
+Python-Schleife; sie wird an einem Ausschnitt der Kohorte gemessen und auf
+die ganze Kohorte hochgerechnet.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.projektion
+"""
+
+import os
+import random
+import time
+
+from . import erstelle_grossen_studiengang
+
+
+def simuliere_skalar(studiengang, noten, anteile, simulationen: int, modul_ects: int = 5) -> float:
+    """Schätzt die Wahrscheinlichkeit, das Ziel zu erreichen, mit einer Python-Schleife."""
+    verbleibend = studiengang.berechne_verbleibende_ects()
+    gewichte = [modul_ects] * (verbleibend // modul_ects)
+    if verbleibend % modul_ects:
+        gewichte.append(verbleibend % modul_ects)
+    summe = studiengang.berechne_durchschnitt() * studiengang.bestandene_ects
+    gesamt = studiengang.bestandene_ects + verbleibend
+    erreicht = 0
+    for _ in range(simulationen):
+        gezogen = random.choices(noten, anteile, k=len(gewichte))
+        abschluss = (summe + sum(n * g for n, g in zip(gezogen, gewichte))) / gesamt
+        erreicht += abschluss <= studiengang.ziel_notendurchschnitt
+    return erreicht / simulationen
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    try:
+        from analyse import NotenProjektion, NotenVerteilung
+        NotenProjektion.aus_studiengaengen([])
+    except ImportError as e:
+        print(f"ℹ {e}")
+        return
+    
+    studierende = 10000
+    simulationen = 1000
+    kohorte = [erstelle_grossen_studiengang(36) for _ in range(studierende)]
+    projektion = NotenProjektion.aus_studiengaengen(kohorte)
+    verteilung = NotenVerteilung.aus_tabelle(projektion.tabelle)
+    noten, anteile = verteilung.noten.tolist(), verteilung.anteile.tolist()
+    
+    ausschnitt = 200
+    start = time.perf_counter()
+    for studiengang in kohorte[:ausschnitt]:
+        simuliere_skalar(studiengang, noten, anteile, simulationen)
+    skalar = (time.perf_counter() - start) * studierende / ausschnitt
+    
+    start = time.perf_counter()
+    projektion.simuliere(verteilung, simulationen, saat=1)
+    vektorisiert = time.perf_counter() - start
+    
+    prozesse = max(2, os.cpu_count() or 1)
+    start = time.perf_counter()
+    projektion.simuliere(verteilung, simulationen, saat=1, prozesse=prozesse)
+    pool = time.perf_counter() - start
+    
+    print(f"Projektion für {studierende} Studierende, je {simulationen} Simulationsläufe:")
+    print(f"  je Studiengang (hochgerechnet): {skalar:8.1f} s")
+    print(f"  vektorisiert:                   {vektorisiert:8.1f} s")
+    print(f"  vektorisiert, {prozesse} Prozesse:      {pool:8.1f} s  ({os.cpu_count()} CPU-Kerne)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Benchmark: Standard-Pickle des Objektgraphs vs. schema-versioniertes Format.
+
+Das Laden im Schema-Format enthält die Prüfung aller Werte und den Aufbau
+von Statusgruppen, Summen und Modulcode-Index.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.serialisierung
+"""
+
+import pickle
+
+from persistence.serialisierer import SCHEMA_VERSION, deserialisiere, serialisiere
+from . import erstelle_grossen_studiengang, miss
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    studiengang = erstelle_grossen_studiengang(10000)
+    alt = pickle.dumps(studiengang, protocol=pickle.HIGHEST_PROTOCOL)
+    neu = serialisiere(studiengang)
+    
+    print("Serialisierung (10.000 Module):")
+    print(f"  {'Format':<12} {'Größe':>12} {'Speichern':>12} {'Laden':>12}")
+    laden_alt = miss(lambda: pickle.loads(alt), 10)
+    laden_neu = miss(lambda: deserialisiere(neu), 10)
+    print(f"  {'pickle':<12} {len(alt) / 1024:9.1f} KB "
+          f"{miss(lambda: pickle.dumps(studiengang, protocol=pickle.HIGHEST_PROTOCOL)) * 1000:9.1f} ms "
+          f"{laden_alt * 1000:9.1f} ms")
+    print(f"  {f'Schema v{SCHEMA_VERSION}':<12} {len(neu) / 1024:9.1f} KB "
+          f"{miss(lambda: serialisiere(studiengang)) * 1000:9.1f} ms "
+          f"{laden_neu * 1000:9.1f} ms")
+    print(f"  Laden im Schema-Format: {laden_alt / laden_neu:.2f}x so schnell wie pickle")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark: Speicherbedarf der Domänenobjekte (tracemalloc).
+
+Gemessen wird jeweils mit den Domänenklassen und mit einer Referenz ohne
+__slots__ (gleiche Methoden, Attribute in einem __dict__ je Objekt), so wie
+die Klassen vor der Umstellung auf __slots__ aussahen.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.speicherbedarf
+"""
+
+import gc
+import sys
+import tracemalloc
+from contextlib import contextmanager
+
+from domain import Modul, Pruefungsleistung, Semester, Studiengang
+
+from . import erstelle_grossen_studiengang
+
+# Module, in denen die Domänenklassen für die Referenz ersetzt werden
+_VERWENDER = ('benchmarks', 'domain.studiengang', 'domain.semester', 'domain.modul')
+
+
+def ohne_slots(klasse: type) -> type:
+    """
+    Erstellt eine Kopie einer Klasse ohne __slots__.
+    
+    Args:
+        klasse: Die Klasse mit __slots__
+    
+    Returns:
+        Eine Klasse mit denselben Methoden, deren Objekte ein __dict__ haben
+    """
+    weglassen = set(klasse.__slots__) | {'__slots__', '__getstate__', '__setstate__'}
+    namensraum = {name: wert for name, wert in vars(klasse).items() if name not in weglassen}
+    return type(klasse.__name__, klasse.__bases__, namensraum)
+
+
+@contextmanager
+def referenz_ohne_slots():
+    """Ersetzt die Domänenklassen für die Dauer des Blocks durch Kopien ohne __slots__."""
+    ersatz = {klasse: ohne_slots(klasse) for klasse in (Studiengang, Semester, Modul, Pruefungsleistung)}
+    ersetzt = []
+    for name in _VERWENDER:
+        modul = sys.modules[name]
+        for klasse, kopie in ersatz.items():
+            if vars(modul).get(klasse.__name__) is klasse:
+                setattr(modul, klasse.__name__, kopie)
+                ersetzt.append((modul, klasse))
+    try:
+        yield
+    finally:
+        for modul, klasse in ersetzt:
+            setattr(modul, klasse.__name__, klasse)
+
+
+def belegter_speicher(erzeuge) -> tuple:
+    """
+    Misst den Speicher, den die von einer Funktion erzeugten Objekte belegen.
+    
+    Args:
+        erzeuge: Funktion ohne Argumente, die die Objekte erzeugt und zurückgibt
+    
+    Returns:
+        Die erzeugten Objekte und die belegten Bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    objekte = erzeuge()
+    gc.collect()
+    belegt, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objekte, belegt
+
+
+def vergleiche(erzeuge) -> tuple:
+    """
+    Misst den Speicher einmal mit der Referenz ohne __slots__ und einmal mit den Domänenklassen.
+    
+    Args:
+        erzeuge: Funktion ohne Argumente, die die Objekte erzeugt und zurückgibt
+    
+    Returns:
+        Die belegten Bytes (ohne __slots__, mit __slots__)
+    """
+    with referenz_ohne_slots():
+        _, vorher = belegter_speicher(erzeuge)
+    _, nachher = belegter_speicher(erzeuge)
+    return vorher, nachher
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    anzahl_module = 20000
+    vorher, nachher = vergleiche(lambda: erstelle_grossen_studiengang(anzahl_module))
+    print(f"Ein Studiengang mit {anzahl_module} Modulen (inkl. Prüfungsleistung bei jedem zweiten):")
+    print(f"  {'':<22} {'ohne __slots__':>14} {'mit __slots__':>14}")
+    print(f"  {'Bytes pro Modul':<22} {vorher / anzahl_module:14.1f} {nachher / anzahl_module:14.1f}")
+    
+    studierende = 2000
+    module_je_studiengang = 36
+    vorher, nachher = vergleiche(
+        lambda: [erstelle_grossen_studiengang(module_je_studiengang) for _ in range(studierende)]
+    )
+    print(f"\nKohorte mit {studierende} Studierenden à {module_je_studiengang} Module:")
+    print(f"  {'':<22} {'ohne __slots__':>14} {'mit __slots__':>14}")
+    print(f"  {'KB pro Studierendem':<22} {vorher / studierende / 1024:14.1f} "
+          f"{nachher / studierende / 1024:14.1f}")
+    print(f"  {'MB gesamt':<22} {vorher / 2**20:14.1f} {nachher / 2**20:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
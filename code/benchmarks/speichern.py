@@ -0,0 +1,112 @@
+"""
+Benchmark: Speichern in-place vs. atomar vs. Gruppen-Commit.
+
+Gruppen-Commit wird für mehrere Sitzungen auf dieselbe Datei und für mehrere
+Mandanten mit je eigener Datei gemessen, jeweils mit der Anzahl der fsync-Aufrufe.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.speichern
+"""
+
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+from persistence import DatenManager
+from persistence.atomar import GruppenCommit
+from . import erstelle_grossen_studiengang, miss
+
+
+def speichere_in_place(pfad: str, studiengang) -> None:
+    """Bisheriger Weg: Datei mit 'wb' öffnen und direkt überschreiben (plus fsync)."""
+    with open(pfad, 'wb') as datei:
+        pickle.dump(studiengang, datei)
+        datei.flush()
+        os.fsync(datei.fileno())
+
+
+def parallel_speichern(daten_manager_liste, studiengang, vorgaenge: int) -> float:
+    """
+    Lässt mehrere Sitzungen gleichzeitig speichern.
+    
+    Args:
+        daten_manager_liste: Ein DatenManager je Sitzung
+        studiengang: Der zu speichernde Studiengang
+        vorgaenge: Speichervorgänge je Sitzung
+        
+    Returns:
+        Die Gesamtdauer in Sekunden und die Anzahl der fsync-Aufrufe
+    """
+    def sitzung(daten_manager):
+        for _ in range(vorgaenge):
+            daten_manager.speichere_studiengang(studiengang)
+    
+    fsyncs = []
+    original_fsync = os.fsync
+    
+    def zaehle_fsync(fd):
+        fsyncs.append(fd)
+        original_fsync(fd)
+    
+    threads = [threading.Thread(target=sitzung, args=(dm,)) for dm in daten_manager_liste]
+    os.fsync = zaehle_fsync
+    try:
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start, len(fsyncs)
+    finally:
+        os.fsync = original_fsync
+
+
+def zeige_vergleich(einzeln, gruppe, studiengang, vorgaenge: int) -> None:
+    """Gibt Dauer und fsync-Aufrufe ohne und mit Gruppen-Commit aus."""
+    for bezeichnung, daten_manager_liste in (("atomar, je Vorgang fsync:", einzeln),
+                                             ("Gruppen-Commit (5 ms):   ", gruppe)):
+        dauer, fsyncs = parallel_speichern(daten_manager_liste, studiengang, vorgaenge)
+        print(f"  {bezeichnung} {dauer * 1000:8.2f} ms  {fsyncs:4} fsync-Aufrufe")
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    studiengang = erstelle_grossen_studiengang(1000)
+    sitzungen = 8
+    vorgaenge = 10
+    
+    with tempfile.TemporaryDirectory() as verzeichnis:
+        pfad = os.path.join(verzeichnis, "studiengang.pkl")
+        daten_manager = DatenManager(pfad)
+        daten_manager.meldungen = False
+        
+        print("Einzelnes Speichern (1.000 Module):")
+        print(f"  in-place ('wb' + fsync): {miss(lambda: speichere_in_place(pfad, studiengang)) * 1000:8.2f} ms")
+        print(f"  atomar (temp + rename):  {miss(lambda: daten_manager.speichere_studiengang(studiengang)) * 1000:8.2f} ms")
+        
+        print(f"\n{sitzungen} Sitzungen x {vorgaenge} Speichervorgänge auf dieselbe Datei:")
+        einzeln = [DatenManager(pfad) for _ in range(sitzungen)]
+        gruppe = [DatenManager(pfad) for _ in range(sitzungen)]
+        gruppen_commit = GruppenCommit(fenster=0.005)
+        for dm in einzeln + gruppe:
+            dm.meldungen = False
+        for dm in gruppe:
+            dm.gruppen_commit = gruppen_commit
+        zeige_vergleich(einzeln, gruppe, studiengang, vorgaenge)
+        
+        print(f"\n{sitzungen} Mandanten x {vorgaenge} Speichervorgänge auf je eine eigene Datei:")
+        pfade = [os.path.join(verzeichnis, f"mandant{i}.pkl") for i in range(sitzungen)]
+        einzeln = [DatenManager(pfad) for pfad in pfade]
+        gruppe = [DatenManager(pfad) for pfad in pfade]
+        gruppen_commit = GruppenCommit(fenster=0.005)
+        for dm in einzeln + gruppe:
+            dm.meldungen = False
+        for dm in gruppe:
+            dm.gruppen_commit = gruppen_commit
+        zeige_vergleich(einzeln, gruppe, studiengang, vorgaenge)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: Prüfungsergebnisse einzeln vs. gesammelt eintragen.
+
+Für alle offenen und angemeldeten Module eines großen Studiengangs wird eine
+Note eingetragen und für neue Module ein Modul angelegt, einmal einzeln über
+Pruefungsleistung/setze_pruefungsleistung bzw. fuege_modul_hinzu und einmal
+über Studiengang.wende_aenderungen_an. Ein registrierter Beobachter steht für
+eine Ansicht, die bei jeder Benachrichtigung die Liste der bestandenen Module
+neu aufbaut.
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.stapel
+"""
+
+import time
+from datetime import date
+
+from domain import Modul, ModulAnlage, NotenEintrag, Pruefungsleistung
+from domain.enums import ModulStatus, Pruefungsart
+
+from . import erstelle_grossen_studiengang
+
+
+def erstelle_aenderungen(studiengang, neue_module: int) -> list:
+    """Erstellt Noten für alle nicht bestandenen Module und neue Module mit Note."""
+    datum = date(2025, 2, 15)
+    aenderungen = [NotenEintrag(modul.modulcode, 1.0 + (i % 31) / 10, datum)
+                   for i, modul in enumerate(studiengang.iter_alle_module())
+                   if modul.status != ModulStatus.BESTANDEN]
+    for i in range(neue_module):
+        aenderungen.append(ModulAnlage(i % len(studiengang.semester) + 1, f"NEU{i:06d}", f"Neues Modul {i}", 5))
+        aenderungen.append(NotenEintrag(f"NEU{i:06d}", 2.0, datum))
+    return aenderungen
+
+
+def einzeln(studiengang, aenderungen) -> None:
+    """Wendet die Änderungen einzeln über die bisherigen Methoden an."""
+    semester_liste = studiengang.semester
+    for aenderung in aenderungen:
+        if isinstance(aenderung, ModulAnlage):
+            semester_liste[aenderung.semester_nummer - 1].fuege_modul_hinzu(
+                Modul(aenderung.modulcode, aenderung.name, aenderung.ects, aenderung.semester_empfehlung))
+        else:
+            studiengang.finde_modul(aenderung.modulcode).setze_pruefungsleistung(
+                Pruefungsleistung(aenderung.note, aenderung.datum, aenderung.versuch, Pruefungsart.KLAUSUR))
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    ergebnisse = {}
+    for name in ("einzeln", "gesammelt"):
+        beste = float('inf')
+        for _ in range(3):
+            studiengang = erstelle_grossen_studiengang(10000)
+            aenderungen = erstelle_aenderungen(studiengang, 2000)
+            benachrichtigungen = []
+            
+            def ansicht(objekt, studiengang=studiengang, benachrichtigungen=benachrichtigungen):
+                benachrichtigungen.append(objekt)
+                studiengang.hole_module_mit_status(ModulStatus.BESTANDEN)
+            
+            studiengang.registriere_beobachter(ansicht)
+            start = time.perf_counter()
+            if name == "einzeln":
+                einzeln(studiengang, aenderungen)
+            else:
+                studiengang.wende_aenderungen_an(aenderungen)
+            beste = min(beste, time.perf_counter() - start)
+        ergebnisse[name] = (beste, len(benachrichtigungen), studiengang.berechne_durchschnitt())
+    
+    print(f"{len(aenderungen)} Änderungen (Noten für 5.000 Module, 2.000 neue Module mit Note):")
+    for name, (dauer, benachrichtigungen, durchschnitt) in ergebnisse.items():
+        print(f"  {name:<10} {dauer * 1000:8.1f} ms  {benachrichtigungen:6} Benachrichtigungen  Ø {durchschnitt}")
+
+
+if __name__ == "__main__":
+    main()
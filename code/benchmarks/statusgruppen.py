@@ -0,0 +1,54 @@
+"""
+Benchmark: Gruppieren nach Status durch Filtern vs. über die Statusgruppen.
+
+Die Variante "Filtern" bildet das bisherige Verhalten nach (je Status ein
+Durchlauf über alle Module, ebenso für die abgeschlossenen Module).
+
+Start aus dem Verzeichnis code/:
+    python -m benchmarks.statusgruppen
+"""
+
+from domain.enums import ModulStatus
+
+from . import erstelle_grossen_studiengang, miss
+
+
+def gruppiere_filtern(studiengang) -> int:
+    """Gruppiert wie bisher durch Filtern der vollständigen Modulliste je Status."""
+    anzahl = 0
+    alle_module = studiengang.hole_alle_modulen()
+    for status in ModulStatus:
+        anzahl += len([m for m in alle_module if m.status == status])
+    anzahl += len([m for m in studiengang.iter_alle_module() if m.ist_abgeschlossen()])
+    return anzahl
+
+
+def gruppiere_statusgruppen(studiengang) -> int:
+    """Gruppiert über die Statusgruppen der Semester."""
+    anzahl = 0
+    for status in ModulStatus:
+        anzahl += len(studiengang.hole_module_mit_status(status))
+    anzahl += len(studiengang.hole_abgeschlossene_modulen())
+    return anzahl
+
+
+def main():
+    """Führt den Benchmark aus und gibt die Ergebnisse aus."""
+    studiengang = erstelle_grossen_studiengang(10000)
+    
+    print("Modul-Übersicht nach Status und abgeschlossene Module (10.000 Module):")
+    for name, funktion in (("Filtern", gruppiere_filtern), ("Statusgruppen", gruppiere_statusgruppen)):
+        dauer = miss(lambda: funktion(studiengang), 20)
+        print(f"  {name:<14} {dauer * 1000:9.2f} ms")
+    
+    anzahl = studiengang.anzahl_module_mit_status(ModulStatus.ANGEMELDET)
+    print(f"\nNur die {anzahl} angemeldeten Module holen:")
+    filtern = miss(lambda: [m for m in studiengang.iter_alle_module()
+                            if m.status == ModulStatus.ANGEMELDET], 20)
+    gruppen = miss(lambda: studiengang.hole_module_mit_status(ModulStatus.ANGEMELDET), 20)
+    print(f"  {'Filtern':<14} {filtern * 1000:9.2f} ms")
+    print(f"  {'Statusgruppen':<14} {gruppen * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,24 @@ from .studiengang import Studiengang
 from .semester import Semester
 from .modul import Modul
 from .pruefungsleistung import Pruefungsleistung
+from .versuchs_protokoll import VersuchsProtokoll
+from .aenderungen import ModulAnlage, NotenEintrag, StatusAenderung
 from .enums import Abschluss, Pruefungsart, ModulStatus
+from .ansichten import ListenAnsicht
+from .suchindex import ModulSuchindex
 
 __all__ = [
     'Studiengang',
     'Semester',
     'Modul',
     'Pruefungsleistung',
+    'VersuchsProtokoll',
+    'ModulAnlage',
+    'NotenEintrag',
+    'StatusAenderung',
     'Abschluss',
     'Pruefungsart',
-    'ModulStatus'
+    'ModulStatus',
+    'ListenAnsicht',
+    'ModulSuchindex'
 ]
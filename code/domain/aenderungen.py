@@ -0,0 +1,174 @@
+"""
+Änderungen für Studiengang.wende_aenderungen_an.
+
+Jede Klasse beschreibt eine einzelne Änderung mit einfachen Werten. Geprüft
+und angewendet werden die Änderungen erst gesammelt vom Studiengang.
+"""
+
+from datetime import date
+from typing import Optional
+
+from .enums import ModulStatus, Pruefungsart
+
+
+class ModulAnlage:
+    """
+    Legt ein neues Modul in einem Semester an.
+    
+    Attributes:
+        _semester_nummer: Die Nummer des Semesters
+        _modulcode: Der Modulcode
+        _name: Der Name des Moduls
+        _ects: Die ECTS-Punkte
+        _semester_empfehlung: Das empfohlene Semester (Standard: die Semesternummer)
+    """
+    
+    __slots__ = ('_semester_nummer', '_modulcode', '_name', '_ects', '_semester_empfehlung')
+    
+    def __init__(self, semester_nummer: int, modulcode: str, name: str, ects: int,
+                 semester_empfehlung: Optional[int] = None):
+        """
+        Initialisiert die ModulAnlage.
+        
+        Args:
+            semester_nummer: Die Nummer des Semesters
+            modulcode: Der Modulcode
+            name: Der Name des Moduls
+            ects: Die ECTS-Punkte
+            semester_empfehlung: Das empfohlene Semester (Standard: die Semesternummer)
+        """
+        self._semester_nummer = semester_nummer
+        self._modulcode = modulcode
+        self._name = name
+        self._ects = ects
+        self._semester_empfehlung = semester_nummer if semester_empfehlung is None else semester_empfehlung
+    
+    @property
+    def semester_nummer(self) -> int:
+        """Getter für die Semesternummer."""
+        return self._semester_nummer
+    
+    @property
+    def modulcode(self) -> str:
+        """Getter für den Modulcode."""
+        return self._modulcode
+    
+    @property
+    def name(self) -> str:
+        """Getter für den Namen."""
+        return self._name
+    
+    @property
+    def ects(self) -> int:
+        """Getter für die ECTS-Punkte."""
+        return self._ects
+    
+    @property
+    def semester_empfehlung(self) -> int:
+        """Getter für die Semester-Empfehlung."""
+        return self._semester_empfehlung
+    
+    def __repr__(self) -> str:
+        """Repräsentation für Debugging."""
+        return (f"ModulAnlage({self._semester_nummer!r}, {self._modulcode!r}, {self._name!r}, "
+                f"{self._ects!r}, {self._semester_empfehlung!r})")
+
+
+class NotenEintrag:
+    """
+    Trägt eine Prüfungsleistung für ein Modul ein.
+    
+    Attributes:
+        _modulcode: Der Modulcode
+        _note: Die erreichte Note (1.0 - 5.0)
+        _datum: Das Datum der Prüfung
+        _versuch: Der Versuch (1, 2, 3, ...)
+        _art: Die Art der Prüfung
+    """
+    
+    __slots__ = ('_modulcode', '_note', '_datum', '_versuch', '_art')
+    
+    def __init__(self, modulcode: str, note: float, datum: date, versuch: int = 1,
+                 art: Pruefungsart = Pruefungsart.KLAUSUR):
+        """
+        Initialisiert den NotenEintrag.
+        
+        Args:
+            modulcode: Der Modulcode
+            note: Die erreichte Note (1.0 - 5.0)
+            datum: Das Datum der Prüfung
+            versuch: Der Versuch (Standard: 1)
+            art: Die Art der Prüfung (Standard: Klausur)
+        """
+        self._modulcode = modulcode
+        self._note = note
+        self._datum = datum
+        self._versuch = versuch
+        self._art = art
+    
+    @property
+    def modulcode(self) -> str:
+        """Getter für den Modulcode."""
+        return self._modulcode
+    
+    @property
+    def note(self) -> float:
+        """Getter für die Note."""
+        return self._note
+    
+    @property
+    def datum(self) -> date:
+        """Getter für das Datum."""
+        return self._datum
+    
+    @property
+    def versuch(self) -> int:
+        """Getter für den Versuch."""
+        return self._versuch
+    
+    @property
+    def art(self) -> Pruefungsart:
+        """Getter für die Prüfungsart."""
+        return self._art
+    
+    def __repr__(self) -> str:
+        """Repräsentation für Debugging."""
+        return (f"NotenEintrag({self._modulcode!r}, {self._note!r}, {self._datum!r}, "
+                f"{self._versuch!r}, {self._art!r})")
+
+
+class StatusAenderung:
+    """
+    Setzt den Status eines Moduls.
+    
+    Attributes:
+        _modulcode: Der Modulcode
+        _status: Der neue Status
+    """
+    
+    __slots__ = ('_modulcode', '_status')
+    
+    def __init__(self, modulcode: str, status: ModulStatus):
+        """
+        Initialisiert die StatusAenderung.
+        
+        Args:
+            modulcode: Der Modulcode
+            status: Der neue Status
+        """
+        self._modulcode = modulcode
+        self._status = status
+    
+    @property
+    def modulcode(self) -> str:
+        """Getter für den Modulcode."""
+        return self._modulcode
+    
+    @property
+    def status(self) -> ModulStatus:
+        """Getter für den Status."""
+        return self._status
+    
+    def __repr__(self) -> str:
+        """Repräsentation für Debugging."""
+        return f"StatusAenderung({self._modulcode!r}, {self._status!r})"
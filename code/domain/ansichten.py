@@ -0,0 +1,74 @@
+"""
+Schreibgeschützte Ansichten auf die Listen des Domänenmodells.
+
+Eine Ansicht verweist auf die interne Liste, ohne sie zu kopieren. Sie
+bietet nur lesende Operationen, sodass Module und Semester weiterhin nur
+über die Methoden von Semester und Studiengang geändert werden können.
+"""
+
+from collections.abc import Sequence
+
+
+class ListenAnsicht(Sequence):
+    """
+    Schreibgeschützte Ansicht auf eine Liste ohne Kopie.
+    
+    Änderungen an der zugrunde liegenden Liste sind sofort sichtbar; für eine
+    unveränderliche Momentaufnahme list(ansicht) verwenden.
+    
+    Attributes:
+        _liste: Die zugrunde liegende Liste
+    """
+    
+    __slots__ = ('_liste',)
+    
+    def __init__(self, liste: list):
+        """
+        Initialisiert die Ansicht.
+        
+        Args:
+            liste: Die zugrunde liegende Liste
+        """
+        self._liste = liste
+    
+    def __len__(self) -> int:
+        """Anzahl der Elemente."""
+        return len(self._liste)
+    
+    def __getitem__(self, index):
+        """Element am Index (bzw. neue Liste bei einem Slice)."""
+        return self._liste[index]
+    
+    def __iter__(self):
+        """Iterator über die Elemente."""
+        return iter(self._liste)
+    
+    def __reversed__(self):
+        """Iterator über die Elemente in umgekehrter Reihenfolge."""
+        return reversed(self._liste)
+    
+    def __contains__(self, element) -> bool:
+        """Prüft, ob ein Element enthalten ist."""
+        return element in self._liste
+    
+    def index(self, element, *args) -> int:
+        """Position eines Elements (wie list.index)."""
+        return self._liste.index(element, *args)
+    
+    def count(self, element) -> int:
+        """Anzahl der Vorkommen eines Elements (wie list.count)."""
+        return self._liste.count(element)
+    
+    def __eq__(self, other) -> bool:
+        """Vergleich mit einer anderen Ansicht oder Liste."""
+        if isinstance(other, ListenAnsicht):
+            other = other._liste
+        if isinstance(other, list):
+            return self._liste == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        """Repr-Repräsentation der Ansicht."""
+        return f"ListenAnsicht({self._liste!r})"
@@ -4,9 +4,16 @@ Modul-Klasse für das Studien-Dashboard.
 Diese Klasse repräsentiert ein Studienmodul mit allen relevanten Informationen.
 """
 
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 from .enums import ModulStatus, Pruefungsart
 from .pruefungsleistung import Pruefungsleistung
+from .versuchs_protokoll import VersuchsProtokoll
+from .validierung import enums_aus_namen, pruefe_ganzzahlen, pruefe_texte
+
+# Note · ECTS ist mindestens 1 und damit ein Vielfaches von 2^-52; mit 2^52
+# multipliziert ergibt sich eine ganze Zahl. Die Notensummen werden so exakt
+# und unabhängig von der Reihenfolge der Änderungen geführt.
+NOTEN_SKALA = 2 ** 52
 
 
 class Modul:
@@ -19,9 +26,15 @@ class Modul:
         _ects: Die Anzahl der ECTS-Punkte
         _semester_empfehlung: Das empfohlene Semester
         _status: Der aktuelle Status des Moduls
-        _pruefungsleistung: Die zugehörige Prüfungsleistung (optional)
+        _pruefungsleistung: Die zugehörige Prüfungsleistung, d.h. der letzte Versuch (optional)
+        _fruehere_versuche: Die früheren Versuche (None solange es keine gibt)
+        _enthalten_in: Tupel der Semester, die das Modul enthalten (Rückverweise)
+        _version: Änderungszähler des Moduls (einschließlich seiner Prüfungsleistungen)
     """
     
+    __slots__ = ('_modulcode', '_name', '_ects', '_semester_empfehlung', '_status',
+                 '_pruefungsleistung', '_fruehere_versuche', '_enthalten_in', '_version')
+    
     def __init__(self, modulcode: str, name: str, ects: int, semester_empfehlung: int):
         """
         Initialisiert ein neues Modul.
@@ -41,6 +54,9 @@ class Modul:
         self._semester_empfehlung = semester_empfehlung
         self._status = ModulStatus.OFFEN
         self._pruefungsleistung: Optional[Pruefungsleistung] = None
+        self._fruehere_versuche: Optional[VersuchsProtokoll] = None
+        self._enthalten_in: Tuple = ()
+        self._version = 0
         
         # Validierung
         if ects <= 0:
@@ -58,7 +74,16 @@ class Modul:
         """Setter für den Modulcode."""
         if not value:
             raise ValueError("Modulcode darf nicht leer sein")
+        if value == self._modulcode:
+            return
+        studiengaenge = [s._studiengang for s in self._enthalten_in if s._studiengang is not None]
+        for studiengang in studiengaenge:
+            studiengang._pruefe_modulcode_frei(value)
+        alter_code = self._modulcode
         self._modulcode = value
+        for studiengang in studiengaenge:
+            studiengang._benenne_im_index_um(alter_code, self)
+        self._markiere_geaendert()
     
     @property
     def name(self) -> str:
@@ -79,6 +104,10 @@ class Modul:
         if not value:
             raise ValueError("Der Name darf nicht leer sein")
         self._name = value
+        for semester in self._enthalten_in:
+            if semester._studiengang is not None:
+                semester._studiengang._aktualisiere_suchindex(self)
+        self._markiere_geaendert()
     
     @property
     def ects(self) -> int:
@@ -98,7 +127,10 @@ class Modul:
         """
         if value <= 0:
             raise ValueError("ECTS müssen größer als 0 sein")
+        alter_beitrag = self._beitrag()
         self._ects = value
+        self._melde_aenderung(alter_beitrag)
+        self._markiere_geaendert()
     
     @property
     def semester_empfehlung(self) -> int:
@@ -119,6 +151,7 @@ class Modul:
         if value < 1:
             raise ValueError("Semester-Empfehlung muss mindestens 1 sein")
         self._semester_empfehlung = value
+        self._markiere_geaendert()
     
     @property
     def status(self) -> ModulStatus:
@@ -128,7 +161,10 @@ class Modul:
     @status.setter
     def status(self, value: ModulStatus):
         """Setter für den Modulstatus."""
+        alter_beitrag = self._beitrag()
         self._status = value
+        self._melde_aenderung(alter_beitrag)
+        self._markiere_geaendert()
     
     @property
     def pruefungsleistung(self) -> Optional[Pruefungsleistung]:
@@ -139,25 +175,157 @@ class Modul:
         """
         Setzt die Prüfungsleistung für dieses Modul (Komposition).
         
+        Hat die bisherige Prüfungsleistung eine andere Versuchsnummer, wird sie
+        in die früheren Versuche übernommen; bei gleicher Versuchsnummer gilt
+        die neue Prüfungsleistung als Korrektur und ersetzt sie.
+        
+        Args:
+            pruefungsleistung: Die Prüfungsleistung
+        """
+        alter_beitrag = self._beitrag()
+        self._setze_pruefungsleistung(pruefungsleistung)
+        self._melde_aenderung(alter_beitrag)
+        self._markiere_geaendert()
+    
+    def _setze_pruefungsleistung(self, pruefungsleistung: Pruefungsleistung) -> None:
+        """
+        Setzt die Prüfungsleistung und den Status, ohne die Semester zu benachrichtigen.
+        
         Args:
             pruefungsleistung: Die Prüfungsleistung
         """
+        vorherige = self._pruefungsleistung
+        if vorherige is not None:
+            if vorherige._modul is self:
+                vorherige._modul = None
+            if vorherige.versuch != pruefungsleistung.versuch:
+                if self._fruehere_versuche is None:
+                    self._fruehere_versuche = VersuchsProtokoll()
+                self._fruehere_versuche.fuege_hinzu(vorherige)
         self._pruefungsleistung = pruefungsleistung
-        # Status automatisch aktualisieren
-        if pruefungsleistung.ist_bestanden():
+        pruefungsleistung._modul = self
+        # Status automatisch aktualisieren (bestanden, wenn ein Versuch bestanden ist)
+        if self.hole_note() <= 4.0:
             self._status = ModulStatus.BESTANDEN
         else:
             self._status = ModulStatus.NICHT_BESTANDEN
     
+    def _beitrag(self) -> Tuple[int, int, ModulStatus]:
+        """
+        Gibt den Beitrag des Moduls zu den Summen seiner Semester zurück.
+        
+        Returns:
+            (Note · ECTS · NOTEN_SKALA, bestandene ECTS, Status); nur bestandene
+            Module tragen zu Notensumme und ECTS bei
+        """
+        if self._status == ModulStatus.BESTANDEN:
+            note = self.hole_note()
+            return (int(note * self._ects * NOTEN_SKALA) if note else 0, self._ects, self._status)
+        return (0, 0, self._status)
+    
+    def _entferne_rueckverweis(self, semester) -> None:
+        """
+        Entfernt den Rückverweis auf ein Semester, aus dem das Modul entfernt wurde.
+        
+        Args:
+            semester: Das Semester
+        """
+        i = self._enthalten_in.index(semester)
+        self._enthalten_in = self._enthalten_in[:i] + self._enthalten_in[i + 1:]
+    
+    def _melde_aenderung(self, alter_beitrag: Tuple[int, int, ModulStatus]) -> None:
+        """
+        Aktualisiert die Summen aller Semester, die das Modul enthalten.
+        
+        Args:
+            alter_beitrag: Der Beitrag vor der Änderung (aus _beitrag)
+        """
+        if self._enthalten_in:
+            neuer_beitrag = self._beitrag()
+            for semester in self._enthalten_in:
+                semester._ersetze_beitrag(self, alter_beitrag, neuer_beitrag)
+    
+    @property
+    def version(self) -> int:
+        """Getter für den Änderungszähler des Moduls."""
+        return self._version
+    
+    def _markiere_geaendert(self, objekt=None) -> None:
+        """
+        Erhöht den Änderungszähler und meldet die Änderung an die Semester weiter.
+        
+        Args:
+            objekt: Das geänderte Objekt (Standard: das Modul selbst)
+        """
+        self._version += 1
+        if self._enthalten_in:
+            if objekt is None:
+                objekt = self
+            for semester in self._enthalten_in:
+                semester._markiere_geaendert(objekt)
+    
     def hole_pruefungsleistung(self) -> Optional[Pruefungsleistung]:
         """
-        Gibt die Prüfungsleistung zurück.
+        Gibt die Prüfungsleistung (den letzten Versuch) zurück.
+        
+        Returns:
+            Die Prüfungsleistung oder None
+        """
+        return self._pruefungsleistung
+    
+    def _zaehlt_frueherer_versuch(self) -> bool:
+        """
+        Prüft, ob ein früherer bestandener Versuch besser ist als der letzte.
+        
+        Returns:
+            True wenn die beste frühere Note zählt, sonst False
+        """
+        fruehere = self._fruehere_versuche
+        if fruehere is None or not len(fruehere):
+            return False
+        beste = fruehere.beste_note
+        return beste <= 4.0 and beste < self._pruefungsleistung.note
+    
+    def hole_massgebliche_pruefungsleistung(self) -> Optional[Pruefungsleistung]:
+        """
+        Gibt den Versuch zurück, dessen Note für das Modul zählt.
+        
+        Das ist der bestandene Versuch mit der besten Note, sonst der letzte Versuch.
         
         Returns:
             Die Prüfungsleistung oder None
         """
+        if self._pruefungsleistung is None:
+            return None
+        if self._zaehlt_frueherer_versuch():
+            return self._fruehere_versuche.hole_besten()
         return self._pruefungsleistung
     
+    def anzahl_versuche(self) -> int:
+        """
+        Gibt die Anzahl der Prüfungsversuche zurück.
+        
+        Returns:
+            Die Anzahl aller Versuche einschließlich des letzten
+        """
+        if self._pruefungsleistung is None:
+            return 0
+        return 1 + (len(self._fruehere_versuche) if self._fruehere_versuche is not None else 0)
+    
+    def hole_versuche(self) -> List[Pruefungsleistung]:
+        """
+        Gibt alle Prüfungsversuche in zeitlicher Reihenfolge zurück.
+        
+        Frühere Versuche werden dabei als neue Pruefungsleistung-Objekte erzeugt.
+        
+        Returns:
+            Liste der Versuche; der letzte Eintrag ist die aktuelle Prüfungsleistung
+        """
+        if self._pruefungsleistung is None:
+            return []
+        fruehere = list(self._fruehere_versuche) if self._fruehere_versuche is not None else []
+        return fruehere + [self._pruefungsleistung]
+    
     def ist_bestanden(self) -> bool:
         """
         Prüft, ob das Modul bestanden wurde.
@@ -180,13 +348,119 @@ class Modul:
         """
         Gibt die Note des Moduls zurück.
         
+        Zählt die beste bestandene Note aller Versuche, sonst die des letzten Versuchs.
+        
         Returns:
             Die Note oder None wenn keine Prüfungsleistung vorhanden ist
         """
         if self._pruefungsleistung:
+            if self._zaehlt_frueherer_versuch():
+                return self._fruehere_versuche.beste_note
             return self._pruefungsleistung.hole_note()
         return None
     
+    def als_tupel(self) -> tuple:
+        """
+        Gibt den Zustand als Tupel einfacher Werte zurück (für die Serialisierung).
+        
+        Returns:
+            (modulcode, name, ects, semester_empfehlung, Name des Status,
+            Prüfungsleistung als Tupel oder None, frühere Versuche als Tupel oder None)
+        """
+        pruefung = self._pruefungsleistung.als_tupel() if self._pruefungsleistung else None
+        fruehere = self._fruehere_versuche.als_tupel() if self._fruehere_versuche else None
+        return (self._modulcode, self._name, self._ects, self._semester_empfehlung,
+                self._status.name, pruefung, fruehere)
+    
+    @classmethod
+    def aus_tupel(cls, daten: tuple) -> 'Modul':
+        """
+        Erstellt ein Modul aus als_tupel und prüft dabei Typen und Wertebereiche.
+        
+        Args:
+            daten: Das Tupel aus als_tupel
+            
+        Returns:
+            Das erstellte Modul
+            
+        Raises:
+            ValueError: Wenn ein Wert ungültig ist
+        """
+        return cls.aus_tupeln((daten,))[0]
+    
+    @classmethod
+    def aus_tupeln(cls, daten: Sequence[tuple], enthalten_in: tuple = ()) -> List['Modul']:
+        """
+        Erstellt viele Module aus als_tupel; geprüft wird spaltenweise.
+        
+        Args:
+            daten: Die Tupel aus als_tupel
+            enthalten_in: Die Semester, die die Module enthalten (Rückverweis)
+            
+        Returns:
+            Die erstellten Module in derselben Reihenfolge
+            
+        Raises:
+            ValueError: Wenn ein Wert ungültig ist
+        """
+        if not daten:
+            return []
+        if set(map(len, daten)) != {7}:
+            raise ValueError("Ein Modul besteht aus sieben Werten")
+        codes, namen, ects, empfehlungen, status_namen, pruefungen, fruehere = zip(*daten)
+        pruefe_texte(codes, "Modulcode")
+        pruefe_texte(namen, "Modulname")
+        pruefe_ganzzahlen(ects, "ECTS", 1)
+        pruefe_ganzzahlen(empfehlungen, "Semester-Empfehlung", 1)
+        stati = enums_aus_namen(ModulStatus, status_namen, "Modulstatus")
+        naechste_pruefung = iter(Pruefungsleistung.aus_tupeln(
+            [pruefung for pruefung in pruefungen if pruefung is not None])).__next__
+        
+        neu = cls.__new__
+        module = []
+        for modulcode, name, modul_ects, empfehlung, status, pruefung, frueher in zip(
+                codes, namen, ects, empfehlungen, stati, pruefungen, fruehere):
+            modul = neu(cls)
+            modul._modulcode = modulcode
+            modul._name = name
+            modul._ects = modul_ects
+            modul._semester_empfehlung = empfehlung
+            modul._status = status
+            modul._fruehere_versuche = VersuchsProtokoll.aus_tupel(frueher) if frueher else None
+            modul._enthalten_in = enthalten_in
+            modul._version = 0
+            if pruefung is None:
+                modul._pruefungsleistung = None
+            else:
+                modul._pruefungsleistung = naechste_pruefung()
+                modul._pruefungsleistung._modul = modul
+            module.append(modul)
+        return module
+    
+    def __getstate__(self) -> dict:
+        """
+        Gibt den Zustand für pickle zurück (die Klasse hat kein __dict__).
+        
+        Returns:
+            Die Attribute als Dictionary
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __setstate__(self, zustand: dict) -> None:
+        """
+        Stellt den Zustand beim Entpicklen her (auch aus Dateien ohne Rückverweise).
+        
+        Args:
+            zustand: Die gespeicherten Attribute
+        """
+        self._enthalten_in = ()
+        self._fruehere_versuche = None
+        self._version = 0
+        for name, wert in zustand.items():
+            setattr(self, name, wert)
+        if self._pruefungsleistung is not None:
+            self._pruefungsleistung._modul = self
+    
     def __str__(self) -> str:
         """String-Repräsentation des Moduls."""
         status_str = f", Status: {self._status.value}"
@@ -5,7 +5,9 @@ Diese Klasse repräsentiert eine Prüfungsleistung mit Note, Datum, Versuch und
 """
 
 from datetime import date
+from typing import List, Sequence
 from .enums import Pruefungsart
+from .validierung import daten_aus_ordinalen, enums_aus_namen, pruefe_ganzzahlen, pruefe_noten
 
 
 class Pruefungsleistung:
@@ -17,8 +19,11 @@ class Pruefungsleistung:
         _datum: Das Datum der Prüfung
         _versuch: Der Versuch (1, 2, 3, ...)
         _art: Die Art der Prüfung (aus Pruefungsart Enum)
+        _modul: Das Modul, zu dem die Prüfungsleistung gehört (Rückverweis)
     """
     
+    __slots__ = ('_note', '_datum', '_versuch', '_art', '_modul')
+    
     def __init__(self, note: float, datum: date, versuch: int, art: Pruefungsart):
         """
         Initialisiert eine neue Prüfungsleistung.
@@ -37,6 +42,7 @@ class Pruefungsleistung:
         self._datum = datum
         self._versuch = versuch
         self._art = art
+        self._modul = None
         
         # Validierung
         if not 1.0 <= note <= 5.0:
@@ -62,7 +68,12 @@ class Pruefungsleistung:
         """
         if not 1.0 <= value <= 5.0:
             raise ValueError("Note muss zwischen 1.0 und 5.0 liegen")
+        modul = self._modul
+        alter_beitrag = modul._beitrag() if modul else None
         self._note = value
+        if modul:
+            modul._melde_aenderung(alter_beitrag)
+        self._markiere_geaendert()
     
     @property
     def datum(self) -> date:
@@ -73,6 +84,7 @@ class Pruefungsleistung:
     def datum(self, value: date):
         """Setter für das Datum."""
         self._datum = value
+        self._markiere_geaendert()
     
     @property
     def versuch(self) -> int:
@@ -93,6 +105,7 @@ class Pruefungsleistung:
         if value < 1:
             raise ValueError("Versuch muss mindestens 1 sein")
         self._versuch = value
+        self._markiere_geaendert()
     
     @property
     def art(self) -> Pruefungsart:
@@ -103,6 +116,12 @@ class Pruefungsleistung:
     def art(self, value: Pruefungsart):
         """Setter für die Prüfungsart."""
         self._art = value
+        self._markiere_geaendert()
+    
+    def _markiere_geaendert(self) -> None:
+        """Meldet eine Änderung an das Modul weiter, zu dem die Prüfungsleistung gehört."""
+        if self._modul is not None:
+            self._modul._markiere_geaendert(self)
     
     def ist_bestanden(self) -> bool:
         """
@@ -140,6 +159,103 @@ class Pruefungsleistung:
         else:
             return "Nicht bestanden"
     
+    def als_tupel(self) -> tuple:
+        """
+        Gibt den Zustand als Tupel einfacher Werte zurück (für die Serialisierung).
+        
+        Returns:
+            (note, datum als Ordinalzahl, versuch, Name der Prüfungsart)
+        """
+        return (self._note, self._datum.toordinal(), self._versuch, self._art.name)
+    
+    @classmethod
+    def aus_tupel(cls, daten: tuple) -> 'Pruefungsleistung':
+        """
+        Erstellt eine Prüfungsleistung aus als_tupel und prüft dabei Typen und Wertebereiche.
+        
+        Args:
+            daten: Das Tupel aus als_tupel
+            
+        Returns:
+            Die erstellte Prüfungsleistung
+            
+        Raises:
+            ValueError: Wenn ein Wert ungültig ist
+        """
+        return cls.aus_tupeln((daten,))[0]
+    
+    @classmethod
+    def aus_tupeln(cls, daten: Sequence[tuple]) -> List['Pruefungsleistung']:
+        """
+        Erstellt viele Prüfungsleistungen aus als_tupel; geprüft wird spaltenweise.
+        
+        Args:
+            daten: Die Tupel aus als_tupel
+            
+        Returns:
+            Die erstellten Prüfungsleistungen in derselben Reihenfolge
+            
+        Raises:
+            ValueError: Wenn ein Wert ungültig ist
+        """
+        if not daten:
+            return []
+        noten, ordinale, versuche, arten = cls._pruefe_spalten(daten)
+        neu = cls.__new__
+        pruefungen = []
+        for note, datum, versuch, art in zip(noten, daten_aus_ordinalen(ordinale, "Prüfungsdatum"),
+                                             versuche, arten):
+            pruefung = neu(cls)
+            pruefung._note = note
+            pruefung._datum = datum
+            pruefung._versuch = versuch
+            pruefung._art = art
+            pruefung._modul = None
+            pruefungen.append(pruefung)
+        return pruefungen
+    
+    @staticmethod
+    def _pruefe_spalten(daten: Sequence[tuple]) -> tuple:
+        """
+        Zerlegt Tupel aus als_tupel in Spalten und prüft Noten, Versuche und Prüfungsarten.
+        
+        Args:
+            daten: Die Tupel aus als_tupel (nicht leer)
+            
+        Returns:
+            (Noten, Daten als Ordinalzahl, Versuche, Prüfungsarten); die
+            Ordinalzahlen sind noch ungeprüft
+            
+        Raises:
+            ValueError: Wenn ein Wert ungültig ist
+        """
+        if set(map(len, daten)) != {4}:
+            raise ValueError("Eine Prüfungsleistung besteht aus vier Werten")
+        noten, ordinale, versuche, arten = zip(*daten)
+        pruefe_noten(noten)
+        pruefe_ganzzahlen(versuche, "Versuch", 1)
+        return noten, ordinale, versuche, enums_aus_namen(Pruefungsart, arten, "Prüfungsart")
+    
+    def __getstate__(self) -> dict:
+        """
+        Gibt den Zustand für pickle zurück (die Klasse hat kein __dict__).
+        
+        Returns:
+            Die Attribute als Dictionary
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __setstate__(self, zustand: dict) -> None:
+        """
+        Stellt den Zustand beim Entpicklen her (auch aus Dateien ohne Rückverweis).
+        
+        Args:
+            zustand: Die gespeicherten Attribute
+        """
+        self._modul = None
+        for name, wert in zustand.items():
+            setattr(self, name, wert)
+    
     def __str__(self) -> str:
         """String-Repräsentation der Prüfungsleistung."""
         return f"Prüfungsleistung: {self._art.value}, Note: {self._note}, Datum: {self._datum}, Versuch: {self._versuch}"
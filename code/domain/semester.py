@@ -5,8 +5,11 @@ Diese Klasse repräsentiert ein Semester mit Modulen (Aggregation).
 """
 
 from datetime import date
-from typing import List
-from .modul import Modul
+from typing import Dict, List, Optional, Tuple
+from .ansichten import ListenAnsicht
+from .enums import ModulStatus
+from .modul import NOTEN_SKALA, Modul
+from .validierung import datum_aus_ordinal, pruefe_ganzzahl, pruefe_text
 
 
 class Semester:
@@ -19,8 +22,19 @@ class Semester:
         _startdatum: Das Startdatum des Semesters
         _enddatum: Das Enddatum des Semesters
         _module: Liste der Module in diesem Semester (Aggregation)
+        _studiengang: Der Studiengang, zu dem das Semester gehört (Rückverweis)
+        _noten_summe: Summe Note · ECTS · NOTEN_SKALA der bestandenen Module (exakt)
+        _bestandene_ects: Summe der ECTS der bestandenen Module
+        _status_module: Die Module je Status (dict als geordnete Menge; bei der
+            ersten Abfrage aufgebaut, None wenn nicht aufgebaut)
+        _version: Änderungszähler des Semesters (einschließlich seiner Module)
+        _positionen: Position je Modul in _module (bei Bedarf aufgebaut, None wenn
+            nicht aufgebaut)
     """
     
+    __slots__ = ('_nummer', '_bezeichnung', '_startdatum', '_enddatum', '_module', '_studiengang',
+                 '_noten_summe', '_bestandene_ects', '_status_module', '_version', '_positionen')
+    
     def __init__(self, nummer: int, bezeichnung: str, startdatum: date, enddatum: date):
         """
         Initialisiert ein neues Semester.
@@ -39,6 +53,12 @@ class Semester:
         self._startdatum = startdatum
         self._enddatum = enddatum
         self._module: List[Modul] = []
+        self._studiengang = None
+        self._noten_summe = 0
+        self._bestandene_ects = 0
+        self._status_module: Optional[Dict[ModulStatus, Dict[Modul, None]]] = None
+        self._version = 0
+        self._positionen: Optional[Dict[Modul, int]] = None
         
         # Validierung
         if nummer < 1:
@@ -57,6 +77,7 @@ class Semester:
         if value < 1:
             raise ValueError("Semesternummer muss mindestens 1 sein")
         self._nummer = value
+        self._markiere_geaendert()
     
     @property
     def bezeichnung(self) -> str:
@@ -69,6 +90,7 @@ class Semester:
         if not value:
             raise ValueError("Bezeichnung darf nicht leer sein")
         self._bezeichnung = value
+        self._markiere_geaendert()
     
     @property
     def startdatum(self) -> date:
@@ -81,6 +103,7 @@ class Semester:
         if self._enddatum and value >= self._enddatum:
             raise ValueError("Startdatum muss vor Enddatum liegen")
         self._startdatum = value
+        self._markiere_geaendert()
     
     @property
     def enddatum(self) -> date:
@@ -93,11 +116,12 @@ class Semester:
         if value <= self._startdatum:
             raise ValueError("Enddatum muss nach Startdatum liegen")
         self._enddatum = value
+        self._markiere_geaendert()
     
     @property
-    def module(self) -> List[Modul]:
-        """Getter für die Module (gibt eine Kopie zurück)."""
-        return self._module.copy()
+    def module(self) -> ListenAnsicht:
+        """Getter für die Module (schreibgeschützte Ansicht ohne Kopie)."""
+        return ListenAnsicht(self._module)
     
     def fuege_modul_hinzu(self, modul: Modul) -> None:
         """
@@ -110,11 +134,62 @@ class Semester:
             modul: Das hinzuzufügende Modul
             
         Raises:
-            ValueError: Wenn das Modul bereits im Semester ist
+            ValueError: Wenn das Modul bereits im Semester ist oder sein
+                Modulcode im Studiengang schon vergeben ist
         """
-        if modul in self._module:
+        if self in modul._enthalten_in:
             raise ValueError(f"Modul {modul.name} ist bereits im Semester")
+        if self._studiengang is not None:
+            self._studiengang._nimm_in_index_auf([modul])
         self._module.append(modul)
+        if self._positionen is not None:
+            self._positionen[modul] = len(self._module) - 1
+        modul._enthalten_in += (self,)
+        noten_summe, ects, status = modul._beitrag()
+        if self._status_module is not None:
+            self._status_module[status][modul] = None
+        self._veraendere_summen(noten_summe, ects, {status: 1})
+        self._markiere_geaendert()
+    
+    def fuege_module_hinzu(self, module: List[Modul]) -> None:
+        """
+        Fügt mehrere Module in einem Schritt hinzu (Aggregation).
+        
+        Die Duplikatprüfung erfolgt einmal über eine Menge statt je Modul
+        über die ganze Liste. Bei einem Duplikat wird kein Modul hinzugefügt.
+        
+        Args:
+            module: Die hinzuzufügenden Module
+            
+        Raises:
+            ValueError: Wenn ein Modul bereits im Semester ist, doppelt übergeben
+                wurde oder sein Modulcode im Studiengang schon vergeben ist
+        """
+        vorhanden = set()
+        for modul in module:
+            if id(modul) in vorhanden or self in modul._enthalten_in:
+                raise ValueError(f"Modul {modul.name} ist bereits im Semester")
+            vorhanden.add(id(modul))
+        if self._studiengang is not None:
+            self._studiengang._nimm_in_index_auf(module)
+        if self._positionen is not None:
+            self._positionen.update(zip(module, range(len(self._module), len(self._module) + len(module))))
+        self._module.extend(module)
+        
+        noten_summe = 0
+        bestandene_ects = 0
+        status_anzahl: Dict[ModulStatus, int] = {}
+        gruppen = self._status_module
+        for modul in module:
+            modul._enthalten_in += (self,)
+            note, ects, status = modul._beitrag()
+            noten_summe += note
+            bestandene_ects += ects
+            status_anzahl[status] = status_anzahl.get(status, 0) + 1
+            if gruppen is not None:
+                gruppen[status][modul] = None
+        self._veraendere_summen(noten_summe, bestandene_ects, status_anzahl)
+        self._markiere_geaendert()
     
     def entferne_modul(self, modul: Modul) -> None:
         """
@@ -129,38 +204,207 @@ class Semester:
         Raises:
             ValueError: Wenn das Modul nicht im Semester ist
         """
-        if modul not in self._module:
+        if self not in modul._enthalten_in:
             raise ValueError(f"Modul {modul.name} ist nicht im Semester")
         self._module.remove(modul)
+        # Die Positionen der folgenden Module verschieben sich
+        self._positionen = None
+        modul._entferne_rueckverweis(self)
+        if self._studiengang is not None:
+            self._studiengang._entferne_aus_index(modul)
+        noten_summe, ects, status = modul._beitrag()
+        if self._status_module is not None:
+            del self._status_module[status][modul]
+        self._veraendere_summen(-noten_summe, -ects, {status: -1})
+        self._markiere_geaendert()
     
-    def hole_modulen(self) -> List[Modul]:
+    def hole_modulen(self) -> ListenAnsicht:
         """
         Gibt alle Module des Semesters zurück.
         
         Returns:
-            Liste aller Module
+            Schreibgeschützte Ansicht auf die Module (ohne Kopie)
+        """
+        return ListenAnsicht(self._module)
+    
+    def position_von(self, modul: Modul) -> int:
+        """
+        Gibt die Position eines Moduls im Semester zurück.
+        
+        Die Positionen werden beim ersten Aufruf einmal bestimmt und beim
+        Hinzufügen nachgeführt; erst das Entfernen eines Moduls verwirft sie.
+        
+        Args:
+            modul: Das gesuchte Modul
+            
+        Returns:
+            Die Position in hole_modulen (ab 0)
+            
+        Raises:
+            ValueError: Wenn das Modul nicht im Semester ist
+        """
+        if self._positionen is None:
+            self._positionen = {m: position for position, m in enumerate(self._module)}
+        position = self._positionen.get(modul)
+        if position is None:
+            raise ValueError(f"Modul {modul.name} ist nicht im Semester")
+        return position
+    
+    @property
+    def version(self) -> int:
+        """Getter für den Änderungszähler des Semesters."""
+        return self._version
+    
+    def _markiere_geaendert(self, objekt=None) -> None:
+        """
+        Erhöht den Änderungszähler und meldet die Änderung an den Studiengang weiter.
+        
+        Args:
+            objekt: Das geänderte Objekt (Standard: das Semester selbst)
+        """
+        self._version += 1
+        if self._studiengang is not None:
+            self._studiengang._markiere_geaendert(self if objekt is None else objekt)
+    
+    @property
+    def bestandene_ects(self) -> int:
+        """Getter für die ECTS der bestandenen Module."""
+        return self._bestandene_ects
+    
+    def anzahl_module_mit_status(self, status: ModulStatus) -> int:
+        """
+        Gibt die Anzahl der Module mit einem Status zurück.
+        
+        Args:
+            status: Der gesuchte Status
+            
+        Returns:
+            Die Anzahl der Module mit diesem Status
+        """
+        return len(self._statusgruppen()[status])
+    
+    def hole_module_mit_status(self, status: ModulStatus) -> List[Modul]:
+        """
+        Gibt die Module mit einem Status zurück, ohne alle Module zu durchlaufen.
+        
+        Args:
+            status: Der gesuchte Status
+            
+        Returns:
+            Die Module in der Reihenfolge, in der sie den Status erhalten haben
+            (vor der ersten Abfrage und nach dem Laden in Listenreihenfolge)
         """
-        return self._module.copy()
+        return list(self._statusgruppen()[status])
+    
+    def _statusgruppen(self) -> Dict[ModulStatus, Dict[Modul, None]]:
+        """
+        Gibt die Module je Status zurück und baut die Gruppen bei Bedarf auf.
+        
+        Die Gruppen werden erst bei der ersten Abfrage einmal aus allen Modulen
+        aufgebaut und danach bei jeder Änderung nachgeführt; Semester, deren
+        Module nie nach Status abgefragt werden, belegen dafür keinen Speicher.
+        
+        Returns:
+            Die Module je Status (dict als geordnete Menge)
+        """
+        if self._status_module is None:
+            gruppen: Dict[ModulStatus, Dict[Modul, None]] = {status: {} for status in ModulStatus}
+            for modul in self._module:
+                gruppen[modul._status][modul] = None
+            self._status_module = gruppen
+        return self._status_module
     
     def berechne_semester_durchschnitt(self) -> float:
         """
-        Berechnet den Notendurchschnitt des Semesters.
+        Berechnet den Notendurchschnitt des Semesters aus den laufenden Summen.
         
         Returns:
             Der gewichtete Notendurchschnitt oder 0.0 wenn keine Noten vorhanden
         """
-        bestandene_module = [m for m in self._module if m.ist_bestanden()]
-        
-        if not bestandene_module:
+        if not self._bestandene_ects:
             return 0.0
+        return round(self._noten_summe / (self._bestandene_ects * NOTEN_SKALA), 2)
+    
+    def _veraendere_summen(self, noten_summe: int, bestandene_ects: int,
+                           status_anzahl: Dict[ModulStatus, int]) -> None:
+        """
+        Verändert die laufenden Summen und gibt die Änderung an den Studiengang weiter.
         
-        gewichtete_summe = sum(m.hole_note() * m.ects for m in bestandene_module if m.hole_note())
-        gesamt_ects = sum(m.ects for m in bestandene_module)
+        Args:
+            noten_summe: Änderung der Summe Note · ECTS · NOTEN_SKALA
+            bestandene_ects: Änderung der bestandenen ECTS
+            status_anzahl: Änderung der Anzahl je Status (für den Studiengang)
+        """
+        self._noten_summe += noten_summe
+        self._bestandene_ects += bestandene_ects
+        if self._studiengang is not None:
+            self._studiengang._veraendere_summen(noten_summe, bestandene_ects, status_anzahl)
+    
+    def _ersetze_beitrag(self, modul: Modul, alter_beitrag: Tuple[int, int, ModulStatus],
+                         neuer_beitrag: Tuple[int, int, ModulStatus]) -> None:
+        """
+        Ersetzt den Beitrag eines geänderten Moduls in den laufenden Summen.
         
-        if gesamt_ects == 0:
-            return 0.0
+        Hat sich der Status geändert, wechselt das Modul die Statusgruppe.
+        
+        Args:
+            modul: Das geänderte Modul
+            alter_beitrag: Der Beitrag vor der Änderung
+            neuer_beitrag: Der Beitrag nach der Änderung
+        """
+        alter_status = alter_beitrag[2]
+        neuer_status = neuer_beitrag[2]
+        if alter_status is neuer_status:
+            status_anzahl = {}
+        else:
+            if self._status_module is not None:
+                del self._status_module[alter_status][modul]
+                self._status_module[neuer_status][modul] = None
+            status_anzahl = {alter_status: -1, neuer_status: 1}
+        self._veraendere_summen(neuer_beitrag[0] - alter_beitrag[0],
+                                neuer_beitrag[1] - alter_beitrag[1], status_anzahl)
+    
+    def _ersetze_beitraege(self, aenderungen: List[Tuple[Modul, tuple, tuple]]) -> None:
+        """
+        Ersetzt die Beiträge mehrerer geänderter Module mit einer Summenänderung.
+        
+        Args:
+            aenderungen: (Modul, alter Beitrag, neuer Beitrag) je geändertem Modul
+        """
+        noten_summe = 0
+        bestandene_ects = 0
+        status_anzahl: Dict[ModulStatus, int] = {}
+        gruppen = self._status_module
+        for modul, alter_beitrag, neuer_beitrag in aenderungen:
+            noten_summe += neuer_beitrag[0] - alter_beitrag[0]
+            bestandene_ects += neuer_beitrag[1] - alter_beitrag[1]
+            alter_status = alter_beitrag[2]
+            neuer_status = neuer_beitrag[2]
+            if alter_status is not neuer_status:
+                if gruppen is not None:
+                    del gruppen[alter_status][modul]
+                    gruppen[neuer_status][modul] = None
+                status_anzahl[alter_status] = status_anzahl.get(alter_status, 0) - 1
+                status_anzahl[neuer_status] = status_anzahl.get(neuer_status, 0) + 1
+        self._veraendere_summen(noten_summe, bestandene_ects, status_anzahl)
+    
+    def _berechne_summen(self) -> None:
+        """
+        Berechnet die laufenden Summen einmalig aus allen Modulen.
         
-        return round(gewichtete_summe / gesamt_ects, 2)
+        Zu Notensumme und ECTS tragen nur bestandene Module bei; nur für sie
+        wird der Beitrag berechnet. Die Statusgruppen werden verworfen und erst
+        bei der nächsten Abfrage neu aufgebaut.
+        """
+        self._status_module = None
+        self._noten_summe = 0
+        self._bestandene_ects = 0
+        bestanden = ModulStatus.BESTANDEN
+        for modul in self._module:
+            if modul._status is bestanden:
+                noten_summe, ects, _ = modul._beitrag()
+                self._noten_summe += noten_summe
+                self._bestandene_ects += ects
     
     def ist_aktuell(self) -> bool:
         """
@@ -181,6 +425,76 @@ class Semester:
         """
         return len(self._module)
     
+    def als_tupel(self) -> tuple:
+        """
+        Gibt den Zustand als Tupel einfacher Werte zurück (für die Serialisierung).
+        
+        Returns:
+            (nummer, bezeichnung, Start- und Enddatum als Ordinalzahl, Module als Tupel)
+        """
+        return (self._nummer, self._bezeichnung, self._startdatum.toordinal(),
+                self._enddatum.toordinal(), tuple(m.als_tupel() for m in self._module))
+    
+    @classmethod
+    def aus_tupel(cls, daten: tuple) -> 'Semester':
+        """
+        Erstellt ein Semester aus als_tupel und prüft dabei Typen und Wertebereiche.
+        
+        Args:
+            daten: Das Tupel aus als_tupel
+            
+        Returns:
+            Das erstellte Semester
+            
+        Raises:
+            ValueError: Wenn ein Wert ungültig ist
+        """
+        nummer, bezeichnung, start, ende, module = daten
+        semester = cls.__new__(cls)
+        semester._nummer = pruefe_ganzzahl(nummer, "Semesternummer", 1)
+        semester._bezeichnung = pruefe_text(bezeichnung, "Semesterbezeichnung")
+        semester._startdatum = datum_aus_ordinal(start, "Startdatum")
+        semester._enddatum = datum_aus_ordinal(ende, "Enddatum")
+        if semester._enddatum < semester._startdatum:
+            raise ValueError("Enddatum muss nach Startdatum liegen")
+        semester._module = Modul.aus_tupeln(module, (semester,))
+        semester._studiengang = None
+        semester._version = 0
+        semester._positionen = None
+        semester._berechne_summen()
+        return semester
+    
+    def __getstate__(self) -> dict:
+        """
+        Gibt den Zustand für pickle zurück (die Klasse hat kein __dict__).
+        
+        Returns:
+            Die Attribute als Dictionary (ohne die bei Bedarf aufgebauten Positionen)
+        """
+        return {name: getattr(self, name) for name in self.__slots__ if name != '_positionen'}
+    
+    def __setstate__(self, zustand: dict) -> None:
+        """
+        Stellt den Zustand beim Entpicklen her (auch aus Dateien ohne laufende
+        Summen oder ohne Statusgruppen).
+        
+        Args:
+            zustand: Die gespeicherten Attribute
+        """
+        zustand = dict(zustand)
+        ohne_summen = '_status_anzahl' not in zustand and '_status_module' not in zustand
+        zustand.pop('_status_anzahl', None)
+        self._version = 0
+        self._positionen = None
+        for name, wert in zustand.items():
+            setattr(self, name, wert)
+        if ohne_summen:
+            self._studiengang = None
+            for modul in self._module:
+                modul._enthalten_in += (self,)
+        if '_status_module' not in zustand:
+            self._berechne_summen()
+    
     def __str__(self) -> str:
         """String-Repräsentation des Semesters."""
         return f"Semester {self._nummer}: {self._bezeichnung} ({self.anzahl_module()} Module)"
@@ -4,11 +4,19 @@ Studiengang-Klasse für das Studien-Dashboard.
 Diese Klasse repräsentiert einen Studiengang mit Semestern (Komposition).
 """
 
+import math
+from collections import Counter
 from datetime import date, timedelta
-from typing import List
-from .enums import Abschluss
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from .aenderungen import ModulAnlage, NotenEintrag, StatusAenderung
+from .ansichten import ListenAnsicht
+from .enums import Abschluss, ModulStatus, Pruefungsart
 from .semester import Semester
-from .modul import Modul
+from .modul import NOTEN_SKALA, Modul
+from .pruefungsleistung import Pruefungsleistung
+from .suchindex import ModulSuchindex
+from .validierung import enum_aus_name, ist_ganzzahl, ist_zahl, pruefe_ganzzahl, pruefe_note, pruefe_text
 
 
 class Studiengang:
@@ -22,8 +30,24 @@ class Studiengang:
         _ziel_notendurchschnitt: Der angestrebte Notendurchschnitt
         _ziel_abschlussdauer: Die angestrebte Abschlussdauer in Semestern
         _semester: Liste der Semester (Komposition)
+        _noten_summe: Summe Note · ECTS · NOTEN_SKALA der bestandenen Module aller Semester
+        _bestandene_ects: Summe der ECTS der bestandenen Module aller Semester
+        _status_anzahl: Anzahl der Module je Status über alle Semester
+        _modul_index: Die Module aller Semester nach Modulcode
+        _version: Monotoner Änderungszähler über den gesamten Studiengang
+        _geaenderte: Die seit dem letzten Speichern geänderten Objekte (dict als geordnete Menge)
+        _beobachter: Funktionen, die bei jeder Änderung mit dem geänderten Objekt aufgerufen werden
+        _suchindex: Suchindex über Modulcode und Name (erst bei der ersten Suche aufgebaut)
     """
     
+    __slots__ = ('_name', '_abschluss', '_gesamtdauer', '_ziel_notendurchschnitt',
+                 '_ziel_abschlussdauer', '_semester', '_noten_summe', '_bestandene_ects',
+                 '_status_anzahl', '_modul_index', '_version', '_geaenderte', '_beobachter',
+                 '_suchindex')
+    
+    # Nur für die laufende Sitzung, wird nicht gespeichert
+    _FLUECHTIG = ('_geaenderte', '_beobachter', '_suchindex')
+    
     def __init__(self, name: str, abschluss: Abschluss, gesamtdauer: int, 
                  ziel_notendurchschnitt: float, ziel_abschlussdauer: int):
         """
@@ -55,6 +79,15 @@ class Studiengang:
         if ziel_abschlussdauer < 1 or ziel_abschlussdauer > gesamtdauer:
             raise ValueError("Ziel-Abschlussdauer muss zwischen 1 und Gesamtdauer liegen")
         
+        self._noten_summe = 0
+        self._bestandene_ects = 0
+        self._status_anzahl: Dict[ModulStatus, int] = {status: 0 for status in ModulStatus}
+        self._modul_index: Dict[str, Modul] = {}
+        self._version = 0
+        self._geaenderte: Dict[object, None] = {self: None}
+        self._beobachter: List[Callable[[object], None]] = []
+        self._suchindex: Optional[ModulSuchindex] = None
+        
         # Semester erstellen (Komposition)
         self._semester: List[Semester] = self.erstelle_semester()
     
@@ -69,6 +102,7 @@ class Studiengang:
         if not value:
             raise ValueError("Name darf nicht leer sein")
         self._name = value
+        self._markiere_geaendert()
     
     @property
     def abschluss(self) -> Abschluss:
@@ -79,6 +113,7 @@ class Studiengang:
     def abschluss(self, value: Abschluss):
         """Setter für den Abschluss."""
         self._abschluss = value
+        self._markiere_geaendert()
     
     @property
     def gesamtdauer(self) -> int:
@@ -91,6 +126,7 @@ class Studiengang:
         if value < 1:
             raise ValueError("Gesamtdauer muss mindestens 1 Semester sein")
         self._gesamtdauer = value
+        self._markiere_geaendert()
     
     @property
     def ziel_notendurchschnitt(self) -> float:
@@ -103,6 +139,7 @@ class Studiengang:
         if not 1.0 <= value <= 4.0:
             raise ValueError("Ziel-Notendurchschnitt muss zwischen 1.0 und 4.0 liegen")
         self._ziel_notendurchschnitt = value
+        self._markiere_geaendert()
     
     @property
     def ziel_abschlussdauer(self) -> int:
@@ -115,11 +152,12 @@ class Studiengang:
         if value < 1 or value > self._gesamtdauer:
             raise ValueError("Ziel-Abschlussdauer muss zwischen 1 und Gesamtdauer liegen")
         self._ziel_abschlussdauer = value
+        self._markiere_geaendert()
     
     @property
-    def semester(self) -> List[Semester]:
-        """Getter für die Semester (gibt eine Kopie zurück)."""
-        return self._semester.copy()
+    def semester(self) -> ListenAnsicht:
+        """Getter für die Semester (schreibgeschützte Ansicht ohne Kopie)."""
+        return ListenAnsicht(self._semester)
     
     def erstelle_semester(self) -> List[Semester]:
         """
@@ -144,6 +182,7 @@ class Studiengang:
                 bezeichnung = f"SoSe {startdatum.year}"
             
             semester = Semester(i, bezeichnung, startdatum, enddatum)
+            semester._studiengang = self
             semester_liste.append(semester)
             
             # Nächstes Semester startet einen Tag nach Ende des aktuellen
@@ -163,34 +202,338 @@ class Studiengang:
             alle_module.extend(semester.hole_modulen())
         return alle_module
     
+    def iter_alle_module(self, start: int = 0) -> Iterator[Modul]:
+        """
+        Durchläuft alle Module aller Semester, ohne eine Liste anzulegen.
+        
+        Semester, die vollständig vor start liegen, werden über ihre Anzahl
+        übersprungen, ohne ihre Module zu durchlaufen.
+        
+        Args:
+            start: Die Position des ersten Moduls (Standard: 0)
+        
+        Yields:
+            Die Module in Semester- und Einfügereihenfolge
+        """
+        for semester in self._semester:
+            anzahl = semester.anzahl_module()
+            if start >= anzahl:
+                start -= anzahl
+                continue
+            yield from islice(semester.hole_modulen(), start, None)
+            start = 0
+    
+    def anzahl_module(self) -> int:
+        """
+        Gibt die Anzahl der Module über alle Semester zurück.
+        
+        Returns:
+            Die Anzahl der Module (wie len(hole_alle_modulen()))
+        """
+        return sum(semester.anzahl_module() for semester in self._semester)
+    
+    def finde_modul(self, modulcode: str) -> Optional[Modul]:
+        """
+        Sucht ein Modul über den Modulcode im Index.
+        
+        Args:
+            modulcode: Der gesuchte Modulcode
+            
+        Returns:
+            Das Modul oder None wenn kein Modul diesen Code hat
+        """
+        return self._modul_index.get(modulcode)
+    
+    def suche_module(self, anfrage: str, anzahl: int = 10) -> List[Modul]:
+        """
+        Sucht Module über Modulcode und Name (Präfix- und Teilstringsuche).
+        
+        Der Suchindex wird beim ersten Aufruf aufgebaut und danach bei jeder
+        Änderung von Modulen nachgeführt.
+        
+        Args:
+            anfrage: Der Suchtext (Groß-/Kleinschreibung wird ignoriert)
+            anzahl: Die maximale Anzahl der Treffer (Standard: 10)
+            
+        Returns:
+            Die besten Treffer: zuerst Code-Präfix, dann Wortanfang im Namen,
+            dann Teilstring in Code oder Name
+        """
+        if self._suchindex is None:
+            self._suchindex = ModulSuchindex(self.iter_alle_module())
+        return self._suchindex.suche(anfrage, anzahl)
+    
+    def finde_position(self, modul: Modul) -> Optional[int]:
+        """
+        Bestimmt die Position eines Moduls über alle Semester.
+        
+        Args:
+            modul: Das gesuchte Modul
+            
+        Returns:
+            Die Position wie in iter_alle_module (ab 0) oder None wenn das
+            Modul nicht zum Studiengang gehört
+        """
+        semester = next((s for s in modul._enthalten_in if s._studiengang is self), None)
+        if semester is None:
+            return None
+        davor = sum(s.anzahl_module() for s in self._semester[:self._semester.index(semester)])
+        return davor + semester.position_von(modul)
+    
+    def verschiebe_modul(self, modul: Modul, semester_nummer: int) -> None:
+        """
+        Verschiebt ein Modul in ein anderes Semester dieses Studiengangs.
+        
+        Args:
+            modul: Das zu verschiebende Modul
+            semester_nummer: Die Nummer des Zielsemesters
+            
+        Raises:
+            ValueError: Wenn das Semester nicht existiert oder das Modul nicht
+                zum Studiengang gehört
+        """
+        if not 1 <= semester_nummer <= len(self._semester):
+            raise ValueError(f"Semester {semester_nummer} existiert nicht")
+        quelle = next((s for s in modul._enthalten_in if s._studiengang is self), None)
+        if quelle is None:
+            raise ValueError(f"Modul {modul.name} gehört nicht zum Studiengang")
+        ziel = self._semester[semester_nummer - 1]
+        if ziel is not quelle:
+            quelle.entferne_modul(modul)
+            ziel.fuege_modul_hinzu(modul)
+    
+    def wende_aenderungen_an(self, aenderungen: Iterable) -> List[Modul]:
+        """
+        Wendet viele Änderungen gesammelt an (alle oder keine).
+        
+        Zuerst werden alle Änderungen geprüft; ist eine ungültig, wird nichts
+        geändert und alle Verstöße werden gemeinsam gemeldet. Danach werden die
+        Änderungen in der gegebenen Reihenfolge angewendet. Neue Module werden je
+        Semester in einem Schritt eingefügt, Summen und Statusgruppen einmal je
+        Semester aktualisiert. Alle geänderten Module werden als geändert
+        vorgemerkt (der Studiengang selbst nicht), die Beobachter aber nur
+        einmal mit dem Studiengang benachrichtigt. Innerhalb einer Statusgruppe stehen Module mit neuem
+        Status in der Reihenfolge ihrer ersten Änderung, neue Module dahinter.
+        
+        Speicher, die nur Einzeländerungen schreiben (Journal, SQLite), erfahren
+        davon über ihre protokolliere-Methoden; dafür werden die betroffenen
+        Module zurückgegeben.
+        
+        Args:
+            aenderungen: ModulAnlage-, NotenEintrag- und StatusAenderung-Objekte
+            
+        Returns:
+            Die betroffenen Module in der Reihenfolge ihrer ersten Änderung
+            
+        Raises:
+            ValueError: Wenn mindestens eine Änderung ungültig ist
+        """
+        aenderungen = list(aenderungen)
+        fehler = []
+        for nummer, verstoesse in enumerate(self.pruefe_aenderungen(aenderungen), 1):
+            if verstoesse:
+                fehler.append(f"Änderung {nummer}: {'; '.join(verstoesse)}")
+        if fehler:
+            raise ValueError(f"{len(fehler)} ungültige Änderung(en):\n" + "\n".join(fehler))
+        
+        # Die Änderungen sind gültig: ab hier kann nichts mehr fehlschlagen
+        neue_module: Dict[str, Modul] = {}
+        neu_je_semester: Dict[int, List[Modul]] = {}
+        alte_beitraege: Dict[Modul, tuple] = {}
+        betroffen: Dict[Modul, None] = {}
+        index = self._modul_index
+        for aenderung in aenderungen:
+            art = type(aenderung)
+            if art is ModulAnlage:
+                modul = Modul(aenderung._modulcode, aenderung._name, aenderung._ects,
+                              aenderung._semester_empfehlung)
+                neue_module[aenderung._modulcode] = modul
+                neu_je_semester.setdefault(aenderung._semester_nummer, []).append(modul)
+            else:
+                modul = neue_module.get(aenderung._modulcode) or index[aenderung._modulcode]
+                if modul._enthalten_in and modul not in alte_beitraege:
+                    alte_beitraege[modul] = modul._beitrag()
+                if art is NotenEintrag:
+                    modul._setze_pruefungsleistung(Pruefungsleistung(
+                        aenderung._note, aenderung._datum, aenderung._versuch, aenderung._art))
+                else:
+                    modul._status = aenderung._status
+            betroffen[modul] = None
+        
+        beobachter, self._beobachter = self._beobachter, []
+        try:
+            # Summen und Statusgruppen einmal je Semester aktualisieren
+            je_semester: Dict[Semester, list] = {}
+            for modul, alter_beitrag in alte_beitraege.items():
+                neuer_beitrag = modul._beitrag()
+                for semester in modul._enthalten_in:
+                    je_semester.setdefault(semester, []).append((modul, alter_beitrag, neuer_beitrag))
+            for semester, eintraege in je_semester.items():
+                semester._ersetze_beitraege(eintraege)
+            for nummer, module in neu_je_semester.items():
+                self._semester[nummer - 1].fuege_module_hinzu(module)
+            for modul in alte_beitraege:
+                modul._markiere_geaendert()
+        finally:
+            self._beobachter = beobachter
+        # Geändert haben sich nur Module und Semester (bereits vorgemerkt); der
+        # Studiengang selbst wird nicht vorgemerkt, damit Journal und SQLite
+        # weiterhin nur die protokollierten Einzeländerungen schreiben
+        self._version += 1
+        for beobachter in self._beobachter:
+            beobachter(self)
+        return list(betroffen)
+    
+    def pruefe_aenderungen(self, aenderungen: Iterable) -> List[List[str]]:
+        """
+        Prüft Änderungen wie wende_aenderungen_an, ohne etwas zu ändern.
+        
+        Module, die eine frühere Änderung anlegt, gelten für spätere
+        Änderungen als vorhanden.
+        
+        Args:
+            aenderungen: ModulAnlage-, NotenEintrag- und StatusAenderung-Objekte
+            
+        Returns:
+            Die Verstöße je Änderung (eine leere Liste für gültige Änderungen)
+        """
+        neue_codes = set()
+        return [self._pruefe_aenderung(aenderung, neue_codes) for aenderung in aenderungen]
+    
+    def _pruefe_aenderung(self, aenderung, neue_codes: set) -> List[str]:
+        """
+        Prüft eine Änderung für wende_aenderungen_an.
+        
+        Es werden dieselben Regeln wie in den Konstruktoren von Modul und
+        Pruefungsleistung geprüft, aber alle Verstöße gesammelt. Falsch
+        typisierte Werte (z.B. eine Semesternummer als String) gelten ebenfalls
+        als Verstoß.
+        
+        Args:
+            aenderung: Die zu prüfende Änderung
+            neue_codes: Die Modulcodes, die frühere Änderungen anlegen (wird ergänzt)
+            
+        Returns:
+            Die Liste der Verstöße (leer wenn gültig)
+        """
+        verstoesse = []
+        if isinstance(aenderung, ModulAnlage):
+            if not ist_ganzzahl(aenderung.semester_nummer):
+                verstoesse.append(f"Ungültige Semesternummer {aenderung.semester_nummer!r}")
+            elif not 1 <= aenderung.semester_nummer <= len(self._semester):
+                verstoesse.append(f"Semester {aenderung.semester_nummer} existiert nicht")
+            modulcode = aenderung.modulcode
+            if not isinstance(modulcode, str):
+                verstoesse.append(f"Ungültiger Modulcode {modulcode!r}")
+            elif not modulcode:
+                verstoesse.append("Modulcode darf nicht leer sein")
+            elif modulcode in self._modul_index or modulcode in neue_codes:
+                verstoesse.append(f"Modulcode {modulcode} ist bereits vergeben")
+            if not isinstance(aenderung.name, str) or not aenderung.name:
+                verstoesse.append("Der Name darf nicht leer sein")
+            if not ist_ganzzahl(aenderung.ects) or aenderung.ects <= 0:
+                verstoesse.append("ECTS müssen eine Ganzzahl größer als 0 sein")
+            if not ist_ganzzahl(aenderung.semester_empfehlung) or aenderung.semester_empfehlung < 1:
+                verstoesse.append("Semester-Empfehlung muss eine Ganzzahl von mindestens 1 sein")
+            if not verstoesse:
+                neue_codes.add(modulcode)
+        elif isinstance(aenderung, (NotenEintrag, StatusAenderung)):
+            if not isinstance(aenderung.modulcode, str):
+                verstoesse.append(f"Ungültiger Modulcode {aenderung.modulcode!r}")
+            elif aenderung.modulcode not in self._modul_index and aenderung.modulcode not in neue_codes:
+                verstoesse.append(f"Modul {aenderung.modulcode} existiert nicht")
+            if isinstance(aenderung, StatusAenderung):
+                if not isinstance(aenderung.status, ModulStatus):
+                    verstoesse.append(f"Unbekannter Status '{aenderung.status}'")
+            else:
+                if not ist_zahl(aenderung.note) or not 1.0 <= aenderung.note <= 5.0:
+                    verstoesse.append("Note muss zwischen 1.0 und 5.0 liegen")
+                if not ist_ganzzahl(aenderung.versuch) or aenderung.versuch < 1:
+                    verstoesse.append("Versuch muss eine Ganzzahl von mindestens 1 sein")
+                if not isinstance(aenderung.datum, date):
+                    verstoesse.append(f"Ungültiges Datum '{aenderung.datum}'")
+                if not isinstance(aenderung.art, Pruefungsart):
+                    verstoesse.append(f"Unbekannte Prüfungsart '{aenderung.art}'")
+        else:
+            verstoesse.append(f"Unbekannte Änderung {aenderung!r}")
+        return verstoesse
+    
     def hole_abgeschlossene_modulen(self) -> List[Modul]:
         """
         Gibt alle abgeschlossenen Module zurück.
         
         Returns:
-            Liste der abgeschlossenen Module
+            Liste der abgeschlossenen Module (je Semester erst bestandene,
+            dann nicht bestandene)
         """
-        return [m for m in self.hole_alle_modulen() if m.ist_abgeschlossen()]
+        abgeschlossene = []
+        for semester in self._semester:
+            gruppen = semester._statusgruppen()
+            abgeschlossene.extend(gruppen[ModulStatus.BESTANDEN])
+            abgeschlossene.extend(gruppen[ModulStatus.NICHT_BESTANDEN])
+        return abgeschlossene
     
-    def berechne_durchschnitt(self) -> float:
+    def hole_module_mit_status(self, status: ModulStatus) -> List[Modul]:
         """
-        Berechnet den gewichteten Notendurchschnitt über alle bestandenen Module.
+        Gibt die Module mit einem Status über alle Semester zurück.
+        
+        Es werden nur die Statusgruppen der Semester gelesen, nicht alle Module
+        (nur beim ersten Aufruf werden die Gruppen je Semester einmal aufgebaut).
         
+        Args:
+            status: Der gesuchte Status
+            
         Returns:
-            Der gewichtete Notendurchschnitt oder 0.0 wenn keine Noten vorhanden
+            Die Module in Semesterreihenfolge
+        """
+        module = []
+        for semester in self._semester:
+            module.extend(semester._statusgruppen()[status])
+        return module
+    
+    @property
+    def bestandene_ects(self) -> int:
+        """Getter für die ECTS der bestandenen Module."""
+        return self._bestandene_ects
+    
+    def anzahl_module_mit_status(self, status: ModulStatus) -> int:
         """
-        bestandene_module = [m for m in self.hole_alle_modulen() if m.ist_bestanden()]
+        Gibt die Anzahl der Module mit einem Status über alle Semester zurück.
         
-        if not bestandene_module:
-            return 0.0
+        Args:
+            status: Der gesuchte Status
+            
+        Returns:
+            Die Anzahl der Module mit diesem Status
+        """
+        return self._status_anzahl[status]
+    
+    def berechne_durchschnitt(self) -> float:
+        """
+        Berechnet den gewichteten Notendurchschnitt über alle bestandenen Module.
         
-        gewichtete_summe = sum(m.hole_note() * m.ects for m in bestandene_module if m.hole_note())
-        gesamt_ects = sum(m.ects for m in bestandene_module)
+        Die Summen werden von den Semestern laufend aktualisiert.
         
-        if gesamt_ects == 0:
+        Returns:
+            Der gewichtete Notendurchschnitt oder 0.0 wenn keine Noten vorhanden
+        """
+        if not self._bestandene_ects:
             return 0.0
+        return round(self._noten_summe / (self._bestandene_ects * NOTEN_SKALA), 2)
+    
+    @property
+    def gesamt_ects_ziel(self) -> int:
+        """
+        Getter für die Gesamt-ECTS des Abschlusses.
         
-        return round(gewichtete_summe / gesamt_ects, 2)
+        Annahme: Ein Bachelor hat 180 ECTS, ein Master 120 ECTS, ein Diplom 240 ECTS.
+        """
+        if self._abschluss == Abschluss.BACHELOR:
+            return 180
+        elif self._abschluss == Abschluss.MASTER:
+            return 120
+        else:  # DIPLOM
+            return 240
     
     def berechne_fortschritt(self) -> float:
         """
@@ -201,18 +544,7 @@ class Studiengang:
         Returns:
             Der Fortschritt in Prozent (0.0 - 100.0)
         """
-        # Gesamt-ECTS je nach Abschluss
-        if self._abschluss == Abschluss.BACHELOR:
-            gesamt_ects_ziel = 180
-        elif self._abschluss == Abschluss.MASTER:
-            gesamt_ects_ziel = 120
-        else:  # DIPLOM
-            gesamt_ects_ziel = 240
-        
-        # Erreichte ECTS aus bestandenen Modulen
-        erreichte_ects = sum(m.ects for m in self.hole_alle_modulen() if m.ist_bestanden())
-        
-        fortschritt = (erreichte_ects / gesamt_ects_ziel) * 100
+        fortschritt = (self._bestandene_ects / self.gesamt_ects_ziel) * 100
         return round(min(fortschritt, 100.0), 2)
     
     def berechne_verbleibende_ects(self) -> int:
@@ -222,16 +554,268 @@ class Studiengang:
         Returns:
             Die Anzahl der verbleibenden ECTS
         """
-        # Gesamt-ECTS je nach Abschluss
-        if self._abschluss == Abschluss.BACHELOR:
-            gesamt_ects_ziel = 180
-        elif self._abschluss == Abschluss.MASTER:
-            gesamt_ects_ziel = 120
-        else:  # DIPLOM
-            gesamt_ects_ziel = 240
+        return max(0, self.gesamt_ects_ziel - self._bestandene_ects)
+    
+    def berechne_benoetigten_durchschnitt(self) -> Optional[float]:
+        """
+        Berechnet den schlechtesten Durchschnitt, den die verbleibenden ECTS noch haben dürfen.
+        
+        Erreichen die verbleibenden ECTS genau diesen Durchschnitt, liegt der
+        Gesamtdurchschnitt auf dem Ziel-Notendurchschnitt. Das Ergebnis wird auf
+        zwei Nachkommastellen abgerundet (zur sicheren Seite).
+        
+        Returns:
+            Der höchstens erlaubte Durchschnitt oder None wenn keine ECTS mehr offen sind;
+            ein Wert unter 1.0 bedeutet, dass das Ziel nicht mehr erreichbar ist, ein
+            Wert ab 4.0, dass jede bestandene Note genügt
+        """
+        verbleibend = self.berechne_verbleibende_ects()
+        if not verbleibend:
+            return None
+        erlaubt = (self._ziel_notendurchschnitt * (self._bestandene_ects + verbleibend)
+                   - self._noten_summe / NOTEN_SKALA) / verbleibend
+        # Rechenfehler im Bereich der Maschinengenauigkeit dürfen nicht abrunden
+        return math.floor(round(erlaubt * 100, 6)) / 100
+    
+    def _veraendere_summen(self, noten_summe: int, bestandene_ects: int,
+                           status_anzahl: Dict[ModulStatus, int]) -> None:
+        """
+        Verändert die laufenden Summen (aufgerufen von den Semestern).
+        
+        Args:
+            noten_summe: Änderung der Summe Note · ECTS · NOTEN_SKALA
+            bestandene_ects: Änderung der bestandenen ECTS
+            status_anzahl: Änderung der Anzahl je Status
+        """
+        self._noten_summe += noten_summe
+        self._bestandene_ects += bestandene_ects
+        for status, anzahl in status_anzahl.items():
+            self._status_anzahl[status] += anzahl
+    
+    @property
+    def version(self) -> int:
+        """Getter für den Änderungszähler (steigt mit jeder Änderung im Studiengang)."""
+        return self._version
+    
+    def ist_geaendert(self) -> bool:
+        """
+        Prüft, ob seit dem letzten Laden oder Speichern etwas geändert wurde.
+        
+        Returns:
+            True wenn ungespeicherte Änderungen vorliegen, sonst False
+        """
+        return bool(self._geaenderte)
+    
+    def hole_geaenderte_objekte(self) -> List[object]:
+        """
+        Gibt die seit dem letzten Laden oder Speichern geänderten Objekte zurück.
+        
+        Returns:
+            Studiengang, Semester, Module und Prüfungsleistungen in der
+            Reihenfolge ihrer ersten Änderung
+        """
+        return list(self._geaenderte)
+    
+    def markiere_gespeichert(self) -> None:
+        """Setzt die geänderten Objekte zurück (nach dem Laden oder Speichern)."""
+        self._geaenderte.clear()
+    
+    def registriere_beobachter(self, beobachter: Callable[[object], None]) -> None:
+        """
+        Registriert eine Funktion, die bei jeder Änderung aufgerufen wird.
         
-        erreichte_ects = sum(m.ects for m in self.hole_alle_modulen() if m.ist_bestanden())
-        return max(0, gesamt_ects_ziel - erreichte_ects)
+        Args:
+            beobachter: Funktion, die das geänderte Objekt erhält
+        """
+        self._beobachter.append(beobachter)
+    
+    def entferne_beobachter(self, beobachter: Callable[[object], None]) -> None:
+        """
+        Entfernt einen registrierten Beobachter.
+        
+        Args:
+            beobachter: Der zu entfernende Beobachter
+            
+        Raises:
+            ValueError: Wenn der Beobachter nicht registriert ist
+        """
+        self._beobachter.remove(beobachter)
+    
+    def _markiere_geaendert(self, objekt=None) -> None:
+        """
+        Erhöht den Änderungszähler, merkt das Objekt vor und benachrichtigt die Beobachter.
+        
+        Args:
+            objekt: Das geänderte Objekt (Standard: der Studiengang selbst)
+        """
+        if objekt is None:
+            objekt = self
+        self._version += 1
+        self._geaenderte[objekt] = None
+        for beobachter in self._beobachter:
+            beobachter(objekt)
+    
+    def _pruefe_modulcode_frei(self, modulcode: str) -> None:
+        """
+        Prüft, ob ein Modulcode im Studiengang noch frei ist.
+        
+        Args:
+            modulcode: Der zu prüfende Modulcode
+            
+        Raises:
+            ValueError: Wenn bereits ein Modul diesen Code hat
+        """
+        if modulcode in self._modul_index:
+            raise ValueError(f"Modulcode {modulcode} ist im Studiengang bereits vergeben")
+    
+    def _nimm_in_index_auf(self, module: List[Modul]) -> None:
+        """
+        Nimmt Module in den Modulcode-Index auf (alle oder keines).
+        
+        Args:
+            module: Die aufzunehmenden Module
+            
+        Raises:
+            ValueError: Wenn ein Modulcode bereits vergeben ist oder doppelt vorkommt
+        """
+        neue_codes = set()
+        for modul in module:
+            self._pruefe_modulcode_frei(modul.modulcode)
+            if modul.modulcode in neue_codes:
+                raise ValueError(f"Modulcode {modul.modulcode} kommt mehrfach vor")
+            neue_codes.add(modul.modulcode)
+        for modul in module:
+            self._modul_index[modul.modulcode] = modul
+        if self._suchindex is not None:
+            for modul in module:
+                self._suchindex.fuege_hinzu(modul)
+    
+    def _entferne_aus_index(self, modul: Modul) -> None:
+        """
+        Entfernt ein Modul aus dem Modulcode-Index.
+        
+        Args:
+            modul: Das entfernte Modul
+        """
+        if self._modul_index.get(modul.modulcode) is modul:
+            del self._modul_index[modul.modulcode]
+        if self._suchindex is not None:
+            self._suchindex.entferne(modul)
+    
+    def _benenne_im_index_um(self, alter_code: str, modul: Modul) -> None:
+        """
+        Trägt ein umbenanntes Modul unter seinem neuen Code in den Index ein.
+        
+        Args:
+            alter_code: Der bisherige Modulcode
+            modul: Das Modul mit dem neuen Code
+        """
+        if self._modul_index.get(alter_code) is modul:
+            del self._modul_index[alter_code]
+        self._modul_index[modul.modulcode] = modul
+        self._aktualisiere_suchindex(modul)
+    
+    def _aktualisiere_suchindex(self, modul: Modul) -> None:
+        """
+        Führt den Suchindex nach einer Änderung von Code oder Name nach.
+        
+        Args:
+            modul: Das geänderte Modul
+        """
+        if self._suchindex is not None:
+            self._suchindex.aktualisiere(modul)
+    
+    def _baue_index(self) -> None:
+        """
+        Baut den Modulcode-Index einmalig aus allen Semestern auf.
+        
+        Ältere Dateien können doppelte Modulcodes enthalten; dann verweist
+        der Index auf das erste Modul, die Datei wird aber weiterhin geladen.
+        """
+        module = list(self.iter_alle_module())
+        # Rückwärts eingetragen, damit bei doppelten Codes das erste Modul gewinnt
+        self._modul_index = {modul._modulcode: modul for modul in reversed(module)}
+    
+    def _berechne_summen(self) -> None:
+        """Fasst die laufenden Summen einmalig aus allen Semestern zusammen."""
+        self._noten_summe = sum(s._noten_summe for s in self._semester)
+        self._bestandene_ects = sum(s._bestandene_ects for s in self._semester)
+        self._status_anzahl = {status: 0 for status in ModulStatus}
+        self._status_anzahl.update(Counter(modul._status for modul in self.iter_alle_module()))
+    
+    def als_tupel(self) -> tuple:
+        """
+        Gibt den Zustand als Tupel einfacher Werte zurück (für die Serialisierung).
+        
+        Returns:
+            (name, Name des Abschlusses, gesamtdauer, ziel_notendurchschnitt,
+            ziel_abschlussdauer, Semester als Tupel)
+        """
+        return (self._name, self._abschluss.name, self._gesamtdauer, self._ziel_notendurchschnitt,
+                self._ziel_abschlussdauer, tuple(s.als_tupel() for s in self._semester))
+    
+    @classmethod
+    def aus_tupel(cls, daten: tuple) -> 'Studiengang':
+        """
+        Erstellt einen Studiengang aus als_tupel und prüft dabei Typen und Wertebereiche.
+        
+        Args:
+            daten: Das Tupel aus als_tupel
+            
+        Returns:
+            Der erstellte Studiengang
+            
+        Raises:
+            ValueError: Wenn ein Wert ungültig ist
+        """
+        name, abschluss, gesamtdauer, ziel_notendurchschnitt, ziel_abschlussdauer, semester = daten
+        studiengang = cls.__new__(cls)
+        studiengang._name = pruefe_text(name, "Name")
+        studiengang._abschluss = enum_aus_name(Abschluss, abschluss, "Abschluss")
+        studiengang._gesamtdauer = pruefe_ganzzahl(gesamtdauer, "Gesamtdauer", 1)
+        studiengang._ziel_notendurchschnitt = pruefe_note(ziel_notendurchschnitt, 1.0, 4.0)
+        studiengang._ziel_abschlussdauer = pruefe_ganzzahl(ziel_abschlussdauer, "Ziel-Abschlussdauer", 1)
+        if ziel_abschlussdauer > gesamtdauer:
+            raise ValueError("Ziel-Abschlussdauer muss zwischen 1 und Gesamtdauer liegen")
+        studiengang._version = 0
+        studiengang._geaenderte = {studiengang: None}
+        studiengang._beobachter = []
+        studiengang._suchindex = None
+        studiengang._semester = [Semester.aus_tupel(s) for s in semester]
+        for s in studiengang._semester:
+            s._studiengang = studiengang
+        studiengang._berechne_summen()
+        studiengang._baue_index()
+        return studiengang
+    
+    def __getstate__(self) -> dict:
+        """
+        Gibt den Zustand für pickle zurück (die Klasse hat kein __dict__).
+        
+        Returns:
+            Die Attribute als Dictionary
+        """
+        return {name: getattr(self, name) for name in self.__slots__ if name not in self._FLUECHTIG}
+    
+    def __setstate__(self, zustand: dict) -> None:
+        """
+        Stellt den Zustand beim Entpicklen her (auch aus Dateien ohne laufende Summen).
+        
+        Args:
+            zustand: Die gespeicherten Attribute
+        """
+        self._version = 0
+        self._geaenderte = {}
+        self._beobachter = []
+        self._suchindex = None
+        for name, wert in zustand.items():
+            setattr(self, name, wert)
+        if '_status_anzahl' not in zustand:
+            for semester in self._semester:
+                semester._studiengang = self
+            self._berechne_summen()
+        if '_modul_index' not in zustand:
+            self._baue_index()
     
     def __str__(self) -> str:
         """String-Repräsentation des Studiengangs."""
@@ -0,0 +1,318 @@
+"""
+Suchindex über Modulcode und Name der Module eines Studiengangs.
+
+Der Studiengang baut den Index erst bei der ersten Suche auf und führt ihn
+danach beim Hinzufügen, Entfernen und Umbenennen von Modulen nach, so wie den
+Modulcode-Index.
+"""
+
+import re
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .modul import Modul
+
+_WORT = re.compile(r"\w+")
+
+
+class ModulSuchindex:
+    """
+    Präfix- und Trigramm-Index für die Modulsuche.
+    
+    Groß-/Kleinschreibung wird ignoriert. Treffer werden in dieser Rangfolge
+    geliefert:
+    1. der Modulcode beginnt mit der Anfrage (nach Code sortiert, exakter Code zuerst)
+    2. ein Wort des Namens beginnt mit der Anfrage (nach Wort sortiert)
+    3. Modulcode oder Name enthalten die Anfrage (ab 3 Zeichen, über Trigramme,
+       kürzere Texte zuerst)
+    4. bei mehreren Wörtern: jedes Wort der Anfrage passt für sich, in
+       beliebiger Reihenfolge (als Anfang eines Wortes oder ab 3 Zeichen als
+       Teilstring; kürzere Texte zuerst)
+    Jede Stufe wird nur so weit gelesen, bis genug Treffer gefunden sind.
+    
+    Attributes:
+        _nummern: Interne Nummer je Modul
+        _module: Modul je interner Nummer
+        _texte: Indexierter Text je Nummer (Code und Name in Kleinschreibung)
+        _codes: Sortierte Liste aus (Code, Nummer)
+        _woerter: Sortierte Liste aus (Wort des Namens, Nummer)
+        _trigramme: Nummern je Trigramm des Textes
+        _naechste_nummer: Die Nummer für das nächste Modul
+    """
+    
+    __slots__ = ('_nummern', '_module', '_texte', '_codes', '_woerter', '_trigramme', '_naechste_nummer')
+    
+    # Bis zu dieser Anzahl Kandidaten werden Teilstring-Treffer nach Textlänge sortiert
+    _SORTIER_GRENZE = 2000
+    
+    def __init__(self, module: Iterable[Modul] = ()):
+        """
+        Initialisiert den Index und nimmt die Module in einem Schritt auf.
+        
+        Args:
+            module: Die aufzunehmenden Module
+        """
+        self._nummern: Dict[Modul, int] = {}
+        self._module: Dict[int, Modul] = {}
+        self._texte: Dict[int, str] = {}
+        self._codes: List[Tuple[str, int]] = []
+        self._woerter: List[Tuple[str, int]] = []
+        self._trigramme: Dict[str, Set[int]] = defaultdict(set)
+        self._naechste_nummer = 0
+        for modul in module:
+            if modul not in self._nummern:
+                self._nimm_auf(modul, sortiert=False)
+        self._codes.sort()
+        self._woerter.sort()
+    
+    def __len__(self) -> int:
+        """Anzahl der indexierten Module."""
+        return len(self._nummern)
+    
+    def __contains__(self, modul: Modul) -> bool:
+        """Prüft, ob ein Modul im Index ist."""
+        return modul in self._nummern
+    
+    def fuege_hinzu(self, modul: Modul) -> None:
+        """
+        Nimmt ein Modul in den Index auf (ohne Wirkung, wenn es schon enthalten ist).
+        
+        Args:
+            modul: Das aufzunehmende Modul
+        """
+        if modul not in self._nummern:
+            self._nimm_auf(modul, sortiert=True)
+    
+    def entferne(self, modul: Modul) -> None:
+        """
+        Entfernt ein Modul aus dem Index (ohne Wirkung, wenn es nicht enthalten ist).
+        
+        Args:
+            modul: Das zu entfernende Modul
+        """
+        nummer = self._nummern.pop(modul, None)
+        if nummer is None:
+            return
+        del self._module[nummer]
+        text = self._texte.pop(nummer)
+        code, name = text.split("\n", 1)
+        self._entferne_eintrag(self._codes, (code, nummer))
+        for wort in set(_WORT.findall(name)):
+            self._entferne_eintrag(self._woerter, (wort, nummer))
+        for trigramm in self._zerlege(text):
+            nummern = self._trigramme[trigramm]
+            nummern.discard(nummer)
+            if not nummern:
+                del self._trigramme[trigramm]
+    
+    def aktualisiere(self, modul: Modul) -> None:
+        """
+        Indexiert ein Modul nach einer Änderung von Code oder Name neu.
+        
+        Module, die nicht im Index sind oder deren Code und Name unverändert
+        sind, werden übersprungen.
+        
+        Args:
+            modul: Das geänderte Modul
+        """
+        nummer = self._nummern.get(modul)
+        if nummer is not None and self._texte[nummer] != self._text(modul):
+            self.entferne(modul)
+            self._nimm_auf(modul, sortiert=True)
+    
+    def suche(self, anfrage: str, anzahl: int = 10) -> List[Modul]:
+        """
+        Sucht Module über Modulcode und Name.
+        
+        Args:
+            anfrage: Der Suchtext
+            anzahl: Die maximale Anzahl der Treffer (Standard: 10)
+        
+        Returns:
+            Die besten Treffer in der Rangfolge der Klasse
+        """
+        anfrage = anfrage.strip().casefold()
+        if not anfrage or anzahl < 1:
+            return []
+        treffer: Dict[int, None] = {}
+        self._sammle_praefix(self._codes, anfrage, treffer, anzahl)
+        self._sammle_praefix(self._woerter, anfrage, treffer, anzahl)
+        if len(treffer) < anzahl and len(anfrage) >= 3:
+            self._sammle_teilstring(anfrage, treffer, anzahl)
+        woerter = list(dict.fromkeys(_WORT.findall(anfrage)))
+        if len(treffer) < anzahl and len(woerter) > 1:
+            self._sammle_woerter(woerter, treffer, anzahl)
+        return [self._module[nummer] for nummer in treffer]
+    
+    @staticmethod
+    def _text(modul: Modul) -> str:
+        """Indexierter Text eines Moduls (Code und Name, durch einen Zeilenumbruch getrennt)."""
+        return f"{modul.modulcode.casefold()}\n{modul.name.casefold()}"
+    
+    @staticmethod
+    def _zerlege(text: str) -> Set[str]:
+        """Zerlegt einen Text in seine Trigramme."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @staticmethod
+    def _praefix_bereich(liste: List[Tuple[str, int]], wort: str) -> range:
+        """Positionen der Einträge einer sortierten Liste, deren Schlüssel mit dem Wort beginnt."""
+        return range(bisect_left(liste, (wort,)), bisect_left(liste, (wort + "\U0010ffff",)))
+    
+    @staticmethod
+    def _entferne_eintrag(liste: List[Tuple[str, int]], eintrag: Tuple[str, int]) -> None:
+        """Entfernt einen Eintrag aus einer sortierten Liste."""
+        position = bisect_left(liste, eintrag)
+        if position < len(liste) and liste[position] == eintrag:
+            del liste[position]
+    
+    def _nimm_auf(self, modul: Modul, sortiert: bool) -> None:
+        """
+        Nimmt ein Modul in alle Teilindizes auf.
+        
+        Args:
+            modul: Das aufzunehmende Modul
+            sortiert: Ob sortiert eingefügt wird (sonst wird anschließend einmal sortiert)
+        """
+        nummer = self._naechste_nummer
+        self._naechste_nummer += 1
+        text = self._text(modul)
+        code, name = text.split("\n", 1)
+        self._nummern[modul] = nummer
+        self._module[nummer] = modul
+        self._texte[nummer] = text
+        eintraege = [(code, nummer)]
+        eintraege.extend((wort, nummer) for wort in set(_WORT.findall(name)))
+        if sortiert:
+            insort(self._codes, eintraege[0])
+            for eintrag in eintraege[1:]:
+                insort(self._woerter, eintrag)
+        else:
+            self._codes.append(eintraege[0])
+            self._woerter.extend(eintraege[1:])
+        trigramme = self._trigramme
+        for trigramm in self._zerlege(text):
+            trigramme[trigramm].add(nummer)
+    
+    @staticmethod
+    def _sammle_praefix(liste: List[Tuple[str, int]], anfrage: str,
+                        treffer: Dict[int, None], anzahl: int) -> None:
+        """
+        Sammelt Treffer aus einer sortierten Liste, deren Schlüssel mit der Anfrage beginnt.
+        
+        Args:
+            liste: Die sortierte Liste aus (Schlüssel, Nummer)
+            anfrage: Der Suchtext in Kleinschreibung
+            treffer: Die bisherigen Treffer (wird ergänzt)
+            anzahl: Die maximale Anzahl der Treffer
+        """
+        position = bisect_left(liste, (anfrage,))
+        ende = len(liste)
+        while position < ende and len(treffer) < anzahl:
+            schluessel, nummer = liste[position]
+            if not schluessel.startswith(anfrage):
+                break
+            treffer[nummer] = None
+            position += 1
+    
+    def _sammle_teilstring(self, anfrage: str, treffer: Dict[int, None], anzahl: int) -> None:
+        """
+        Sammelt Treffer, deren Code oder Name die Anfrage enthält.
+        
+        Gelesen wird nur die kleinste Nummernmenge der Trigramme der Anfrage;
+        jeder Kandidat wird am gespeicherten Text bestätigt. Bei wenigen
+        Kandidaten werden kürzere Texte (genauere Treffer) zuerst geliefert,
+        sonst wird nach den ersten passenden Kandidaten abgebrochen.
+        
+        Args:
+            anfrage: Der Suchtext in Kleinschreibung (mindestens 3 Zeichen)
+            treffer: Die bisherigen Treffer (wird ergänzt)
+            anzahl: Die maximale Anzahl der Treffer
+        """
+        kandidaten = None
+        for trigramm in self._zerlege(anfrage):
+            nummern = self._trigramme.get(trigramm)
+            if not nummern:
+                return
+            if kandidaten is None or len(nummern) < len(kandidaten):
+                kandidaten = nummern
+        texte = self._texte
+        if len(kandidaten) <= self._SORTIER_GRENZE:
+            passend = [(len(texte[nummer]), nummer) for nummer in kandidaten
+                       if nummer not in treffer and anfrage in texte[nummer]]
+            passend.sort()
+            for _, nummer in passend[:anzahl - len(treffer)]:
+                treffer[nummer] = None
+            return
+        for nummer in kandidaten:
+            if nummer not in treffer and anfrage in texte[nummer]:
+                treffer[nummer] = None
+                if len(treffer) >= anzahl:
+                    return
+    
+    def _kandidaten(self, wort: str) -> Optional[Set[int]]:
+        """
+        Liefert die Nummern, unter denen alle Treffer für ein einzelnes Wort liegen.
+        
+        Ab 3 Zeichen ist das die kleinste Nummernmenge der Trigramme des Wortes,
+        sonst die Nummern mit passendem Code- oder Wortanfang.
+        
+        Args:
+            wort: Das Wort in Kleinschreibung
+        
+        Returns:
+            Die Kandidaten (Obermenge der Treffer) oder None wenn es keine gibt
+        """
+        if len(wort) >= 3:
+            kandidaten: Set[int] = set()
+            for trigramm in self._zerlege(wort):
+                nummern = self._trigramme.get(trigramm)
+                if not nummern:
+                    return None
+                if not kandidaten or len(nummern) < len(kandidaten):
+                    kandidaten = nummern
+            return kandidaten
+        kandidaten = {self._codes[i][1] for i in self._praefix_bereich(self._codes, wort)}
+        kandidaten.update(self._woerter[i][1] for i in self._praefix_bereich(self._woerter, wort))
+        return kandidaten or None
+    
+    def _passt(self, nummer: int, wort: str) -> bool:
+        """Prüft, ob ein einzelnes Wort der Anfrage zum Text einer Nummer passt."""
+        text = self._texte[nummer]
+        if len(wort) >= 3:
+            return wort in text
+        return any(teil.startswith(wort) for teil in _WORT.findall(text))
+    
+    def _sammle_woerter(self, woerter: List[str], treffer: Dict[int, None], anzahl: int) -> None:
+        """
+        Sammelt Treffer, zu denen jedes Wort der Anfrage für sich passt.
+        
+        Gelesen werden nur die Kandidaten des seltensten Wortes; jeder Kandidat
+        wird mit allen Wörtern am gespeicherten Text bestätigt. Die Reihenfolge
+        folgt _sammle_teilstring.
+        
+        Args:
+            woerter: Die Wörter der Anfrage in Kleinschreibung (mindestens zwei)
+            treffer: Die bisherigen Treffer (wird ergänzt)
+            anzahl: Die maximale Anzahl der Treffer
+        """
+        kleinste = None
+        for wort in woerter:
+            kandidaten = self._kandidaten(wort)
+            if kandidaten is None:
+                return
+            if kleinste is None or len(kandidaten) < len(kleinste):
+                kleinste = kandidaten
+        passend = (nummer for nummer in kleinste
+                   if nummer not in treffer and all(self._passt(nummer, wort) for wort in woerter))
+        texte = self._texte
+        if len(kleinste) <= self._SORTIER_GRENZE:
+            sortiert = sorted((len(texte[nummer]), nummer) for nummer in passend)
+            for _, nummer in sortiert[:anzahl - len(treffer)]:
+                treffer[nummer] = None
+            return
+        for nummer in passend:
+            treffer[nummer] = None
+            if len(treffer) >= anzahl:
+                return
@@ -0,0 +1,230 @@
+"""
+Prüfungen für Werte aus Dateien und Änderungslisten.
+
+Die Setter der Domänenklassen validieren nur Wertebereiche; beim Laden aus
+Dateien (aus_tupel) und beim Anwenden von Änderungen kommen die Werte aber
+ungeprüft von außen. Diese Funktionen prüfen zusätzlich die Typen und melden
+Fehler einheitlich als ValueError.
+"""
+
+from datetime import date
+from enum import Enum
+from typing import Type, TypeVar
+
+E = TypeVar('E', bound=Enum)
+
+
+def ist_ganzzahl(wert) -> bool:
+    """
+    Prüft, ob ein Wert eine Ganzzahl ist (bool zählt nicht).
+    
+    Args:
+        wert: Der zu prüfende Wert
+    
+    Returns:
+        True wenn der Wert ein int, aber kein bool ist
+    """
+    return isinstance(wert, int) and not isinstance(wert, bool)
+
+
+def ist_zahl(wert) -> bool:
+    """
+    Prüft, ob ein Wert eine Zahl ist (bool zählt nicht).
+    
+    Args:
+        wert: Der zu prüfende Wert
+    
+    Returns:
+        True wenn der Wert ein int oder float, aber kein bool ist
+    """
+    return isinstance(wert, (int, float)) and not isinstance(wert, bool)
+
+
+def pruefe_text(wert, bezeichnung: str) -> str:
+    """
+    Prüft, ob ein Wert ein nicht leerer String ist.
+    
+    Args:
+        wert: Der zu prüfende Wert
+        bezeichnung: Der Name des Feldes für die Fehlermeldung
+    
+    Returns:
+        Der geprüfte Wert
+    
+    Raises:
+        ValueError: Wenn der Wert kein oder ein leerer String ist
+    """
+    if not isinstance(wert, str) or not wert:
+        raise ValueError(f"{bezeichnung} darf nicht leer sein")
+    return wert
+
+
+def pruefe_ganzzahl(wert, bezeichnung: str, minimum: int) -> int:
+    """
+    Prüft, ob ein Wert eine Ganzzahl von mindestens minimum ist.
+    
+    Args:
+        wert: Der zu prüfende Wert
+        bezeichnung: Der Name des Feldes für die Fehlermeldung
+        minimum: Der kleinste erlaubte Wert
+    
+    Returns:
+        Der geprüfte Wert
+    
+    Raises:
+        ValueError: Wenn der Wert keine Ganzzahl oder kleiner als minimum ist
+    """
+    if not ist_ganzzahl(wert) or wert < minimum:
+        raise ValueError(f"{bezeichnung} muss eine Ganzzahl von mindestens {minimum} sein")
+    return wert
+
+
+def pruefe_note(wert, minimum: float = 1.0, maximum: float = 5.0) -> float:
+    """
+    Prüft, ob ein Wert eine Note im erlaubten Bereich ist.
+    
+    Args:
+        wert: Der zu prüfende Wert
+        minimum: Die beste erlaubte Note
+        maximum: Die schlechteste erlaubte Note
+    
+    Returns:
+        Der geprüfte Wert
+    
+    Raises:
+        ValueError: Wenn der Wert keine Zahl ist oder außerhalb des Bereichs liegt
+    """
+    if not ist_zahl(wert) or not minimum <= wert <= maximum:
+        raise ValueError(f"Note muss zwischen {minimum} und {maximum} liegen")
+    return wert
+
+
+def datum_aus_ordinal(wert, bezeichnung: str) -> date:
+    """
+    Wandelt eine Ordinalzahl in ein Datum um.
+    
+    Args:
+        wert: Das Datum als Ordinalzahl (siehe date.toordinal)
+        bezeichnung: Der Name des Feldes für die Fehlermeldung
+    
+    Returns:
+        Das Datum
+    
+    Raises:
+        ValueError: Wenn der Wert keine gültige Ordinalzahl ist
+    """
+    if not ist_ganzzahl(wert) or not 1 <= wert <= date.max.toordinal():
+        raise ValueError(f"{bezeichnung} ist kein gültiges Datum: {wert!r}")
+    return date.fromordinal(wert)
+
+
+def enum_aus_name(enum: Type[E], name, bezeichnung: str) -> E:
+    """
+    Sucht einen Enum-Wert über seinen Namen.
+    
+    Args:
+        enum: Die Enum-Klasse
+        name: Der gespeicherte Name des Werts
+        bezeichnung: Der Name des Feldes für die Fehlermeldung
+    
+    Returns:
+        Der Enum-Wert
+    
+    Raises:
+        ValueError: Wenn es keinen Wert mit diesem Namen gibt
+    """
+    if not isinstance(name, str) or name not in enum.__members__:
+        raise ValueError(f"Unbekannte(r) {bezeichnung}: {name!r}")
+    return enum[name]
+
+
+# Spaltenweise Prüfungen für das Laden vieler Objekte: jede Spalte wird einmal
+# als Ganzes geprüft statt jeder Wert einzeln (type() is int schließt bool aus)
+
+def pruefe_texte(werte: tuple, bezeichnung: str) -> None:
+    """
+    Prüft, ob alle Werte einer Spalte nicht leere Strings sind.
+    
+    Args:
+        werte: Die Spalte
+        bezeichnung: Der Name des Feldes für die Fehlermeldung
+    
+    Raises:
+        ValueError: Wenn ein Wert kein oder ein leerer String ist
+    """
+    if set(map(type, werte)) - {str} or '' in werte:
+        raise ValueError(f"{bezeichnung} darf nicht leer sein")
+
+
+def pruefe_ganzzahlen(werte: tuple, bezeichnung: str, minimum: int) -> None:
+    """
+    Prüft, ob alle Werte einer (nicht leeren) Spalte Ganzzahlen von mindestens minimum sind.
+    
+    Args:
+        werte: Die Spalte
+        bezeichnung: Der Name des Feldes für die Fehlermeldung
+        minimum: Der kleinste erlaubte Wert
+    
+    Raises:
+        ValueError: Wenn ein Wert keine Ganzzahl oder kleiner als minimum ist
+    """
+    if set(map(type, werte)) - {int} or min(werte) < minimum:
+        raise ValueError(f"{bezeichnung} muss eine Ganzzahl von mindestens {minimum} sein")
+
+
+def pruefe_noten(werte: tuple) -> None:
+    """
+    Prüft, ob alle Werte einer (nicht leeren) Spalte Noten zwischen 1.0 und 5.0 sind.
+    
+    Args:
+        werte: Die Spalte
+    
+    Raises:
+        ValueError: Wenn ein Wert keine Zahl ist oder außerhalb des Bereichs liegt
+    """
+    if set(map(type, werte)) - {float, int} or min(werte) < 1.0 or max(werte) > 5.0:
+        raise ValueError("Note muss zwischen 1.0 und 5.0 liegen")
+
+
+def daten_aus_ordinalen(werte: tuple, bezeichnung: str) -> list:
+    """
+    Wandelt eine (nicht leere) Spalte von Ordinalzahlen in Daten um.
+    
+    Gleiche Ordinalzahlen ergeben dasselbe date-Objekt.
+    
+    Args:
+        werte: Die Spalte
+        bezeichnung: Der Name des Feldes für die Fehlermeldung
+    
+    Returns:
+        Die Daten in der Reihenfolge der Spalte
+    
+    Raises:
+        ValueError: Wenn ein Wert keine gültige Ordinalzahl ist
+    """
+    if set(map(type, werte)) - {int} or min(werte) < 1 or max(werte) > date.max.toordinal():
+        raise ValueError(f"{bezeichnung} ist kein gültiges Datum")
+    nach_ordinal = {ordinal: date.fromordinal(ordinal) for ordinal in set(werte)}
+    return list(map(nach_ordinal.__getitem__, werte))
+
+
+def enums_aus_namen(enum: Type[E], namen: tuple, bezeichnung: str) -> list:
+    """
+    Sucht die Enum-Werte einer Spalte über ihre Namen.
+    
+    Args:
+        enum: Die Enum-Klasse
+        namen: Die gespeicherten Namen
+        bezeichnung: Der Name des Feldes für die Fehlermeldung
+    
+    Returns:
+        Die Enum-Werte in der Reihenfolge der Spalte
+    
+    Raises:
+        ValueError: Wenn es zu einem Namen keinen Wert gibt
+    """
+    nach_name = enum.__members__
+    unbekannt = set(namen) - nach_name.keys()
+    if unbekannt:
+        raise ValueError(f"Unbekannte(r) {bezeichnung}: {sorted(map(repr, unbekannt))[0]}")
+    return list(map(nach_name.__getitem__, namen))
@@ -0,0 +1,156 @@
+"""
+VersuchsProtokoll-Klasse für das Studien-Dashboard.
+
+Diese Klasse speichert die früheren Prüfungsversuche eines Moduls als feste
+Datensätze in einem bytearray statt als einzelne Pruefungsleistung-Objekte.
+"""
+
+import struct
+from typing import Iterator, Optional
+from .enums import Pruefungsart
+from .pruefungsleistung import Pruefungsleistung
+from .validierung import daten_aus_ordinalen
+
+_ARTEN = list(Pruefungsart)
+
+# note, datum als Ordinalzahl, versuch, art als Index in Pruefungsart
+_VERSUCH = struct.Struct('<diiB3x')
+
+
+class VersuchsProtokoll:
+    """
+    Kompaktes Protokoll früherer Prüfungsversuche eines Moduls.
+    
+    Jeder Versuch belegt einen Datensatz von 20 Bytes (Note, Datum, Versuch,
+    Prüfungsart). Die beste Note wird beim Anhängen mitgeführt, sodass sie
+    ohne Durchlauf über alle Versuche abgefragt werden kann.
+    
+    Attributes:
+        _saetze: Die Versuche als aneinandergereihte Datensätze
+        _beste: Index des Versuchs mit der besten Note (-1 wenn leer)
+    """
+    
+    __slots__ = ('_saetze', '_beste')
+    
+    def __init__(self):
+        """Initialisiert ein leeres VersuchsProtokoll."""
+        self._saetze = bytearray()
+        self._beste = -1
+    
+    def fuege_hinzu(self, pruefungsleistung: Pruefungsleistung) -> None:
+        """
+        Hängt einen Versuch an das Protokoll an.
+        
+        Args:
+            pruefungsleistung: Der abgeschlossene Versuch
+        """
+        self._haenge_an(pruefungsleistung.note, pruefungsleistung.datum.toordinal(),
+                        pruefungsleistung.versuch, _ARTEN.index(pruefungsleistung.art))
+    
+    def _haenge_an(self, note: float, datum: int, versuch: int, art: int) -> None:
+        """
+        Hängt einen Versuch an und führt die beste Note mit.
+        
+        Args:
+            note: Die Note
+            datum: Das Prüfungsdatum als Ordinalzahl
+            versuch: Die Versuchsnummer
+            art: Die Prüfungsart als Index in Pruefungsart
+        """
+        if self._beste < 0 or note < self.beste_note:
+            self._beste = len(self)
+        self._saetze += _VERSUCH.pack(note, datum, versuch, art)
+    
+    @property
+    def beste_note(self) -> Optional[float]:
+        """Getter für die beste Note aller Versuche (None wenn leer)."""
+        return self._tupel(self._beste)[0] if self._beste >= 0 else None
+    
+    def hole_besten(self) -> Optional[Pruefungsleistung]:
+        """
+        Gibt den Versuch mit der besten Note zurück.
+        
+        Returns:
+            Der Versuch als neue Pruefungsleistung oder None wenn leer
+        """
+        return self[self._beste] if self._beste >= 0 else None
+    
+    def __len__(self) -> int:
+        """Anzahl der Versuche."""
+        return len(self._saetze) // _VERSUCH.size
+    
+    def __getitem__(self, index: int) -> Pruefungsleistung:
+        """Versuch am Index als neue Pruefungsleistung (ohne erneute Validierung)."""
+        return Pruefungsleistung.aus_tupel(self._tupel(index))
+    
+    def __iter__(self) -> Iterator[Pruefungsleistung]:
+        """Iterator über die Versuche in Reihenfolge des Anhängens."""
+        for index in range(len(self)):
+            yield self[index]
+    
+    def _tupel(self, index: int) -> tuple:
+        """
+        Gibt einen Versuch im Format von Pruefungsleistung.als_tupel zurück.
+        
+        Args:
+            index: Der Index des Versuchs
+        
+        Returns:
+            (note, datum als Ordinalzahl, versuch, Name der Prüfungsart)
+        """
+        note, datum, versuch, art = _VERSUCH.unpack_from(self._saetze, _VERSUCH.size * index)
+        return (note, datum, versuch, _ARTEN[art].name)
+    
+    def als_tupel(self) -> tuple:
+        """
+        Gibt den Zustand als Tupel einfacher Werte zurück (für die Serialisierung).
+        
+        Returns:
+            Die Versuche im Format von Pruefungsleistung.als_tupel
+        """
+        return tuple(self._tupel(index) for index in range(len(self)))
+    
+    @classmethod
+    def aus_tupel(cls, daten: tuple) -> 'VersuchsProtokoll':
+        """
+        Erstellt ein VersuchsProtokoll aus als_tupel.
+        
+        Args:
+            daten: Das Tupel aus als_tupel
+        
+        Returns:
+            Das erstellte VersuchsProtokoll
+            
+        Raises:
+            ValueError: Wenn ein Versuch ungültige Werte enthält
+        """
+        protokoll = cls()
+        if daten:
+            noten, ordinale, versuche, arten = Pruefungsleistung._pruefe_spalten(daten)
+            daten_aus_ordinalen(ordinale, "Prüfungsdatum")
+            for note, datum, versuch, art in zip(noten, ordinale, versuche, arten):
+                protokoll._haenge_an(note, datum, versuch, _ARTEN.index(art))
+        return protokoll
+    
+    def __getstate__(self) -> dict:
+        """
+        Gibt den Zustand für pickle zurück (die Klasse hat kein __dict__).
+        
+        Returns:
+            Die Attribute als Dictionary
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __setstate__(self, zustand: dict) -> None:
+        """
+        Stellt den Zustand beim Entpicklen her.
+        
+        Args:
+            zustand: Die gespeicherten Attribute
+        """
+        for name, wert in zustand.items():
+            setattr(self, name, wert)
+    
+    def __str__(self) -> str:
+        """String-Repräsentation des VersuchsProtokolls."""
+        return f"VersuchsProtokoll ({len(self)} Versuche, beste Note: {self.beste_note})"
@@ -6,5 +6,7 @@ Dieses Paket enthält die Benutzeroberflächen-Komponenten.
 
 from .dashboard_view import DashboardView
 from .input_handler import InputHandler
+from .modul_auswahl import ModulAuswahl
+from .batch_verarbeitung import BatchErgebnis, BatchVerarbeitung
 
-__all__ = ['DashboardView', 'InputHandler']
+__all__ = ['DashboardView', 'InputHandler', 'ModulAuswahl', 'BatchErgebnis', 'BatchVerarbeitung']
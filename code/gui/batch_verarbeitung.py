@@ -0,0 +1,396 @@
+"""
+BatchVerarbeitung-Klasse für den nicht-interaktiven Betrieb.
+
+Befehle werden zeilenweise aus einer Datei oder von stdin gelesen, entweder
+als Kommandozeilen oder als JSON-Zeilen (eine Zeile, die mit "{" beginnt):
+
+    modul 1 DLBCSICS01 5 "Einführung in Cybersecurity"   # Semester Code ECTS Name [Empfehlung]
+    note DLBCSICS01 2.3 2025-02-15 1 KLAUSUR               # Code Note [Datum] [Versuch] [Art]
+    status DLBCSICS01 ANGEMELDET                           # Code Status
+    speichern
+    export
+    {"befehl": "note", "modulcode": "DLBCSICS01", "note": 2.3, "datum": "2025-02-15"}
+
+Alle Zeilen werden zuerst gemeinsam geprüft; fehlerhafte Zeilen werden
+gesammelt gemeldet. Die Änderungen zwischen zwei speichern/export-Befehlen
+werden gesammelt über Studiengang.wende_aenderungen_an angewendet, am Ende
+wird einmal gespeichert. Es gibt keine Rückfragen, Pausen oder Menüs.
+"""
+
+import json
+import shlex
+import sys
+import time
+from datetime import date
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+
+from domain import ModulAnlage, NotenEintrag, StatusAenderung
+from domain.enums import ModulStatus, Pruefungsart
+
+if TYPE_CHECKING:
+    from domain import Studiengang
+    from persistence import BasisDatenManager
+
+
+# Feldnamen der Kommandozeilen je Befehl (in der Reihenfolge der Argumente)
+_FELDER = {
+    'modul': ('semester', 'modulcode', 'ects', 'name', 'semester_empfehlung'),
+    'note': ('modulcode', 'note', 'datum', 'versuch', 'art'),
+    'status': ('modulcode', 'status'),
+    'speichern': (),
+    'export': (),
+}
+
+# Anzahl der Pflichtfelder je Befehl
+_PFLICHTFELDER = {'modul': 4, 'note': 2, 'status': 2, 'speichern': 0, 'export': 0}
+
+# Zeilen ohne diese Zeichen werden ohne shlex an Leerzeichen getrennt
+_SHLEX_ZEICHEN = frozenset('"\'\\#')
+
+
+class BatchErgebnis:
+    """
+    Ergebnis einer Batch-Verarbeitung.
+    
+    Attributes:
+        _ausgefuehrt: Anzahl der ausgeführten Befehle
+        _fehler: Fehlermeldungen der übersprungenen Zeilen
+        _dauer: Die Laufzeit in Sekunden
+    """
+    
+    def __init__(self, ausgefuehrt: int, fehler: List[str], dauer: float):
+        """
+        Initialisiert das BatchErgebnis.
+        
+        Args:
+            ausgefuehrt: Anzahl der ausgeführten Befehle
+            fehler: Fehlermeldungen der übersprungenen Zeilen
+            dauer: Die Laufzeit in Sekunden
+        """
+        self._ausgefuehrt = ausgefuehrt
+        self._fehler = fehler
+        self._dauer = dauer
+    
+    @property
+    def ausgefuehrt(self) -> int:
+        """Getter für die Anzahl der ausgeführten Befehle."""
+        return self._ausgefuehrt
+    
+    @property
+    def fehler(self) -> List[str]:
+        """Getter für die Fehlermeldungen (gibt eine Kopie zurück)."""
+        return self._fehler.copy()
+    
+    @property
+    def dauer(self) -> float:
+        """Getter für die Laufzeit in Sekunden."""
+        return self._dauer
+    
+    def ist_fehlerfrei(self) -> bool:
+        """
+        Prüft, ob alle Zeilen ausgeführt werden konnten.
+        
+        Returns:
+            True wenn keine Zeile übersprungen wurde, sonst False
+        """
+        return not self._fehler
+    
+    def __str__(self) -> str:
+        """String-Repräsentation des Ergebnisses."""
+        pro_sekunde = self._ausgefuehrt / self._dauer if self._dauer > 0 else 0
+        return (f"{self._ausgefuehrt} Befehle in {self._dauer:.2f} s ({pro_sekunde:,.0f}/s), "
+                f"{len(self._fehler)} fehlerhafte Zeilen")
+
+
+class BatchVerarbeitung:
+    """
+    Führt Befehle ohne Benutzerinteraktion aus.
+    
+    Attributes:
+        _studiengang: Der zu bearbeitende Studiengang
+        _daten_manager: Der DatenManager für Speichern und Export
+        _strikt: Ob bei fehlerhaften Zeilen gar nichts ausgeführt wird
+    """
+    
+    def __init__(self, studiengang: 'Studiengang', daten_manager: 'BasisDatenManager', strikt: bool = True):
+        """
+        Initialisiert die BatchVerarbeitung.
+        
+        Args:
+            studiengang: Der zu bearbeitende Studiengang
+            daten_manager: Der DatenManager für Speichern und Export
+            strikt: Ob bei fehlerhaften Zeilen gar nichts ausgeführt wird
+                (sonst werden nur die gültigen Zeilen ausgeführt)
+        """
+        self._studiengang = studiengang
+        self._daten_manager = daten_manager
+        self._strikt = strikt
+    
+    @property
+    def studiengang(self) -> 'Studiengang':
+        """Getter für den Studiengang."""
+        return self._studiengang
+    
+    @property
+    def strikt(self) -> bool:
+        """Getter für den strikten Modus."""
+        return self._strikt
+    
+    def fuehre_datei_aus(self, pfad: str) -> BatchErgebnis:
+        """
+        Führt die Befehle aus einer Datei aus.
+        
+        Args:
+            pfad: Der Pfad der Befehlsdatei ("-" für stdin)
+        
+        Returns:
+            Das BatchErgebnis
+        
+        Raises:
+            ValueError: Im strikten Modus, wenn mindestens eine Zeile fehlerhaft ist
+            IOError: Wenn die Datei nicht gelesen werden kann
+        """
+        if pfad == "-":
+            return self.fuehre_aus(sys.stdin)
+        try:
+            with open(pfad, 'r', encoding='utf-8') as datei:
+                zeilen = datei.readlines()
+        except Exception as e:
+            raise IOError(f"Fehler beim Lesen der Befehlsdatei: {e}")
+        return self.fuehre_aus(zeilen)
+    
+    def fuehre_aus(self, zeilen: Iterable[str]) -> BatchErgebnis:
+        """
+        Prüft und führt Befehlszeilen aus.
+        
+        Args:
+            zeilen: Die Befehlszeilen (Kommandozeilen oder JSON)
+        
+        Returns:
+            Das BatchErgebnis
+        
+        Raises:
+            ValueError: Im strikten Modus, wenn mindestens eine Zeile fehlerhaft ist
+            IOError: Wenn Speichern oder Export fehlschlagen
+        """
+        start = time.perf_counter()
+        befehle, fehler = self._lese_befehle(zeilen)
+        befehle = self._pruefe_befehle(befehle, fehler)
+        meldungen = [f"Zeile {zeilen_nr}: {text}" for zeilen_nr, text in sorted(fehler)]
+        
+        if meldungen and self._strikt:
+            raise ValueError(f"{len(meldungen)} fehlerhafte Zeile(n), nichts ausgeführt:\n" + "\n".join(meldungen))
+        
+        # Änderungen bis zum nächsten speichern/export gesammelt anwenden; eine
+        # zweite Note für dasselbe Modul beginnt einen neuen Block, damit der
+        # DatenManager jeden Versuch einzeln protokollieren kann
+        block = []
+        benotet = set()
+        for _, befehl in befehle:
+            if isinstance(befehl, str):
+                self._wende_an(block)
+                benotet.clear()
+                if befehl == 'speichern':
+                    self._speichere()
+                else:
+                    self._daten_manager.exportiere_csv(self._studiengang)
+                continue
+            if isinstance(befehl, NotenEintrag):
+                if befehl.modulcode in benotet:
+                    self._wende_an(block)
+                    benotet.clear()
+                benotet.add(befehl.modulcode)
+            block.append(befehl)
+        self._wende_an(block)
+        self._speichere()
+        
+        return BatchErgebnis(len(befehle), meldungen, time.perf_counter() - start)
+    
+    def _lese_befehle(self, zeilen: Iterable[str]) -> Tuple[List[Tuple[int, object]], List[Tuple[int, str]]]:
+        """
+        Wandelt die Zeilen in Änderungen bzw. die Befehle speichern/export um.
+        
+        Leere Zeilen und Kommentare (#) werden übersprungen.
+        
+        Args:
+            zeilen: Die Befehlszeilen
+        
+        Returns:
+            Die Befehle als (Zeilennummer, Änderung oder Befehlsname) und die
+            Fehler als (Zeilennummer, Meldung)
+        """
+        befehle = []
+        fehler = []
+        for zeilen_nr, zeile in enumerate(zeilen, 1):
+            zeile = zeile.strip()
+            if not zeile or zeile.startswith("#"):
+                continue
+            try:
+                if zeile.startswith("{"):
+                    werte = json.loads(zeile)
+                    if not isinstance(werte, dict):
+                        raise ValueError("JSON-Objekt erwartet")
+                    befehl = str(werte.pop('befehl', ''))
+                    self._pruefe_befehl(befehl)
+                else:
+                    if _SHLEX_ZEICHEN.isdisjoint(zeile):
+                        teile = zeile.split()
+                    else:
+                        teile = shlex.split(zeile, comments=True)
+                    befehl = teile[0]
+                    self._pruefe_befehl(befehl)
+                    felder = _FELDER[befehl]
+                    if len(teile) - 1 > len(felder):
+                        raise ValueError(f"Höchstens {len(felder)} Argumente für '{befehl}' erwartet")
+                    werte = dict(zip(felder, teile[1:]))
+                befehle.append((zeilen_nr, self._erstelle_befehl(befehl, werte)))
+            except (ValueError, TypeError, KeyError) as e:
+                fehler.append((zeilen_nr, str(e)))
+        return befehle, fehler
+    
+    def _pruefe_befehle(self, befehle: List[Tuple[int, object]],
+                        fehler: List[Tuple[int, str]]) -> List[Tuple[int, object]]:
+        """
+        Prüft die Änderungen gegen den Studiengang und entfernt ungültige.
+        
+        Eine ungültige Modulanlage macht auch spätere Änderungen an diesem
+        Modul ungültig (siehe Studiengang.pruefe_aenderungen).
+        
+        Args:
+            befehle: Die gelesenen Befehle
+            fehler: Die bisherigen Fehler als (Zeilennummer, Meldung) (wird ergänzt)
+        
+        Returns:
+            Die gültigen Befehle
+        """
+        aenderungen = [(zeilen_nr, befehl) for zeilen_nr, befehl in befehle if not isinstance(befehl, str)]
+        verstoesse = self._studiengang.pruefe_aenderungen(befehl for _, befehl in aenderungen)
+        ungueltig = set()
+        for (zeilen_nr, _), zeilen_verstoesse in zip(aenderungen, verstoesse):
+            if zeilen_verstoesse:
+                ungueltig.add(zeilen_nr)
+                fehler.append((zeilen_nr, "; ".join(zeilen_verstoesse)))
+        return [(zeilen_nr, befehl) for zeilen_nr, befehl in befehle if zeilen_nr not in ungueltig]
+    
+    @staticmethod
+    def _pruefe_befehl(befehl: str) -> None:
+        """
+        Prüft, ob ein Befehlsname bekannt ist.
+        
+        Raises:
+            ValueError: Wenn der Befehl unbekannt ist
+        """
+        if befehl not in _FELDER:
+            raise ValueError(f"Unbekannter Befehl '{befehl}' (erwartet: {', '.join(_FELDER)})")
+    
+    @staticmethod
+    def _erstelle_befehl(befehl: str, werte: dict):
+        """
+        Wandelt die Werte eines Befehls in eine Änderung um.
+        
+        Args:
+            befehl: Der Befehlsname
+            werte: Die Werte nach Feldnamen (Texte oder JSON-Werte)
+        
+        Returns:
+            Die Änderung bzw. der Befehlsname bei speichern/export
+        
+        Raises:
+            ValueError: Wenn Werte fehlen, unbekannt sind oder nicht umgewandelt werden können
+        """
+        felder = _FELDER[befehl]
+        unbekannt = [feld for feld in werte if feld not in felder]
+        if unbekannt:
+            raise ValueError(f"Unbekannte Felder für '{befehl}': {', '.join(unbekannt)}")
+        fehlend = [feld for feld in felder[:_PFLICHTFELDER[befehl]] if feld not in werte]
+        if fehlend:
+            raise ValueError(f"Fehlende Felder für '{befehl}': {', '.join(fehlend)}")
+        
+        if befehl == 'modul':
+            semester = _als_zahl(werte['semester'], "Semester")
+            empfehlung = werte.get('semester_empfehlung')
+            return ModulAnlage(semester, str(werte['modulcode']), str(werte['name']),
+                               _als_zahl(werte['ects'], "ECTS"),
+                               None if empfehlung is None else _als_zahl(empfehlung, "Semester-Empfehlung"))
+        if befehl == 'note':
+            datum = werte.get('datum')
+            try:
+                note = float(werte['note'])
+            except (TypeError, ValueError):
+                raise ValueError(f"Ungültige Note '{werte['note']}'")
+            try:
+                datum = date.today() if datum is None else date.fromisoformat(str(datum))
+            except ValueError:
+                raise ValueError(f"Ungültiges Datum '{datum}'")
+            return NotenEintrag(str(werte['modulcode']), note, datum,
+                                _als_zahl(werte.get('versuch', 1), "Versuch"),
+                                _als_enum(Pruefungsart, werte.get('art', 'KLAUSUR'), "Prüfungsart"))
+        if befehl == 'status':
+            return StatusAenderung(str(werte['modulcode']), _als_enum(ModulStatus, werte['status'], "Status"))
+        return befehl
+    
+    def _wende_an(self, block: list) -> None:
+        """
+        Wendet gesammelte Änderungen an, meldet sie dem DatenManager und leert den Block.
+        
+        Je betroffenem Modul wird die Anlage, die Prüfungsleistung und zuletzt
+        der Status protokolliert, jeweils mit dem Stand nach dem Block.
+        
+        Args:
+            block: Die gesammelten Änderungen (höchstens eine Note je Modul)
+        """
+        if not block:
+            return
+        angelegt = {}
+        benotet = set()
+        geaendert = set()
+        for aenderung in block:
+            if isinstance(aenderung, ModulAnlage):
+                angelegt[aenderung.modulcode] = aenderung.semester_nummer
+            elif isinstance(aenderung, NotenEintrag):
+                benotet.add(aenderung.modulcode)
+            else:
+                geaendert.add(aenderung.modulcode)
+        for modul in self._studiengang.wende_aenderungen_an(block):
+            code = modul.modulcode
+            if code in angelegt:
+                self._daten_manager.protokolliere_modul_hinzugefuegt(angelegt[code], modul)
+            if code in benotet:
+                self._daten_manager.protokolliere_pruefungsleistung(modul)
+            if code in geaendert:
+                self._daten_manager.protokolliere_status(modul)
+        block.clear()
+    
+    def _speichere(self) -> None:
+        """Speichert den Studiengang, sofern er seit dem letzten Speichern geändert wurde."""
+        if self._studiengang.ist_geaendert():
+            self._daten_manager.speichere_studiengang(self._studiengang)
+
+
+def _als_zahl(wert, bezeichnung: str) -> int:
+    """
+    Wandelt einen Wert in eine ganze Zahl um.
+    
+    Raises:
+        ValueError: Wenn der Wert keine ganze Zahl ist
+    """
+    if isinstance(wert, (bool, float)):
+        raise ValueError(f"Ungültige(r) {bezeichnung} '{wert}'")
+    try:
+        return int(wert)
+    except (TypeError, ValueError):
+        raise ValueError(f"Ungültige(r) {bezeichnung} '{wert}'")
+
+
+def _als_enum(enum_klasse, wert, bezeichnung: str):
+    """
+    Sucht einen Enum-Wert über den Namen (KLAUSUR) oder den Text (Klausur).
+    
+    Raises:
+        ValueError: Wenn es keinen passenden Wert gibt
+    """
+    text = str(wert).casefold()
+    for eintrag in enum_klasse:
+        if text in (eintrag.name.casefold(), eintrag.value.casefold()):
+            return eintrag
+    raise ValueError(f"Unbekannte(r) {bezeichnung} '{wert}'")
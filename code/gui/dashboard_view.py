@@ -2,12 +2,18 @@
 DashboardView-Klasse für die Visualisierung des Dashboards.
 
 Diese Klasse ist verantwortlich für die Darstellung des Studien-Dashboards.
+Das Dashboard wird zuerst vollständig als Text aufgebaut und dann mit einem
+einzigen Schreibaufruf ausgegeben. Jeder Abschnitt wird zusammen mit einem
+Schlüssel aus den Änderungszählern des Studiengangs zwischengespeichert und nur
+neu aufgebaut, wenn sich seine Daten geändert haben.
 """
 
-from typing import TYPE_CHECKING
+import sys
+from datetime import date
+from typing import TYPE_CHECKING, Dict, List, Optional, TextIO, Tuple
 
 if TYPE_CHECKING:
-    from domain import Studiengang
+    from domain import Modul, Semester, Studiengang
 
 
 class DashboardView:
@@ -16,16 +22,30 @@ class DashboardView:
     
     Attributes:
         _studiengang: Der anzuzeigende Studiengang
+        _ausgabe: Das Ausgabeziel (None = die aktuelle Standardausgabe)
+        _abschnitte: Zwischenspeicher je Abschnitt (Name -> (Schlüssel, Text))
+        _dashboard: Zwischenspeicher des kompletten Dashboards (Schlüssel, Text)
+        _semester_zeilen: Zeilen je Semester (Semester -> (Schlüssel, Zeilen))
+        _modul_zeilen: Zeile je Modul (Modul -> (Version, Zeile))
     """
     
-    def __init__(self, studiengang: 'Studiengang'):
+    _ABSCHNITTE = ('header', 'studienfortschritt', 'notendurchschnitt',
+                   'quartal_uebersicht', 'modul_uebersicht')
+    
+    def __init__(self, studiengang: 'Studiengang', ausgabe: Optional[TextIO] = None):
         """
         Initialisiert die DashboardView.
         
         Args:
             studiengang: Der Studiengang der angezeigt werden soll
+            ausgabe: Ein beliebiges Datei-Objekt mit write() (Standard: sys.stdout)
         """
         self._studiengang = studiengang
+        self._ausgabe = ausgabe
+        self._abschnitte: Dict[str, Tuple[object, str]] = {}
+        self._dashboard: Optional[Tuple[tuple, str]] = None
+        self._semester_zeilen: Dict['Semester', Tuple[tuple, List[str]]] = {}
+        self._modul_zeilen: Dict['Modul', Tuple[int, str]] = {}
     
     @property
     def studiengang(self) -> 'Studiengang':
@@ -36,99 +56,280 @@ class DashboardView:
     def studiengang(self, value: 'Studiengang'):
         """Setter für den Studiengang."""
         self._studiengang = value
+        self.verwerfe_zwischenspeicher()
+    
+    @property
+    def ausgabe(self) -> Optional[TextIO]:
+        """Getter für das Ausgabeziel (None = die aktuelle Standardausgabe)."""
+        return self._ausgabe
+    
+    @ausgabe.setter
+    def ausgabe(self, value: Optional[TextIO]):
+        """Setter für das Ausgabeziel."""
+        self._ausgabe = value
+    
+    def rendere_dashboard(self) -> str:
+        """
+        Baut das komplette Dashboard als Text auf.
+        
+        Unveränderte Abschnitte werden aus dem Zwischenspeicher übernommen;
+        hat sich seit dem letzten Aufruf nichts geändert, wird der zuletzt
+        erzeugte Text unverändert zurückgegeben.
+        
+        Returns:
+            Das Dashboard mit abschließendem Zeilenumbruch
+        """
+        schluessel = tuple(self._schluessel(abschnitt) for abschnitt in self._ABSCHNITTE)
+        if self._dashboard is not None and self._dashboard[0] == schluessel:
+            return self._dashboard[1]
+        text = "\n".join(self._hole_abschnitt(abschnitt, schluessel_abschnitt)
+                         for abschnitt, schluessel_abschnitt in zip(self._ABSCHNITTE, schluessel))
+        self._dashboard = (schluessel, text)
+        return text
+    
+    def verwerfe_zwischenspeicher(self) -> None:
+        """
+        Verwirft alle zwischengespeicherten Abschnitte.
+        
+        Nur nötig, wenn Daten des Studiengangs an den Änderungszählern vorbei
+        verändert wurden (z.B. über private Attribute).
+        """
+        self._abschnitte.clear()
+        self._dashboard = None
+        self._semester_zeilen.clear()
+        self._modul_zeilen.clear()
     
     def zeige_dashboard(self) -> None:
         """Zeigt das komplette Dashboard an."""
-        self.zeige_header()
-        print()
-        self.zeige_studienfortschritt()
-        print()
-        self.zeige_notendurchschnitt()
-        print()
-        self.zeige_quartal_uebersicht()
-        print()
-        self.zeige_modul_uebersicht()
+        self._schreibe(self.rendere_dashboard())
     
     def zeige_header(self) -> None:
         """Zeigt den Header des Dashboards an."""
-        print("=" * 80)
-        print(f"  STUDIEN-DASHBOARD: {self._studiengang.name}")
-        print(f"  Abschluss: {self._studiengang.abschluss.value}")
-        print("=" * 80)
+        self._zeige('header')
     
     def zeige_studienfortschritt(self) -> None:
         """Zeigt den Studienfortschritt an."""
+        self._zeige('studienfortschritt')
+    
+    def zeige_notendurchschnitt(self) -> None:
+        """Zeigt den Notendurchschnitt an."""
+        self._zeige('notendurchschnitt')
+    
+    def zeige_quartal_uebersicht(self) -> None:
+        """Zeigt eine Übersicht der Semester/Quartale an."""
+        self._zeige('quartal_uebersicht')
+    
+    def zeige_modul_uebersicht(self) -> None:
+        """Zeigt eine detaillierte Modul-Übersicht an."""
+        self._zeige('modul_uebersicht')
+    
+    @staticmethod
+    def _verbinde(zeilen: List[str]) -> str:
+        """
+        Verbindet Zeilen zu einem Text.
+        
+        Args:
+            zeilen: Die Zeilen ohne Zeilenumbruch
+        
+        Returns:
+            Der Text mit einem Zeilenumbruch nach jeder Zeile
+        """
+        zeilen.append("")
+        return "\n".join(zeilen)
+    
+    def _schluessel(self, abschnitt: str) -> object:
+        """
+        Bestimmt den Schlüssel, von dem der Inhalt eines Abschnitts abhängt.
+        
+        Der Header hängt nur von Name und Abschluss ab, die übrigen Abschnitte
+        vom Änderungszähler des Studiengangs; die Semester-Übersicht zusätzlich
+        vom heutigen Datum (aktuelles Semester).
+        
+        Args:
+            abschnitt: Der Name des Abschnitts
+            
+        Returns:
+            Ein vergleichbarer Schlüssel
+        """
+        if abschnitt == 'header':
+            return (self._studiengang.name, self._studiengang.abschluss)
+        if abschnitt == 'quartal_uebersicht':
+            return (self._studiengang.version, date.today())
+        return self._studiengang.version
+    
+    def _hole_abschnitt(self, abschnitt: str, schluessel: object) -> str:
+        """
+        Gibt den Text eines Abschnitts zurück und baut ihn nur bei Änderungen neu auf.
+        
+        Args:
+            abschnitt: Der Name des Abschnitts
+            schluessel: Der aktuelle Schlüssel des Abschnitts
+            
+        Returns:
+            Der Text des Abschnitts mit abschließendem Zeilenumbruch
+        """
+        eintrag = self._abschnitte.get(abschnitt)
+        if eintrag is not None and eintrag[0] == schluessel:
+            return eintrag[1]
+        zeilen: List[str] = []
+        getattr(self, '_rendere_' + abschnitt)(zeilen)
+        text = self._verbinde(zeilen)
+        self._abschnitte[abschnitt] = (schluessel, text)
+        return text
+    
+    def _zeige(self, abschnitt: str) -> None:
+        """
+        Gibt einen einzelnen Abschnitt aus.
+        
+        Args:
+            abschnitt: Der Name des Abschnitts
+        """
+        self._schreibe(self._hole_abschnitt(abschnitt, self._schluessel(abschnitt)))
+    
+    def _schreibe(self, text: str) -> None:
+        """
+        Schreibt den Text mit einem einzigen Aufruf in das Ausgabeziel.
+        
+        Args:
+            text: Der auszugebende Text
+        """
+        ausgabe = sys.stdout if self._ausgabe is None else self._ausgabe
+        ausgabe.write(text)
+        ausgabe.flush()
+    
+    def _rendere_header(self, zeilen: List[str]) -> None:
+        """
+        Baut den Header des Dashboards auf.
+        
+        Args:
+            zeilen: Die Liste, an die die Zeilen angehängt werden
+        """
+        zeilen.append("=" * 80)
+        zeilen.append(f"  STUDIEN-DASHBOARD: {self._studiengang.name}")
+        zeilen.append(f"  Abschluss: {self._studiengang.abschluss.value}")
+        zeilen.append("=" * 80)
+    
+    def _rendere_studienfortschritt(self, zeilen: List[str]) -> None:
+        """
+        Baut den Studienfortschritt auf.
+        
+        Args:
+            zeilen: Die Liste, an die die Zeilen angehängt werden
+        """
         fortschritt = self._studiengang.berechne_fortschritt()
         verbleibende_ects = self._studiengang.berechne_verbleibende_ects()
         
-        print("📊 STUDIENFORTSCHRITT")
-        print("-" * 80)
-        print(f"  Fortschritt: {fortschritt}%")
+        zeilen.append("📊 STUDIENFORTSCHRITT")
+        zeilen.append("-" * 80)
+        zeilen.append(f"  Fortschritt: {fortschritt}%")
         
         # Fortschrittsbalken
         balken_laenge = 50
         gefuellt = int((fortschritt / 100) * balken_laenge)
         balken = "█" * gefuellt + "░" * (balken_laenge - gefuellt)
-        print(f"  [{balken}]")
+        zeilen.append(f"  [{balken}]")
         
-        print(f"  Verbleibende ECTS: {verbleibende_ects}")
+        zeilen.append(f"  Verbleibende ECTS: {verbleibende_ects}")
     
-    def zeige_notendurchschnitt(self) -> None:
-        """Zeigt den Notendurchschnitt an."""
+    def _rendere_notendurchschnitt(self, zeilen: List[str]) -> None:
+        """
+        Baut den Notendurchschnitt auf.
+        
+        Args:
+            zeilen: Die Liste, an die die Zeilen angehängt werden
+        """
         durchschnitt = self._studiengang.berechne_durchschnitt()
         ziel = self._studiengang.ziel_notendurchschnitt
         
-        print("📈 NOTENDURCHSCHNITT")
-        print("-" * 80)
-        print(f"  Aktueller Durchschnitt: {durchschnitt:.2f}")
-        print(f"  Ziel-Durchschnitt: {ziel:.2f}")
+        zeilen.append("📈 NOTENDURCHSCHNITT")
+        zeilen.append("-" * 80)
+        zeilen.append(f"  Aktueller Durchschnitt: {durchschnitt:.2f}")
+        zeilen.append(f"  Ziel-Durchschnitt: {ziel:.2f}")
         
         if durchschnitt > 0:
             if durchschnitt <= ziel:
-                print(f"  Status: ✓ Ziel erreicht! (Differenz: {abs(durchschnitt - ziel):.2f})")
+                zeilen.append(f"  Status: ✓ Ziel erreicht! (Differenz: {abs(durchschnitt - ziel):.2f})")
             else:
-                print(f"  Status: ⚠ Ziel noch nicht erreicht (Differenz: {abs(durchschnitt - ziel):.2f})")
+                zeilen.append(f"  Status: ⚠ Ziel noch nicht erreicht (Differenz: {abs(durchschnitt - ziel):.2f})")
         else:
-            print("  Status: Noch keine Noten vorhanden")
-    
-    def zeige_quartal_uebersicht(self) -> None:
-        """Zeigt eine Übersicht der Semester/Quartale an."""
-        print("📅 SEMESTER-ÜBERSICHT")
-        print("-" * 80)
+            zeilen.append("  Status: Noch keine Noten vorhanden")
         
-        for semester in self._studiengang.semester:
-            anzahl_module = semester.anzahl_module()
-            bestandene = sum(1 for m in semester.hole_modulen() if m.ist_bestanden())
-            durchschnitt = semester.berechne_semester_durchschnitt()
-            
-            status_icon = "🟢" if semester.ist_aktuell() else "⚪"
-            
-            print(f"  {status_icon} Semester {semester.nummer}: {semester.bezeichnung}")
-            print(f"     Module: {bestandene}/{anzahl_module} bestanden", end="")
-            if durchschnitt > 0:
-                print(f" | Durchschnitt: {durchschnitt:.2f}")
+        benoetigt = self._studiengang.berechne_benoetigten_durchschnitt()
+        if benoetigt is not None:
+            verbleibende_ects = self._studiengang.berechne_verbleibende_ects()
+            if benoetigt < 1.0:
+                zeilen.append(f"  Prognose: ✗ Ziel nicht mehr erreichbar (auch mit 1.0 in {verbleibende_ects} ECTS)")
+            elif benoetigt >= 4.0:
+                zeilen.append(f"  Prognose: ✓ Ziel mit jeder bestandenen Note in den {verbleibende_ects} ECTS erreichbar")
             else:
-                print()
+                zeilen.append(f"  Prognose: Ziel erreichbar mit Ø ≤ {benoetigt:.2f} "
+                              f"in den verbleibenden {verbleibende_ects} ECTS")
     
-    def zeige_modul_uebersicht(self) -> None:
-        """Zeigt eine detaillierte Modul-Übersicht an."""
-        print("📚 MODUL-ÜBERSICHT")
-        print("-" * 80)
+    def _rendere_quartal_uebersicht(self, zeilen: List[str]) -> None:
+        """
+        Baut die Übersicht der Semester/Quartale auf.
+        
+        Args:
+            zeilen: Die Liste, an die die Zeilen angehängt werden
+        """
+        zeilen.append("📅 SEMESTER-ÜBERSICHT")
+        zeilen.append("-" * 80)
         
-        alle_module = self._studiengang.hole_alle_modulen()
+        from domain.enums import ModulStatus
         
-        if not alle_module:
-            print("  Noch keine Module vorhanden.")
-            return
+        # Unveränderte Semester aus dem Zwischenspeicher übernehmen
+        bisher = self._semester_zeilen
+        self._semester_zeilen = {}
+        for semester in self._studiengang.semester:
+            aktuell = semester.ist_aktuell()
+            schluessel = (semester.version, aktuell)
+            eintrag = bisher.get(semester)
+            if eintrag is None or eintrag[0] != schluessel:
+                anzahl_module = semester.anzahl_module()
+                bestandene = semester.anzahl_module_mit_status(ModulStatus.BESTANDEN)
+                durchschnitt = semester.berechne_semester_durchschnitt()
+                
+                status_icon = "🟢" if aktuell else "⚪"
+                
+                zeile = f"     Module: {bestandene}/{anzahl_module} bestanden"
+                if durchschnitt > 0:
+                    zeile += f" | Durchschnitt: {durchschnitt:.2f}"
+                eintrag = (schluessel, [f"  {status_icon} Semester {semester.nummer}: {semester.bezeichnung}", zeile])
+            self._semester_zeilen[semester] = eintrag
+            zeilen.extend(eintrag[1])
+    
+    def _rendere_modul_uebersicht(self, zeilen: List[str]) -> None:
+        """
+        Baut die detaillierte Modul-Übersicht auf.
         
-        # Gruppierung nach Status
+        Args:
+            zeilen: Die Liste, an die die Zeilen angehängt werden
+        """
+        zeilen.append("📚 MODUL-ÜBERSICHT")
+        zeilen.append("-" * 80)
+        
+        # Gruppierung nach Status über die Statusgruppen der Semester
         from domain.enums import ModulStatus
         
+        if not any(semester.anzahl_module() for semester in self._studiengang.semester):
+            zeilen.append("  Noch keine Module vorhanden.")
+            return
+        
+        # Zeilen unveränderter Module aus dem Zwischenspeicher übernehmen
+        bisher = self._modul_zeilen
+        self._modul_zeilen = {}
         for status in ModulStatus:
-            module_mit_status = [m for m in alle_module if m.status == status]
+            module_mit_status = self._studiengang.hole_module_mit_status(status)
             
             if module_mit_status:
-                print(f"\n  {status.value}:")
+                zeilen.append("")
+                zeilen.append(f"  {status.value}:")
                 for modul in module_mit_status:
-                    note_str = f" - Note: {modul.hole_note():.2f}" if modul.hole_note() else ""
-                    print(f"    • {modul.modulcode}: {modul.name} ({modul.ects} ECTS){note_str}")
+                    eintrag = bisher.get(modul)
+                    if eintrag is None or eintrag[0] != modul.version:
+                        note = modul.hole_note()
+                        note_str = f" - Note: {note:.2f}" if note else ""
+                        eintrag = (modul.version,
+                                   f"    • {modul.modulcode}: {modul.name} ({modul.ects} ECTS){note_str}")
+                    self._modul_zeilen[modul] = eintrag
+                    zeilen.append(eintrag[1])
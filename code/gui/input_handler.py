@@ -5,15 +5,16 @@ Diese Klasse verarbeitet Benutzereingaben und steuert die Anwendung.
 """
 
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
-    from domain import Studiengang
-    from persistence import DatenManager
+    from persistence import BasisDatenManager
+    from persistence import MandantenSpeicher
     from .dashboard_view import DashboardView
 
-from domain.enums import Pruefungsart, ModulStatus
-from domain import Pruefungsleistung, Modul
+from domain.enums import Pruefungsart, ModulStatus, Abschluss
+from domain import Pruefungsleistung, Modul, Studiengang
+from .modul_auswahl import ModulAuswahl
 
 
 class InputHandler:
@@ -24,10 +25,14 @@ class InputHandler:
         _studiengang: Der aktuelle Studiengang
         _daten_manager: Der DatenManager für Persistierung
         _dashboard_view: Die DashboardView für Visualisierung
+        _mandanten_speicher: Optionaler Speicher für mehrere Mandanten
+        _kennung: Die Kennung des aktuellen Mandanten
     """
     
-    def __init__(self, studiengang: 'Studiengang', daten_manager: 'DatenManager', 
-                 dashboard_view: 'DashboardView'):
+    def __init__(self, studiengang: 'Studiengang', daten_manager: 'BasisDatenManager', 
+                 dashboard_view: 'DashboardView',
+                 mandanten_speicher: Optional['MandantenSpeicher'] = None,
+                 kennung: Optional[str] = None):
         """
         Initialisiert den InputHandler.
         
@@ -35,10 +40,14 @@ class InputHandler:
             studiengang: Der Studiengang
             daten_manager: Der DatenManager
             dashboard_view: Die DashboardView
+            mandanten_speicher: Optionaler Speicher für mehrere Mandanten
+            kennung: Die Kennung des aktuellen Mandanten im Mandanten-Speicher
         """
         self._studiengang = studiengang
         self._daten_manager = daten_manager
         self._dashboard_view = dashboard_view
+        self._mandanten_speicher = mandanten_speicher
+        self._kennung = kennung
     
     @property
     def studiengang(self) -> 'Studiengang':
@@ -67,10 +76,12 @@ class InputHandler:
                 elif auswahl == "4":
                     self._modul_status_aendern()
                 elif auswahl == "5":
-                    self._daten_manager.speichere_studiengang(self._studiengang)
+                    self.speichere()
                 elif auswahl == "6":
                     self._daten_manager.exportiere_csv(self._studiengang)
                 elif auswahl == "7":
+                    self._mandant_wechseln()
+                elif auswahl == "8":
                     print("\n👋 Auf Wiedersehen!")
                     break
                 else:
@@ -86,6 +97,81 @@ class InputHandler:
                 print(f"\n❌ Fehler: {e}")
                 input("\nDrücken Sie Enter um fortzufahren...")
     
+    @property
+    def kennung(self) -> Optional[str]:
+        """Getter für die Kennung des aktuellen Mandanten."""
+        return self._kennung
+    
+    def hat_aenderungen(self) -> bool:
+        """
+        Prüft, ob ungespeicherte Änderungen vorliegen.
+        
+        Returns:
+            True wenn der aktuelle oder ein geladener Studiengang geändert wurde
+        """
+        if self._mandanten_speicher is not None:
+            return self._mandanten_speicher.hat_aenderungen()
+        return self._studiengang.ist_geaendert()
+    
+    def speichere(self) -> None:
+        """Speichert den aktuellen Studiengang (über den Mandanten-Speicher, falls vorhanden)."""
+        if not self._studiengang.ist_geaendert():
+            print("ℹ Keine ungespeicherten Änderungen")
+            return
+        if self._mandanten_speicher is not None and self._kennung is not None:
+            self._mandanten_speicher.speichere(self._kennung)
+            print(f"✓ Mandant '{self._kennung}' gespeichert")
+        else:
+            self._daten_manager.speichere_studiengang(self._studiengang)
+    
+    def speichere_alle(self) -> None:
+        """Speichert alle geänderten Studiengänge (bzw. den aktuellen ohne Mandanten-Speicher)."""
+        if self._mandanten_speicher is None:
+            self.speichere()
+            return
+        anzahl = self._mandanten_speicher.speichere_alle()
+        print(f"✓ {anzahl} Mandant(en) gespeichert")
+    
+    def wechsle_mandant(self, kennung: str, anlegen: bool = False) -> bool:
+        """
+        Wechselt zum Studiengang eines anderen Mandanten.
+        
+        Ungespeicherte Änderungen des bisherigen Mandanten bleiben im Cache des
+        Mandanten-Speichers und werden spätestens beim Verdrängen gespeichert
+        (erkannt über Studiengang.ist_geaendert).
+        Bereits geladene Mandanten werden ohne Festplattenzugriff gewechselt.
+        
+        Args:
+            kennung: Die Kennung des Ziel-Mandanten
+            anlegen: Ob ein leerer Studiengang angelegt wird, falls keiner existiert
+            
+        Returns:
+            True wenn gewechselt wurde, False wenn der Mandant nicht existiert
+            
+        Raises:
+            ValueError: Wenn kein Mandanten-Speicher konfiguriert ist
+        """
+        if self._mandanten_speicher is None:
+            raise ValueError("Kein Mandanten-Speicher konfiguriert")
+        
+        studiengang = self._mandanten_speicher.hole(kennung)
+        if studiengang is None:
+            if not anlegen:
+                return False
+            studiengang = Studiengang(
+                name="Mein Studiengang",
+                abschluss=Abschluss.BACHELOR,
+                gesamtdauer=6,
+                ziel_notendurchschnitt=2.5,
+                ziel_abschlussdauer=6
+            )
+            self._mandanten_speicher.lege_an(kennung, studiengang)
+        
+        self.studiengang = studiengang
+        self._daten_manager = self._mandanten_speicher.daten_manager(kennung)
+        self._kennung = kennung
+        return True
+    
     def zeige_menu(self) -> None:
         """Zeigt das Hauptmenü an."""
         print("\n" + "=" * 80)
@@ -97,9 +183,43 @@ class InputHandler:
         print("  4. Modulstatus ändern")
         print("  5. Daten speichern")
         print("  6. Daten als CSV exportieren")
-        print("  7. Beenden")
+        print("  7. Mandant wechseln")
+        print("  8. Beenden")
         print("=" * 80)
     
+    def _mandant_wechseln(self) -> None:
+        """Wechselt interaktiv zu einem anderen Mandanten."""
+        print("\n" + "=" * 80)
+        print("  MANDANT WECHSELN")
+        print("=" * 80)
+        
+        if self._mandanten_speicher is None:
+            print("\n❌ Kein Mandanten-Speicher konfiguriert (main.py --verzeichnis <ordner>).")
+            return
+        
+        print(f"\nAktueller Mandant: {self._kennung}")
+        kennungen = self._mandanten_speicher.kennungen()
+        if kennungen:
+            print("Vorhandene Mandanten:")
+            for kennung in kennungen:
+                geladen = " (geladen)" if self._mandanten_speicher.ist_geladen(kennung) else ""
+                print(f"  • {kennung}{geladen}")
+        
+        try:
+            kennung = input("\nKennung: ").strip()
+            if self.wechsle_mandant(kennung):
+                print(f"\n✓ Gewechselt zu Mandant '{kennung}': {self._studiengang}")
+                return
+            
+            antwort = input(f"Mandant '{kennung}' existiert nicht. Neu anlegen? (j/n): ").strip().lower()
+            if antwort == 'j':
+                self.wechsle_mandant(kennung, anlegen=True)
+                print(f"\n✓ Mandant '{kennung}' angelegt")
+        except ValueError as e:
+            print(f"❌ Ungültige Eingabe: {e}")
+        except Exception as e:
+            print(f"❌ Fehler: {e}")
+    
     def _modul_hinzufuegen(self) -> None:
         """Fügt ein neues Modul hinzu."""
         print("\n" + "=" * 80)
@@ -128,6 +248,7 @@ class InputHandler:
             # Modul erstellen und hinzufügen
             modul = Modul(modulcode, name, ects, semester_empfehlung)
             semester.fuege_modul_hinzu(modul)
+            self._daten_manager.protokolliere_modul_hinzugefuegt(semester.nummer, modul)
             
             print(f"\n✓ Modul '{name}' erfolgreich zu Semester {semester_nr} hinzugefügt!")
             
@@ -142,25 +263,17 @@ class InputHandler:
         print("  PRÜFUNGSLEISTUNG HINZUFÜGEN")
         print("=" * 80)
         
-        # Alle Module anzeigen
-        alle_module = self._studiengang.hole_alle_modulen()
-        
-        if not alle_module:
+        if not self._studiengang.anzahl_module():
             print("\n❌ Keine Module vorhanden. Bitte fügen Sie zuerst Module hinzu.")
             return
         
-        print("\nVerfügbare Module:")
-        for i, modul in enumerate(alle_module, 1):
-            print(f"  {i}. {modul}")
-        
         try:
-            modul_nr = int(input("\nModul-Nummer: "))
-            if modul_nr < 1 or modul_nr > len(alle_module):
-                print("❌ Ungültige Modul-Nummer")
+            # Modul seitenweise auswählen
+            modul = ModulAuswahl(self._studiengang).waehle()
+            if modul is None:
+                print("ℹ Abgebrochen")
                 return
             
-            modul = alle_module[modul_nr - 1]
-            
             # Prüfungsdaten eingeben
             note = float(input("Note (1.0 - 5.0): "))
             
@@ -184,10 +297,13 @@ class InputHandler:
             # Prüfungsleistung erstellen und setzen
             pruefungsleistung = Pruefungsleistung(note, datum, versuch, pruefungsart)
             modul.setze_pruefungsleistung(pruefungsleistung)
+            self._daten_manager.protokolliere_pruefungsleistung(modul)
             
             print(f"\n✓ Prüfungsleistung erfolgreich zu Modul '{modul.name}' hinzugefügt!")
             print(f"  Note: {note} ({pruefungsleistung.hole_bewertung()})")
             print(f"  Status: {'✓ Bestanden' if pruefungsleistung.ist_bestanden() else '✗ Nicht bestanden'}")
+            if modul.anzahl_versuche() > 1:
+                print(f"  Versuche: {modul.anzahl_versuche()} | Maßgebliche Note: {modul.hole_note()}")
             
         except ValueError as e:
             print(f"❌ Ungültige Eingabe: {e}")
@@ -200,24 +316,17 @@ class InputHandler:
         print("  MODULSTATUS ÄNDERN")
         print("=" * 80)
         
-        alle_module = self._studiengang.hole_alle_modulen()
-        
-        if not alle_module:
+        if not self._studiengang.anzahl_module():
             print("\n❌ Keine Module vorhanden.")
             return
         
-        print("\nVerfügbare Module:")
-        for i, modul in enumerate(alle_module, 1):
-            print(f"  {i}. {modul}")
-        
         try:
-            modul_nr = int(input("\nModul-Nummer: "))
-            if modul_nr < 1 or modul_nr > len(alle_module):
-                print("❌ Ungültige Modul-Nummer")
+            # Modul seitenweise auswählen
+            modul = ModulAuswahl(self._studiengang).waehle()
+            if modul is None:
+                print("ℹ Abgebrochen")
                 return
             
-            modul = alle_module[modul_nr - 1]
-            
             print("\nVerfügbare Status:")
             for i, status in enumerate(ModulStatus, 1):
                 print(f"  {i}. {status.value}")
@@ -226,6 +335,7 @@ class InputHandler:
             neuer_status = list(ModulStatus)[status_nr - 1]
             
             modul.status = neuer_status
+            self._daten_manager.protokolliere_status(modul)
             
             print(f"\n✓ Status von Modul '{modul.name}' erfolgreich geändert zu: {neuer_status.value}")
             
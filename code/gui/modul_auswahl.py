@@ -0,0 +1,203 @@
+"""
+ModulAuswahl-Klasse für die seitenweise Auswahl eines Moduls.
+
+Statt alle Module auszugeben, wird nur die sichtbare Seite formatiert. Die
+Module der Seite werden über Studiengang.iter_alle_module ab dem ersten Modul
+der Seite gelesen. Mit "/Suchtext" wird über den Suchindex des Studiengangs
+nach Modulcode und Name gesucht.
+"""
+
+from itertools import islice
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from domain import Modul, Studiengang
+
+
+class ModulAuswahl:
+    """
+    Blätterbare Modulauswahl für die Konsole.
+    
+    Die Nummern entsprechen der Position des Moduls über alle Semester
+    (wie in hole_alle_modulen) und bleiben auf allen Seiten gleich; ein Modul
+    kann daher auch über eine Nummer außerhalb der sichtbaren Seite gewählt
+    werden.
+    
+    Attributes:
+        _studiengang: Der Studiengang, aus dem gewählt wird
+        _seitengroesse: Die Anzahl der Module je Seite
+        _seite: Die aktuelle Seite (ab 1)
+    """
+    
+    STANDARD_SEITENGROESSE = 20
+    SUCHTREFFER = 10
+    
+    def __init__(self, studiengang: 'Studiengang', seitengroesse: int = STANDARD_SEITENGROESSE):
+        """
+        Initialisiert die ModulAuswahl.
+        
+        Args:
+            studiengang: Der Studiengang, aus dem gewählt wird
+            seitengroesse: Die Anzahl der Module je Seite (Standard: 20)
+        
+        Raises:
+            ValueError: Wenn die Seitengröße kleiner als 1 ist
+        """
+        if seitengroesse < 1:
+            raise ValueError("Die Seitengröße muss mindestens 1 sein")
+        self._studiengang = studiengang
+        self._seitengroesse = seitengroesse
+        self._seite = 1
+    
+    @property
+    def studiengang(self) -> 'Studiengang':
+        """Getter für den Studiengang."""
+        return self._studiengang
+    
+    @property
+    def seitengroesse(self) -> int:
+        """Getter für die Seitengröße."""
+        return self._seitengroesse
+    
+    @property
+    def seite(self) -> int:
+        """Getter für die aktuelle Seite (ab 1)."""
+        return self._seite
+    
+    @seite.setter
+    def seite(self, value: int):
+        """Setter für die aktuelle Seite mit Validierung."""
+        if not 1 <= value <= self.anzahl_seiten():
+            raise ValueError(f"Seite muss zwischen 1 und {self.anzahl_seiten()} liegen")
+        self._seite = value
+    
+    def anzahl_seiten(self) -> int:
+        """
+        Berechnet die Anzahl der Seiten.
+        
+        Returns:
+            Die Anzahl der Seiten (mindestens 1)
+        """
+        return max(1, -(-self._studiengang.anzahl_module() // self._seitengroesse))
+    
+    def hole_seite(self, seite: Optional[int] = None) -> List[Tuple[int, 'Modul']]:
+        """
+        Gibt die Module einer Seite mit ihren Nummern zurück.
+        
+        Args:
+            seite: Die Seite (Standard: die aktuelle Seite)
+        
+        Returns:
+            Liste von (Nummer, Modul) für die Seite
+        """
+        if seite is None:
+            seite = self._seite
+        start = (seite - 1) * self._seitengroesse
+        module = self._studiengang.iter_alle_module(start)
+        return list(enumerate(islice(module, self._seitengroesse), start + 1))
+    
+    def hole_modul(self, nummer: int) -> Optional['Modul']:
+        """
+        Gibt das Modul mit einer Nummer zurück.
+        
+        Args:
+            nummer: Die Nummer des Moduls (ab 1)
+        
+        Returns:
+            Das Modul oder None wenn es keine solche Nummer gibt
+        """
+        if nummer < 1:
+            return None
+        return next(self._studiengang.iter_alle_module(nummer - 1), None)
+    
+    def suche(self, anfrage: str) -> List[Tuple[int, 'Modul']]:
+        """
+        Sucht Module über Modulcode und Name.
+        
+        Args:
+            anfrage: Der Suchtext
+        
+        Returns:
+            Liste von (Nummer, Modul) der besten Treffer
+        """
+        treffer = self._studiengang.suche_module(anfrage, self.SUCHTREFFER)
+        return [(self._studiengang.finde_position(modul) + 1, modul) for modul in treffer]
+    
+    def zeige_suche(self, anfrage: str) -> None:
+        """
+        Zeigt die Treffer einer Suche mit ihren Modul-Nummern an.
+        
+        Args:
+            anfrage: Der Suchtext
+        """
+        eintraege = self.suche(anfrage)
+        if not eintraege:
+            print(f"ℹ Keine Module zu '{anfrage}' gefunden")
+            return
+        zeilen = [f"\nTreffer für '{anfrage}':"]
+        for nummer, modul in eintraege:
+            zeilen.append(f"  {nummer}. {modul}")
+        zeilen.append("  [/Text] weiter eingrenzen  [Nummer] auswählen  [w/z/s N] Seiten  [Enter] abbrechen")
+        print("\n".join(zeilen))
+    
+    def zeige_seite(self) -> None:
+        """Zeigt die aktuelle Seite und die Steuerung zum Blättern an."""
+        anzahl = self._studiengang.anzahl_module()
+        seiten = self.anzahl_seiten()
+        self._seite = min(self._seite, seiten)
+        eintraege = self.hole_seite()
+        
+        zeilen = []
+        if seiten > 1:
+            zeilen.append(f"\nVerfügbare Module (Seite {self._seite}/{seiten}, "
+                          f"Nr. {eintraege[0][0]}-{eintraege[-1][0]} von {anzahl}):")
+        else:
+            zeilen.append("\nVerfügbare Module:")
+        for nummer, modul in eintraege:
+            zeilen.append(f"  {nummer}. {modul}")
+        if seiten > 1:
+            zeilen.append("  [w] weiter  [z] zurück  [s N] Seite N  [/Text] suchen  [Nummer] auswählen  [Enter] abbrechen")
+        print("\n".join(zeilen))
+    
+    def waehle(self) -> Optional['Modul']:
+        """
+        Lässt den Benutzer ein Modul wählen und blättert bei Bedarf.
+        
+        Returns:
+            Das gewählte Modul oder None bei Abbruch (leere Eingabe)
+        """
+        self.zeige_seite()
+        while True:
+            eingabe = input("\nModul-Nummer: ").strip()
+            if not eingabe:
+                return None
+            
+            if eingabe.startswith("/"):
+                if eingabe[1:].strip():
+                    self.zeige_suche(eingabe[1:].strip())
+                continue
+            
+            eingabe = eingabe.lower()
+            if eingabe in ("w", "z"):
+                neue_seite = self._seite + (1 if eingabe == "w" else -1)
+                if not 1 <= neue_seite <= self.anzahl_seiten():
+                    print("ℹ Keine weitere Seite")
+                    continue
+                self._seite = neue_seite
+                self.zeige_seite()
+                continue
+            
+            try:
+                if eingabe.startswith("s"):
+                    self.seite = int(eingabe[1:])
+                    self.zeige_seite()
+                    continue
+                modul = self.hole_modul(int(eingabe))
+            except ValueError as e:
+                print(f"❌ Ungültige Eingabe: {e}")
+                continue
+            
+            if modul is None:
+                print("❌ Ungültige Modul-Nummer")
+                continue
+            return modul
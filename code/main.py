@@ -5,11 +5,14 @@ Dieses Programm startet das Studien-Dashboard und ermöglicht die Verwaltung
 eines Studiengangs mit Semestern, Modulen und Prüfungsleistungen.
 """
 
+import argparse
+import sys
 from datetime import date
+from typing import List, Optional
 from domain import Studiengang, Semester, Modul, Pruefungsleistung
 from domain.enums import Abschluss, Pruefungsart, ModulStatus
-from persistence import DatenManager
-from gui import DashboardView, InputHandler
+from persistence import erstelle_daten_manager, MandantenSpeicher
+from gui import BatchVerarbeitung, DashboardView, InputHandler
 
 
 def erstelle_beispiel_studiengang() -> Studiengang:
@@ -151,57 +154,208 @@ def erstelle_beispiel_studiengang() -> Studiengang:
     return studiengang
 
 
-def main():
-    """Hauptfunktion der Anwendung."""
-    print("\n" + "=" * 80)
-    print("  WILLKOMMEN ZUM STUDIEN-DASHBOARD")
-    print("=" * 80)
+def erstelle_start_studiengang() -> Studiengang:
+    """
+    Fragt nach, ob ein Beispiel- oder ein leerer Studiengang erstellt werden soll.
+    
+    Returns:
+        Der neu erstellte Studiengang
+    """
+    print("\nKeine gespeicherten Daten gefunden.")
+    antwort = input("Möchten Sie einen Beispiel-Studiengang erstellen? (j/n): ").strip().lower()
+    
+    if antwort == 'j':
+        studiengang = erstelle_beispiel_studiengang()
+        print("\n✓ Beispiel-Studiengang erstellt!")
+        print("  → Basierend auf dem echten B.Sc. Cybersecurity Studienplan")
+        print("  → Mit Ihren aktuellen Modulen und Noten")
+    else:
+        print("\nErstelle leeren Studiengang...")
+        studiengang = erstelle_leeren_studiengang()
+        print("✓ Leerer Studiengang erstellt!")
+    return studiengang
+
+
+def erstelle_leeren_studiengang() -> Studiengang:
+    """
+    Erstellt einen leeren Studiengang mit Standardwerten.
+    
+    Returns:
+        Der neu erstellte Studiengang
+    """
+    return Studiengang(
+        name="Mein Studiengang",
+        abschluss=Abschluss.BACHELOR,
+        gesamtdauer=6,
+        ziel_notendurchschnitt=2.5,
+        ziel_abschlussdauer=6
+    )
+
+
+def lese_argumente(argumente: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Liest die Kommandozeilenargumente.
     
-    # DatenManager initialisieren
-    daten_manager = DatenManager("studiengang.pkl")
+    Args:
+        argumente: Die Argumente (Standard: sys.argv)
+        
+    Returns:
+        Die gelesenen Argumente
+    """
+    parser = argparse.ArgumentParser(description="Studien-Dashboard")
+    parser.add_argument("--verzeichnis",
+                        help="Verzeichnis mit einer Datei je Mandant (aktiviert den Mandanten-Speicher)")
+    parser.add_argument("--kennung", default="standard",
+                        help="Kennung des Start-Mandanten (Standard: standard)")
+    parser.add_argument("--cache", type=int, default=32,
+                        help="Anzahl gleichzeitig geladener Mandanten (Standard: 32)")
+    parser.add_argument("--batch", metavar="DATEI",
+                        help="Befehle aus DATEI (\"-\" für stdin) ohne Rückfragen ausführen und einmal speichern")
+    parser.add_argument("--tolerant", action="store_true",
+                        help="Im Batch-Betrieb fehlerhafte Zeilen überspringen statt nichts auszuführen")
+    parser.add_argument("--migriere", action="store_true",
+                        help="Dateien im alten Pickle-Format einmalig umwandeln (nur vertrauenswürdige Dateien)")
+    return parser.parse_args(argumente)
+
+
+def fuehre_batch_aus(args: argparse.Namespace) -> int:
+    """
+    Führt eine Befehlsdatei ohne Rückfragen, Pausen und Menüs aus (--batch).
     
-    # Versuchen, gespeicherten Studiengang zu laden
-    studiengang = daten_manager.lade_studiengang()
+    Existiert noch kein gespeicherter Studiengang, wird ein leerer angelegt.
     
-    if studiengang is None:
-        print("\nKeine gespeicherten Daten gefunden.")
-        antwort = input("Möchten Sie einen Beispiel-Studiengang erstellen? (j/n): ").strip().lower()
+    Args:
+        args: Die gelesenen Kommandozeilenargumente
         
-        if antwort == 'j':
-            studiengang = erstelle_beispiel_studiengang()
-            print("\n✓ Beispiel-Studiengang erstellt!")
-            print("  → Basierend auf dem echten B.Sc. Cybersecurity Studienplan")
-            print("  → Mit Ihren aktuellen Modulen und Noten")
+    Returns:
+        Der Exit-Code (0 wenn alle Zeilen ausgeführt wurden, sonst 1)
+    """
+    try:
+        if args.verzeichnis:
+            mandanten_speicher = MandantenSpeicher(args.verzeichnis, args.cache)
+            studiengang = mandanten_speicher.hole(args.kennung)
+            if studiengang is None:
+                studiengang = erstelle_leeren_studiengang()
+                mandanten_speicher.lege_an(args.kennung, studiengang)
+            daten_manager = mandanten_speicher.daten_manager(args.kennung)
+        else:
+            daten_manager = erstelle_daten_manager("studiengang.pkl")
+            studiengang = daten_manager.lade_studiengang()
+            if studiengang is None:
+                studiengang = erstelle_leeren_studiengang()
+    except IOError as e:
+        print(f"❌ {e}")
+        return 1
+    
+    batch = BatchVerarbeitung(studiengang, daten_manager, strikt=not args.tolerant)
+    try:
+        ergebnis = batch.fuehre_datei_aus(args.batch)
+    except (ValueError, IOError) as e:
+        print(f"❌ {e}")
+        return 1
+    
+    for meldung in ergebnis.fehler:
+        print(f"❌ {meldung}")
+    print(f"✓ Batch abgeschlossen: {ergebnis}")
+    return 0 if ergebnis.ist_fehlerfrei() else 1
+
+
+def migriere_dateien(args: argparse.Namespace) -> int:
+    """
+    Wandelt Dateien im alten Pickle-Format einmalig in das aktuelle Format um (--migriere).
+    
+    Args:
+        args: Die gelesenen Kommandozeilenargumente
+        
+    Returns:
+        Der Exit-Code (0 bei Erfolg, sonst 1)
+    """
+    try:
+        if args.verzeichnis:
+            umgewandelt = MandantenSpeicher(args.verzeichnis, args.cache).migriere_altes_format()
+        else:
+            daten_manager = erstelle_daten_manager("studiengang.pkl")
+            daten_manager.meldungen = False
+            umgewandelt = ["studiengang.pkl"] if daten_manager.migriere_altes_format() else []
+    except (ValueError, IOError) as e:
+        print(f"❌ {e}")
+        return 1
+    
+    for name in umgewandelt:
+        print(f"✓ Umgewandelt: {name}")
+    print(f"ℹ {len(umgewandelt)} Datei(en) in das aktuelle Format umgewandelt")
+    return 0
+
+
+def main(argumente: Optional[List[str]] = None):
+    """
+    Hauptfunktion der Anwendung.
+    
+    Args:
+        argumente: Die Kommandozeilenargumente (Standard: sys.argv)
+        
+    Returns:
+        Der Exit-Code im Batch-Betrieb, bei --migriere und wenn das Laden
+        fehlschlägt, sonst None
+    """
+    args = lese_argumente(argumente)
+    
+    if args.migriere:
+        return migriere_dateien(args)
+    if args.batch:
+        return fuehre_batch_aus(args)
+    
+    print("\n" + "=" * 80)
+    print("  WILLKOMMEN ZUM STUDIEN-DASHBOARD")
+    print("=" * 80)
+    
+    mandanten_speicher = None
+    kennung = None
+    try:
+        if args.verzeichnis:
+            # Mandanten-Speicher: eine Datei je Studierendem, LRU-Cache im Speicher
+            mandanten_speicher = MandantenSpeicher(args.verzeichnis, args.cache)
+            kennung = args.kennung
+            studiengang = mandanten_speicher.hole(kennung)
+            if studiengang is None:
+                studiengang = erstelle_start_studiengang()
+                mandanten_speicher.lege_an(kennung, studiengang)
+            daten_manager = mandanten_speicher.daten_manager(kennung)
         else:
-            print("\nErstelle leeren Studiengang...")
-            studiengang = Studiengang(
-                name="Mein Studiengang",
-                abschluss=Abschluss.BACHELOR,
-                gesamtdauer=6,
-                ziel_notendurchschnitt=2.5,
-                ziel_abschlussdauer=6
-            )
-            print("✓ Leerer Studiengang erstellt!")
+            # DatenManager initialisieren (Pickle-Snapshot + Änderungsjournal, .db für SQLite)
+            daten_manager = erstelle_daten_manager("studiengang.pkl")
+            
+            # Versuchen, gespeicherten Studiengang zu laden
+            studiengang = daten_manager.lade_studiengang()
+            
+            if studiengang is None:
+                studiengang = erstelle_start_studiengang()
+    except IOError as e:
+        # z.B. eine Datei im alten Pickle-Format: die Meldung nennt --migriere
+        print(f"❌ {e}")
+        return 1
     
     # Dashboard und InputHandler initialisieren
     dashboard_view = DashboardView(studiengang)
-    input_handler = InputHandler(studiengang, daten_manager, dashboard_view)
+    input_handler = InputHandler(studiengang, daten_manager, dashboard_view,
+                                 mandanten_speicher, kennung)
     
     # Anwendung starten
     input_handler.starten()
     
-    # Beim Beenden fragen, ob gespeichert werden soll
-    antwort = input("\nMöchten Sie die Änderungen speichern? (j/n): ").strip().lower()
-    if antwort == 'j':
-        daten_manager.speichere_studiengang(studiengang)
-        print("✓ Daten gespeichert!")
+    # Beim Beenden fragen, ob gespeichert werden soll (nur bei ungespeicherten Änderungen)
+    if input_handler.hat_aenderungen():
+        antwort = input("\nMöchten Sie die Änderungen speichern? (j/n): ").strip().lower()
+        if antwort == 'j':
+            input_handler.speichere_alle()
+            print("✓ Daten gespeichert!")
     
     print("\n👋 Auf Wiedersehen!\n")
 
 
 if __name__ == "__main__":
     try:
-        main()
+        sys.exit(main())
     except KeyboardInterrupt:
         print("\n\n👋 Programm beendet.")
     except Exception as e:
@@ -4,6 +4,28 @@ Persistence-Paket für das Studien-Dashboard.
 Dieses Paket enthält die Datenspeicher-Komponenten.
 """
 
-from .daten_manager import DatenManager
+from .daten_manager import BasisDatenManager, DatenManager
+from .journal_daten_manager import JournalDatenManager
+from .sqlite_daten_manager import SQLiteDatenManager
+from .binaer_daten_manager import BinaerDatenManager, BinaerSnapshot
+from .fabrik import erstelle_daten_manager
+from .csv_export import ExportStatistik, exportiere_kohorte_csv
+from .csv_import import ImportErgebnis, importiere_csv
+from .mandanten_speicher import MandantenSpeicher
+from .asynchron import lade_studiengaenge_async
 
-__all__ = ['DatenManager']
+__all__ = [
+    'BasisDatenManager',
+    'DatenManager',
+    'JournalDatenManager',
+    'SQLiteDatenManager',
+    'BinaerDatenManager',
+    'BinaerSnapshot',
+    'erstelle_daten_manager',
+    'ExportStatistik',
+    'exportiere_kohorte_csv',
+    'ImportErgebnis',
+    'importiere_csv',
+    'MandantenSpeicher',
+    'lade_studiengaenge_async'
+]
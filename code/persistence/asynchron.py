@@ -0,0 +1,65 @@
+"""
+Nebenläufiges Laden vieler Studiengänge mit asyncio.
+
+Die Dateien werden über einen Executor gelesen, sodass Festplattenzugriffe
+und das Deserialisieren mehrerer Studiengänge überlappen. Eine Semaphore
+begrenzt die Anzahl gleichzeitig laufender Ladevorgänge.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional
+
+
+def _lade_datei(datei_pfad: str):
+    """
+    Lädt einen Studiengang über den passenden DatenManager.
+    
+    Die Funktion liegt auf Modulebene, damit sie auch mit einem
+    ProcessPoolExecutor verwendet werden kann.
+    
+    Args:
+        datei_pfad: Der Pfad der gespeicherten Datei
+        
+    Returns:
+        Der geladene Studiengang oder None wenn die Datei nicht existiert
+    """
+    from .fabrik import erstelle_daten_manager
+    
+    daten_manager = erstelle_daten_manager(datei_pfad)
+    daten_manager.meldungen = False
+    return daten_manager.lade_studiengang()
+
+
+async def lade_studiengaenge_async(datei_pfade: Iterable[str], max_gleichzeitig: int = 8,
+                                   executor: Optional[Executor] = None) -> List:
+    """
+    Lädt viele Studiengänge nebenläufig.
+    
+    Mit dem Standard-Executor (Threads) überlappen vor allem die
+    Festplattenzugriffe; ein ProcessPoolExecutor verteilt zusätzlich das
+    CPU-lastige Deserialisieren auf mehrere Kerne.
+    
+    Args:
+        datei_pfade: Die Pfade der gespeicherten Dateien
+        max_gleichzeitig: Maximale Anzahl gleichzeitig laufender Ladevorgänge
+        executor: Der Executor für die blockierende Arbeit (None = Standard)
+        
+    Returns:
+        Die Studiengänge in der Reihenfolge der Pfade (None für fehlende Dateien)
+        
+    Raises:
+        ValueError: Wenn max_gleichzeitig kleiner als 1 ist
+        IOError: Wenn eine Datei nicht geladen werden kann
+    """
+    if max_gleichzeitig < 1:
+        raise ValueError("Es muss mindestens ein Ladevorgang gleichzeitig erlaubt sein")
+    
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_gleichzeitig)
+    
+    async def lade(datei_pfad: str):
+        async with semaphore:
+            return await loop.run_in_executor(executor, _lade_datei, datei_pfad)
+    
+    return await asyncio.gather(*(lade(datei_pfad) for datei_pfad in datei_pfade))
@@ -0,0 +1,235 @@
+"""
+Atomares, absturzsicheres Schreiben von Dateien.
+
+Dateien werden zuerst in eine temporäre Datei im selben Verzeichnis
+geschrieben, mit fsync dauerhaft gemacht und dann per os.replace an ihren
+Platz umbenannt. Ein Absturz hinterlässt so immer entweder die alte oder die
+neue Fassung. Die neue Fassung behält die Zugriffsrechte der alten Datei bzw.
+erhält für neue Dateien die üblichen Rechte gemäß umask.
+
+GruppenCommit sammelt die Speichervorgänge eines kurzen Zeitfensters: Für
+dieselbe Datei wird nur der neueste Inhalt geschrieben, verschiedene Dateien
+werden gemeinsam geschrieben (alle temporären Dateien schreiben und syncen,
+dann alle umbenennen und jedes Verzeichnis nur einmal syncen).
+"""
+
+import os
+import secrets
+import stat
+import threading
+import time
+from typing import Dict, Optional
+
+
+def _synchronisiere_verzeichnis(verzeichnis: str) -> None:
+    """
+    Macht eine Umbenennung im Verzeichnis dauerhaft (nur POSIX).
+    
+    Args:
+        verzeichnis: Das Verzeichnis der umbenannten Datei
+    """
+    if os.name != 'posix':
+        return
+    fd = os.open(verzeichnis, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _oeffne_temp_datei(datei_pfad: str, verzeichnis: str) -> tuple:
+    """
+    Legt neben der Zieldatei eine neue temporäre Datei an.
+    
+    Anders als tempfile.mkstemp (immer 0600) wird die Datei mit 0666 angelegt,
+    sodass das Betriebssystem die umask anwendet. Existiert die Zieldatei,
+    übernimmt die temporäre Datei deren Zugriffsrechte.
+    
+    Args:
+        datei_pfad: Der Pfad der Zieldatei
+        verzeichnis: Das Verzeichnis der Zieldatei
+    
+    Returns:
+        Dateideskriptor und Pfad der temporären Datei
+    """
+    try:
+        modus = stat.S_IMODE(os.stat(datei_pfad).st_mode)
+    except FileNotFoundError:
+        modus = None
+    praefix = os.path.join(verzeichnis, '.' + os.path.basename(datei_pfad) + '.')
+    while True:
+        temp_pfad = praefix + secrets.token_hex(8) + '.tmp'
+        try:
+            fd = os.open(temp_pfad, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+            break
+        except FileExistsError:
+            continue
+    if modus is not None:
+        try:
+            os.chmod(temp_pfad, modus)
+        except BaseException:
+            os.close(fd)
+            os.remove(temp_pfad)
+            raise
+    return fd, temp_pfad
+
+
+def _schreibe_temp_datei(datei_pfad: str, daten: bytes, dauerhaft: bool) -> str:
+    """
+    Schreibt den neuen Inhalt in eine temporäre Datei neben der Zieldatei.
+    
+    Args:
+        datei_pfad: Der Pfad der Zieldatei
+        daten: Der neue Inhalt
+        dauerhaft: Ob die temporäre Datei per fsync auf die Platte geschrieben wird
+    
+    Returns:
+        Der Pfad der temporären Datei
+    """
+    fd, temp_pfad = _oeffne_temp_datei(datei_pfad, os.path.dirname(os.path.abspath(datei_pfad)))
+    try:
+        with os.fdopen(fd, 'wb') as datei:
+            datei.write(daten)
+            datei.flush()
+            if dauerhaft:
+                os.fsync(datei.fileno())
+    except BaseException:
+        os.remove(temp_pfad)
+        raise
+    return temp_pfad
+
+
+def schreibe_atomar(datei_pfad: str, daten: bytes, dauerhaft: bool = True) -> None:
+    """
+    Ersetzt den Inhalt einer Datei atomar.
+    
+    Args:
+        datei_pfad: Der Pfad der Zieldatei
+        daten: Der neue Inhalt
+        dauerhaft: Ob Datei und Verzeichnis per fsync auf die Platte geschrieben werden
+    """
+    schreibe_atomar_gemeinsam({datei_pfad: daten}, dauerhaft)
+
+
+def schreibe_atomar_gemeinsam(dateien: Dict[str, bytes], dauerhaft: bool = True) -> None:
+    """
+    Ersetzt mehrere Dateien, jede für sich atomar, in einem gemeinsamen Durchgang.
+    
+    Zuerst werden alle temporären Dateien geschrieben (und gesynct), dann
+    alle umbenannt; jedes betroffene Verzeichnis wird danach nur einmal
+    gesynct. Schlägt das Schreiben einer temporären Datei fehl, wird keine
+    Zieldatei ersetzt.
+    
+    Args:
+        dateien: Der neue Inhalt je Zieldateipfad
+        dauerhaft: Ob Dateien und Verzeichnisse per fsync auf die Platte geschrieben werden
+    """
+    temp_pfade: Dict[str, str] = {}
+    verzeichnisse: Dict[str, None] = {}
+    try:
+        for datei_pfad, daten in dateien.items():
+            temp_pfade[datei_pfad] = _schreibe_temp_datei(datei_pfad, daten, dauerhaft)
+        for datei_pfad in list(temp_pfade):
+            os.replace(temp_pfade.pop(datei_pfad), datei_pfad)
+            verzeichnisse[os.path.dirname(os.path.abspath(datei_pfad))] = None
+    finally:
+        for temp_pfad in temp_pfade.values():
+            if os.path.exists(temp_pfad):
+                os.remove(temp_pfad)
+    if dauerhaft:
+        for verzeichnis in verzeichnisse:
+            _synchronisiere_verzeichnis(verzeichnis)
+
+
+class _Stapel:
+    """
+    Sammelt die Speichervorgänge eines Zeitfensters.
+    
+    Attributes:
+        daten: Der jeweils neueste Inhalt je Dateipfad
+        fertig: Wird gesetzt, sobald der Stapel geschrieben ist
+        fehler: Der beim Schreiben aufgetretene Fehler (falls vorhanden)
+    """
+    
+    def __init__(self):
+        """Initialisiert einen leeren Stapel."""
+        self.daten: Dict[str, bytes] = {}
+        self.fertig = threading.Event()
+        self.fehler: Optional[BaseException] = None
+
+
+class GruppenCommit:
+    """
+    Fasst Speichervorgänge innerhalb eines kurzen Zeitfensters zusammen.
+    
+    Der erste Aufrufer eines Fensters wartet die Fensterdauer ab und schreibt
+    dann für jede Datei nur den neuesten Inhalt, alle Dateien des Fensters
+    gemeinsam über schreibe_atomar_gemeinsam. Alle übrigen Aufrufer
+    des Fensters warten, bis dieser Schreibvorgang dauerhaft ist. Stapel werden
+    streng nacheinander geschrieben, sodass ein älterer Stand nie einen
+    neueren überschreibt.
+    
+    Attributes:
+        _fenster: Die Länge des Sammelfensters in Sekunden
+        _sperre: Schützt den offenen Stapel
+        _schreib_sperre: Serialisiert das Schreiben der Stapel
+        _offen: Der Stapel, der gerade Speichervorgänge sammelt
+    """
+    
+    def __init__(self, fenster: float = 0.005):
+        """
+        Initialisiert den GruppenCommit.
+        
+        Args:
+            fenster: Die Länge des Sammelfensters in Sekunden (Standard: 5 ms)
+        
+        Raises:
+            ValueError: Wenn das Fenster negativ ist
+        """
+        if fenster < 0:
+            raise ValueError("Fenster darf nicht negativ sein")
+        self._fenster = fenster
+        self._sperre = threading.Lock()
+        self._schreib_sperre = threading.Lock()
+        self._offen: Optional[_Stapel] = None
+    
+    @property
+    def fenster(self) -> float:
+        """Getter für die Länge des Sammelfensters in Sekunden."""
+        return self._fenster
+    
+    def schreibe(self, datei_pfad: str, daten: bytes) -> None:
+        """
+        Schreibt eine Datei im nächsten Gruppen-Commit und wartet, bis sie dauerhaft ist.
+        
+        Args:
+            datei_pfad: Der Pfad der Zieldatei
+            daten: Der neue Inhalt
+        
+        Raises:
+            IOError: Wenn das Schreiben des Stapels fehlschlägt
+        """
+        with self._sperre:
+            stapel = self._offen
+            anfuehrer = stapel is None
+            if anfuehrer:
+                stapel = self._offen = _Stapel()
+            stapel.daten[datei_pfad] = daten
+        
+        if anfuehrer:
+            time.sleep(self._fenster)
+            with self._sperre:
+                self._offen = None
+                self._schreib_sperre.acquire()
+            try:
+                schreibe_atomar_gemeinsam(stapel.daten)
+            except BaseException as e:
+                stapel.fehler = e
+            finally:
+                self._schreib_sperre.release()
+                stapel.fertig.set()
+        else:
+            stapel.fertig.wait()
+        
+        if stapel.fehler is not None:
+            raise IOError(f"Fehler beim Gruppen-Commit: {stapel.fehler}")
@@ -0,0 +1,440 @@
+"""
+Kompaktes Binärformat für Studiengang-Snapshots.
+
+Das Format besteht aus einem Kopf mit vorberechneten Kennzahlen, festen
+Semester- und Moduldatensätzen sowie einer Stringtabelle für Namen und Codes.
+Es wird über mmap gelesen, sodass Objekte erst bei Bedarf erzeugt werden.
+
+Aufbau (Little Endian):
+    Kopf           KOPF (inkl. Kennzahlen), direkt gefolgt von den Semesterdatensätzen
+    Module         ab modul_offset (auf SEITENGROESSE ausgerichtet), je MODUL_SATZ
+    Stringtabelle  ab string_offset: (anzahl_strings + 1) Offsets, danach UTF-8-Daten
+    Versuche       nur mit FLAG_FRUEHERE_VERSUCHE, direkt nach der Stringtabelle:
+                   Anzahl, danach je früherem Prüfungsversuch VERSUCH_SATZ
+"""
+
+import io
+import mmap
+import struct
+from datetime import date
+from typing import Dict, List, Optional
+
+from .daten_manager import BasisDatenManager, setze_semester_zeitraum
+
+
+MAGIC = b'SDBN'
+FORMAT_VERSION = 1
+SEITENGROESSE = 4096
+FLAG_FRUEHERE_VERSUCHE = 1
+
+# magic, version, flags, anzahl_semester, anzahl_module, anzahl_strings, modul_offset,
+# string_offset, name, abschluss, gesamtdauer, ziel_note, ziel_dauer,
+# durchschnitt, fortschritt, verbleibende_ects, bestandene_module
+KOPF = struct.Struct('<4sHHIIIIIIB3xIdI4xddII')
+# nummer, bezeichnung, startdatum, enddatum, erstes_modul, anzahl_module
+SEMESTER_SATZ = struct.Struct('<IIiiII')
+# modulcode, name, ects, semester_empfehlung, status, hat_pruefung, art, note, datum, versuch
+MODUL_SATZ = struct.Struct('<IIHHBBBxdiHxx')
+# modul_index, art, versuch, note, datum (nach Modul und Versuchsreihenfolge sortiert)
+VERSUCH_SATZ = struct.Struct('<IBxHdi')
+OFFSET = struct.Struct('<I')
+
+# Größter Wert der 16-Bit-Felder (ECTS, Semester-Empfehlung, Versuch)
+MAX_KURZ = 0xFFFF
+
+
+class BinaerSnapshot:
+    """
+    Lesezugriff auf einen binären Snapshot über mmap.
+    
+    Kopf und Kennzahlen sind sofort verfügbar; Semester, Module und Strings
+    werden erst beim ersten Zugriff aus der Datei gelesen und zwischengespeichert.
+    
+    Attributes:
+        _datei: Die geöffnete Datei
+        _mmap: Die eingeblendete Datei
+        _kopf: Die entpackten Kopffelder
+        _strings: Zwischenspeicher der gelesenen Strings
+        _module: Zwischenspeicher der erzeugten Module
+        _fruehere_versuche: Frühere Prüfungsversuche je Modulindex (beim ersten Bedarf gelesen)
+        _studiengang: Der vollständig erzeugte Studiengang (falls angefordert)
+        _status_werte: ModulStatus-Werte in Codereihenfolge
+        _arten: Pruefungsart-Werte in Codereihenfolge
+    """
+    
+    def __init__(self, datei_pfad: str):
+        """
+        Öffnet einen binären Snapshot.
+        
+        Args:
+            datei_pfad: Der Pfad zur Snapshot-Datei
+        
+        Raises:
+            ValueError: Wenn die Datei kein gültiger Snapshot ist
+        """
+        self._datei = open(datei_pfad, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._datei.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._datei.close()
+            raise
+        self._kopf = KOPF.unpack_from(self._mmap, 0)
+        if self._kopf[0] != MAGIC:
+            self.schliesse()
+            raise ValueError("Keine Studiengang-Binärdatei")
+        if self._kopf[1] != FORMAT_VERSION:
+            self.schliesse()
+            raise ValueError(f"Nicht unterstützte Formatversion: {self._kopf[1]}")
+        self._strings: Dict[int, str] = {}
+        self._module: Dict[int, object] = {}
+        self._fruehere_versuche: Optional[Dict[int, List[tuple]]] = None
+        self._studiengang = None
+        
+        from domain.enums import ModulStatus, Pruefungsart
+        self._status_werte = list(ModulStatus)
+        self._arten = list(Pruefungsart)
+    
+    def __enter__(self) -> 'BinaerSnapshot':
+        """Betritt den Kontext."""
+        return self
+    
+    def __exit__(self, *args) -> None:
+        """Verlässt den Kontext und schließt den Snapshot."""
+        self.schliesse()
+    
+    def schliesse(self) -> None:
+        """Schließt die eingeblendete Datei."""
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._datei.close()
+    
+    @property
+    def anzahl_semester(self) -> int:
+        """Getter für die Anzahl der Semester."""
+        return self._kopf[3]
+    
+    @property
+    def anzahl_module(self) -> int:
+        """Getter für die Anzahl der Module."""
+        return self._kopf[4]
+    
+    @property
+    def name(self) -> str:
+        """Getter für den Namen des Studiengangs."""
+        return self._string(self._kopf[8])
+    
+    @property
+    def durchschnitt(self) -> float:
+        """Getter für den gespeicherten Notendurchschnitt."""
+        return self._kopf[13]
+    
+    @property
+    def fortschritt(self) -> float:
+        """Getter für den gespeicherten Studienfortschritt in Prozent."""
+        return self._kopf[14]
+    
+    @property
+    def verbleibende_ects(self) -> int:
+        """Getter für die gespeicherten verbleibenden ECTS."""
+        return self._kopf[15]
+    
+    @property
+    def bestandene_module(self) -> int:
+        """Getter für die gespeicherte Anzahl bestandener Module."""
+        return self._kopf[16]
+    
+    def _string(self, index: int) -> str:
+        """
+        Liest einen String aus der Stringtabelle.
+        
+        Args:
+            index: Der Index in der Stringtabelle
+        
+        Returns:
+            Der dekodierte String
+        """
+        text = self._strings.get(index)
+        if text is None:
+            basis = self._kopf[7]
+            daten_start = basis + OFFSET.size * (self._kopf[5] + 1)
+            anfang = OFFSET.unpack_from(self._mmap, basis + OFFSET.size * index)[0]
+            ende = OFFSET.unpack_from(self._mmap, basis + OFFSET.size * (index + 1))[0]
+            text = self._mmap[daten_start + anfang:daten_start + ende].decode('utf-8')
+            self._strings[index] = text
+        return text
+    
+    def _lies_fruehere_versuche(self) -> Dict[int, List[tuple]]:
+        """
+        Liest (bei Bedarf) den Abschnitt mit den früheren Prüfungsversuchen.
+        
+        Returns:
+            Zuordnung von Modulindex zu (art, versuch, note, datum)-Sätzen in Versuchsreihenfolge
+        """
+        if self._fruehere_versuche is None:
+            self._fruehere_versuche = {}
+            if self._kopf[2] & FLAG_FRUEHERE_VERSUCHE:
+                basis = self._kopf[7]
+                anzahl_strings = self._kopf[5]
+                daten_laenge = OFFSET.unpack_from(self._mmap, basis + OFFSET.size * anzahl_strings)[0]
+                position = basis + OFFSET.size * (anzahl_strings + 1) + daten_laenge
+                anzahl = OFFSET.unpack_from(self._mmap, position)[0]
+                start = position + OFFSET.size
+                for modul_index, *versuch in VERSUCH_SATZ.iter_unpack(
+                        self._mmap[start:start + VERSUCH_SATZ.size * anzahl]):
+                    self._fruehere_versuche.setdefault(modul_index, []).append(versuch)
+        return self._fruehere_versuche
+    
+    def _semester_satz(self, nummer: int) -> tuple:
+        """
+        Liest den Datensatz eines Semesters.
+        
+        Args:
+            nummer: Die Semesternummer (ab 1)
+        
+        Returns:
+            Die entpackten Felder des Semesterdatensatzes
+        
+        Raises:
+            IndexError: Wenn das Semester nicht existiert
+        """
+        if not 1 <= nummer <= self.anzahl_semester:
+            raise IndexError(f"Semester {nummer} existiert nicht")
+        return SEMESTER_SATZ.unpack_from(self._mmap, KOPF.size + SEMESTER_SATZ.size * (nummer - 1))
+    
+    def hole_modul(self, index: int):
+        """
+        Erzeugt (bei Bedarf) das Modul mit dem gegebenen Index.
+        
+        Args:
+            index: Der Modulindex in Speicherreihenfolge (ab 0)
+        
+        Returns:
+            Das Modul
+        
+        Raises:
+            IndexError: Wenn der Index ungültig ist
+        """
+        modul = self._module.get(index)
+        if modul is not None:
+            return modul
+        if not 0 <= index < self.anzahl_module:
+            raise IndexError(f"Modul {index} existiert nicht")
+        
+        from domain import Modul, Pruefungsleistung
+        
+        (code, name, ects, empfehlung, status, hat_pruefung, art,
+         note, datum, versuch) = MODUL_SATZ.unpack_from(self._mmap, self._kopf[6] + MODUL_SATZ.size * index)
+        modul = Modul(self._string(code), self._string(name), ects, empfehlung)
+        if hat_pruefung:
+            for v_art, v_versuch, v_note, v_datum in self._lies_fruehere_versuche().get(index, ()):
+                modul.setze_pruefungsleistung(
+                    Pruefungsleistung(v_note, date.fromordinal(v_datum), v_versuch, self._arten[v_art])
+                )
+            modul.setze_pruefungsleistung(
+                Pruefungsleistung(note, date.fromordinal(datum), versuch, self._arten[art])
+            )
+        modul.status = self._status_werte[status]
+        self._module[index] = modul
+        return modul
+    
+    def hole_module_von_semester(self, nummer: int) -> List:
+        """
+        Erzeugt (bei Bedarf) die Module eines Semesters.
+        
+        Args:
+            nummer: Die Semesternummer (ab 1)
+        
+        Returns:
+            Liste der Module des Semesters
+        """
+        satz = self._semester_satz(nummer)
+        return [self.hole_modul(i) for i in range(satz[4], satz[4] + satz[5])]
+    
+    def studiengang(self):
+        """
+        Erzeugt (bei Bedarf) den vollständigen Studiengang.
+        
+        Returns:
+            Der Studiengang mit allen Semestern und Modulen
+        """
+        if self._studiengang is not None:
+            return self._studiengang
+        
+        from domain import Studiengang
+        from domain.enums import Abschluss
+        
+        (_, _, _, _, _, _, _, _, name, abschluss, gesamtdauer, ziel_note, ziel_dauer,
+         _, _, _, _) = self._kopf
+        studiengang = Studiengang(self._string(name), list(Abschluss)[abschluss],
+                                  gesamtdauer, ziel_note, ziel_dauer)
+        for semester in studiengang.semester:
+            nummer, bezeichnung, start, ende, _, _ = self._semester_satz(semester.nummer)
+            semester.bezeichnung = self._string(bezeichnung)
+            setze_semester_zeitraum(semester, date.fromordinal(start), date.fromordinal(ende))
+            semester.fuege_module_hinzu(self.hole_module_von_semester(nummer))
+        self._studiengang = studiengang
+        return studiengang
+
+
+def _pruefe_kurz(wert: int, bezeichnung: str, modul) -> None:
+    """
+    Prüft, ob ein Wert in ein 16-Bit-Feld des Binärformats passt.
+    
+    Args:
+        wert: Der zu prüfende Wert
+        bezeichnung: Die Bezeichnung des Feldes für die Fehlermeldung
+        modul: Das Modul, zu dem der Wert gehört
+    
+    Raises:
+        ValueError: Wenn der Wert größer als MAX_KURZ ist
+    """
+    if wert > MAX_KURZ:
+        raise ValueError(f"{bezeichnung} {wert} von Modul {modul.modulcode} ist für das Binärformat "
+                         f"zu groß (höchstens {MAX_KURZ}); bitte .pkl oder .db verwenden")
+
+
+def _schreibe_snapshot(studiengang, datei) -> None:
+    """
+    Schreibt einen Studiengang im Binärformat in eine geöffnete Datei.
+    
+    Args:
+        studiengang: Der zu speichernde Studiengang
+        datei: Die im Binärmodus geöffnete Zieldatei
+    
+    Raises:
+        ValueError: Wenn ECTS, Semester-Empfehlung oder Versuch eines Moduls
+            größer als MAX_KURZ sind
+    """
+    from domain.enums import Abschluss, ModulStatus, Pruefungsart
+    
+    status_codes = {status: i for i, status in enumerate(ModulStatus)}
+    art_codes = {art: i for i, art in enumerate(Pruefungsart)}
+    string_index: Dict[str, int] = {}
+    strings: List[bytes] = []
+    
+    def intern(text: str) -> int:
+        index = string_index.get(text)
+        if index is None:
+            index = string_index[text] = len(strings)
+            strings.append(text.encode('utf-8'))
+        return index
+    
+    name_index = intern(studiengang.name)
+    semester_saetze = []
+    modul_saetze = bytearray()
+    versuch_saetze = bytearray()
+    bestandene_module = 0
+    for semester in studiengang.semester:
+        module = semester.hole_modulen()
+        erstes_modul = len(modul_saetze) // MODUL_SATZ.size
+        semester_saetze.append(SEMESTER_SATZ.pack(
+            semester.nummer, intern(semester.bezeichnung), semester.startdatum.toordinal(),
+            semester.enddatum.toordinal(), erstes_modul, len(module)
+        ))
+        for modul in module:
+            pruefung = modul.hole_pruefungsleistung()
+            _pruefe_kurz(modul.ects, "ECTS", modul)
+            _pruefe_kurz(modul.semester_empfehlung, "Semester-Empfehlung", modul)
+            for versuch in modul.hole_versuche():
+                _pruefe_kurz(versuch.versuch, "Versuch", modul)
+            if modul.anzahl_versuche() > 1:
+                modul_index = len(modul_saetze) // MODUL_SATZ.size
+                for versuch in modul.hole_versuche()[:-1]:
+                    versuch_saetze += VERSUCH_SATZ.pack(modul_index, art_codes[versuch.art],
+                                                        versuch.versuch, versuch.note,
+                                                        versuch.datum.toordinal())
+            if modul.ist_bestanden():
+                bestandene_module += 1
+            modul_saetze += MODUL_SATZ.pack(
+                intern(modul.modulcode), intern(modul.name), modul.ects, modul.semester_empfehlung,
+                status_codes[modul.status], 1 if pruefung else 0,
+                art_codes[pruefung.art] if pruefung else 0,
+                pruefung.note if pruefung else 0.0,
+                pruefung.datum.toordinal() if pruefung else 0,
+                pruefung.versuch if pruefung else 0
+            )
+    
+    semester_ende = KOPF.size + SEMESTER_SATZ.size * len(semester_saetze)
+    modul_offset = -(-semester_ende // SEITENGROESSE) * SEITENGROESSE
+    string_offset = modul_offset + len(modul_saetze)
+    
+    string_offsets = [0]
+    for text in strings:
+        string_offsets.append(string_offsets[-1] + len(text))
+    
+    datei.write(KOPF.pack(
+        MAGIC, FORMAT_VERSION, FLAG_FRUEHERE_VERSUCHE if versuch_saetze else 0,
+        len(semester_saetze), len(modul_saetze) // MODUL_SATZ.size,
+        len(strings), modul_offset, string_offset, name_index,
+        list(Abschluss).index(studiengang.abschluss), studiengang.gesamtdauer,
+        studiengang.ziel_notendurchschnitt, studiengang.ziel_abschlussdauer,
+        studiengang.berechne_durchschnitt(), studiengang.berechne_fortschritt(),
+        studiengang.berechne_verbleibende_ects(), bestandene_module
+    ))
+    datei.write(b''.join(semester_saetze))
+    datei.write(b'\0' * (modul_offset - semester_ende))
+    datei.write(modul_saetze)
+    datei.write(struct.pack(f'<{len(string_offsets)}I', *string_offsets))
+    datei.write(b''.join(strings))
+    if versuch_saetze:
+        datei.write(OFFSET.pack(len(versuch_saetze) // VERSUCH_SATZ.size))
+        datei.write(versuch_saetze)
+
+
+class BinaerDatenManager(BasisDatenManager):
+    """
+    Persistiert Studiengang-Daten im kompakten Binärformat.
+    
+    Attributes:
+        _datei_pfad: Der Pfad zur Snapshot-Datei
+    """
+    
+    def __init__(self, datei_pfad: str = "studiengang.sdb"):
+        """
+        Initialisiert den BinaerDatenManager.
+        
+        Args:
+            datei_pfad: Der Pfad zur Snapshot-Datei (Standard: studiengang.sdb)
+        """
+        super().__init__(datei_pfad)
+    
+    def _schreibe(self, studiengang) -> None:
+        """
+        Schreibt den Studiengang atomar als binären Snapshot.
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+        """
+        puffer = io.BytesIO()
+        _schreibe_snapshot(studiengang, puffer)
+        self._schreibe_datei(puffer.getvalue())
+    
+    def _lese(self):
+        """
+        Liest den vollständigen Studiengang aus dem Snapshot.
+        
+        Returns:
+            Der gelesene Studiengang
+        """
+        with BinaerSnapshot(self._datei_pfad) as snapshot:
+            return snapshot.studiengang()
+    
+    def oeffne_snapshot(self) -> Optional[BinaerSnapshot]:
+        """
+        Öffnet den Snapshot für den verzögerten Zugriff.
+        
+        Der Aufrufer ist für das Schließen verantwortlich (z.B. mit ``with``).
+        
+        Returns:
+            Der geöffnete BinaerSnapshot oder None wenn die Datei nicht existiert
+        
+        Raises:
+            IOError: Wenn die Datei nicht geöffnet werden kann
+        """
+        if not self.datei_existiert():
+            self._melde(f"ℹ Keine gespeicherten Daten gefunden: {self._datei_pfad}")
+            return None
+        try:
+            return BinaerSnapshot(self._datei_pfad)
+        except Exception as e:
+            raise IOError(f"Fehler beim Öffnen des Snapshots: {e}")
@@ -0,0 +1,205 @@
+"""
+CSV-Export für einzelne Studiengänge und ganze Kohorten.
+
+Die Zeilen werden über Generatoren erzeugt und gepuffert geschrieben, sodass
+auch Tausende Studiengänge mit begrenztem Speicherbedarf exportiert werden können.
+"""
+
+import csv
+import io
+import os
+import time
+from typing import Iterable, Iterator, Tuple, Union
+
+
+CSV_KOPFZEILE = [
+    'Semester',
+    'Modulcode',
+    'Modulname',
+    'ECTS',
+    'Status',
+    'Note',
+    'Prüfungsart',
+    'Prüfungsdatum',
+    'Versuch'
+]
+
+KOHORTEN_KOPFZEILE = ['Kennung'] + CSV_KOPFZEILE
+
+SPEICHER_ENDUNGEN = ('.pkl', '.db', '.sqlite', '.sqlite3', '.sdb')
+
+
+class ExportStatistik:
+    """
+    Kennzahlen eines Kohorten-Exports.
+    
+    Attributes:
+        _zeilen: Anzahl der geschriebenen Datenzeilen
+        _studiengaenge: Anzahl der exportierten Studiengänge
+        _sekunden: Die Dauer des Exports in Sekunden
+    """
+    
+    def __init__(self, zeilen: int, studiengaenge: int, sekunden: float):
+        """
+        Initialisiert die ExportStatistik.
+        
+        Args:
+            zeilen: Anzahl der geschriebenen Datenzeilen
+            studiengaenge: Anzahl der exportierten Studiengänge
+            sekunden: Die Dauer des Exports in Sekunden
+        """
+        self._zeilen = zeilen
+        self._studiengaenge = studiengaenge
+        self._sekunden = sekunden
+    
+    @property
+    def zeilen(self) -> int:
+        """Getter für die Anzahl der Datenzeilen."""
+        return self._zeilen
+    
+    @property
+    def studiengaenge(self) -> int:
+        """Getter für die Anzahl der Studiengänge."""
+        return self._studiengaenge
+    
+    @property
+    def sekunden(self) -> float:
+        """Getter für die Dauer in Sekunden."""
+        return self._sekunden
+    
+    @property
+    def zeilen_pro_sekunde(self) -> float:
+        """Getter für den Durchsatz in Zeilen pro Sekunde."""
+        if self._sekunden <= 0:
+            return float(self._zeilen)
+        return self._zeilen / self._sekunden
+    
+    def __str__(self) -> str:
+        """String-Repräsentation der Statistik."""
+        return (f"{self._zeilen} Zeilen aus {self._studiengaenge} Studiengängen in "
+                f"{self._sekunden:.2f}s ({self.zeilen_pro_sekunde:.0f} Zeilen/s)")
+
+
+def modul_zeilen(studiengang) -> Iterator[list]:
+    """
+    Erzeugt die CSV-Zeilen aller Module eines Studiengangs.
+    
+    Args:
+        studiengang: Der zu exportierende Studiengang
+    
+    Yields:
+        Eine Zeile im Format von CSV_KOPFZEILE je Modul (mit dem Versuch, dessen Note zählt)
+    """
+    for semester in studiengang.semester:
+        bezeichnung = f"Semester {semester.nummer}"
+        for modul in semester.hole_modulen():
+            pruefung = modul.hole_massgebliche_pruefungsleistung()
+            if pruefung:
+                yield [bezeichnung, modul.modulcode, modul.name, modul.ects, modul.status.value,
+                       pruefung.note, pruefung.art.value, pruefung.datum, pruefung.versuch]
+            else:
+                yield [bezeichnung, modul.modulcode, modul.name, modul.ects, modul.status.value,
+                       '', '', '', '']
+
+
+def lade_verzeichnis(verzeichnis: str) -> Iterator[Tuple[str, object]]:
+    """
+    Lädt die gespeicherten Studiengänge eines Verzeichnisses nacheinander.
+    
+    Es befindet sich immer nur ein Studiengang gleichzeitig im Speicher.
+    
+    Args:
+        verzeichnis: Das Verzeichnis mit .pkl- oder .db-Dateien
+    
+    Yields:
+        Paare aus Kennung (Dateiname ohne Endung) und Studiengang
+    """
+    from .fabrik import erstelle_daten_manager
+    
+    for dateiname in sorted(os.listdir(verzeichnis)):
+        kennung, endung = os.path.splitext(dateiname)
+        if endung.lower() not in SPEICHER_ENDUNGEN:
+            continue
+        daten_manager = erstelle_daten_manager(os.path.join(verzeichnis, dateiname))
+        daten_manager.meldungen = False
+        studiengang = daten_manager.lade_studiengang()
+        if studiengang is not None:
+            yield kennung, studiengang
+
+
+def _mit_kennung(studiengaenge: Iterable) -> Iterator[Tuple[str, object]]:
+    """
+    Versieht Studiengänge ohne eigene Kennung mit einer laufenden Nummer.
+    
+    Args:
+        studiengaenge: Studiengänge oder bereits (Kennung, Studiengang)-Paare
+    
+    Yields:
+        Paare aus Kennung und Studiengang
+    """
+    for nummer, eintrag in enumerate(studiengaenge, 1):
+        if isinstance(eintrag, tuple):
+            yield str(eintrag[0]), eintrag[1]
+        else:
+            yield str(nummer), eintrag
+
+
+def exportiere_kohorte_csv(quelle: Union[str, Iterable], ziel_pfad: str,
+                           puffer_zeilen: int = 10000) -> ExportStatistik:
+    """
+    Exportiert viele Studiengänge gestreamt in eine gemeinsame CSV-Datei.
+    
+    Die Zeilen werden in einem Textpuffer gesammelt und alle puffer_zeilen
+    Zeilen in einem einzigen Schreibaufruf in die Datei geschrieben. Es wird
+    nichts ausgegeben; die Meldung übernimmt der Aufrufer anhand der Statistik.
+    
+    Args:
+        quelle: Ein Verzeichnis mit gespeicherten Studiengängen oder ein Iterable
+            aus Studiengängen bzw. (Kennung, Studiengang)-Paaren
+        ziel_pfad: Der Pfad der CSV-Datei
+        puffer_zeilen: Anzahl Zeilen pro Schreibvorgang
+    
+    Returns:
+        Die ExportStatistik mit Zeilen pro Sekunde
+    
+    Raises:
+        ValueError: Wenn puffer_zeilen kleiner als 1 ist
+        IOError: Wenn der Export fehlschlägt
+    """
+    if puffer_zeilen < 1:
+        raise ValueError("Puffergröße muss mindestens 1 Zeile sein")
+    
+    if isinstance(quelle, str):
+        eintraege = lade_verzeichnis(quelle)
+    else:
+        eintraege = _mit_kennung(quelle)
+    
+    start = time.perf_counter()
+    zeilen = 0
+    studiengaenge = 0
+    
+    try:
+        with open(ziel_pfad, 'w', newline='', encoding='utf-8') as datei:
+            puffer = io.StringIO()
+            writer = csv.writer(puffer, delimiter=';')
+            writer.writerow(KOHORTEN_KOPFZEILE)
+            im_puffer = 0
+            
+            for kennung, studiengang in eintraege:
+                studiengaenge += 1
+                for zeile in modul_zeilen(studiengang):
+                    writer.writerow([kennung] + zeile)
+                    im_puffer += 1
+                    if im_puffer >= puffer_zeilen:
+                        datei.write(puffer.getvalue())
+                        puffer.seek(0)
+                        puffer.truncate()
+                        zeilen += im_puffer
+                        im_puffer = 0
+            
+            datei.write(puffer.getvalue())
+            zeilen += im_puffer
+    except Exception as e:
+        raise IOError(f"Fehler beim Kohorten-Export: {e}")
+    
+    return ExportStatistik(zeilen, studiengaenge, time.perf_counter() - start)
@@ -0,0 +1,220 @@
+"""
+CSV-Import für Moduldaten im Format von exportiere_csv.
+
+Alle Zeilen werden zuerst gemeinsam validiert, sodass fehlerhafte Zeilen
+gesammelt gemeldet werden, und danach in einem Durchlauf in den Studiengang
+eingefügt.
+"""
+
+import csv
+from datetime import date
+from typing import List, Optional, Tuple
+
+from .csv_export import CSV_KOPFZEILE
+
+
+class ImportErgebnis:
+    """
+    Ergebnis eines CSV-Imports.
+    
+    Attributes:
+        _module: Die importierten Module als (Semesternummer, Modul)
+        _fehler: Fehlermeldungen der abgelehnten Zeilen
+    """
+    
+    def __init__(self, module: List[tuple], fehler: List[str]):
+        """
+        Initialisiert das ImportErgebnis.
+        
+        Args:
+            module: Die importierten Module als (Semesternummer, Modul)
+            fehler: Fehlermeldungen der abgelehnten Zeilen
+        """
+        self._module = module
+        self._fehler = fehler
+    
+    @property
+    def importiert(self) -> int:
+        """Getter für die Anzahl der importierten Module."""
+        return len(self._module)
+    
+    @property
+    def module(self) -> List[tuple]:
+        """Getter für die importierten Module als (Semesternummer, Modul) (gibt eine Kopie zurück)."""
+        return self._module.copy()
+    
+    @property
+    def fehler(self) -> List[str]:
+        """Getter für die Fehlermeldungen (gibt eine Kopie zurück)."""
+        return self._fehler.copy()
+    
+    def ist_fehlerfrei(self) -> bool:
+        """
+        Prüft, ob alle Zeilen importiert werden konnten.
+        
+        Returns:
+            True wenn keine Zeile abgelehnt wurde, sonst False
+        """
+        return not self._fehler
+    
+    def __str__(self) -> str:
+        """String-Repräsentation des Ergebnisses."""
+        return f"{self.importiert} Module importiert, {len(self._fehler)} fehlerhafte Zeilen"
+
+
+def _pruefe_zeile(zeile: List[str], anzahl_semester: int, status_nach_wert: dict,
+                  art_nach_wert: dict) -> Tuple[Optional[tuple], List[str]]:
+    """
+    Validiert eine CSV-Zeile und wandelt ihre Felder in Python-Werte um.
+    
+    Es werden dieselben Regeln wie in den Konstruktoren von Modul und
+    Pruefungsleistung geprüft, aber alle Verstöße der Zeile gesammelt.
+    
+    Args:
+        zeile: Die Felder der CSV-Zeile
+        anzahl_semester: Anzahl der Semester im Ziel-Studiengang
+        status_nach_wert: Zuordnung von Statustext zu ModulStatus
+        art_nach_wert: Zuordnung von Prüfungsart-Text zu Pruefungsart
+    
+    Returns:
+        Die umgewandelten Werte (oder None) und die Liste der Verstöße
+    """
+    if len(zeile) != len(CSV_KOPFZEILE):
+        return None, [f"{len(CSV_KOPFZEILE)} Spalten erwartet, {len(zeile)} gefunden"]
+    
+    semester_text, modulcode, name, ects_text, status_text, note_text, art_text, datum_text, versuch_text = zeile
+    fehler = []
+    
+    semester_nr = None
+    if semester_text.startswith("Semester ") and semester_text[9:].isdigit():
+        semester_nr = int(semester_text[9:])
+        if not 1 <= semester_nr <= anzahl_semester:
+            fehler.append(f"Semester {semester_nr} existiert nicht")
+    else:
+        fehler.append(f"Ungültiges Semester '{semester_text}'")
+    
+    if not modulcode:
+        fehler.append("Modulcode darf nicht leer sein")
+    if not name:
+        fehler.append("Der Name darf nicht leer sein")
+    
+    ects = None
+    try:
+        ects = int(ects_text)
+        if ects <= 0:
+            fehler.append("ECTS müssen größer als 0 sein")
+    except ValueError:
+        fehler.append(f"Ungültige ECTS '{ects_text}'")
+    
+    status = status_nach_wert.get(status_text)
+    if status is None:
+        fehler.append(f"Unbekannter Status '{status_text}'")
+    
+    pruefung = None
+    if note_text or art_text or datum_text or versuch_text:
+        pruefung_fehler = len(fehler)
+        try:
+            note = float(note_text)
+            if not 1.0 <= note <= 5.0:
+                fehler.append("Note muss zwischen 1.0 und 5.0 liegen")
+        except ValueError:
+            fehler.append(f"Ungültige Note '{note_text}'")
+        art = art_nach_wert.get(art_text)
+        if art is None:
+            fehler.append(f"Unbekannte Prüfungsart '{art_text}'")
+        try:
+            datum = date.fromisoformat(datum_text)
+        except ValueError:
+            fehler.append(f"Ungültiges Datum '{datum_text}'")
+        try:
+            versuch = int(versuch_text)
+            if versuch < 1:
+                fehler.append("Versuch muss mindestens 1 sein")
+        except ValueError:
+            fehler.append(f"Ungültiger Versuch '{versuch_text}'")
+        if len(fehler) == pruefung_fehler:
+            pruefung = (note, datum, versuch, art)
+    
+    if fehler:
+        return None, fehler
+    return (semester_nr, modulcode, name, ects, status, pruefung), []
+
+
+def importiere_csv(csv_pfad: str, studiengang, strikt: bool = True) -> ImportErgebnis:
+    """
+    Importiert Module aus einer CSV-Datei im Format von exportiere_csv.
+    
+    Zuerst werden alle Zeilen validiert. Im strikten Modus wird bei einer
+    fehlerhaften Zeile nichts importiert und alle Fehler werden gemeinsam
+    gemeldet; sonst werden nur die gültigen Zeilen übernommen. Die
+    Semester-Empfehlung wird, da sie nicht exportiert wird, auf die
+    Semesternummer gesetzt. Zeilen mit einem Modulcode, der im Studiengang
+    oder weiter oben in der Datei schon vorkommt, gelten als fehlerhaft.
+    
+    Es wird nichts ausgegeben und nichts protokolliert; das übernimmt
+    BasisDatenManager.importiere_csv anhand des Ergebnisses.
+    
+    Args:
+        csv_pfad: Der Pfad der CSV-Datei
+        studiengang: Der Studiengang, in den importiert wird
+        strikt: Ob bei fehlerhaften Zeilen der ganze Import abgelehnt wird
+    
+    Returns:
+        Das ImportErgebnis
+    
+    Raises:
+        ValueError: Im strikten Modus, wenn mindestens eine Zeile fehlerhaft ist
+        IOError: Wenn die Datei nicht gelesen werden kann
+    """
+    from domain import Modul, Pruefungsleistung
+    from domain.enums import ModulStatus, Pruefungsart
+    
+    status_nach_wert = {status.value: status for status in ModulStatus}
+    art_nach_wert = {art.value: art for art in Pruefungsart}
+    semester_liste = studiengang.semester
+    
+    gueltig = []
+    fehler = []
+    neue_codes = set()
+    try:
+        with open(csv_pfad, 'r', newline='', encoding='utf-8') as datei:
+            reader = csv.reader(datei, delimiter=';')
+            kopfzeile = next(reader, None)
+            if kopfzeile != CSV_KOPFZEILE:
+                raise ValueError(f"Unerwartete Kopfzeile: {kopfzeile}")
+            for zeilen_nr, zeile in enumerate(reader, 2):
+                werte, zeilen_fehler = _pruefe_zeile(zeile, len(semester_liste),
+                                                     status_nach_wert, art_nach_wert)
+                if not zeilen_fehler:
+                    modulcode = werte[1]
+                    if modulcode in neue_codes or studiengang.finde_modul(modulcode) is not None:
+                        zeilen_fehler = [f"Modulcode {modulcode} ist bereits vergeben"]
+                    else:
+                        neue_codes.add(modulcode)
+                if zeilen_fehler:
+                    fehler.append(f"Zeile {zeilen_nr}: {'; '.join(zeilen_fehler)}")
+                else:
+                    gueltig.append(werte)
+    except ValueError:
+        raise
+    except Exception as e:
+        raise IOError(f"Fehler beim CSV-Import: {e}")
+    
+    if fehler and strikt:
+        raise ValueError(f"{len(fehler)} fehlerhafte Zeile(n) in {csv_pfad}:\n" + "\n".join(fehler))
+    
+    # Graph in einem Durchlauf aufbauen: Module je Semester sammeln und gesammelt einfügen
+    neue_module = [[] for _ in semester_liste]
+    importiert = []
+    for semester_nr, modulcode, name, ects, status, pruefung in gueltig:
+        modul = Modul(modulcode, name, ects, semester_nr)
+        if pruefung:
+            modul.setze_pruefungsleistung(Pruefungsleistung(*pruefung))
+        modul.status = status
+        neue_module[semester_nr - 1].append(modul)
+        importiert.append((semester_nr, modul))
+    for semester, module in zip(semester_liste, neue_module):
+        if module:
+            semester.fuege_module_hinzu(module)
+    
+    return ImportErgebnis(importiert, fehler)
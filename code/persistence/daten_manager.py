@@ -1,32 +1,73 @@
 """
-DatenManager-Klasse für die Persistierung von Daten.
+DatenManager-Klassen für die Persistierung von Daten.
 
-Diese Klasse ist verantwortlich für das Speichern und Laden von Studiengang-Daten.
+Dieses Modul enthält die abstrakte Schnittstelle BasisDatenManager sowie die
+Pickle-Implementierung DatenManager, die für das Speichern und Laden von
+Studiengang-Daten verantwortlich ist.
 """
 
 import pickle
 import csv
 import os
-from typing import Optional
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import Dict, Optional, Set
 from datetime import date
 
+from .atomar import GruppenCommit, schreibe_atomar
+from .csv_export import CSV_KOPFZEILE, modul_zeilen
+from .csv_import import ImportErgebnis, importiere_csv
+from .kompression import dekomprimiere, komprimiere, pruefe_verfahren
+from .serialisierer import deserialisiere, ist_serialisiert, serialisiere
 
-class DatenManager:
+
+def setze_semester_zeitraum(semester, startdatum: date, enddatum: date) -> None:
+    """
+    Setzt Start- und Enddatum eines Semesters in einer Reihenfolge,
+    die die Validierung beider Setter erfüllt.
+    
+    Args:
+        semester: Das zu ändernde Semester
+        startdatum: Das neue Startdatum
+        enddatum: Das neue Enddatum
+    """
+    if startdatum < semester.enddatum:
+        semester.startdatum = startdatum
+        semester.enddatum = enddatum
+    else:
+        semester.enddatum = enddatum
+        semester.startdatum = startdatum
+
+
+class BasisDatenManager(ABC):
     """
-    Verwaltet die Persistierung von Studiengang-Daten.
+    Abstrakte Schnittstelle für die Persistierung von Studiengang-Daten.
+    
+    Konkrete Speicher (Pickle, SQLite, ...) implementieren nur _schreibe und
+    _lese; Fehlerbehandlung, Meldungen und CSV-Export sind gemeinsam.
     
     Attributes:
         _datei_pfad: Der Pfad zur Datei für die Persistierung
+        _meldungen: Ob Statusmeldungen ausgegeben werden
+        _gruppen_commit: Optionaler GruppenCommit für zusammengefasste Schreibvorgänge
+        _protokollierte_module: Seit dem letzten Speichern protokollierte Module mit
+            ihrem Änderungszähler zum Zeitpunkt des Protokollierens
+        _erweiterte_semester: Nummern der Semester, für die ein neues Modul protokolliert wurde
     """
     
-    def __init__(self, datei_pfad: str = "studiengang.pkl"):
+    def __init__(self, datei_pfad: str):
         """
         Initialisiert den DatenManager.
         
         Args:
-            datei_pfad: Der Pfad zur Datei (Standard: studiengang.pkl)
+            datei_pfad: Der Pfad zur Datei
         """
         self._datei_pfad = datei_pfad
+        self._meldungen = True
+        self._gruppen_commit: Optional[GruppenCommit] = None
+        self._protokollierte_module: Dict[object, int] = {}
+        self._erweiterte_semester: Set[int] = set()
     
     @property
     def datei_pfad(self) -> str:
@@ -40,9 +81,79 @@ class DatenManager:
             raise ValueError("Dateipfad darf nicht leer sein")
         self._datei_pfad = value
     
+    @property
+    def meldungen(self) -> bool:
+        """Getter für die Ausgabe von Statusmeldungen."""
+        return self._meldungen
+    
+    @meldungen.setter
+    def meldungen(self, value: bool):
+        """Setter für die Ausgabe von Statusmeldungen (z.B. aus bei Massenverarbeitung)."""
+        self._meldungen = value
+    
+    def _melde(self, text: str) -> None:
+        """
+        Gibt eine Statusmeldung aus, sofern Meldungen aktiviert sind.
+        
+        Args:
+            text: Die Meldung
+        """
+        if self._meldungen:
+            print(text)
+    
+    @property
+    def gruppen_commit(self) -> Optional[GruppenCommit]:
+        """Getter für den GruppenCommit."""
+        return self._gruppen_commit
+    
+    @gruppen_commit.setter
+    def gruppen_commit(self, value: Optional[GruppenCommit]):
+        """Setter für den GruppenCommit (None = jeder Speichervorgang schreibt sofort)."""
+        self._gruppen_commit = value
+    
+    def _schreibe_datei(self, daten: bytes) -> None:
+        """
+        Ersetzt die Datei atomar durch neue Daten.
+        
+        Ist ein GruppenCommit gesetzt, wird der Schreibvorgang mit anderen
+        Speichervorgängen desselben Zeitfensters zusammengefasst.
+        
+        Args:
+            daten: Der neue Dateiinhalt
+        """
+        if self._gruppen_commit is not None:
+            self._gruppen_commit.schreibe(self._datei_pfad, daten)
+        else:
+            schreibe_atomar(self._datei_pfad, daten)
+    
+    @property
+    def csv_pfad(self) -> str:
+        """Getter für den Pfad der CSV-Exportdatei."""
+        return os.path.splitext(self._datei_pfad)[0] + '.csv'
+    
+    @abstractmethod
+    def _schreibe(self, studiengang) -> None:
+        """
+        Schreibt einen Studiengang in den Speicher.
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+        """
+    
+    @abstractmethod
+    def _lese(self):
+        """
+        Liest einen Studiengang aus dem (existierenden) Speicher.
+        
+        Returns:
+            Der gelesene Studiengang
+        """
+    
     def speichere_studiengang(self, studiengang) -> None:
         """
-        Speichert einen Studiengang in einer Datei (Pickle).
+        Speichert einen Studiengang im Speicher.
+        
+        Danach gilt der Studiengang als unverändert (siehe Studiengang.ist_geaendert).
         
         Args:
             studiengang: Der zu speichernde Studiengang
@@ -51,15 +162,114 @@ class DatenManager:
             IOError: Wenn das Speichern fehlschlägt
         """
         try:
-            with open(self._datei_pfad, 'wb') as datei:
-                pickle.dump(studiengang, datei)
-            print(f"✓ Studiengang erfolgreich gespeichert in: {self._datei_pfad}")
+            self._schreibe(studiengang)
+            self._vergiss_protokollierte()
+            studiengang.markiere_gespeichert()
+            self._melde(f"✓ Studiengang erfolgreich gespeichert in: {self._datei_pfad}")
         except Exception as e:
             raise IOError(f"Fehler beim Speichern: {e}")
     
+    def speichere_vollstaendig(self, studiengang) -> None:
+        """
+        Schreibt den ganzen Studiengang, unabhängig von Änderungsverfolgung und Protokoll.
+        
+        Für Speicher, die sonst nur protokollierte Einzeländerungen schreiben,
+        z.B. wenn ein Studiengang ersetzt oder außerhalb der Änderungsverfolgung
+        als geändert markiert wurde.
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+            
+        Raises:
+            IOError: Wenn das Speichern fehlschlägt
+        """
+        BasisDatenManager.speichere_studiengang(self, studiengang)
+    
+    def _merke_protokolliert(self, modul, semester_nummer: Optional[int] = None) -> None:
+        """
+        Merkt vor, dass eine Änderung an einem Modul protokolliert wurde.
+        
+        Args:
+            modul: Das protokollierte Modul
+            semester_nummer: Die Nummer des Semesters, in das das Modul eingefügt wurde
+        """
+        self._protokollierte_module[modul] = modul.version
+        if semester_nummer is not None:
+            self._erweiterte_semester.add(semester_nummer)
+    
+    def _vergiss_protokollierte(self) -> None:
+        """Setzt die protokollierten Module zurück (nach dem Laden oder Speichern)."""
+        self._protokollierte_module.clear()
+        self._erweiterte_semester.clear()
+    
+    def _ist_vollstaendig_protokolliert(self, studiengang) -> bool:
+        """
+        Prüft, ob alle ungespeicherten Änderungen über die protokolliere-Methoden gemeldet wurden.
+        
+        Gedeckt sind Änderungen an protokollierten Modulen und ihren
+        Prüfungsleistungen, solange das Modul seit dem Protokollieren nicht
+        weiter geändert wurde, sowie Semester, in die ein protokolliertes Modul
+        eingefügt wurde. Alles andere (z.B. Name des Studiengangs, entfernte
+        Module oder ein Import ohne Protokoll) erfordert ein vollständiges Speichern.
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+        
+        Returns:
+            True wenn die protokollierten Änderungen alle Änderungen abdecken, sonst False
+        """
+        from domain import Modul, Pruefungsleistung, Semester
+        
+        pruefungsleistungen = None
+        for objekt in studiengang.hole_geaenderte_objekte():
+            if isinstance(objekt, Modul):
+                if self._protokollierte_module.get(objekt) != objekt.version:
+                    return False
+            elif isinstance(objekt, Pruefungsleistung):
+                if pruefungsleistungen is None:
+                    pruefungsleistungen = {id(modul.hole_pruefungsleistung()): modul
+                                           for modul in self._protokollierte_module}
+                modul = pruefungsleistungen.get(id(objekt))
+                if modul is None or self._protokollierte_module[modul] != modul.version:
+                    return False
+            elif isinstance(objekt, Semester):
+                if objekt.nummer not in self._erweiterte_semester:
+                    return False
+            else:
+                return False
+        return True
+    
+    def protokolliere_modul_hinzugefuegt(self, semester_nummer: int, modul) -> None:
+        """
+        Wird aufgerufen, nachdem ein Modul zu einem Semester hinzugefügt wurde.
+        
+        Speicher, die beim Speichern immer den ganzen Studiengang schreiben,
+        müssen hier nichts vormerken.
+        
+        Args:
+            semester_nummer: Die Nummer des Semesters
+            modul: Das hinzugefügte Modul
+        """
+    
+    def protokolliere_pruefungsleistung(self, modul) -> None:
+        """
+        Wird aufgerufen, nachdem eine Prüfungsleistung gesetzt wurde.
+        
+        Args:
+            modul: Das Modul, dessen Prüfungsleistung gesetzt wurde
+        """
+    
+    def protokolliere_status(self, modul) -> None:
+        """
+        Wird aufgerufen, nachdem der Status eines Moduls geändert wurde.
+        
+        Args:
+            modul: Das Modul, dessen Status geändert wurde
+        """
+    
     def lade_studiengang(self):
         """
-        Lädt einen Studiengang aus einer Datei.
+        Lädt einen Studiengang aus dem Speicher.
         
         Returns:
             Der geladene Studiengang oder None wenn die Datei nicht existiert
@@ -68,13 +278,14 @@ class DatenManager:
             IOError: Wenn das Laden fehlschlägt
         """
         if not os.path.exists(self._datei_pfad):
-            print(f"ℹ Keine gespeicherten Daten gefunden: {self._datei_pfad}")
+            self._melde(f"ℹ Keine gespeicherten Daten gefunden: {self._datei_pfad}")
             return None
         
         try:
-            with open(self._datei_pfad, 'rb') as datei:
-                studiengang = pickle.load(datei)
-            print(f"✓ Studiengang erfolgreich geladen aus: {self._datei_pfad}")
+            studiengang = self._lese()
+            self._vergiss_protokollierte()
+            studiengang.markiere_gespeichert()
+            self._melde(f"✓ Studiengang erfolgreich geladen aus: {self._datei_pfad}")
             return studiengang
         except Exception as e:
             raise IOError(f"Fehler beim Laden: {e}")
@@ -89,47 +300,97 @@ class DatenManager:
         Raises:
             IOError: Wenn der Export fehlschlägt
         """
-        csv_pfad = self._datei_pfad.replace('.pkl', '.csv')
+        csv_pfad = self.csv_pfad
         
         try:
             with open(csv_pfad, 'w', newline='', encoding='utf-8') as datei:
                 writer = csv.writer(datei, delimiter=';')
                 
-                # Header
-                writer.writerow([
-                    'Semester',
-                    'Modulcode',
-                    'Modulname',
-                    'ECTS',
-                    'Status',
-                    'Note',
-                    'Prüfungsart',
-                    'Prüfungsdatum',
-                    'Versuch'
-                ])
-                
-                # Daten
-                for semester in studiengang.semester:
-                    for modul in semester.hole_modulen():
-                        pruefung = modul.hole_pruefungsleistung()
-                        
-                        row = [
-                            f"Semester {semester.nummer}",
-                            modul.modulcode,
-                            modul.name,
-                            modul.ects,
-                            modul.status.value,
-                            pruefung.note if pruefung else '',
-                            pruefung.art.value if pruefung else '',
-                            pruefung.datum if pruefung else '',
-                            pruefung.versuch if pruefung else ''
-                        ]
-                        writer.writerow(row)
+                writer.writerow(CSV_KOPFZEILE)
+                writer.writerows(modul_zeilen(studiengang))
             
-            print(f"✓ Daten erfolgreich exportiert nach: {csv_pfad}")
+            self._melde(f"✓ Daten erfolgreich exportiert nach: {csv_pfad}")
         except Exception as e:
             raise IOError(f"Fehler beim CSV-Export: {e}")
     
+    def importiere_csv(self, studiengang, strikt: bool = True) -> ImportErgebnis:
+        """
+        Importiert Module aus der CSV-Datei, die exportiere_csv geschrieben hat.
+        
+        Jedes importierte Modul wird über die protokolliere-Methoden gemeldet,
+        sodass auch Journal und SQLite den Import beim nächsten Speichern schreiben.
+        
+        Args:
+            studiengang: Der Studiengang, in den importiert wird
+            strikt: Ob bei fehlerhaften Zeilen der ganze Import abgelehnt wird
+            
+        Returns:
+            Das ImportErgebnis mit allen abgelehnten Zeilen
+            
+        Raises:
+            ValueError: Im strikten Modus, wenn mindestens eine Zeile fehlerhaft ist
+            IOError: Wenn die Datei nicht gelesen werden kann
+        """
+        ergebnis = importiere_csv(self.csv_pfad, studiengang, strikt)
+        for semester_nummer, modul in ergebnis.module:
+            self.protokolliere_modul_hinzugefuegt(semester_nummer, modul)
+            if modul.hole_pruefungsleistung() is not None:
+                # Die Note setzt den Status neu, daher den Status danach protokollieren
+                self.protokolliere_pruefungsleistung(modul)
+                self.protokolliere_status(modul)
+        self._melde(f"✓ CSV importiert aus: {self.csv_pfad} ({ergebnis})")
+        return ergebnis
+    
+    async def lade_studiengang_async(self, executor: Optional[Executor] = None):
+        """
+        Lädt einen Studiengang, ohne die Ereignisschleife zu blockieren.
+        
+        Das Lesen und Deserialisieren läuft im Executor (Standard: der
+        Thread-Pool der Ereignisschleife).
+        
+        Args:
+            executor: Der Executor für die blockierende Arbeit (None = Standard)
+            
+        Returns:
+            Der geladene Studiengang oder None wenn die Datei nicht existiert
+            
+        Raises:
+            IOError: Wenn das Laden fehlschlägt
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.lade_studiengang)
+    
+    async def speichere_studiengang_async(self, studiengang, executor: Optional[Executor] = None) -> None:
+        """
+        Speichert einen Studiengang, ohne die Ereignisschleife zu blockieren.
+        
+        Der Studiengang darf bis zum Abschluss nicht verändert werden, und pro
+        DatenManager sollte nur ein Speichervorgang gleichzeitig laufen.
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+            executor: Der Executor für die blockierende Arbeit (None = Standard)
+            
+        Raises:
+            IOError: Wenn das Speichern fehlschlägt
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, self.speichere_studiengang, studiengang)
+    
+    async def exportiere_csv_async(self, studiengang, executor: Optional[Executor] = None) -> None:
+        """
+        Exportiert die Modul-Daten, ohne die Ereignisschleife zu blockieren.
+        
+        Args:
+            studiengang: Der Studiengang dessen Daten exportiert werden sollen
+            executor: Der Executor für die blockierende Arbeit (None = Standard)
+            
+        Raises:
+            IOError: Wenn der Export fehlschlägt
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, self.exportiere_csv, studiengang)
+    
     def datei_existiert(self) -> bool:
         """
         Prüft, ob die Datei existiert.
@@ -149,8 +410,147 @@ class DatenManager:
         if self.datei_existiert():
             try:
                 os.remove(self._datei_pfad)
-                print(f"✓ Datei erfolgreich gelöscht: {self._datei_pfad}")
+                self._melde(f"✓ Datei erfolgreich gelöscht: {self._datei_pfad}")
             except Exception as e:
                 raise IOError(f"Fehler beim Löschen: {e}")
         else:
-            print(f"ℹ Keine Datei zum Löschen gefunden: {self._datei_pfad}")
+            self._melde(f"ℹ Keine Datei zum Löschen gefunden: {self._datei_pfad}")
+
+
+class DatenManager(BasisDatenManager):
+    """
+    Persistiert Studiengang-Daten als (optional komprimierte) Datei.
+    
+    Gespeichert wird im schema-versionierten Format aus serialisierer.py.
+    Ältere, mit pickle gespeicherte Objektgraphen werden nur gelesen, wenn
+    altes_pickle_erlaubt gesetzt ist; dafür ist migriere_altes_format gedacht,
+    das solche Dateien einmalig in das aktuelle Format umwandelt.
+    
+    Attributes:
+        _datei_pfad: Der Pfad zur Datei für die Persistierung
+        _kompression: Das Kompressionsverfahren beim Speichern (None = unkomprimiert)
+        _altes_pickle_erlaubt: Ob Dateien im alten Pickle-Format geladen werden
+    """
+    
+    def __init__(self, datei_pfad: str = "studiengang.pkl", kompression: Optional[str] = None,
+                 altes_pickle_erlaubt: bool = False):
+        """
+        Initialisiert den DatenManager.
+        
+        Args:
+            datei_pfad: Der Pfad zur Datei (Standard: studiengang.pkl)
+            kompression: 'zlib', 'lzma', 'bz2' oder None für keine Kompression
+            altes_pickle_erlaubt: Ob Dateien im alten Pickle-Format geladen werden
+                (pickle kann beim Laden beliebigen Code ausführen; nur für
+                vertrauenswürdige Dateien setzen)
+            
+        Raises:
+            ValueError: Wenn das Kompressionsverfahren unbekannt ist
+        """
+        super().__init__(datei_pfad)
+        pruefe_verfahren(kompression)
+        self._kompression = kompression
+        self._altes_pickle_erlaubt = altes_pickle_erlaubt
+    
+    @property
+    def kompression(self) -> Optional[str]:
+        """Getter für das Kompressionsverfahren."""
+        return self._kompression
+    
+    @kompression.setter
+    def kompression(self, value: Optional[str]):
+        """Setter für das Kompressionsverfahren mit Validierung."""
+        pruefe_verfahren(value)
+        self._kompression = value
+    
+    @property
+    def altes_pickle_erlaubt(self) -> bool:
+        """Getter dafür, ob das alte Pickle-Format geladen wird."""
+        return self._altes_pickle_erlaubt
+    
+    @altes_pickle_erlaubt.setter
+    def altes_pickle_erlaubt(self, value: bool):
+        """Setter dafür, ob das alte Pickle-Format geladen wird."""
+        self._altes_pickle_erlaubt = value
+    
+    def _schreibe(self, studiengang) -> None:
+        """
+        Schreibt den Studiengang atomar und (ggf.) komprimiert.
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+        """
+        self._schreibe_datei(komprimiere(serialisiere(studiengang), self._kompression))
+    
+    def _lese(self):
+        """
+        Liest den Studiengang aus der Datei.
+        
+        Kompressionsverfahren und Format werden an der Signatur erkannt, sodass
+        auch unkomprimierte und alte Pickle-Dateien gelesen werden.
+        
+        Returns:
+            Der gelesene Studiengang
+            
+        Raises:
+            ValueError: Wenn die Datei im alten Pickle-Format vorliegt, dieses
+                aber nicht erlaubt ist
+        """
+        with open(self._datei_pfad, 'rb') as datei:
+            return self._lese_daten(datei.read())
+    
+    def _lese_daten(self, daten: bytes):
+        """
+        Baut den Studiengang aus dem gelesenen Dateiinhalt auf.
+        
+        Args:
+            daten: Der (ggf. komprimierte) Dateiinhalt
+        
+        Returns:
+            Der gelesene Studiengang
+            
+        Raises:
+            ValueError: Wenn die Datei im alten Pickle-Format vorliegt, dieses
+                aber nicht erlaubt ist
+        """
+        daten = dekomprimiere(daten)
+        if ist_serialisiert(daten):
+            return deserialisiere(daten)
+        if not self._altes_pickle_erlaubt:
+            raise ValueError("Datei liegt im alten Pickle-Format vor; vertrauenswürdige Dateien "
+                             "einmalig mit 'python main.py --migriere' (bzw. migriere_altes_format) "
+                             "umwandeln")
+        return pickle.loads(daten)
+    
+    def migriere_altes_format(self) -> bool:
+        """
+        Wandelt eine Datei im alten Pickle-Format einmalig in das aktuelle Format um.
+        
+        Das alte Format wird dafür ausnahmsweise geladen. pickle kann dabei
+        beliebigen Code ausführen; nur für Dateien aus vertrauenswürdiger
+        Quelle verwenden.
+        
+        Returns:
+            True wenn die Datei umgewandelt wurde, False wenn sie fehlt oder
+            bereits im aktuellen Format vorliegt
+            
+        Raises:
+            IOError: Wenn beim Lesen oder Schreiben ein Fehler auftritt
+        """
+        if not self.datei_existiert():
+            return False
+        try:
+            with open(self._datei_pfad, 'rb') as datei:
+                daten = dekomprimiere(datei.read())
+        except Exception as e:
+            raise IOError(f"Fehler beim Laden: {e}")
+        if ist_serialisiert(daten):
+            return False
+        erlaubt = self._altes_pickle_erlaubt
+        self._altes_pickle_erlaubt = True
+        try:
+            studiengang = self.lade_studiengang()
+        finally:
+            self._altes_pickle_erlaubt = erlaubt
+        self.speichere_vollstaendig(studiengang)
+        return True
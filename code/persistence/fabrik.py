@@ -0,0 +1,41 @@
+"""
+Fabrikfunktion für DatenManager.
+
+Wählt anhand der Dateiendung den passenden Speicher aus.
+"""
+
+import os
+from typing import Optional
+
+from .daten_manager import BasisDatenManager, DatenManager
+from .journal_daten_manager import JournalDatenManager
+from .sqlite_daten_manager import SQLiteDatenManager
+from .binaer_daten_manager import BinaerDatenManager
+
+
+SQLITE_ENDUNGEN = ('.db', '.sqlite', '.sqlite3')
+BINAER_ENDUNGEN = ('.sdb',)
+
+
+def erstelle_daten_manager(datei_pfad: str, journal: bool = True,
+                           kompression: Optional[str] = None) -> BasisDatenManager:
+    """
+    Erstellt den passenden DatenManager für einen Dateipfad.
+    
+    Args:
+        datei_pfad: Der Pfad zur Datei
+        journal: Ob Pickle-Dateien mit Änderungsjournal gespeichert werden sollen
+        kompression: Kompressionsverfahren für Pickle-Dateien ('zlib', 'lzma', 'bz2')
+    
+    Returns:
+        Ein SQLiteDatenManager für .db/.sqlite-Dateien, ein BinaerDatenManager
+        für .sdb-Dateien, sonst ein Pickle-DatenManager
+    """
+    endung = os.path.splitext(datei_pfad)[1].lower()
+    if endung in SQLITE_ENDUNGEN:
+        return SQLiteDatenManager(datei_pfad)
+    if endung in BINAER_ENDUNGEN:
+        return BinaerDatenManager(datei_pfad)
+    if journal:
+        return JournalDatenManager(datei_pfad, kompression=kompression)
+    return DatenManager(datei_pfad, kompression)
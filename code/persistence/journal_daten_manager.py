@@ -0,0 +1,343 @@
+"""
+JournalDatenManager-Klasse für die inkrementelle Persistierung.
+
+Diese Klasse speichert Änderungen als kleine Journal-Einträge statt den
+gesamten Studiengang bei jedem Speichern neu zu schreiben.
+
+Die erste Zeile des Journals nennt die Kennung (Prüfsumme) des Snapshots,
+auf dem es aufbaut. Stürzt das Programm beim Kompaktieren nach dem Schreiben
+des neuen Snapshots, aber vor dem Löschen des Journals ab, passt die Kennung
+nicht mehr und das veraltete Journal wird beim Laden verworfen, statt seine
+bereits im Snapshot enthaltenen Einträge ein zweites Mal abzuspielen.
+"""
+
+import hashlib
+import json
+import os
+from datetime import date
+from typing import Dict, List, Optional
+
+from .daten_manager import DatenManager
+
+
+def _snapshot_kennung(daten: bytes) -> str:
+    """
+    Berechnet die Kennung eines Snapshots.
+    
+    Args:
+        daten: Der Dateiinhalt des Snapshots
+    
+    Returns:
+        Die Prüfsumme als Hex-String
+    """
+    return hashlib.blake2b(daten, digest_size=16).hexdigest()
+
+
+class JournalDatenManager(DatenManager):
+    """
+    Persistiert einen Studiengang als Snapshot plus Änderungsjournal.
+    
+    Jede Änderung (Modul hinzugefügt, Note gesetzt, Status geändert) wird als
+    JSON-Zeile vorgemerkt und beim Speichern an das Journal angehängt. Erreicht
+    das Journal die Kompaktierungsschwelle, wird ein neuer Snapshot geschrieben
+    und das Journal geleert.
+    
+    Attributes:
+        _kompaktierungs_schwelle: Anzahl Journal-Einträge bis zur Kompaktierung
+        _ausstehend: Noch nicht gespeicherte Journal-Einträge
+        _journal_laenge: Anzahl der Einträge im Journal auf der Festplatte
+            (ohne Kopfzeile)
+        _snapshot_kennung: Kennung des zuletzt gelesenen oder geschriebenen
+            Snapshots (None = noch nicht bekannt)
+    """
+    
+    def __init__(self, datei_pfad: str = "studiengang.pkl", kompaktierungs_schwelle: int = 500,
+                 kompression: Optional[str] = None):
+        """
+        Initialisiert den JournalDatenManager.
+        
+        Args:
+            datei_pfad: Der Pfad zur Snapshot-Datei (Standard: studiengang.pkl)
+            kompaktierungs_schwelle: Anzahl Journal-Einträge bis zur Kompaktierung
+            kompression: Kompressionsverfahren des Snapshots (None = unkomprimiert)
+        
+        Raises:
+            ValueError: Wenn die Kompaktierungsschwelle kleiner als 1 ist
+                oder das Kompressionsverfahren unbekannt ist
+        """
+        super().__init__(datei_pfad, kompression)
+        if kompaktierungs_schwelle < 1:
+            raise ValueError("Kompaktierungsschwelle muss mindestens 1 sein")
+        self._kompaktierungs_schwelle = kompaktierungs_schwelle
+        self._ausstehend: List[str] = []
+        self._journal_laenge = 0
+        self._snapshot_kennung: Optional[str] = None
+    
+    @property
+    def journal_pfad(self) -> str:
+        """Getter für den Pfad der Journal-Datei."""
+        return self._datei_pfad + ".journal"
+    
+    @property
+    def kompaktierungs_schwelle(self) -> int:
+        """Getter für die Kompaktierungsschwelle."""
+        return self._kompaktierungs_schwelle
+    
+    @kompaktierungs_schwelle.setter
+    def kompaktierungs_schwelle(self, value: int):
+        """Setter für die Kompaktierungsschwelle mit Validierung."""
+        if value < 1:
+            raise ValueError("Kompaktierungsschwelle muss mindestens 1 sein")
+        self._kompaktierungs_schwelle = value
+    
+    def protokolliere_modul_hinzugefuegt(self, semester_nummer: int, modul) -> None:
+        """
+        Merkt ein neu hinzugefügtes Modul für das Journal vor.
+        
+        Args:
+            semester_nummer: Die Nummer des Semesters, in das das Modul eingefügt wurde
+            modul: Das hinzugefügte Modul
+        """
+        self._merke_vor({
+            'typ': 'modul_hinzugefuegt',
+            'semester': semester_nummer,
+            'modulcode': modul.modulcode,
+            'name': modul.name,
+            'ects': modul.ects,
+            'semester_empfehlung': modul.semester_empfehlung,
+            'status': modul.status.name
+        })
+        self._merke_protokolliert(modul, semester_nummer)
+    
+    def protokolliere_pruefungsleistung(self, modul) -> None:
+        """
+        Merkt eine gesetzte Prüfungsleistung für das Journal vor.
+        
+        Args:
+            modul: Das Modul, dessen Prüfungsleistung gesetzt wurde
+        """
+        pruefung = modul.hole_pruefungsleistung()
+        if pruefung is None:
+            return
+        self._merke_vor({
+            'typ': 'pruefungsleistung_gesetzt',
+            'modulcode': modul.modulcode,
+            'note': pruefung.note,
+            'datum': pruefung.datum.isoformat(),
+            'versuch': pruefung.versuch,
+            'art': pruefung.art.name
+        })
+        self._merke_protokolliert(modul)
+    
+    def protokolliere_status(self, modul) -> None:
+        """
+        Merkt eine Statusänderung für das Journal vor.
+        
+        Args:
+            modul: Das Modul, dessen Status geändert wurde
+        """
+        self._merke_vor({
+            'typ': 'status_geaendert',
+            'modulcode': modul.modulcode,
+            'status': modul.status.name
+        })
+        self._merke_protokolliert(modul)
+    
+    def speichere_studiengang(self, studiengang) -> None:
+        """
+        Speichert die ausstehenden Änderungen im Journal.
+        
+        Existiert noch kein Snapshot, würde das Journal die
+        Kompaktierungsschwelle überschreiten oder hat der Studiengang Änderungen,
+        die nicht protokolliert wurden (z.B. durch einen CSV-Import), wird
+        stattdessen ein vollständiger Snapshot geschrieben und das Journal geleert.
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+        
+        Raises:
+            IOError: Wenn das Speichern fehlschlägt
+        """
+        if (not self.datei_existiert()
+                or self._journal_laenge + len(self._ausstehend) >= self._kompaktierungs_schwelle
+                or not self._ist_vollstaendig_protokolliert(studiengang)):
+            self.kompaktiere(studiengang)
+            return
+        
+        if not self._ausstehend:
+            self._melde(f"ℹ Keine Änderungen zu speichern: {self._datei_pfad}")
+            return
+        
+        try:
+            zeilen = self._ausstehend
+            if not os.path.exists(self.journal_pfad) or os.path.getsize(self.journal_pfad) == 0:
+                zeilen = [self._kopfzeile()] + zeilen
+            with open(self.journal_pfad, 'a', encoding='utf-8') as datei:
+                datei.write("\n".join(zeilen) + "\n")
+                datei.flush()
+                os.fsync(datei.fileno())
+            self._journal_laenge += len(self._ausstehend)
+            anzahl = len(self._ausstehend)
+            self._ausstehend.clear()
+            self._vergiss_protokollierte()
+            studiengang.markiere_gespeichert()
+            self._melde(f"✓ {anzahl} Änderung(en) im Journal gespeichert: {self.journal_pfad}")
+        except Exception as e:
+            raise IOError(f"Fehler beim Schreiben des Journals: {e}")
+    
+    def speichere_vollstaendig(self, studiengang) -> None:
+        """
+        Schreibt einen vollständigen Snapshot und leert das Journal (siehe kompaktiere).
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+        
+        Raises:
+            IOError: Wenn das Speichern fehlschlägt
+        """
+        self.kompaktiere(studiengang)
+    
+    def kompaktiere(self, studiengang) -> None:
+        """
+        Schreibt einen vollständigen Snapshot und leert das Journal.
+        
+        Bricht der Vorgang nach dem Schreiben des Snapshots ab, bleibt das alte
+        Journal liegen; es verweist aber auf den vorherigen Snapshot und wird
+        daher beim nächsten Laden verworfen.
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+        
+        Raises:
+            IOError: Wenn das Speichern fehlschlägt
+        """
+        super().speichere_studiengang(studiengang)
+        try:
+            if os.path.exists(self.journal_pfad):
+                os.remove(self.journal_pfad)
+        except Exception as e:
+            raise IOError(f"Fehler beim Leeren des Journals: {e}")
+        self._journal_laenge = 0
+        self._ausstehend.clear()
+    
+    def lade_studiengang(self):
+        """
+        Lädt den Snapshot und spielt das Journal darauf ab.
+        
+        Returns:
+            Der geladene Studiengang oder None wenn kein Snapshot existiert
+        
+        Raises:
+            IOError: Wenn das Laden oder Abspielen fehlschlägt
+        """
+        studiengang = super().lade_studiengang()
+        self._ausstehend.clear()
+        self._journal_laenge = 0
+        if studiengang is None or not os.path.exists(self.journal_pfad):
+            return studiengang
+        
+        try:
+            with open(self.journal_pfad, 'r', encoding='utf-8') as datei:
+                zeilen = datei.read().split("\n")
+            # Die letzte Zeile ist nach einem Absturz beim Anhängen evtl. unvollständig
+            if zeilen[-1]:
+                with open(self.journal_pfad, 'r+b') as datei:
+                    datei.truncate(os.path.getsize(self.journal_pfad) - len(zeilen[-1].encode('utf-8')))
+            eintraege = [json.loads(zeile) for zeile in zeilen[:-1] if zeile.strip()]
+            if eintraege and eintraege[0]['typ'] == 'snapshot':
+                if eintraege[0]['kennung'] != self._snapshot_kennung:
+                    # Absturz beim Kompaktieren: die Einträge stecken bereits im Snapshot
+                    os.remove(self.journal_pfad)
+                    self._melde(f"ℹ Veraltetes Journal verworfen: {self.journal_pfad}")
+                    return studiengang
+                eintraege = eintraege[1:]
+            self._spiele_ab(studiengang, eintraege)
+            self._journal_laenge = len(eintraege)
+            studiengang.markiere_gespeichert()
+            self._melde(f"✓ {len(eintraege)} Journal-Einträge abgespielt aus: {self.journal_pfad}")
+            return studiengang
+        except Exception as e:
+            raise IOError(f"Fehler beim Abspielen des Journals: {e}")
+    
+    def _schreibe_datei(self, daten: bytes) -> None:
+        """
+        Ersetzt den Snapshot atomar und merkt sich dessen Kennung.
+        
+        Args:
+            daten: Der neue Dateiinhalt
+        """
+        super()._schreibe_datei(daten)
+        self._snapshot_kennung = _snapshot_kennung(daten)
+    
+    def _lese(self):
+        """
+        Liest den Snapshot und merkt sich dessen Kennung.
+        
+        Returns:
+            Der gelesene Studiengang
+        """
+        with open(self._datei_pfad, 'rb') as datei:
+            daten = datei.read()
+        self._snapshot_kennung = _snapshot_kennung(daten)
+        return self._lese_daten(daten)
+    
+    def _kopfzeile(self) -> str:
+        """
+        Erstellt die Kopfzeile eines neuen Journals mit der Kennung des Snapshots.
+        
+        Returns:
+            Die Kopfzeile als JSON
+        """
+        if self._snapshot_kennung is None:
+            with open(self._datei_pfad, 'rb') as datei:
+                self._snapshot_kennung = _snapshot_kennung(datei.read())
+        return json.dumps({'typ': 'snapshot', 'kennung': self._snapshot_kennung})
+    
+    def _merke_vor(self, eintrag: Dict) -> None:
+        """
+        Merkt einen Journal-Eintrag für das nächste Speichern vor.
+        
+        Args:
+            eintrag: Der Eintrag als Dictionary
+        """
+        self._ausstehend.append(json.dumps(eintrag, ensure_ascii=False))
+    
+    @staticmethod
+    def _spiele_ab(studiengang, eintraege: List[Dict]) -> None:
+        """
+        Wendet Journal-Einträge der Reihe nach auf einen Studiengang an.
+        
+        Args:
+            studiengang: Der Studiengang aus dem Snapshot
+            eintraege: Die Journal-Einträge in Schreibreihenfolge
+        
+        Raises:
+            ValueError: Wenn ein Eintrag unbekannt ist oder ein Modul fehlt
+        """
+        from domain import Modul, Pruefungsleistung
+        from domain.enums import ModulStatus, Pruefungsart
+        
+        for eintrag in eintraege:
+            typ = eintrag['typ']
+            if typ == 'modul_hinzugefuegt':
+                modul = Modul(eintrag['modulcode'], eintrag['name'],
+                              eintrag['ects'], eintrag['semester_empfehlung'])
+                modul.status = ModulStatus[eintrag['status']]
+                studiengang.semester[eintrag['semester'] - 1].fuege_modul_hinzu(modul)
+                continue
+            
+            modul = studiengang.finde_modul(eintrag['modulcode'])
+            if modul is None:
+                raise ValueError(f"Modul {eintrag['modulcode']} nicht im Studiengang")
+            
+            if typ == 'pruefungsleistung_gesetzt':
+                modul.setze_pruefungsleistung(Pruefungsleistung(
+                    eintrag['note'],
+                    date.fromisoformat(eintrag['datum']),
+                    eintrag['versuch'],
+                    Pruefungsart[eintrag['art']]
+                ))
+            elif typ == 'status_geaendert':
+                modul.status = ModulStatus[eintrag['status']]
+            else:
+                raise ValueError(f"Unbekannter Journal-Eintrag: {typ}")
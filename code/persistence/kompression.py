@@ -0,0 +1,95 @@
+"""
+Transparente Kompression gespeicherter Studiengänge.
+
+Unterstützt zlib, lzma und bz2 aus der Standardbibliothek. Das Verfahren
+wird beim Laden an der Signatur am Dateianfang erkannt; Daten ohne bekannte
+Signatur (z.B. unkomprimierte Pickle-Dateien) werden unverändert zurückgegeben.
+"""
+
+import bz2
+import lzma
+import zlib
+from typing import Optional
+
+
+KOMPRESSIONEN = {
+    'zlib': zlib.compress,
+    'lzma': lzma.compress,
+    'bz2': bz2.compress
+}
+
+
+def pruefe_verfahren(verfahren: Optional[str]) -> None:
+    """
+    Prüft, ob ein Kompressionsverfahren unterstützt wird.
+    
+    Args:
+        verfahren: Der Name des Verfahrens oder None für keine Kompression
+    
+    Raises:
+        ValueError: Wenn das Verfahren unbekannt ist
+    """
+    if verfahren is not None and verfahren not in KOMPRESSIONEN:
+        raise ValueError(f"Unbekanntes Kompressionsverfahren '{verfahren}' "
+                         f"(erlaubt: {', '.join(KOMPRESSIONEN)})")
+
+
+def komprimiere(daten: bytes, verfahren: Optional[str]) -> bytes:
+    """
+    Komprimiert Daten mit dem gewählten Verfahren.
+    
+    Args:
+        daten: Die Rohdaten
+        verfahren: 'zlib', 'lzma', 'bz2' oder None für keine Kompression
+    
+    Returns:
+        Die (ggf.) komprimierten Daten
+    
+    Raises:
+        ValueError: Wenn das Verfahren unbekannt ist
+    """
+    pruefe_verfahren(verfahren)
+    if verfahren is None:
+        return daten
+    return KOMPRESSIONEN[verfahren](daten)
+
+
+def erkenne_verfahren(daten: bytes) -> Optional[str]:
+    """
+    Erkennt das Kompressionsverfahren an der Signatur am Datenanfang.
+    
+    Args:
+        daten: Die gelesenen Daten
+    
+    Returns:
+        'zlib', 'lzma', 'bz2' oder None für unkomprimierte Daten
+    """
+    if daten.startswith(b'\xfd7zXZ\x00'):
+        return 'lzma'
+    if daten.startswith(b'BZh'):
+        return 'bz2'
+    # zlib.compress schreibt immer CMF 0x78 (deflate, 32K-Fenster); die
+    # Prüfsumme des Zwei-Byte-Kopfs ist durch 31 teilbar
+    if len(daten) >= 2 and daten[0] == 0x78 and (daten[0] << 8 | daten[1]) % 31 == 0:
+        return 'zlib'
+    return None
+
+
+def dekomprimiere(daten: bytes) -> bytes:
+    """
+    Dekomprimiert Daten mit dem automatisch erkannten Verfahren.
+    
+    Args:
+        daten: Die gelesenen Daten
+    
+    Returns:
+        Die Rohdaten
+    """
+    verfahren = erkenne_verfahren(daten)
+    if verfahren == 'lzma':
+        return lzma.decompress(daten)
+    if verfahren == 'bz2':
+        return bz2.decompress(daten)
+    if verfahren == 'zlib':
+        return zlib.decompress(daten)
+    return daten
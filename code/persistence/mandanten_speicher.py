@@ -0,0 +1,315 @@
+"""
+MandantenSpeicher-Klasse für die Verwaltung vieler Studiengänge.
+
+Jeder Mandant (z.B. ein Studierender) hat eine eigene Datei in einem
+gemeinsamen Verzeichnis. Geladene Studiengänge werden in einem LRU-Cache
+gehalten; geänderte Einträge werden beim Verdrängen zurückgeschrieben.
+Geändert ist ein Eintrag, wenn er als geändert markiert wurde oder sein
+Studiengang ungespeicherte Änderungen meldet (Studiengang.ist_geaendert).
+Markierte Einträge werden vollständig geschrieben, da ihr Speicher die
+Änderungen nicht aus dem Protokoll kennt.
+"""
+
+import os
+from collections import OrderedDict
+from typing import List, Optional
+
+from .daten_manager import BasisDatenManager, DatenManager
+from .fabrik import erstelle_daten_manager
+
+
+class _CacheEintrag:
+    """
+    Ein geladener Mandant im LRU-Cache.
+    
+    Attributes:
+        studiengang: Der geladene Studiengang
+        daten_manager: Der DatenManager der Mandantendatei
+        geaendert: Ob der Eintrag unabhängig vom Studiengang als geändert markiert ist
+    """
+    
+    def __init__(self, studiengang, daten_manager: BasisDatenManager, geaendert: bool = False):
+        """
+        Initialisiert den Cache-Eintrag.
+        
+        Args:
+            studiengang: Der geladene Studiengang
+            daten_manager: Der DatenManager der Mandantendatei
+            geaendert: Ob der Eintrag unabhängig vom Studiengang als geändert markiert ist
+        """
+        self.studiengang = studiengang
+        self.daten_manager = daten_manager
+        self.geaendert = geaendert
+    
+    def ist_geaendert(self) -> bool:
+        """
+        Prüft, ob der Eintrag gespeichert werden muss.
+        
+        Returns:
+            True wenn markiert oder der Studiengang ungespeicherte Änderungen hat
+        """
+        return self.geaendert or self.studiengang.ist_geaendert()
+
+
+class MandantenSpeicher:
+    """
+    Verwaltet ein Verzeichnis mit einer Datei je Mandant und einen LRU-Cache.
+    
+    Attributes:
+        _verzeichnis: Das Verzeichnis der Mandantendateien
+        _endung: Die Dateiendung (bestimmt den Speicher, z.B. .pkl oder .db)
+        _kapazitaet: Die maximale Anzahl gleichzeitig geladener Studiengänge
+        _cache: Die geladenen Mandanten in LRU-Reihenfolge (ältester zuerst)
+    """
+    
+    def __init__(self, verzeichnis: str, kapazitaet: int = 32, endung: str = ".pkl"):
+        """
+        Initialisiert den MandantenSpeicher und legt das Verzeichnis bei Bedarf an.
+        
+        Args:
+            verzeichnis: Das Verzeichnis der Mandantendateien
+            kapazitaet: Die maximale Anzahl gleichzeitig geladener Studiengänge
+            endung: Die Dateiendung der Mandantendateien (Standard: .pkl)
+        
+        Raises:
+            ValueError: Wenn die Kapazität kleiner als 1 ist
+        """
+        if kapazitaet < 1:
+            raise ValueError("Kapazität muss mindestens 1 sein")
+        self._verzeichnis = verzeichnis
+        self._endung = endung
+        self._kapazitaet = kapazitaet
+        self._cache: 'OrderedDict[str, _CacheEintrag]' = OrderedDict()
+        os.makedirs(verzeichnis, exist_ok=True)
+    
+    @property
+    def verzeichnis(self) -> str:
+        """Getter für das Verzeichnis."""
+        return self._verzeichnis
+    
+    @property
+    def kapazitaet(self) -> int:
+        """Getter für die Cache-Kapazität."""
+        return self._kapazitaet
+    
+    @kapazitaet.setter
+    def kapazitaet(self, value: int):
+        """Setter für die Cache-Kapazität; überzählige Einträge werden verdrängt."""
+        if value < 1:
+            raise ValueError("Kapazität muss mindestens 1 sein")
+        self._kapazitaet = value
+        self._verdraenge_ueberzaehlige()
+    
+    def _pfad(self, kennung: str) -> str:
+        """
+        Ermittelt den Dateipfad eines Mandanten.
+        
+        Args:
+            kennung: Die Mandantenkennung
+        
+        Returns:
+            Der Pfad zur Mandantendatei
+        
+        Raises:
+            ValueError: Wenn die Kennung leer ist oder Pfadtrenner enthält
+        """
+        if not kennung or os.sep in kennung or (os.altsep and os.altsep in kennung) or kennung.startswith('.'):
+            raise ValueError(f"Ungültige Kennung: '{kennung}'")
+        return os.path.join(self._verzeichnis, kennung + self._endung)
+    
+    def kennungen(self) -> List[str]:
+        """
+        Gibt die Kennungen aller gespeicherten und geladenen Mandanten zurück.
+        
+        Returns:
+            Sortierte Liste der Kennungen
+        """
+        gespeichert = {
+            os.path.splitext(name)[0]
+            for name in os.listdir(self._verzeichnis) if name.endswith(self._endung)
+        }
+        return sorted(gespeichert | set(self._cache))
+    
+    def ist_geladen(self, kennung: str) -> bool:
+        """
+        Prüft, ob ein Mandant im Cache liegt.
+        
+        Args:
+            kennung: Die Mandantenkennung
+        
+        Returns:
+            True wenn der Studiengang ohne Festplattenzugriff verfügbar ist
+        """
+        return kennung in self._cache
+    
+    def hole(self, kennung: str):
+        """
+        Gibt den Studiengang eines Mandanten zurück (aus dem Cache oder von der Festplatte).
+        
+        Args:
+            kennung: Die Mandantenkennung
+        
+        Returns:
+            Der Studiengang oder None wenn für die Kennung nichts gespeichert ist
+        """
+        eintrag = self._cache.get(kennung)
+        if eintrag is not None:
+            self._cache.move_to_end(kennung)
+            return eintrag.studiengang
+        
+        daten_manager = erstelle_daten_manager(self._pfad(kennung))
+        daten_manager.meldungen = False
+        studiengang = daten_manager.lade_studiengang()
+        if studiengang is None:
+            return None
+        self._lege_ab(kennung, _CacheEintrag(studiengang, daten_manager))
+        return studiengang
+    
+    def lege_an(self, kennung: str, studiengang) -> None:
+        """
+        Legt einen Mandanten neu an bzw. ersetzt dessen Studiengang.
+        
+        Der Eintrag gilt als geändert und wird spätestens beim Verdrängen gespeichert.
+        
+        Args:
+            kennung: Die Mandantenkennung
+            studiengang: Der Studiengang des Mandanten
+        """
+        daten_manager = erstelle_daten_manager(self._pfad(kennung))
+        daten_manager.meldungen = False
+        self._cache.pop(kennung, None)
+        self._lege_ab(kennung, _CacheEintrag(studiengang, daten_manager, geaendert=True))
+    
+    def daten_manager(self, kennung: str) -> Optional[BasisDatenManager]:
+        """
+        Gibt den DatenManager eines geladenen Mandanten zurück.
+        
+        Args:
+            kennung: Die Mandantenkennung
+        
+        Returns:
+            Der DatenManager oder None wenn der Mandant nicht geladen ist
+        """
+        eintrag = self._cache.get(kennung)
+        return eintrag.daten_manager if eintrag else None
+    
+    def markiere_geaendert(self, kennung: str) -> None:
+        """
+        Markiert einen geladenen Mandanten als geändert.
+        
+        Args:
+            kennung: Die Mandantenkennung
+        
+        Raises:
+            KeyError: Wenn der Mandant nicht geladen ist
+        """
+        self._cache[kennung].geaendert = True
+    
+    def speichere(self, kennung: str) -> None:
+        """
+        Speichert einen geladenen Mandanten und markiert ihn als unverändert.
+        
+        Args:
+            kennung: Die Mandantenkennung
+        
+        Raises:
+            KeyError: Wenn der Mandant nicht geladen ist
+            IOError: Wenn das Speichern fehlschlägt
+        """
+        self._speichere_eintrag(self._cache[kennung])
+    
+    def hat_aenderungen(self) -> bool:
+        """
+        Prüft, ob ein geladener Mandant ungespeicherte Änderungen hat.
+        
+        Returns:
+            True wenn mindestens ein Eintrag gespeichert werden muss
+        """
+        return any(eintrag.ist_geaendert() for eintrag in self._cache.values())
+    
+    def speichere_alle(self) -> int:
+        """
+        Speichert alle geänderten Mandanten im Cache.
+        
+        Returns:
+            Die Anzahl der gespeicherten Mandanten
+        """
+        anzahl = 0
+        for kennung, eintrag in self._cache.items():
+            if eintrag.ist_geaendert():
+                self.speichere(kennung)
+                anzahl += 1
+        return anzahl
+    
+    def migriere_altes_format(self) -> List[str]:
+        """
+        Wandelt alle Mandantendateien im alten Pickle-Format einmalig um.
+        
+        Nur für Verzeichnisse aus vertrauenswürdiger Quelle verwenden (siehe
+        DatenManager.migriere_altes_format). Geladene Mandanten werden
+        übersprungen, da sie bereits im aktuellen Format gelesen wurden.
+        
+        Returns:
+            Die Kennungen der umgewandelten Mandanten
+        
+        Raises:
+            IOError: Wenn eine Datei nicht gelesen oder geschrieben werden kann
+        """
+        umgewandelt = []
+        for kennung in self.kennungen():
+            if kennung in self._cache:
+                continue
+            daten_manager = erstelle_daten_manager(self._pfad(kennung))
+            daten_manager.meldungen = False
+            if isinstance(daten_manager, DatenManager) and daten_manager.migriere_altes_format():
+                umgewandelt.append(kennung)
+        return umgewandelt
+    
+    @staticmethod
+    def _speichere_eintrag(eintrag: _CacheEintrag) -> None:
+        """
+        Speichert einen Eintrag; als geändert markierte Einträge vollständig.
+        
+        Args:
+            eintrag: Der Cache-Eintrag
+        
+        Raises:
+            IOError: Wenn das Speichern fehlschlägt
+        """
+        if eintrag.geaendert:
+            eintrag.daten_manager.speichere_vollstaendig(eintrag.studiengang)
+        else:
+            eintrag.daten_manager.speichere_studiengang(eintrag.studiengang)
+        eintrag.geaendert = False
+    
+    def _lege_ab(self, kennung: str, eintrag: _CacheEintrag) -> None:
+        """
+        Legt einen Eintrag als zuletzt benutzt ab und verdrängt bei Bedarf.
+        
+        Args:
+            kennung: Die Mandantenkennung
+            eintrag: Der Cache-Eintrag
+        """
+        self._cache[kennung] = eintrag
+        self._verdraenge_ueberzaehlige()
+    
+    def _verdraenge_ueberzaehlige(self) -> None:
+        """
+        Verdrängt die am längsten ungenutzten Einträge und speichert geänderte.
+        
+        Ein Eintrag verlässt den Cache erst nach erfolgreichem Speichern.
+        Schlägt das Speichern fehl, bleibt er samt Änderungen im Cache (die
+        Kapazität ist dann vorübergehend überschritten).
+        
+        Raises:
+            IOError: Wenn das Speichern eines geänderten Eintrags fehlschlägt
+        """
+        while len(self._cache) > self._kapazitaet:
+            kennung, eintrag = next(iter(self._cache.items()))
+            if eintrag.ist_geaendert():
+                self._speichere_eintrag(eintrag)
+            del self._cache[kennung]
+    
+    def __len__(self) -> int:
+        """Anzahl der aktuell geladenen Mandanten."""
+        return len(self._cache)
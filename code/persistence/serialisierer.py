@@ -0,0 +1,117 @@
+"""
+Schema-versionierte Serialisierung von Studiengängen.
+
+Ein Studiengang wird als verschachteltes Tupel einfacher Werte (str, int,
+float, None) gespeichert statt als Objektgraph mit vollständigen __dict__s.
+Geladen wird mit einem eingeschränkten Unpickler, der keine Klassen oder
+Funktionen auflöst; Dateien von Dritten können so keinen Code ausführen.
+Beim Aufbau der Objekte prüfen die aus_tupel-Methoden Typen und Wertebereiche.
+Ältere Schema-Versionen werden beim Laden über MIGRATIONEN angehoben.
+"""
+
+import io
+import pickle
+import struct
+from typing import Callable, Dict
+
+MAGIC = b'SDSZ'
+SCHEMA_VERSION = 2
+
+
+def _migriere_v1(nutzdaten: tuple) -> tuple:
+    """
+    Hebt Nutzdaten von Version 1 auf Version 2 an.
+    
+    Version 2 speichert je Modul zusätzlich die früheren Prüfungsversuche.
+    
+    Args:
+        nutzdaten: Der Studiengang als Tupel in Version 1
+    
+    Returns:
+        Der Studiengang als Tupel in Version 2
+    """
+    *studiengang, semester_liste = nutzdaten
+    semester_liste = tuple(
+        (*semester, tuple(modul + (None,) for modul in module))
+        for *semester, module in semester_liste
+    )
+    return (*studiengang, semester_liste)
+
+
+# Migration je Ausgangsversion: wandelt die Nutzdaten von Version n in Version n + 1 um
+MIGRATIONEN: Dict[int, Callable[[tuple], tuple]] = {
+    1: _migriere_v1
+}
+
+
+class _SichererUnpickler(pickle.Unpickler):
+    """Unpickler, der das Auflösen beliebiger Klassen und Funktionen verweigert."""
+    
+    def find_class(self, module: str, name: str):
+        """
+        Verweigert jeden Verweis auf globale Objekte.
+        
+        Raises:
+            pickle.UnpicklingError: Immer
+        """
+        raise pickle.UnpicklingError(f"Unerlaubter Verweis auf {module}.{name}")
+
+
+def ist_serialisiert(daten: bytes) -> bool:
+    """
+    Prüft, ob Daten im Format dieses Moduls vorliegen.
+    
+    Args:
+        daten: Die (dekomprimierten) Dateidaten
+    
+    Returns:
+        True wenn die Daten mit der Signatur beginnen, sonst False
+    """
+    return daten.startswith(MAGIC)
+
+
+def serialisiere(studiengang) -> bytes:
+    """
+    Serialisiert einen Studiengang in der aktuellen Schema-Version.
+    
+    Args:
+        studiengang: Der zu speichernde Studiengang
+    
+    Returns:
+        Signatur, gefolgt von (Schema-Version, Nutzdaten) als Pickle einfacher Werte
+    """
+    return MAGIC + pickle.dumps((SCHEMA_VERSION, studiengang.als_tupel()),
+                                protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def deserialisiere(daten: bytes):
+    """
+    Lädt einen Studiengang und hebt ältere Schema-Versionen an.
+    
+    Args:
+        daten: Die Daten aus serialisiere
+    
+    Returns:
+        Der geladene Studiengang
+    
+    Raises:
+        ValueError: Wenn die Signatur fehlt, die Version unbekannt ist, eine
+            Migration fehlt oder die Nutzdaten ungültige Werte enthalten
+        pickle.UnpicklingError: Wenn die Daten Verweise auf Klassen enthalten
+    """
+    from domain import Studiengang
+    
+    if not ist_serialisiert(daten):
+        raise ValueError("Unbekanntes Dateiformat")
+    version, nutzdaten = _SichererUnpickler(io.BytesIO(memoryview(daten)[len(MAGIC):])).load()
+    if not isinstance(version, int) or version > SCHEMA_VERSION:
+        raise ValueError(f"Nicht unterstützte Schema-Version: {version}")
+    while version < SCHEMA_VERSION:
+        if version not in MIGRATIONEN:
+            raise ValueError(f"Keine Migration von Schema-Version {version}")
+        nutzdaten = MIGRATIONEN[version](nutzdaten)
+        version += 1
+    try:
+        return Studiengang.aus_tupel(nutzdaten)
+    except (TypeError, struct.error) as e:
+        raise ValueError(f"Ungültige Nutzdaten: {e}") from e
@@ -0,0 +1,415 @@
+"""
+SQLiteDatenManager-Klasse für die Persistierung in einer SQLite-Datenbank.
+
+Studiengang, Semester, Module und Prüfungsleistungen (samt früherer Versuche)
+werden in normalisierten
+Tabellen gespeichert, sodass einzelne Änderungen als einzelne Zeilen
+geschrieben und Abfragen direkt in der Datenbank ausgeführt werden können.
+"""
+
+import sqlite3
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from .daten_manager import BasisDatenManager, setze_semester_zeitraum
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS studiengang (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    name TEXT NOT NULL,
+    abschluss TEXT NOT NULL,
+    gesamtdauer INTEGER NOT NULL,
+    ziel_notendurchschnitt REAL NOT NULL,
+    ziel_abschlussdauer INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS semester (
+    nummer INTEGER PRIMARY KEY,
+    bezeichnung TEXT NOT NULL,
+    startdatum TEXT NOT NULL,
+    enddatum TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS modul (
+    id INTEGER PRIMARY KEY,
+    semester_nummer INTEGER NOT NULL REFERENCES semester(nummer),
+    position INTEGER NOT NULL,
+    modulcode TEXT NOT NULL,
+    name TEXT NOT NULL,
+    ects INTEGER NOT NULL,
+    semester_empfehlung INTEGER NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pruefungsleistung (
+    modul_id INTEGER PRIMARY KEY REFERENCES modul(id) ON DELETE CASCADE,
+    note REAL NOT NULL,
+    datum TEXT NOT NULL,
+    versuch INTEGER NOT NULL,
+    art TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS frueherer_versuch (
+    modul_id INTEGER NOT NULL REFERENCES modul(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    note REAL NOT NULL,
+    datum TEXT NOT NULL,
+    versuch INTEGER NOT NULL,
+    art TEXT NOT NULL,
+    PRIMARY KEY (modul_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_modul_modulcode ON modul(modulcode);
+CREATE INDEX IF NOT EXISTS idx_modul_status ON modul(status);
+CREATE INDEX IF NOT EXISTS idx_modul_semester ON modul(semester_nummer, position);
+"""
+
+MODUL_SPALTEN = """
+    SELECT m.semester_nummer, m.modulcode, m.name, m.ects, m.semester_empfehlung, m.status,
+           p.note, p.datum, p.versuch, p.art, m.id
+    FROM modul m LEFT JOIN pruefungsleistung p ON p.modul_id = m.id
+"""
+
+VERSUCH_SPALTEN = """
+    SELECT modul_id, note, datum, versuch, art FROM frueherer_versuch
+"""
+
+
+class SQLiteDatenManager(BasisDatenManager):
+    """
+    Persistiert Studiengang-Daten in einer SQLite-Datenbank.
+    
+    Das erste Speichern schreibt den gesamten Studiengang. Danach werden nur
+    noch die über die protokolliere-Methoden gemeldeten Änderungen als
+    einzelne Zeilen geschrieben.
+    
+    Attributes:
+        _datei_pfad: Der Pfad zur Datenbankdatei
+        _ausstehend: Noch nicht geschriebene SQL-Anweisungen mit Parametern
+    """
+    
+    def __init__(self, datei_pfad: str = "studiengang.db"):
+        """
+        Initialisiert den SQLiteDatenManager.
+        
+        Args:
+            datei_pfad: Der Pfad zur Datenbankdatei (Standard: studiengang.db)
+        """
+        super().__init__(datei_pfad)
+        self._ausstehend: List[Tuple[str, tuple]] = []
+    
+    def _verbinde(self) -> sqlite3.Connection:
+        """
+        Öffnet eine Verbindung zur Datenbank und legt das Schema an.
+        
+        Returns:
+            Die geöffnete Verbindung
+        """
+        verbindung = sqlite3.connect(self._datei_pfad)
+        verbindung.execute("PRAGMA foreign_keys = ON")
+        verbindung.executescript(SCHEMA)
+        return verbindung
+    
+    def _ist_initialisiert(self) -> bool:
+        """
+        Prüft, ob die Datenbank bereits einen Studiengang enthält.
+        
+        Returns:
+            True wenn ein Studiengang gespeichert ist, sonst False
+        """
+        if not self.datei_existiert():
+            return False
+        verbindung = self._verbinde()
+        try:
+            return verbindung.execute("SELECT 1 FROM studiengang").fetchone() is not None
+        finally:
+            verbindung.close()
+    
+    def speichere_studiengang(self, studiengang) -> None:
+        """
+        Speichert den Studiengang in der Datenbank.
+        
+        Ist die Datenbank bereits befüllt und wurden alle ungespeicherten
+        Änderungen protokolliert, werden nur die ausstehenden Einzeländerungen
+        in einer Transaktion geschrieben; sonst wird der ganze Studiengang neu
+        geschrieben.
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+        
+        Raises:
+            IOError: Wenn das Speichern fehlschlägt
+        """
+        if not self._ist_initialisiert() or not self._ist_vollstaendig_protokolliert(studiengang):
+            super().speichere_studiengang(studiengang)
+            return
+        
+        try:
+            verbindung = self._verbinde()
+            try:
+                with verbindung:
+                    for sql, parameter in self._ausstehend:
+                        verbindung.execute(sql, parameter)
+            finally:
+                verbindung.close()
+            anzahl = len(self._ausstehend)
+            self._ausstehend.clear()
+            self._vergiss_protokollierte()
+            studiengang.markiere_gespeichert()
+            self._melde(f"✓ {anzahl} Änderung(en) gespeichert in: {self._datei_pfad}")
+        except Exception as e:
+            raise IOError(f"Fehler beim Speichern: {e}")
+    
+    def _schreibe(self, studiengang) -> None:
+        """
+        Schreibt den gesamten Studiengang in einer Transaktion.
+        
+        Args:
+            studiengang: Der zu speichernde Studiengang
+        """
+        verbindung = self._verbinde()
+        try:
+            with verbindung:
+                verbindung.execute("DELETE FROM frueherer_versuch")
+                verbindung.execute("DELETE FROM pruefungsleistung")
+                verbindung.execute("DELETE FROM modul")
+                verbindung.execute("DELETE FROM semester")
+                verbindung.execute("DELETE FROM studiengang")
+                verbindung.execute(
+                    "INSERT INTO studiengang VALUES (1, ?, ?, ?, ?, ?)",
+                    (studiengang.name, studiengang.abschluss.name, studiengang.gesamtdauer,
+                     studiengang.ziel_notendurchschnitt, studiengang.ziel_abschlussdauer)
+                )
+                for semester in studiengang.semester:
+                    verbindung.execute(
+                        "INSERT INTO semester VALUES (?, ?, ?, ?)",
+                        (semester.nummer, semester.bezeichnung,
+                         semester.startdatum.isoformat(), semester.enddatum.isoformat())
+                    )
+                    for position, modul in enumerate(semester.hole_modulen()):
+                        cursor = verbindung.execute(
+                            "INSERT INTO modul (semester_nummer, position, modulcode, name, ects, "
+                            "semester_empfehlung, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            (semester.nummer, position, modul.modulcode, modul.name, modul.ects,
+                             modul.semester_empfehlung, modul.status.name)
+                        )
+                        versuche = modul.hole_versuche()
+                        if versuche:
+                            pruefung = versuche.pop()
+                            verbindung.execute(
+                                "INSERT INTO pruefungsleistung VALUES (?, ?, ?, ?, ?)",
+                                (cursor.lastrowid, pruefung.note, pruefung.datum.isoformat(),
+                                 pruefung.versuch, pruefung.art.name)
+                            )
+                            verbindung.executemany(
+                                "INSERT INTO frueherer_versuch VALUES (?, ?, ?, ?, ?, ?)",
+                                [(cursor.lastrowid, position, versuch.note, versuch.datum.isoformat(),
+                                  versuch.versuch, versuch.art.name)
+                                 for position, versuch in enumerate(versuche)]
+                            )
+            self._ausstehend.clear()
+        finally:
+            verbindung.close()
+    
+    def _lese(self):
+        """
+        Liest den Studiengang mit allen Semestern und Modulen aus der Datenbank.
+        
+        Returns:
+            Der gelesene Studiengang
+        """
+        from domain import Studiengang
+        from domain.enums import Abschluss
+        
+        verbindung = self._verbinde()
+        try:
+            zeile = verbindung.execute(
+                "SELECT name, abschluss, gesamtdauer, ziel_notendurchschnitt, ziel_abschlussdauer "
+                "FROM studiengang"
+            ).fetchone()
+            if zeile is None:
+                raise ValueError("Datenbank enthält keinen Studiengang")
+            name, abschluss, gesamtdauer, ziel_note, ziel_dauer = zeile
+            studiengang = Studiengang(name, Abschluss[abschluss], gesamtdauer, ziel_note, ziel_dauer)
+            semester_liste = studiengang.semester
+            
+            for nummer, bezeichnung, start, ende in verbindung.execute(
+                    "SELECT nummer, bezeichnung, startdatum, enddatum FROM semester ORDER BY nummer"):
+                semester = semester_liste[nummer - 1]
+                semester.bezeichnung = bezeichnung
+                setze_semester_zeitraum(semester, date.fromisoformat(start), date.fromisoformat(ende))
+            
+            fruehere = self._lies_fruehere_versuche(verbindung)
+            for zeile in verbindung.execute(MODUL_SPALTEN + " ORDER BY m.semester_nummer, m.position"):
+                semester_liste[zeile[0] - 1].fuege_modul_hinzu(self._modul_aus_zeile(zeile, fruehere))
+            return studiengang
+        finally:
+            verbindung.close()
+    
+    @staticmethod
+    def _lies_fruehere_versuche(verbindung: sqlite3.Connection, bedingung: str = "",
+                                parameter: tuple = ()) -> Dict[int, List[tuple]]:
+        """
+        Liest die früheren Prüfungsversuche gruppiert nach Modul.
+        
+        Args:
+            verbindung: Die geöffnete Verbindung
+            bedingung: Optionale WHERE-Klausel zur Auswahl der Module
+            parameter: Die Parameter der WHERE-Klausel
+        
+        Returns:
+            Zuordnung von Modul-ID zu (note, datum, versuch, art)-Zeilen in Versuchsreihenfolge
+        """
+        fruehere: Dict[int, List[tuple]] = {}
+        sql = f"{VERSUCH_SPALTEN} {bedingung} ORDER BY modul_id, position"
+        for modul_id, *versuch in verbindung.execute(sql, parameter):
+            fruehere.setdefault(modul_id, []).append(versuch)
+        return fruehere
+    
+    @staticmethod
+    def _modul_aus_zeile(zeile: tuple, fruehere: Dict[int, List[tuple]]):
+        """
+        Erstellt ein Modul (mit allen Prüfungsversuchen) aus einer Ergebniszeile.
+        
+        Args:
+            zeile: Eine Zeile aus MODUL_SPALTEN
+            fruehere: Die früheren Versuche je Modul-ID (aus _lies_fruehere_versuche)
+        
+        Returns:
+            Das erstellte Modul
+        """
+        from domain import Modul, Pruefungsleistung
+        from domain.enums import ModulStatus, Pruefungsart
+        
+        _, modulcode, name, ects, empfehlung, status, note, datum, versuch, art, modul_id = zeile
+        modul = Modul(modulcode, name, ects, empfehlung)
+        if note is not None:
+            for v_note, v_datum, v_versuch, v_art in fruehere.get(modul_id, ()):
+                modul.setze_pruefungsleistung(
+                    Pruefungsleistung(v_note, date.fromisoformat(v_datum), v_versuch, Pruefungsart[v_art])
+                )
+            modul.setze_pruefungsleistung(
+                Pruefungsleistung(note, date.fromisoformat(datum), versuch, Pruefungsart[art])
+            )
+        modul.status = ModulStatus[status]
+        return modul
+    
+    def protokolliere_modul_hinzugefuegt(self, semester_nummer: int, modul) -> None:
+        """
+        Merkt das Einfügen einer Modulzeile vor.
+        
+        Args:
+            semester_nummer: Die Nummer des Semesters
+            modul: Das hinzugefügte Modul
+        """
+        self._ausstehend.append((
+            "INSERT INTO modul (semester_nummer, position, modulcode, name, ects, "
+            "semester_empfehlung, status) VALUES (?, (SELECT COALESCE(MAX(position), -1) + 1 "
+            "FROM modul WHERE semester_nummer = ?), ?, ?, ?, ?, ?)",
+            (semester_nummer, semester_nummer, modul.modulcode, modul.name, modul.ects,
+             modul.semester_empfehlung, modul.status.name)
+        ))
+        self._merke_protokolliert(modul, semester_nummer)
+        if modul.hole_pruefungsleistung():
+            for position, versuch in enumerate(modul.hole_versuche()[:-2]):
+                self._merke_frueheren_versuch_vor(modul, position, versuch)
+            self.protokolliere_pruefungsleistung(modul)
+    
+    def _merke_frueheren_versuch_vor(self, modul, position: int, versuch) -> None:
+        """
+        Merkt das Schreiben einer Zeile für einen früheren Versuch vor.
+        
+        Args:
+            modul: Das Modul
+            position: Die Position des Versuchs unter den früheren Versuchen
+            versuch: Der frühere Versuch als Pruefungsleistung
+        """
+        self._ausstehend.append((
+            "INSERT OR REPLACE INTO frueherer_versuch (modul_id, position, note, datum, versuch, art) "
+            "SELECT id, ?, ?, ?, ?, ? FROM modul WHERE modulcode = ?",
+            (position, versuch.note, versuch.datum.isoformat(), versuch.versuch, versuch.art.name,
+             modul.modulcode)
+        ))
+    
+    def protokolliere_pruefungsleistung(self, modul) -> None:
+        """
+        Merkt das Schreiben der Prüfungsleistungs- und Statuszeile eines Moduls vor.
+        
+        Ist durch die neue Prüfungsleistung ein früherer Versuch entstanden,
+        wird dieser als letzte Zeile in frueherer_versuch angehängt.
+        
+        Args:
+            modul: Das Modul, dessen Prüfungsleistung gesetzt wurde
+        """
+        pruefung = modul.hole_pruefungsleistung()
+        if pruefung is None:
+            return
+        anzahl_fruehere = modul.anzahl_versuche() - 1
+        if anzahl_fruehere:
+            self._merke_frueheren_versuch_vor(modul, anzahl_fruehere - 1, modul.hole_versuche()[-2])
+        self._ausstehend.append((
+            "INSERT OR REPLACE INTO pruefungsleistung (modul_id, note, datum, versuch, art) "
+            "SELECT id, ?, ?, ?, ? FROM modul WHERE modulcode = ?",
+            (pruefung.note, pruefung.datum.isoformat(), pruefung.versuch, pruefung.art.name,
+             modul.modulcode)
+        ))
+        self.protokolliere_status(modul)
+        self._merke_protokolliert(modul)
+    
+    def protokolliere_status(self, modul) -> None:
+        """
+        Merkt das Aktualisieren der Statusspalte eines Moduls vor.
+        
+        Args:
+            modul: Das Modul, dessen Status geändert wurde
+        """
+        self._ausstehend.append((
+            "UPDATE modul SET status = ? WHERE modulcode = ?",
+            (modul.status.name, modul.modulcode)
+        ))
+        self._merke_protokolliert(modul)
+    
+    def hole_module_mit_status(self, status) -> List:
+        """
+        Liest alle Module mit einem bestimmten Status direkt aus der Datenbank.
+        
+        Args:
+            status: Der gesuchte ModulStatus
+        
+        Returns:
+            Liste der Module in Semester- und Listenreihenfolge
+        """
+        if not self.datei_existiert():
+            return []
+        verbindung = self._verbinde()
+        try:
+            zeilen = verbindung.execute(
+                MODUL_SPALTEN + " WHERE m.status = ? ORDER BY m.semester_nummer, m.position",
+                (status.name,)
+            ).fetchall()
+            fruehere = self._lies_fruehere_versuche(
+                verbindung, "WHERE modul_id IN (SELECT id FROM modul WHERE status = ?)", (status.name,)
+            )
+        finally:
+            verbindung.close()
+        return [self._modul_aus_zeile(zeile, fruehere) for zeile in zeilen]
+    
+    def hole_modul(self, modulcode: str) -> Optional[object]:
+        """
+        Liest ein einzelnes Modul anhand seines Modulcodes aus der Datenbank.
+        
+        Args:
+            modulcode: Der Modulcode
+        
+        Returns:
+            Das Modul oder None wenn es nicht existiert
+        """
+        if not self.datei_existiert():
+            return None
+        verbindung = self._verbinde()
+        try:
+            zeile = verbindung.execute(
+                MODUL_SPALTEN + " WHERE m.modulcode = ? LIMIT 1", (modulcode,)
+            ).fetchone()
+            if zeile is None:
+                return None
+            fruehere = self._lies_fruehere_versuche(verbindung, "WHERE modul_id = ?", (zeile[-1],))
+        finally:
+            verbindung.close()
+        return self._modul_aus_zeile(zeile, fruehere)
@@ -0,0 +1,79 @@
+"""
+Gemeinsame Fixtures für die Tests.
+
+Die Tests werden aus dem Verzeichnis code/ gestartet:
+    python -m pytest tests
+"""
+
+import os
+import random
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain import Studiengang, Modul, Pruefungsleistung  # noqa: E402
+from domain.enums import Abschluss, ModulStatus, Pruefungsart  # noqa: E402
+
+
+def pruefung(note: float, versuch: int = 1, tag: int = 1) -> Pruefungsleistung:
+    """
+    Erstellt eine Klausur-Prüfungsleistung.
+    
+    Args:
+        note: Die Note
+        versuch: Der Versuch (Standard: 1)
+        tag: Der Tag im Februar 2025 (Standard: 1)
+    
+    Returns:
+        Die Prüfungsleistung
+    """
+    return Pruefungsleistung(note, date(2025, 2, tag), versuch, Pruefungsart.KLAUSUR)
+
+
+@pytest.fixture
+def studiengang() -> Studiengang:
+    """Studiengang mit bestandenen, nicht bestandenen und offenen Modulen."""
+    studiengang = Studiengang("Informatik", Abschluss.BACHELOR, 6, 2.0, 6)
+    module = [
+        (1, Modul("MATH01", "Mathematik I", 5, 1), [2.3]),
+        (1, Modul("PROG01", "Programmierung", 10, 1), [5.0, 1.7]),
+        (1, Modul("THEO01", "Theoretische Informatik", 5, 1), [5.0]),
+        (2, Modul("MATH02", "Mathematik II", 5, 2), []),
+        (3, Modul("DB01", "Datenbanken", 5, 3), [1.3]),
+    ]
+    for semester_nummer, modul, noten in module:
+        studiengang.semester[semester_nummer - 1].fuege_modul_hinzu(modul)
+        for versuch, note in enumerate(noten, start=1):
+            modul.setze_pruefungsleistung(pruefung(note, versuch, versuch))
+    studiengang.finde_modul("MATH02").status = ModulStatus.ANGEMELDET
+    return studiengang
+
+
+@pytest.fixture
+def kohorte() -> list:
+    """
+    Zufällige, reproduzierbare Kohorte für den Vergleich mit den Einzelberechnungen.
+    
+    Enthält leere und abgeschlossene Studiengänge, nicht bestandene Module und
+    bestandene Module ohne Note.
+    """
+    zufall = random.Random(15)
+    noten = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0, 5.0]
+    studiengaenge = []
+    for nummer in range(400):
+        dauer = zufall.randint(1, 8)
+        studiengang = Studiengang(f"Studiengang {nummer}", zufall.choice(list(Abschluss)), dauer,
+                                  zufall.choice([1.0, 1.3, 1.5, 2.0, 2.5, 3.0, 4.0]), dauer)
+        for i in range(zufall.randint(0, 60)):
+            modul = Modul(f"M{i:02d}", f"Modul {i}", zufall.choice([3, 5, 6, 10, 15]), 1)
+            art = zufall.random()
+            if art < 0.6:
+                modul.setze_pruefungsleistung(pruefung(zufall.choice(noten), tag=zufall.randint(1, 28)))
+            elif art < 0.7:
+                modul.status = ModulStatus.BESTANDEN
+            zufall.choice(studiengang.semester).fuege_modul_hinzu(modul)
+        studiengaenge.append(studiengang)
+    return studiengaenge
@@ -0,0 +1,125 @@
+"""
+Tests: Gesammeltes Anwenden von Änderungen (Studiengang.wende_aenderungen_an).
+
+Laufende Summen und der Modulcode-Index müssen danach mit einer vollständigen
+Neuberechnung übereinstimmen.
+"""
+
+from datetime import date
+
+import pytest
+
+from domain import Modul, ModulAnlage, NotenEintrag, StatusAenderung, Studiengang
+from domain.enums import ModulStatus
+from gui import BatchVerarbeitung
+from persistence import erstelle_daten_manager
+
+
+def kennzahlen(studiengang) -> tuple:
+    """Die laufend mitgeführten Kennzahlen eines Studiengangs."""
+    return (
+        studiengang.berechne_durchschnitt(),
+        studiengang.bestandene_ects,
+        [semester.berechne_semester_durchschnitt() for semester in studiengang.semester],
+        [semester.bestandene_ects for semester in studiengang.semester],
+        {status: studiengang.anzahl_module_mit_status(status) for status in ModulStatus},
+    )
+
+
+def pruefe_gegen_neuberechnung(studiengang) -> None:
+    """Vergleicht Summen und Index mit einem aus den Rohdaten neu aufgebauten Studiengang."""
+    neu = Studiengang.aus_tupel(studiengang.als_tupel())
+    assert kennzahlen(studiengang) == kennzahlen(neu)
+    bestanden = [m for m in studiengang.iter_alle_module() if m.ist_bestanden()]
+    assert studiengang.bestandene_ects == sum(m.ects for m in bestanden)
+    for modul in studiengang.iter_alle_module():
+        assert studiengang.finde_modul(modul.modulcode) is modul
+
+
+def test_summen_und_index_nach_aenderungen(studiengang):
+    """Neue Module, Noten und Statuswechsel halten Summen und Index konsistent."""
+    studiengang.wende_aenderungen_an([
+        ModulAnlage(2, "NETZ01", "Netzwerke", 5),
+        ModulAnlage(4, "KI01", "Künstliche Intelligenz", 10),
+        NotenEintrag("NETZ01", 2.0, date(2025, 7, 1)),
+        NotenEintrag("THEO01", 3.3, date(2025, 7, 2), versuch=2),
+        NotenEintrag("MATH01", 5.0, date(2025, 7, 3), versuch=2),
+        StatusAenderung("MATH02", ModulStatus.OFFEN),
+        StatusAenderung("KI01", ModulStatus.ANGEMELDET),
+    ])
+    pruefe_gegen_neuberechnung(studiengang)
+    assert studiengang.finde_modul("KI01").status == ModulStatus.ANGEMELDET
+    assert studiengang.anzahl_module() == 7
+
+
+def test_mehrere_noten_fuer_ein_modul(studiengang):
+    """Mehrere Noten für dasselbe Modul in einem Aufruf: die letzte zählt."""
+    studiengang.wende_aenderungen_an([
+        NotenEintrag("THEO01", 4.0, date(2025, 7, 1), versuch=2),
+        NotenEintrag("THEO01", 1.7, date(2025, 9, 1), versuch=3),
+    ])
+    pruefe_gegen_neuberechnung(studiengang)
+    assert studiengang.finde_modul("THEO01").hole_note() == 1.7
+
+
+@pytest.mark.parametrize("vorher_abgefragt", [False, True])
+def test_statusgruppen(studiengang, vorher_abgefragt):
+    """Statusgruppen stimmen, ob sie vor oder erst nach den Änderungen aufgebaut werden."""
+    if vorher_abgefragt:
+        studiengang.hole_module_mit_status(ModulStatus.OFFEN)
+    studiengang.wende_aenderungen_an([
+        ModulAnlage(1, "NETZ01", "Netzwerke", 5),
+        NotenEintrag("MATH02", 1.7, date(2025, 7, 1)),
+        StatusAenderung("DB01", ModulStatus.ANGEMELDET),
+    ])
+    studiengang.semester[0].entferne_modul(studiengang.finde_modul("THEO01"))
+    studiengang.semester[2].fuege_modul_hinzu(Modul("KRYP01", "Kryptografie", 5, 3))
+    
+    for status in ModulStatus:
+        erwartet = [m for m in studiengang.iter_alle_module() if m.status == status]
+        assert studiengang.hole_module_mit_status(status) == erwartet
+        for semester in studiengang.semester:
+            assert semester.anzahl_module_mit_status(status) == sum(m in semester.module for m in erwartet)
+    abgeschlossen = [m.modulcode for m in studiengang.hole_abgeschlossene_modulen()]
+    assert abgeschlossen == ["MATH01", "PROG01", "MATH02"]
+
+
+@pytest.mark.parametrize("aenderung", [
+    ModulAnlage("1", "NEU01", "Neu", 5),
+    ModulAnlage(1, "NEU01", "Neu", "5"),
+    ModulAnlage(1, "MATH01", "Doppelt", 5),
+    NotenEintrag("MATH02", "2.0", date(2025, 7, 1)),
+    NotenEintrag("MATH02", 2.0, date(2025, 7, 1), versuch=True),
+    NotenEintrag("FEHLT01", 2.0, date(2025, 7, 1)),
+    StatusAenderung("MATH02", "BESTANDEN"),
+])
+def test_ungueltige_aenderung_aendert_nichts(studiengang, aenderung):
+    """Eine ungültige (auch falsch typisierte) Änderung verhindert alle Änderungen."""
+    vorher = studiengang.als_tupel()
+    with pytest.raises(ValueError):
+        studiengang.wende_aenderungen_an([NotenEintrag("MATH02", 1.0, date(2025, 7, 1)), aenderung])
+    assert studiengang.als_tupel() == vorher
+    pruefe_gegen_neuberechnung(studiengang)
+
+
+@pytest.mark.parametrize("datei", ["studiengang.pkl", "studiengang.db"])
+def test_batch_speichert_nur_die_aenderungen(tmp_path, monkeypatch, studiengang, datei):
+    """Journal und SQLite schreiben nach einem Batch nur die protokollierten Änderungen."""
+    daten_manager = erstelle_daten_manager(str(tmp_path / datei))
+    daten_manager.meldungen = False
+    daten_manager.speichere_studiengang(studiengang)
+    vollstaendig = []
+    monkeypatch.setattr(daten_manager, "_schreibe", vollstaendig.append)
+    
+    BatchVerarbeitung(studiengang, daten_manager).fuehre_aus([
+        'modul 2 NETZ01 5 "Netzwerke"',
+        "note MATH02 2.0 2025-07-01",
+        "status DB01 ANGEMELDET",
+    ])
+    
+    assert vollstaendig == []
+    assert not studiengang.ist_geaendert()
+    monkeypatch.undo()
+    neu = erstelle_daten_manager(str(tmp_path / datei))
+    neu.meldungen = False
+    assert neu.lade_studiengang().als_tupel() == studiengang.als_tupel()
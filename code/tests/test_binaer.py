@@ -0,0 +1,87 @@
+"""
+Tests: Verzögerter Zugriff auf binäre Snapshots und Grenzen des Binärformats.
+"""
+
+import pytest
+
+from domain import Modul
+from domain.enums import ModulStatus
+from persistence import BinaerDatenManager
+from persistence.binaer_daten_manager import MAX_KURZ
+from conftest import pruefung
+
+
+def erstelle(tmp_path) -> BinaerDatenManager:
+    """Erstellt einen BinaerDatenManager ohne Statusmeldungen."""
+    daten_manager = BinaerDatenManager(str(tmp_path / "studiengang.sdb"))
+    daten_manager.meldungen = False
+    return daten_manager
+
+
+def test_kennzahlen_ohne_module_zu_erzeugen(tmp_path, studiengang):
+    """Kopf und Kennzahlen sind verfügbar, bevor ein Modul erzeugt wird."""
+    daten_manager = erstelle(tmp_path)
+    daten_manager.speichere_studiengang(studiengang)
+    
+    with daten_manager.oeffne_snapshot() as snapshot:
+        assert snapshot.name == studiengang.name
+        assert snapshot.anzahl_semester == len(studiengang.semester)
+        assert snapshot.anzahl_module == studiengang.anzahl_module()
+        assert snapshot.durchschnitt == studiengang.berechne_durchschnitt()
+        assert snapshot.fortschritt == studiengang.berechne_fortschritt()
+        assert snapshot.verbleibende_ects == studiengang.berechne_verbleibende_ects()
+        assert snapshot.bestandene_module == studiengang.anzahl_module_mit_status(ModulStatus.BESTANDEN)
+        assert snapshot._module == {}
+
+
+def test_module_werden_bei_bedarf_erzeugt(tmp_path, studiengang):
+    """Module eines Semesters werden erst beim Zugriff erzeugt und danach wiederverwendet."""
+    daten_manager = erstelle(tmp_path)
+    daten_manager.speichere_studiengang(studiengang)
+    
+    with daten_manager.oeffne_snapshot() as snapshot:
+        module = snapshot.hole_module_von_semester(1)
+        assert [m.modulcode for m in module] == ["MATH01", "PROG01", "THEO01"]
+        assert len(snapshot._module) == 3
+        assert snapshot.hole_modul(1) is module[1]
+        assert module[1].als_tupel() == studiengang.finde_modul("PROG01").als_tupel()
+        assert module[1].anzahl_versuche() == 2
+        with pytest.raises(IndexError):
+            snapshot.hole_modul(snapshot.anzahl_module)
+        with pytest.raises(IndexError):
+            snapshot.hole_module_von_semester(snapshot.anzahl_semester + 1)
+        assert snapshot.studiengang().als_tupel() == studiengang.als_tupel()
+
+
+def test_oeffnen_ohne_oder_mit_ungueltiger_datei(tmp_path):
+    """Eine fehlende Datei liefert None, eine ungültige einen IOError."""
+    daten_manager = erstelle(tmp_path)
+    assert daten_manager.oeffne_snapshot() is None
+    (tmp_path / "studiengang.sdb").write_bytes(b"kein Snapshot" * 100)
+    with pytest.raises(IOError, match="Binärdatei"):
+        daten_manager.oeffne_snapshot()
+
+
+@pytest.mark.parametrize("feld", ["ECTS", "Semester-Empfehlung", "Versuch"])
+def test_grenzen_der_16_bit_felder(tmp_path, studiengang, feld):
+    """Werte bis MAX_KURZ werden gespeichert, größere mit einer Fehlermeldung abgelehnt."""
+    daten_manager = erstelle(tmp_path)
+    
+    def setze(wert):
+        modul = Modul("GROSS01", "Großes Modul", 5, 1)
+        if feld == "ECTS":
+            modul.ects = wert
+        elif feld == "Semester-Empfehlung":
+            modul.semester_empfehlung = wert
+        else:
+            modul.setze_pruefungsleistung(pruefung(2.0, wert))
+        studiengang.semester[0].fuege_modul_hinzu(modul)
+    
+    setze(MAX_KURZ)
+    daten_manager.speichere_studiengang(studiengang)
+    assert erstelle(tmp_path).lade_studiengang().als_tupel() == studiengang.als_tupel()
+    
+    studiengang.semester[0].entferne_modul(studiengang.finde_modul("GROSS01"))
+    setze(MAX_KURZ + 1)
+    with pytest.raises(IOError, match=f"{feld} {MAX_KURZ + 1}.*zu groß"):
+        daten_manager.speichere_studiengang(studiengang)
@@ -0,0 +1,113 @@
+"""
+Tests: CSV-Import mit gesammelten Fehlern und Rundreise über den CSV-Export.
+"""
+
+import csv
+
+import pytest
+
+from domain import Studiengang
+from domain.enums import Abschluss
+from persistence import erstelle_daten_manager, importiere_csv
+from persistence.csv_export import CSV_KOPFZEILE
+
+GUELTIG = ["Semester 2", "NETZ01", "Netzwerke", "5", "Bestanden", "2.0", "Klausur", "2025-07-01", "1"]
+
+
+def schreibe_csv(pfad, zeilen, kopfzeile=CSV_KOPFZEILE) -> str:
+    """Schreibt eine CSV-Datei im Format von exportiere_csv."""
+    with open(pfad, 'w', newline='', encoding='utf-8') as datei:
+        writer = csv.writer(datei, delimiter=';')
+        writer.writerow(kopfzeile)
+        writer.writerows(zeilen)
+    return str(pfad)
+
+
+def zeilen(studiengang) -> list:
+    """Die exportierten Werte je Modul (Semester, Code, Name, ECTS, Status, maßgebliche Note)."""
+    ergebnis = []
+    for semester in studiengang.semester:
+        for modul in semester.hole_modulen():
+            ergebnis.append((semester.nummer, modul.modulcode, modul.name, modul.ects,
+                             modul.status, modul.hole_note()))
+    return ergebnis
+
+
+@pytest.fixture
+def fehlerhafte_datei(tmp_path):
+    """CSV-Datei mit einer gültigen und mehreren fehlerhaften Zeilen."""
+    return schreibe_csv(tmp_path / "import.csv", [
+        GUELTIG,
+        ["Semester 9", "", "Leer", "0", "Unbekannt", "", "", "", ""],
+        ["Semester 1", "MATH01", "Schon vorhanden", "5", "Offen", "", "", "", ""],
+        ["Semester 3", "NETZ01", "Doppelt in der Datei", "5", "Offen", "", "", "", ""],
+        ["Semester 3", "KRYP01", "Kryptografie", "5", "Bestanden", "6.0", "Mündlich", "gestern", "0"],
+        ["Semester 3", "KURZ01"],
+    ])
+
+
+def test_strikt_meldet_alle_fehler_und_importiert_nichts(studiengang, fehlerhafte_datei):
+    """Im strikten Modus werden alle fehlerhaften Zeilen gemeinsam gemeldet."""
+    vorher = studiengang.als_tupel()
+    with pytest.raises(ValueError) as fehler:
+        importiere_csv(fehlerhafte_datei, studiengang)
+    meldung = str(fehler.value)
+    assert meldung.startswith("5 fehlerhafte Zeile(n)")
+    for teil in ("Zeile 3: Semester 9 existiert nicht; Modulcode darf nicht leer sein",
+                 "ECTS müssen größer als 0 sein", "Unbekannter Status 'Unbekannt'",
+                 "Zeile 4: Modulcode MATH01 ist bereits vergeben",
+                 "Zeile 5: Modulcode NETZ01 ist bereits vergeben",
+                 "Note muss zwischen 1.0 und 5.0 liegen", "Ungültiges Datum 'gestern'",
+                 "Versuch muss mindestens 1 sein", "Zeile 7: 9 Spalten erwartet, 2 gefunden"):
+        assert teil in meldung
+    assert studiengang.als_tupel() == vorher
+
+
+def test_nicht_strikt_uebernimmt_die_gueltigen_zeilen(studiengang, fehlerhafte_datei):
+    """Ohne strikten Modus werden die gültigen Zeilen importiert und die übrigen gemeldet."""
+    ergebnis = importiere_csv(fehlerhafte_datei, studiengang, strikt=False)
+    assert ergebnis.importiert == 1
+    assert not ergebnis.ist_fehlerfrei()
+    assert [f.split(":")[0] for f in ergebnis.fehler] == [f"Zeile {nr}" for nr in range(3, 8)]
+    assert str(ergebnis) == "1 Module importiert, 5 fehlerhafte Zeilen"
+    
+    modul = studiengang.finde_modul("NETZ01")
+    assert ergebnis.module == [(2, modul)]
+    assert modul in studiengang.semester[1].module
+    assert modul.hole_note() == 2.0 and modul.ist_bestanden()
+
+
+def test_unerwartete_kopfzeile(tmp_path, studiengang):
+    """Eine Datei mit anderer Kopfzeile wird abgelehnt."""
+    pfad = schreibe_csv(tmp_path / "import.csv", [GUELTIG], kopfzeile=["Code", "Name"])
+    with pytest.raises(ValueError, match="Kopfzeile"):
+        importiere_csv(pfad, studiengang)
+
+
+def test_fehlende_datei(tmp_path, studiengang):
+    """Eine nicht lesbare Datei führt zu IOError."""
+    with pytest.raises(IOError):
+        importiere_csv(str(tmp_path / "fehlt.csv"), studiengang)
+
+
+@pytest.mark.parametrize("datei", ["studiengang.pkl", "studiengang.db"])
+def test_rundreise_ueber_export_und_import(tmp_path, studiengang, datei):
+    """Ein exportierter Studiengang wird in einen leeren Studiengang gleich importiert und gespeichert."""
+    exporteur = erstelle_daten_manager(str(tmp_path / "export.pkl"))
+    exporteur.meldungen = False
+    exporteur.exportiere_csv(studiengang)
+    daten_manager = erstelle_daten_manager(str(tmp_path / datei))
+    daten_manager.meldungen = False
+    leer = Studiengang("Informatik", Abschluss.BACHELOR, 6, 2.0, 6)
+    daten_manager.speichere_studiengang(leer)
+    (tmp_path / "export.csv").rename(daten_manager.csv_pfad)
+    
+    ergebnis = daten_manager.importiere_csv(leer)
+    assert ergebnis.ist_fehlerfrei() and ergebnis.importiert == studiengang.anzahl_module()
+    assert zeilen(leer) == zeilen(studiengang)
+    assert leer.berechne_durchschnitt() == studiengang.berechne_durchschnitt()
+    
+    daten_manager.speichere_studiengang(leer)
+    neu = erstelle_daten_manager(str(tmp_path / datei))
+    neu.meldungen = False
+    assert neu.lade_studiengang().als_tupel() == leer.als_tupel()
@@ -0,0 +1,101 @@
+"""
+Tests: Zwischenspeicher der DashboardView.
+
+Nach jeder Änderung muss das zwischengespeicherte Dashboard mit einem neu
+aufgebauten übereinstimmen; unveränderte Abschnitte werden nicht neu aufgebaut.
+"""
+
+import io
+from datetime import date
+
+import pytest
+
+from domain import Modul, NotenEintrag, StatusAenderung
+from domain.enums import ModulStatus
+from gui import DashboardView
+from conftest import pruefung
+
+
+def neu_aufgebaut(studiengang) -> str:
+    """Das Dashboard einer neuen DashboardView ohne Zwischenspeicher."""
+    return DashboardView(studiengang).rendere_dashboard()
+
+
+AENDERUNGEN = {
+    'note': lambda s: s.finde_modul("MATH02").setze_pruefungsleistung(pruefung(1.3)),
+    'note_direkt': lambda s: setattr(s.finde_modul("MATH01").pruefungsleistung, 'note', 2.7),
+    'modulname': lambda s: setattr(s.finde_modul("DB01"), 'name', "Datenbanksysteme"),
+    'ects': lambda s: setattr(s.finde_modul("PROG01"), 'ects', 8),
+    'status': lambda s: setattr(s.finde_modul("MATH02"), 'status', ModulStatus.OFFEN),
+    'semester': lambda s: setattr(s.semester[0], 'bezeichnung', "Erstes Semester"),
+    'studiengang': lambda s: setattr(s, 'name', "Angewandte Informatik"),
+    'ziel': lambda s: setattr(s, 'ziel_notendurchschnitt', 1.5),
+    'neues_modul': lambda s: s.semester[1].fuege_modul_hinzu(Modul("NETZ01", "Netzwerke", 5, 2)),
+    'batch': lambda s: s.wende_aenderungen_an([
+        NotenEintrag("THEO01", 3.0, date(2025, 7, 1), versuch=2),
+        StatusAenderung("MATH02", ModulStatus.OFFEN),
+    ]),
+}
+
+
+@pytest.mark.parametrize("aendere", AENDERUNGEN.values(), ids=AENDERUNGEN.keys())
+def test_zwischenspeicher_folgt_den_aenderungen(studiengang, aendere):
+    """Nach einer Änderung stimmt das Dashboard mit einem neu aufgebauten überein."""
+    ansicht = DashboardView(studiengang)
+    vorher = ansicht.rendere_dashboard()
+    aendere(studiengang)
+    nachher = ansicht.rendere_dashboard()
+    assert nachher != vorher
+    assert nachher == neu_aufgebaut(studiengang)
+
+
+def test_unveraendertes_dashboard_wird_wiederverwendet(studiengang):
+    """Ohne Änderung wird der zuletzt erzeugte Text zurückgegeben."""
+    ansicht = DashboardView(studiengang)
+    text = ansicht.rendere_dashboard()
+    assert ansicht.rendere_dashboard() is text
+
+
+def test_nur_geaenderte_abschnitte_werden_neu_aufgebaut(studiengang, monkeypatch):
+    """Eine Modulnote baut den Header nicht neu auf, Modul-Zeilen nur für das geänderte Modul."""
+    ansicht = DashboardView(studiengang)
+    ansicht.rendere_dashboard()
+    aufgebaut = []
+    original = ansicht._rendere_header
+    
+    def rendere_header(zeilen):
+        aufgebaut.append('header')
+        original(zeilen)
+    monkeypatch.setattr(ansicht, '_rendere_header', rendere_header)
+    zeilen_vorher = dict(ansicht._modul_zeilen)
+    
+    studiengang.finde_modul("MATH02").setze_pruefungsleistung(pruefung(1.3))
+    ansicht.rendere_dashboard()
+    assert aufgebaut == []
+    geaendert = [modul.modulcode for modul, eintrag in ansicht._modul_zeilen.items()
+                 if zeilen_vorher.get(modul) is not eintrag]
+    assert geaendert == ["MATH02"]
+    
+    studiengang.name = "Angewandte Informatik"
+    ansicht.rendere_dashboard()
+    assert aufgebaut == ['header']
+
+
+def test_verwerfen_und_anzeigen(studiengang):
+    """Die Abschnitte werden wie im Dashboard ausgegeben; Verwerfen erzwingt den Neuaufbau."""
+    ansicht = DashboardView(studiengang, io.StringIO())
+    ansicht.zeige_dashboard()
+    text = ansicht.ausgabe.getvalue()
+    abschnitte = []
+    for abschnitt in DashboardView._ABSCHNITTE:
+        ansicht.ausgabe = io.StringIO()
+        getattr(ansicht, 'zeige_' + abschnitt)()
+        abschnitte.append(ansicht.ausgabe.getvalue())
+    assert "\n".join(abschnitte) == text == ansicht.rendere_dashboard()
+    text = ansicht.rendere_dashboard()
+    
+    # An den Änderungszählern vorbei geändert: erst nach dem Verwerfen sichtbar
+    studiengang.finde_modul("DB01")._name = "Datenbanksysteme"
+    assert ansicht.rendere_dashboard() is text
+    ansicht.verwerfe_zwischenspeicher()
+    assert ansicht.rendere_dashboard() == neu_aufgebaut(studiengang) != text
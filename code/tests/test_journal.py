@@ -0,0 +1,70 @@
+"""
+Tests: Absturzsicherheit des Änderungsjournals.
+"""
+
+import os
+import shutil
+
+from domain import Modul
+from persistence import JournalDatenManager
+
+
+def erstelle(tmp_path) -> JournalDatenManager:
+    """Erstellt einen JournalDatenManager ohne Statusmeldungen."""
+    daten_manager = JournalDatenManager(str(tmp_path / "studiengang.pkl"))
+    daten_manager.meldungen = False
+    return daten_manager
+
+
+def fuege_hinzu(daten_manager, studiengang, modulcode: str) -> None:
+    """Fügt ein Modul in Semester 1 ein und protokolliert es."""
+    modul = Modul(modulcode, f"Modul {modulcode}", 5, 1)
+    studiengang.semester[0].fuege_modul_hinzu(modul)
+    daten_manager.protokolliere_modul_hinzugefuegt(1, modul)
+
+
+def test_journal_wird_abgespielt(tmp_path, studiengang):
+    """Protokollierte Änderungen landen im Journal und werden beim Laden abgespielt."""
+    daten_manager = erstelle(tmp_path)
+    daten_manager.speichere_studiengang(studiengang)
+    fuege_hinzu(daten_manager, studiengang, "NEU01")
+    daten_manager.speichere_studiengang(studiengang)
+    assert os.path.exists(daten_manager.journal_pfad)
+    
+    assert erstelle(tmp_path).lade_studiengang().als_tupel() == studiengang.als_tupel()
+
+
+def test_absturz_zwischen_snapshot_und_journal_loeschen(tmp_path, studiengang):
+    """Ein nach dem Kompaktieren liegen gebliebenes Journal wird nicht erneut abgespielt."""
+    daten_manager = erstelle(tmp_path)
+    daten_manager.speichere_studiengang(studiengang)
+    fuege_hinzu(daten_manager, studiengang, "NEU01")
+    daten_manager.speichere_studiengang(studiengang)
+    altes_journal = tmp_path / "alt.journal"
+    shutil.copy(daten_manager.journal_pfad, altes_journal)
+    
+    # Neuer Snapshot geschrieben, Absturz vor dem Löschen des Journals
+    daten_manager.kompaktiere(studiengang)
+    shutil.copy(altes_journal, daten_manager.journal_pfad)
+    
+    neu = erstelle(tmp_path)
+    geladen = neu.lade_studiengang()
+    assert geladen.als_tupel() == studiengang.als_tupel()
+    assert not os.path.exists(neu.journal_pfad)
+    
+    # Danach wird wieder normal protokolliert
+    fuege_hinzu(neu, geladen, "NEU02")
+    neu.speichere_studiengang(geladen)
+    assert erstelle(tmp_path).lade_studiengang().als_tupel() == geladen.als_tupel()
+
+
+def test_unvollstaendige_letzte_zeile_wird_verworfen(tmp_path, studiengang):
+    """Eine beim Anhängen abgebrochene Zeile wird abgeschnitten, der Rest abgespielt."""
+    daten_manager = erstelle(tmp_path)
+    daten_manager.speichere_studiengang(studiengang)
+    fuege_hinzu(daten_manager, studiengang, "NEU01")
+    daten_manager.speichere_studiengang(studiengang)
+    with open(daten_manager.journal_pfad, 'a', encoding='utf-8') as datei:
+        datei.write('{"typ": "status_geaendert", "modu')
+    
+    assert erstelle(tmp_path).lade_studiengang().als_tupel() == studiengang.als_tupel()
@@ -0,0 +1,50 @@
+"""
+Tests: KohortenTabelle liefert dieselben Kennzahlen wie die Einzelberechnung je Studiengang.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from analyse import KohortenTabelle  # noqa: E402
+
+
+def test_kennzahlen_wie_je_studiengang(kohorte):
+    """Durchschnitt, Fortschritt, bestandene und verbleibende ECTS stimmen exakt überein."""
+    tabelle = KohortenTabelle.aus_studiengaengen(kohorte)
+    assert tabelle.anzahl_studierende == len(kohorte)
+    assert len(tabelle) == sum(s.anzahl_module() for s in kohorte)
+    assert tabelle.berechne_durchschnitte().tolist() == [s.berechne_durchschnitt() for s in kohorte]
+    assert tabelle.berechne_fortschritte().tolist() == [s.berechne_fortschritt() for s in kohorte]
+    assert tabelle.berechne_bestandene_ects().tolist() == [s.bestandene_ects for s in kohorte]
+    assert tabelle.berechne_verbleibende_ects().tolist() == [s.berechne_verbleibende_ects() for s in kohorte]
+
+
+def test_grosse_beitraege_werden_exakt_summiert(studiengang):
+    """Auch mit Beiträgen über int64 (sehr hohe ECTS) stimmt der Durchschnitt."""
+    modul = studiengang.finde_modul("DB01")
+    modul.ects = 10 ** 6
+    tabelle = KohortenTabelle.aus_studiengaengen([studiengang])
+    assert tabelle.berechne_durchschnitte().tolist() == [studiengang.berechne_durchschnitt()]
+
+
+def test_kennungen(studiengang, kohorte):
+    """Ohne Kennung wird ab 1 nummeriert, sonst wird die übergebene Kennung verwendet."""
+    tabelle = KohortenTabelle.aus_studiengaengen(kohorte[:3])
+    assert tabelle.kennungen == ["1", "2", "3"]
+    tabelle = KohortenTabelle.aus_studiengaengen([("anna", studiengang), ("ben", kohorte[0])])
+    assert tabelle.finde_studierenden("ben") == 1
+    assert tabelle.finde_studierenden("fehlt") is None
+
+
+def test_spalten(studiengang):
+    """Spalten sind schreibgeschützt; unbekannte und ungleich lange Spalten werden abgelehnt."""
+    tabelle = KohortenTabelle.aus_studiengaengen([studiengang])
+    ects = tabelle.spalte('ects')
+    assert ects.tolist() == [m.ects for m in studiengang.iter_alle_module()]
+    with pytest.raises(ValueError):
+        ects[0] = 99
+    with pytest.raises(ValueError):
+        tabelle.spalte('_bestandene_ects')
+    with pytest.raises(ValueError, match="gleich lang"):
+        KohortenTabelle(["1"], [180], [0, 0], [1], [5], [2], [1.0], [0], [0])
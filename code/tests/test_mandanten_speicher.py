@@ -0,0 +1,57 @@
+"""
+Tests: MandantenSpeicher mit LRU-Cache und Zurückschreiben beim Verdrängen.
+"""
+
+import pytest
+
+from domain import Modul
+from persistence import MandantenSpeicher
+
+
+def test_lru_verdraengt_den_am_laengsten_ungenutzten(tmp_path, studiengang):
+    """Ein Zugriff schützt einen Mandanten vor dem Verdrängen."""
+    speicher = MandantenSpeicher(str(tmp_path), kapazitaet=2)
+    speicher.lege_an("a", studiengang)
+    speicher.lege_an("b", studiengang)
+    speicher.hole("a")
+    speicher.lege_an("c", studiengang)
+    
+    assert speicher.ist_geladen("a") and speicher.ist_geladen("c")
+    assert not speicher.ist_geladen("b")
+    assert len(speicher) == 2
+    assert speicher.kennungen() == ["a", "b", "c"]
+
+
+def test_verdraengen_schreibt_aenderungen_zurueck(tmp_path, studiengang):
+    """Geänderte Mandanten werden beim Verdrängen gespeichert und wieder geladen."""
+    speicher = MandantenSpeicher(str(tmp_path), kapazitaet=1)
+    speicher.lege_an("a", studiengang)
+    speicher.speichere("a")
+    studiengang.semester[0].fuege_modul_hinzu(Modul("NEU01", "Neu", 5, 1))
+    assert speicher.hat_aenderungen()
+    
+    speicher.lege_an("b", studiengang)
+    assert not speicher.ist_geladen("a")
+    assert speicher.hole("a").finde_modul("NEU01") is not None
+
+
+def test_fehlgeschlagenes_speichern_beim_verdraengen(tmp_path, monkeypatch, studiengang):
+    """Schlägt das Speichern beim Verdrängen fehl, bleibt der Mandant samt Änderungen im Cache."""
+    speicher = MandantenSpeicher(str(tmp_path), kapazitaet=1)
+    speicher.lege_an("a", studiengang)
+    daten_manager = speicher.daten_manager("a")
+    
+    def fehlschlag(_studiengang):
+        raise IOError("Datenträger voll")
+    monkeypatch.setattr(daten_manager, "speichere_vollstaendig", fehlschlag)
+    
+    with pytest.raises(IOError):
+        speicher.lege_an("b", studiengang)
+    assert speicher.ist_geladen("a")
+    assert speicher.hat_aenderungen()
+    
+    # Nach Behebung des Fehlers wird beim nächsten Verdrängen gespeichert
+    monkeypatch.undo()
+    speicher.kapazitaet = 1
+    assert not speicher.ist_geladen("a")
+    assert speicher.hole("a").als_tupel() == studiengang.als_tupel()
@@ -0,0 +1,79 @@
+"""
+Tests: Seitenweise Modulauswahl (ModulAuswahl) und Studiengang.iter_alle_module.
+"""
+
+import pytest
+
+from gui import ModulAuswahl
+
+
+def alle(studiengang) -> list:
+    """Alle Module mit ihren Nummern (ab 1) in Semesterreihenfolge."""
+    return list(enumerate((m for s in studiengang.semester for m in s.hole_modulen()), 1))
+
+
+def test_iter_alle_module_ab_jeder_position(studiengang):
+    """Der Start überspringt ganze Semester, ohne die Reihenfolge zu ändern."""
+    module = [modul for _, modul in alle(studiengang)]
+    for start in range(len(module) + 2):
+        assert list(studiengang.iter_alle_module(start)) == module[start:]
+
+
+@pytest.mark.parametrize("seitengroesse, seiten", [(1, 5), (2, 3), (5, 1), (20, 1)])
+def test_seiten_ergeben_alle_module(studiengang, seitengroesse, seiten):
+    """Die Seiten enthalten zusammen jedes Modul genau einmal mit seiner Nummer."""
+    auswahl = ModulAuswahl(studiengang, seitengroesse)
+    assert auswahl.anzahl_seiten() == seiten
+    eintraege = [eintrag for seite in range(1, seiten + 1) for eintrag in auswahl.hole_seite(seite)]
+    assert eintraege == alle(studiengang)
+    assert all(len(auswahl.hole_seite(seite)) == seitengroesse for seite in range(1, seiten))
+    assert auswahl.hole_seite(seiten + 1) == []
+
+
+def test_hole_modul_ueber_die_nummer(studiengang):
+    """Jede Nummer wählt das Modul unabhängig von der sichtbaren Seite."""
+    auswahl = ModulAuswahl(studiengang, seitengroesse=2)
+    for nummer, modul in alle(studiengang):
+        assert auswahl.hole_modul(nummer) is modul
+    assert auswahl.hole_modul(0) is None
+    assert auswahl.hole_modul(studiengang.anzahl_module() + 1) is None
+
+
+def test_ungueltige_seiten(studiengang):
+    """Seitengröße und Seite werden geprüft; ohne Module gibt es eine leere Seite."""
+    with pytest.raises(ValueError):
+        ModulAuswahl(studiengang, seitengroesse=0)
+    auswahl = ModulAuswahl(studiengang, seitengroesse=2)
+    for seite in (0, 4):
+        with pytest.raises(ValueError):
+            auswahl.seite = seite
+    auswahl.seite = 3
+    assert auswahl.hole_seite() == alle(studiengang)[4:]
+    
+    for semester in studiengang.semester:
+        for modul in list(semester.hole_modulen()):
+            semester.entferne_modul(modul)
+    assert auswahl.anzahl_seiten() == 1
+    assert auswahl.hole_seite(1) == []
+
+
+def test_waehle_mit_blaettern(studiengang, monkeypatch, capsys):
+    """Blättern, Sprung auf eine Seite, Suche und ungültige Eingaben bis zur Auswahl."""
+    eingaben = iter(["z", "w", "w", "w", "s9", "sx", "s2", "/daten", "99", "5"])
+    monkeypatch.setattr('builtins.input', lambda _: next(eingaben))
+    auswahl = ModulAuswahl(studiengang, seitengroesse=2)
+    
+    assert auswahl.waehle() is studiengang.finde_modul("DB01")
+    ausgabe = capsys.readouterr().out
+    assert ausgabe.count("ℹ Keine weitere Seite") == 2
+    assert "Seite 3/3, Nr. 5-5 von 5" in ausgabe
+    assert ausgabe.count("❌ Ungültige Eingabe") == 2
+    assert "5. DB01" in ausgabe.split("Treffer für 'daten'")[1]
+    assert "❌ Ungültige Modul-Nummer" in ausgabe
+    assert auswahl.seite == 2
+
+
+def test_waehle_abbrechen(studiengang, monkeypatch):
+    """Eine leere Eingabe bricht die Auswahl ab."""
+    monkeypatch.setattr('builtins.input', lambda _: "")
+    assert ModulAuswahl(studiengang).waehle() is None
@@ -0,0 +1,105 @@
+"""
+Tests: Speichern, Ändern, erneut Speichern und Laden für jeden Speicher.
+
+Geprüft wird jeweils mit Änderungen, die über die protokolliere-Hooks
+gemeldet werden, und mit Änderungen ohne Hooks (z.B. direkt am Modul).
+"""
+
+import pytest
+
+from domain import Modul
+from domain.enums import ModulStatus
+from persistence import erstelle_daten_manager
+from conftest import pruefung
+
+# Speicher je Fall: (Dateiname, Journal bei Pickle-Dateien)
+SPEICHER = {
+    'journal': ("studiengang.pkl", True),
+    'pickle': ("studiengang.pkl", False),
+    'sqlite': ("studiengang.db", True),
+    'binaer': ("studiengang.sdb", True),
+}
+
+
+def erstelle(tmp_path, art: str):
+    """Erstellt einen DatenManager der Art ohne Statusmeldungen."""
+    datei, journal = SPEICHER[art]
+    daten_manager = erstelle_daten_manager(str(tmp_path / datei), journal=journal)
+    daten_manager.meldungen = False
+    return daten_manager
+
+
+def lade_neu(tmp_path, art: str):
+    """Lädt den Studiengang mit einem frischen DatenManager."""
+    return erstelle(tmp_path, art).lade_studiengang()
+
+
+@pytest.mark.parametrize("art", SPEICHER)
+def test_speichern_und_laden(tmp_path, art, studiengang):
+    """Ein gespeicherter Studiengang wird unverändert geladen."""
+    erstelle(tmp_path, art).speichere_studiengang(studiengang)
+    geladen = lade_neu(tmp_path, art)
+    assert geladen.als_tupel() == studiengang.als_tupel()
+    assert not geladen.ist_geaendert()
+
+
+@pytest.mark.parametrize("art", SPEICHER)
+def test_aenderungen_mit_hooks(tmp_path, art, studiengang):
+    """Über die Hooks gemeldete Änderungen überstehen Speichern und Laden."""
+    daten_manager = erstelle(tmp_path, art)
+    daten_manager.speichere_studiengang(studiengang)
+    
+    neu = Modul("NETZ01", "Netzwerke", 5, 2)
+    studiengang.semester[1].fuege_modul_hinzu(neu)
+    daten_manager.protokolliere_modul_hinzugefuegt(2, neu)
+    modul = studiengang.finde_modul("THEO01")
+    modul.setze_pruefungsleistung(pruefung(2.7, 2, 10))
+    daten_manager.protokolliere_pruefungsleistung(modul)
+    modul = studiengang.finde_modul("MATH02")
+    modul.status = ModulStatus.OFFEN
+    daten_manager.protokolliere_status(modul)
+    daten_manager.speichere_studiengang(studiengang)
+    
+    assert lade_neu(tmp_path, art).als_tupel() == studiengang.als_tupel()
+
+
+@pytest.mark.parametrize("art", SPEICHER)
+def test_aenderungen_ohne_hooks(tmp_path, art, studiengang):
+    """Nicht gemeldete Änderungen gehen beim Speichern nicht verloren."""
+    daten_manager = erstelle(tmp_path, art)
+    daten_manager.speichere_studiengang(studiengang)
+    
+    studiengang.semester[2].fuege_modul_hinzu(Modul("KRYP01", "Kryptografie", 5, 3))
+    studiengang.finde_modul("THEO01").setze_pruefungsleistung(pruefung(3.0, 2, 12))
+    studiengang.finde_modul("MATH01").ects = 7
+    studiengang.finde_modul("MATH02").status = ModulStatus.OFFEN
+    assert studiengang.ist_geaendert()
+    daten_manager.speichere_studiengang(studiengang)
+    
+    geladen = lade_neu(tmp_path, art)
+    assert geladen.als_tupel() == studiengang.als_tupel()
+    assert geladen.finde_modul("MATH01").ects == 7
+
+
+@pytest.mark.parametrize("art", SPEICHER)
+def test_gemischte_aenderungen_ueber_mehrere_speichervorgaenge(tmp_path, art, studiengang):
+    """Gemeldete und nicht gemeldete Änderungen über mehrere Sitzungen."""
+    erstelle(tmp_path, art).speichere_studiengang(studiengang)
+    
+    daten_manager = erstelle(tmp_path, art)
+    geladen = daten_manager.lade_studiengang()
+    modul = geladen.finde_modul("MATH02")
+    modul.setze_pruefungsleistung(pruefung(1.7))
+    daten_manager.protokolliere_pruefungsleistung(modul)
+    geladen.finde_modul("DB01").name = "Datenbanksysteme"
+    daten_manager.speichere_studiengang(geladen)
+    
+    daten_manager = erstelle(tmp_path, art)
+    erneut = daten_manager.lade_studiengang()
+    assert erneut.als_tupel() == geladen.als_tupel()
+    modul = erneut.finde_modul("PROG01")
+    modul.status = ModulStatus.ANGEMELDET
+    daten_manager.protokolliere_status(modul)
+    daten_manager.speichere_studiengang(erneut)
+    
+    assert lade_neu(tmp_path, art).als_tupel() == erneut.als_tupel()
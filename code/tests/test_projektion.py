@@ -0,0 +1,75 @@
+"""
+Tests: NotenProjektion und NotenVerteilung im Vergleich mit den Einzelberechnungen.
+"""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from analyse import NotenProjektion, NotenVerteilung  # noqa: E402
+from analyse import projektion as projektion_modul  # noqa: E402
+
+
+def test_benoetigte_durchschnitte_wie_je_studiengang(kohorte):
+    """Der erlaubte Durchschnitt stimmt mit Studiengang.berechne_benoetigten_durchschnitt überein."""
+    benoetigt = NotenProjektion.aus_studiengaengen(kohorte).berechne_benoetigte_durchschnitte()
+    for wert, studiengang in zip(benoetigt.tolist(), kohorte):
+        erwartet = studiengang.berechne_benoetigten_durchschnitt()
+        if erwartet is None:
+            assert math.isnan(wert)
+        else:
+            assert wert == pytest.approx(erwartet, abs=1e-9)
+
+
+def test_simulation_passt_zu_den_einzelberechnungen(kohorte):
+    """Abgeschlossene behalten ihren Durchschnitt; unerreichbare und sichere Ziele sind eindeutig."""
+    projektion = NotenProjektion.aus_studiengaengen(kohorte)
+    ergebnis = projektion.simuliere(simulationen=200, saat=1)
+    benoetigt = projektion.berechne_benoetigte_durchschnitte()
+    mittelwerte = ergebnis.mittelwerte
+    wahrscheinlichkeiten = ergebnis.wahrscheinlichkeiten
+    
+    assert len(ergebnis) == len(kohorte)
+    for i, studiengang in enumerate(kohorte):
+        if not studiengang.berechne_verbleibende_ects() and studiengang.bestandene_ects:
+            assert mittelwerte[i] == pytest.approx(studiengang.berechne_durchschnitt(), abs=0.006)
+    assert (wahrscheinlichkeiten[benoetigt < 1.0] == 0).all()
+    assert (wahrscheinlichkeiten[benoetigt >= 4.0] == 1).all()
+    assert (ergebnis.quantil(0.1) <= ergebnis.quantil(0.9) + 1e-12).all()
+    with pytest.raises(ValueError):
+        ergebnis.quantil(0.25)
+
+
+def test_gleiche_saat_unabhaengig_von_prozessen(kohorte, monkeypatch):
+    """Mit gleicher Saat liefern ein und mehrere Prozesse dasselbe Ergebnis."""
+    monkeypatch.setattr(projektion_modul, 'ZIEHUNGEN_PRO_BLOCK', 2 ** 14)
+    projektion = NotenProjektion.aus_studiengaengen(kohorte)
+    einzeln = projektion.simuliere(simulationen=50, saat=7)
+    parallel = projektion.simuliere(simulationen=50, saat=7, prozesse=2)
+    assert np.array_equal(einzeln.mittelwerte, parallel.mittelwerte)
+    assert np.array_equal(einzeln.quantil(0.9), parallel.quantil(0.9))
+    assert not np.array_equal(einzeln.mittelwerte, projektion.simuliere(simulationen=50, saat=8).mittelwerte)
+
+
+def test_ungueltige_simulation(kohorte):
+    """Weniger als ein Lauf oder Module ohne ECTS werden abgelehnt."""
+    projektion = NotenProjektion.aus_studiengaengen(kohorte[:5])
+    with pytest.raises(ValueError):
+        projektion.simuliere(simulationen=0)
+    with pytest.raises(ValueError):
+        projektion.simuliere(modul_ects=0)
+
+
+def test_notenverteilung():
+    """Nur bestandene Noten zählen; die Ziehungen folgen den Anteilen."""
+    verteilung = NotenVerteilung([1.0, 1.0, 2.0, 5.0, float('nan')])
+    assert verteilung.noten.tolist() == [1.0, 2.0]
+    assert verteilung.anteile.tolist() == pytest.approx([2 / 3, 1 / 3])
+    assert verteilung.mittelwert == pytest.approx(4 / 3)
+    gezogen = verteilung.ziehe(np.random.default_rng(0), 30000)
+    assert set(gezogen.tolist()) == {1.0, 2.0}
+    assert (gezogen == 1.0).mean() == pytest.approx(2 / 3, abs=0.02)
+    with pytest.raises(ValueError):
+        NotenVerteilung([5.0, float('nan')])
@@ -0,0 +1,92 @@
+"""
+Tests: Schema-versionierte Serialisierung und Laden alter Pickle-Dateien.
+"""
+
+import os
+import pickle
+
+import pytest
+
+from persistence import DatenManager
+from persistence.serialisierer import MAGIC, SCHEMA_VERSION, deserialisiere, serialisiere
+
+
+class _Boesartig:
+    """Objekt, das beim Entpicklen ein Verzeichnis anlegen würde."""
+    
+    def __init__(self, pfad: str):
+        self.pfad = pfad
+    
+    def __reduce__(self):
+        return (os.mkdir, (self.pfad,))
+
+
+def nutzdaten(daten) -> bytes:
+    """Verpackt beliebige Nutzdaten im Dateiformat des Serialisierers."""
+    return MAGIC + pickle.dumps((SCHEMA_VERSION, daten))
+
+
+def test_rundreise(studiengang):
+    """Serialisieren und Deserialisieren erhält den Zustand."""
+    assert deserialisiere(serialisiere(studiengang)).als_tupel() == studiengang.als_tupel()
+
+
+def test_boesartige_nutzdaten_werden_abgelehnt(tmp_path):
+    """Verweise auf Funktionen werden nicht aufgelöst und nicht ausgeführt."""
+    pfad = str(tmp_path / "ausgefuehrt")
+    with pytest.raises(pickle.UnpicklingError):
+        deserialisiere(nutzdaten(_Boesartig(pfad)))
+    assert not os.path.exists(pfad)
+
+
+@pytest.mark.parametrize("aendere", [
+    lambda s: s[:2] + (0,) + s[3:],                        # Gesamtdauer
+    lambda s: s[:1] + ("DOKTOR",) + s[2:],                  # Abschluss
+    lambda s: s[:5] + ((("1",) + s[5][0][1:],) + s[5][1:],),  # Semesternummer als String
+    lambda s: s[:5] + (5,),                                 # Semester keine Folge
+])
+def test_ungueltige_werte_werden_abgelehnt(studiengang, aendere):
+    """Manipulierte Nutzdaten führen zu ValueError statt zu ungültigen Objekten."""
+    with pytest.raises(ValueError):
+        deserialisiere(nutzdaten(aendere(studiengang.als_tupel())))
+
+
+def test_ungueltige_note_wird_abgelehnt(studiengang):
+    """Eine Note außerhalb von 1.0 bis 5.0 wird beim Laden erkannt."""
+    name, abschluss, dauer, ziel_note, ziel_dauer, semester = studiengang.als_tupel()
+    nummer, bezeichnung, start, ende, module = semester[0]
+    code, modulname, ects, empfehlung, status, pruefung, fruehere = module[0]
+    module = ((code, modulname, ects, empfehlung, status, (9.0,) + pruefung[1:], fruehere),) + module[1:]
+    semester = ((nummer, bezeichnung, start, ende, module),) + semester[1:]
+    with pytest.raises(ValueError, match="Note"):
+        deserialisiere(nutzdaten((name, abschluss, dauer, ziel_note, ziel_dauer, semester)))
+
+
+def test_altes_pickle_nur_ueber_migration(tmp_path, studiengang):
+    """Alte Pickle-Dateien werden abgelehnt, bis sie einmalig umgewandelt wurden."""
+    pfad = str(tmp_path / "alt.pkl")
+    with open(pfad, 'wb') as datei:
+        pickle.dump(studiengang, datei)
+    daten_manager = DatenManager(pfad)
+    daten_manager.meldungen = False
+    
+    with pytest.raises(IOError, match="migriere"):
+        daten_manager.lade_studiengang()
+    assert daten_manager.migriere_altes_format()
+    assert not daten_manager.migriere_altes_format()
+    assert daten_manager.lade_studiengang().als_tupel() == studiengang.als_tupel()
+
+
+def test_main_meldet_altes_pickle_ohne_traceback(tmp_path, monkeypatch, capsys, studiengang):
+    """main.py bricht bei einer alten Pickle-Datei mit Hinweis auf --migriere ab."""
+    from main import main
+    
+    monkeypatch.chdir(tmp_path)
+    with open("studiengang.pkl", 'wb') as datei:
+        pickle.dump(studiengang, datei)
+    (tmp_path / "befehle.txt").write_text("status MATH02 OFFEN\n", encoding='utf-8')
+    
+    assert main(["--batch", "befehle.txt"]) == 1
+    assert "--migriere" in capsys.readouterr().out
+    assert main(["--migriere"]) == 0
+    assert main(["--batch", "befehle.txt"]) == 0
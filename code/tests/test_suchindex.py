@@ -0,0 +1,99 @@
+"""
+Tests: Modulsuche über den Suchindex und Modul-Nummern der Treffer.
+"""
+
+import pytest
+
+from domain import Modul
+from gui import ModulAuswahl
+
+
+def codes(module) -> list:
+    """Die Modulcodes einer Trefferliste."""
+    return [modul.modulcode for modul in module]
+
+
+@pytest.fixture
+def mit_sicherheit(studiengang):
+    """Studiengang mit zusätzlichen Modulen aus mehreren Wörtern."""
+    studiengang.semester[1].fuege_modul_hinzu(Modul("NETZ01", "Netzwerke und Sicherheit", 5, 2))
+    studiengang.semester[1].fuege_modul_hinzu(Modul("NETZ02", "Netzwerke", 5, 2))
+    studiengang.semester[3].fuege_modul_hinzu(Modul("CYB01", "Einführung in Cybersecurity", 5, 4))
+    return studiengang
+
+
+@pytest.mark.parametrize("anfrage, erwartet", [
+    ("math", ["MATH01", "MATH02"]),            # Code-Präfix
+    ("MATH02", ["MATH02"]),                     # exakter Code, Groß-/Kleinschreibung egal
+    ("daten", ["DB01"]),                        # Wortanfang im Namen
+    ("informatik", ["THEO01"]),                 # Wortanfang eines späteren Wortes
+    ("ogramm", ["PROG01"]),                     # Teilstring
+    ("xyz", []),
+    ("  ", []),
+])
+def test_einzelne_anfrage(studiengang, anfrage, erwartet):
+    """Code-Präfix, Wortanfang und Teilstring werden gefunden."""
+    assert codes(studiengang.suche_module(anfrage)) == erwartet
+
+
+@pytest.mark.parametrize("anfrage, erwartet", [
+    ("netzwerke sicherheit", ["NETZ01"]),
+    ("sicherheit netzwerke", ["NETZ01"]),
+    ("einführung cyber", ["CYB01"]),
+    ("mathematik ii", ["MATH02"]),
+    ("netzwerke fehlt", []),
+])
+def test_mehrere_woerter(mit_sicherheit, anfrage, erwartet):
+    """Jedes Wort der Anfrage muss für sich passen, die Reihenfolge ist egal."""
+    assert codes(mit_sicherheit.suche_module(anfrage)) == erwartet
+
+
+def test_zusammenhaengender_text_zuerst(mit_sicherheit):
+    """Treffer für die ganze Anfrage kommen vor Treffern über einzelne Wörter."""
+    mit_sicherheit.semester[2].fuege_modul_hinzu(Modul("SICH01", "Sicherheit netzwerkbasierter Systeme", 5, 3))
+    assert codes(mit_sicherheit.suche_module("netzwerke und")) == ["NETZ01"]
+    assert codes(mit_sicherheit.suche_module("sicherheit netzwerk")) == ["SICH01", "NETZ01"]
+
+
+def test_index_wird_nachgefuehrt(studiengang):
+    """Umbenennen, Hinzufügen und Entfernen wirken ohne Neuaufbau auf die Suche."""
+    assert codes(studiengang.suche_module("daten")) == ["DB01"]
+    index = studiengang._suchindex
+    
+    modul = studiengang.finde_modul("DB01")
+    modul.name = "Relationale Systeme"
+    modul.modulcode = "RDB01"
+    assert studiengang.suche_module("daten") == []
+    assert codes(studiengang.suche_module("relationale")) == ["RDB01"]
+    assert codes(studiengang.suche_module("rdb")) == ["RDB01"]
+    assert studiengang.suche_module("datenbanken") == []
+    
+    studiengang.semester[4].fuege_modul_hinzu(Modul("DATA01", "Datenanalyse", 5, 5))
+    assert codes(studiengang.suche_module("daten")) == ["DATA01"]
+    studiengang.semester[2].entferne_modul(modul)
+    assert studiengang.suche_module("relationale") == []
+    assert studiengang._suchindex is index
+
+
+def test_modul_nummern_der_treffer(mit_sicherheit):
+    """Die Nummern der Suchtreffer wählen im Picker dasselbe Modul."""
+    auswahl = ModulAuswahl(mit_sicherheit, seitengroesse=2)
+    for anfrage in ("netzwerke", "math", "cyber", "informatik"):
+        eintraege = auswahl.suche(anfrage)
+        assert eintraege
+        for nummer, modul in eintraege:
+            assert auswahl.hole_modul(nummer) is modul
+
+
+def test_positionen_nach_aenderungen(mit_sicherheit):
+    """Positionen bleiben nach Hinzufügen, Entfernen und Verschieben korrekt."""
+    studiengang = mit_sicherheit
+    for position, modul in enumerate(studiengang.iter_alle_module()):
+        assert studiengang.finde_position(modul) == position
+    
+    studiengang.semester[0].entferne_modul(studiengang.finde_modul("PROG01"))
+    studiengang.semester[0].fuege_modul_hinzu(Modul("ALGO01", "Algorithmen", 5, 1))
+    studiengang.verschiebe_modul(studiengang.finde_modul("MATH01"), 3)
+    for position, modul in enumerate(studiengang.iter_alle_module()):
+        assert studiengang.finde_position(modul) == position
+    assert studiengang.finde_position(Modul("FREI01", "Ohne Semester", 5, 1)) is None